@@ -0,0 +1,5 @@
+CREATE TABLE IF NOT EXISTS public.test_table (
+    id INTEGER,
+    name TEXT,
+    PRIMARY KEY (id)
+);
\ No newline at end of file
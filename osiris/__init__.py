@@ -14,8 +14,11 @@
 
 """Osiris MVP - Conversational ETL pipeline generator."""
 
+import importlib
 from pathlib import Path
+import sys
 import tomllib
+from typing import TYPE_CHECKING, Any
 
 _project_root = Path(__file__).parent.parent
 _pyproject = _project_root / "pyproject.toml"
@@ -36,37 +39,50 @@ except Exception:
 __author__ = "Osiris Team"
 __description__ = "LLM-first conversational ETL pipeline generator"
 
-# Database connectors
-from .connectors import MySQLExtractor, MySQLWriter, SupabaseExtractor, SupabaseWriter  # noqa: E402
-from .core.discovery import ExtractorFactory, ProgressiveDiscovery, WriterFactory  # noqa: E402
-
-# Core interfaces
-from .core.interfaces import (  # noqa: E402
-    IDiscovery,
-    IExtractor,
-    ILoader,
-    IStateStore,
-    ITransformer,
-)
-
-# Core implementations
-from .core.state_store import SQLiteStateStore  # noqa: E402
-
-__all__ = [
+# Public API is resolved lazily (PEP 562) so that `import osiris` and the CLI do not
+# pay for pandas, SQLAlchemy or the Supabase SDK until a connector is actually used.
+_LAZY_ATTRIBUTES = {
     # Interfaces
-    "IStateStore",
-    "IDiscovery",
-    "IExtractor",
-    "ILoader",
-    "ITransformer",
+    "IStateStore": "osiris.core.interfaces",
+    "IDiscovery": "osiris.core.interfaces",
+    "IExtractor": "osiris.core.interfaces",
+    "ILoader": "osiris.core.interfaces",
+    "ITransformer": "osiris.core.interfaces",
     # Implementations
-    "SQLiteStateStore",
-    "ProgressiveDiscovery",
-    "ExtractorFactory",
-    "WriterFactory",
+    "SQLiteStateStore": "osiris.core.state_store",
+    "ProgressiveDiscovery": "osiris.core.discovery",
+    "ExtractorFactory": "osiris.core.discovery",
+    "WriterFactory": "osiris.core.discovery",
     # Connectors
-    "MySQLExtractor",
-    "MySQLWriter",
-    "SupabaseExtractor",
-    "SupabaseWriter",
-]
+    "MySQLExtractor": "osiris.connectors",
+    "MySQLWriter": "osiris.connectors",
+    "SupabaseExtractor": "osiris.connectors",
+    "SupabaseWriter": "osiris.connectors",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .connectors import MySQLExtractor, MySQLWriter, SupabaseExtractor, SupabaseWriter
+    from .core.discovery import ExtractorFactory, ProgressiveDiscovery, WriterFactory
+    from .core.interfaces import IDiscovery, IExtractor, ILoader, IStateStore, ITransformer
+    from .core.state_store import SQLiteStateStore
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        # A re-executed package module (its sys.modules entry was replaced) is not bound to
+        # subpackages that are already imported, since importing them again is a no-op
+        submodule = sys.modules.get(f"{__name__}.{name}")
+        if submodule is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        globals()[name] = submodule
+        return submodule
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so __getattr__ runs once per name
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -26,6 +26,7 @@ def show_compile_help(json_output: bool = False):
                 "--profile": "Active profile (e.g., dev, prod)",
                 "--param": "Set parameters (format: key=value, can be repeated)",
                 "--compile": "Compilation mode: auto|force|never (default: auto)",
+                "--optimize": "Fuse chained DuckDB steps and push projections into MySQL extractors",
                 "--json": "Output in JSON format",
                 "--help": "Show this help message",
             },
@@ -71,6 +72,8 @@ def show_compile_help(json_output: bool = False):
     console.print("                      • auto: Use cache if available (default)")
     console.print("                      • force: Always recompile")
     console.print("                      • never: Only use cache, fail if not cached")
+    console.print("  [cyan]--optimize[/cyan]        Fuse chained DuckDB steps into one query and push")
+    console.print("                      projections into MySQL extractors")
     console.print("  [cyan]--json[/cyan]            Output in JSON format for programmatic use")
     console.print("  [cyan]--help[/cyan]            Show this help message")
     console.print()
@@ -126,6 +129,7 @@ def compile_command(args: list[str]):
     profile = None
     params = {}
     compile_mode = "auto"
+    optimize = False
     use_json = "--json" in args
 
     i = 0
@@ -193,6 +197,9 @@ def compile_command(args: list[str]):
                         sys.exit(2)
                     i += 1
 
+            elif arg == "--optimize":
+                optimize = True
+
             elif arg == "--json":
                 use_json = True
 
@@ -271,7 +278,7 @@ def compile_command(args: list[str]):
             console.print(f"[cyan]🔧 Compiling {pipeline_file}...[/cyan]")
 
         # Use filesystem contract for compilation
-        compiler = CompilerV0(fs_contract=fs_contract, pipeline_slug=pipeline_slug)
+        compiler = CompilerV0(fs_contract=fs_contract, pipeline_slug=pipeline_slug, optimize=optimize)
         success, message = compiler.compile(
             oml_path=pipeline_file, profile=profile, cli_params=params, compile_mode=compile_mode
         )
@@ -285,6 +285,12 @@ aiop/**/annex/
 .osiris/index/counters.sqlite
 .osiris/index/counters.sqlite-shm
 .osiris/index/counters.sqlite-wal
+.osiris/index/state.sqlite
+.osiris/index/state.sqlite-shm
+.osiris/index/state.sqlite-wal
+.osiris/index/runs.sqlite
+.osiris/index/runs.sqlite-shm
+.osiris/index/runs.sqlite-wal
 
 # Secrets and credentials (NEVER commit)
 .env
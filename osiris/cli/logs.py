@@ -77,6 +77,10 @@ def list_sessions(args: list) -> None:
         console.print(
             "  [cyan]--no-wrap[/cyan]             Print session IDs on one line (may truncate in narrow terminals)"
         )
+        console.print("  [cyan]--status STATUS[/cyan]       Only sessions with this status (e.g. success, failed)")
+        console.print("  [cyan]--pipeline NAME[/cyan]       Only sessions of this pipeline")
+        console.print("  [cyan]--label LABEL[/cyan]         Only sessions carrying this label")
+        console.print("  [cyan]--since TIMESTAMP[/cyan]     Only sessions started at or after this ISO timestamp")
         console.print()
         console.print("[bold blue]Session ID Display[/bold blue]")
         console.print("  By default, session IDs wrap to multiple lines to show the full value.")
@@ -87,6 +91,7 @@ def list_sessions(args: list) -> None:
         console.print("  [green]osiris logs list[/green]                         # Show recent 20 sessions")
         console.print("  [green]osiris logs list --limit 50[/green]              # Show recent 50 sessions")
         console.print("  [green]osiris logs list --json[/green]                  # JSON format output")
+        console.print("  [green]osiris logs list --status failed[/green]         # Recent failed sessions")
         console.print("  [green]osiris logs list --logs-dir /path/to/logs[/green]  # Custom logs directory")
         console.print()
 
@@ -110,6 +115,10 @@ def list_sessions(args: list) -> None:
         action="store_true",
         help="Print session IDs on one line (may truncate in narrow terminals)",
     )
+    parser.add_argument("--status", help="Only sessions with this status")
+    parser.add_argument("--pipeline", help="Only sessions of this pipeline")
+    parser.add_argument("--label", help="Only sessions carrying this label")
+    parser.add_argument("--since", help="Only sessions started at or after this ISO timestamp")
 
     try:
         parsed_args = parser.parse_args(args)
@@ -129,7 +138,13 @@ def list_sessions(args: list) -> None:
 
     # Use SessionReader to get sessions
     reader = SessionReader(logs_dir=parsed_args.logs_dir)
-    sessions = reader.list_sessions(limit=parsed_args.limit)
+    sessions = reader.list_sessions(
+        limit=parsed_args.limit,
+        status=parsed_args.status,
+        pipeline=parsed_args.pipeline,
+        label=parsed_args.label,
+        since=parsed_args.since,
+    )
 
     if parsed_args.json:
         # Output as JSON using the serializer
@@ -1115,11 +1130,9 @@ def open_session(args: list) -> None:
     if label_filter:
         # Find session with label
         reader = SessionReader(logs_dir)
-        sessions = reader.list_sessions()
-        for session in sessions:
-            if label_filter in session.labels:
-                session_id = session.session_id
-                break
+        sessions = reader.list_sessions(limit=1, label=label_filter)
+        if sessions:
+            session_id = sessions[0].session_id
         if not session_id:
             console.print(f"❌ No session found with label: {label_filter}")
             return
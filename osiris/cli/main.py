@@ -20,17 +20,38 @@ import json
 import logging
 import sys
 
-from rich.console import Console
+# Environment files loaded at CLI entry (populated by load_cli_env())
+loaded_env_files: list[str] | None = None
 
-from osiris.core.env_loader import load_env
 
-# Load environment variables at CLI entry
-loaded_env_files = load_env()
+def load_cli_env() -> list[str]:
+    """Load .env files once per process (deferred from import to keep startup cheap)."""
+    global loaded_env_files
+
+    if loaded_env_files is None:
+        from osiris.core.env_loader import load_env
+
+        loaded_env_files = load_env()
+    return loaded_env_files
+
+
+class _LazyConsole:
+    """Rich console created on first use, so JSON and --version paths never import Rich."""
+
+    _console = None
+
+    def __getattr__(self, name):
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
-console = Console()
+console = _LazyConsole()
 
 # Global flag for JSON output mode
 json_output = False
@@ -164,6 +185,8 @@ def main():
     """Main CLI entry point with Rich formatting."""
     global json_output
 
+    load_cli_env()
+
     # Special handling for deprecated chat command
     if len(sys.argv) > 1 and sys.argv[1] == "chat":
         from .chat_deprecation import handle_chat_deprecation
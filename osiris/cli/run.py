@@ -58,6 +58,7 @@ def show_run_help(json_output: bool = False):
                 "--param": "Set parameters for OML (format: key=value, repeatable)",
                 "--last-compile": "Use manifest from most recent successful compile",
                 "--last-compile-in": "Find latest compile in specified directory",
+                "--max-parallel": "Run up to N independent steps concurrently (local only, default: 1)",
                 "--verbose": "Show detailed execution logs",
                 "--json": "Output in JSON format",
                 "--help": "Show this help message",
@@ -109,6 +110,7 @@ def show_run_help(json_output: bool = False):
     console.print("  [cyan]--param[/cyan]           Set parameters for OML (format: key=value)")
     console.print("  [cyan]--last-compile[/cyan]    Use manifest from most recent successful compile")
     console.print("  [cyan]--last-compile-in[/cyan] Find latest compile in specified directory")
+    console.print("  [cyan]--max-parallel N[/cyan]  Run up to N independent steps concurrently (local only)")
     console.print("  [cyan]--verbose[/cyan]         Show single-line event summaries on stdout")
     console.print("  [cyan]--json[/cyan]            Output in JSON format")
     console.print("  [cyan]--help[/cyan]            Show this help message")
@@ -302,6 +304,7 @@ def run_command(args: list[str]):
     use_json = "--json" in remaining_args
     last_compile = False
     last_compile_in = None
+    max_parallel = 1
 
     i = 0
     while i < len(remaining_args):
@@ -365,6 +368,18 @@ def run_command(args: list[str]):
                     # Check environment variable
                     last_compile_in = os.environ.get("OSIRIS_LAST_COMPILE_DIR", "logs")
 
+            elif arg == "--max-parallel":
+                value = remaining_args[i + 1] if i + 1 < len(remaining_args) else ""
+                if not value.isdigit() or int(value) < 1:
+                    error_msg = "Option --max-parallel requires a positive integer"
+                    if use_json:
+                        print(json.dumps({"error": error_msg}))
+                    else:
+                        console.print(f"[red]❌ {error_msg}[/red]")
+                    sys.exit(2)
+                max_parallel = int(value)
+                i += 1
+
             elif arg == "--verbose":
                 verbose = True
 
@@ -606,6 +621,7 @@ def run_command(args: list[str]):
             profile=manifest_profile,
             run_id=run_id_final,
             manifest_short=manifest_short,
+            buffered=True,
         )
 
         # Clean up temporary session directory (only if it was created)
@@ -627,8 +643,7 @@ def run_command(args: list[str]):
         # Create execution context with session directory as base
         exec_context = ExecutionContext(session_id=run_id_final, base_path=session.session_dir)
 
-        # Prepare E2B config for adapter
-        adapter_e2b_config = {}
+        # Prepare adapter config (E2B settings or local runner settings)
         if e2b_config.enabled:
             adapter_e2b_config = {
                 "timeout": e2b_config.timeout,
@@ -638,6 +653,8 @@ def run_command(args: list[str]):
                 "verbose": verbose,
                 "install_deps": e2b_config.install_deps,
             }
+        else:
+            adapter_e2b_config = {"max_parallel": max_parallel, "state_path": str(contract.index_paths()["state"])}
 
         # Execute with selected adapter
         execute_success, error_message = execute_with_adapter(
@@ -814,7 +831,8 @@ def run_command(args: list[str]):
                 if "run_id_final" in locals():
                     run_id_aiop = run_id_final
 
-            # Export AIOP
+            # Export AIOP (reads events/metrics back from the session directory)
+            session.flush()
             export_success, export_error = export_aiop_auto(
                 session_id=session_id,
                 manifest_hash=manifest_hash,
@@ -46,11 +46,14 @@ def runs_command(args: list[str]):
     """Execute the runs command."""
     # Parse arguments
     parser = argparse.ArgumentParser(description="Manage pipeline runs", add_help=False)
-    parser.add_argument("action", choices=["list"], default="list", nargs="?", help="Action to perform")
+    parser.add_argument(
+        "action", choices=["list", "reindex", "export"], default="list", nargs="?", help="Action to perform"
+    )
     parser.add_argument("--pipeline", help="Filter by pipeline slug")
     parser.add_argument("--profile", help="Filter by profile")
     parser.add_argument("--tag", help="Filter by tag")
     parser.add_argument("--since", help="Filter by time period (e.g., 7d, 24h, 30m)")
+    parser.add_argument("--out", help="Output file for export (default: stdout)")
     parser.add_argument("--json", action="store_true", help="Output in JSON format")
     parser.add_argument("--help", "-h", action="store_true", help="Show help")
 
@@ -70,13 +73,23 @@ def runs_command(args: list[str]):
         # Load filesystem contract
         from ..core.fs_config import load_osiris_config
         from ..core.fs_paths import FilesystemContract
-        from ..core.run_index import RunIndexReader
+        from ..core.run_index import RunIndexReader, RunIndexStore
 
         fs_config, ids_config, _ = load_osiris_config()
         fs_contract = FilesystemContract(fs_config, ids_config)
 
         # Get index paths
         index_paths = fs_contract.index_paths()
+
+        if parsed_args.action == "reindex":
+            # Rebuild the SQLite run index from runs.jsonl (also migrates JSONL-only indexes)
+            count = RunIndexStore(index_paths["runs_db"], index_paths["runs"]).rebuild()
+            if use_json:
+                print(json.dumps({"reindexed": count, "database": str(index_paths["runs_db"])}))
+            else:
+                console.print(f"[green]✓ Rebuilt run index with {count} runs:[/green] {index_paths['runs_db']}")
+            return
+
         index_reader = RunIndexReader(index_paths["base"])
 
         # Parse since filter
@@ -90,8 +103,20 @@ def runs_command(args: list[str]):
             profile=parsed_args.profile,
             tag=parsed_args.tag,
             since=since_dt,
+            limit=None if parsed_args.action == "export" else 100,
         )
 
+        if parsed_args.action == "export":
+            # JSONL in recording order, same format as runs.jsonl
+            lines = "".join(json.dumps(r.to_dict(), separators=(",", ":")) + "\n" for r in reversed(runs))
+            if parsed_args.out:
+                with open(parsed_args.out, "w") as f:
+                    f.write(lines)
+                console.print(f"[green]✓ Exported {len(runs)} runs to {parsed_args.out}[/green]")
+            else:
+                print(lines, end="")
+            return
+
         # Output results
         if use_json:
             print(json.dumps([r.to_dict() for r in runs], indent=2, default=str))
@@ -116,13 +141,18 @@ def show_runs_help(json_output: bool = False):
         help_data = {
             "command": "runs",
             "description": "List and manage pipeline runs",
-            "usage": "osiris runs [list] [OPTIONS]",
-            "actions": {"list": "List pipeline runs (default)"},
+            "usage": "osiris runs [list|reindex|export] [OPTIONS]",
+            "actions": {
+                "list": "List pipeline runs (default)",
+                "reindex": "Rebuild the SQLite run index from runs.jsonl",
+                "export": "Export runs as JSONL",
+            },
             "options": {
                 "--pipeline": "Filter by pipeline slug",
                 "--profile": "Filter by profile",
                 "--tag": "Filter by tag",
                 "--since": "Filter by time period (e.g., 7d, 24h, 30m)",
+                "--out": "Output file for export (default: stdout)",
                 "--json": "Output in JSON format",
                 "--help": "Show this help message",
             },
@@ -131,6 +161,8 @@ def show_runs_help(json_output: bool = False):
                 "osiris runs list --pipeline orders_etl",
                 "osiris runs list --profile prod --since 7d",
                 "osiris runs list --tag nightly --json",
+                "osiris runs reindex",
+                "osiris runs export --pipeline orders_etl --out orders_runs.jsonl",
             ],
         }
         print(json.dumps(help_data, indent=2))
@@ -138,16 +170,19 @@ def show_runs_help(json_output: bool = False):
         console.print()
         console.print("[bold cyan]osiris runs - Manage Pipeline Runs[/bold cyan]")
         console.print()
-        console.print("[bold]Usage:[/bold] osiris runs [list] [OPTIONS]")
+        console.print("[bold]Usage:[/bold] osiris runs [list|reindex|export] [OPTIONS]")
         console.print()
         console.print("[bold blue]Actions[/bold blue]")
-        console.print("  [cyan]list[/cyan]  List pipeline runs (default)")
+        console.print("  [cyan]list[/cyan]     List pipeline runs (default)")
+        console.print("  [cyan]reindex[/cyan]  Rebuild the SQLite run index from runs.jsonl")
+        console.print("  [cyan]export[/cyan]   Export runs as JSONL")
         console.print()
         console.print("[bold blue]Options[/bold blue]")
         console.print("  [cyan]--pipeline[/cyan]  Filter by pipeline slug")
         console.print("  [cyan]--profile[/cyan]   Filter by profile")
         console.print("  [cyan]--tag[/cyan]       Filter by tag")
         console.print("  [cyan]--since[/cyan]     Filter by time period (e.g., 7d, 24h, 30m)")
+        console.print("  [cyan]--out[/cyan]       Output file for export (default: stdout)")
         console.print("  [cyan]--json[/cyan]      Output in JSON format")
         console.print("  [cyan]--help[/cyan]      Show this help message")
         console.print()
@@ -156,6 +191,8 @@ def show_runs_help(json_output: bool = False):
         console.print("  osiris runs list --pipeline orders_etl")
         console.print("  osiris runs list --profile prod --since 7d")
         console.print("  osiris runs list --tag nightly --json")
+        console.print("  osiris runs reindex")
+        console.print("  osiris runs export --pipeline orders_etl --out orders_runs.jsonl")
         console.print()
 
 
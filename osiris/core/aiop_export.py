@@ -1,5 +1,6 @@
 """AIOP automatic export and indexing functionality."""
 
+from collections.abc import Iterator
 import datetime
 import gzip
 import json
@@ -82,8 +83,6 @@ def export_aiop_auto(
             Path(run_card_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Read session data (similar to logs.py aiop_export)
-        import json
-
         import yaml
 
         from ..core.session_reader import SessionReader
@@ -104,23 +103,9 @@ def export_aiop_auto(
         reader = SessionReader(str(logs_dir))
         session_summary = reader.read_session(session_id)
 
-        # Load events
-        events = []
+        # Events and metrics are streamed from disk; build_aiop reads each file once
         events_file = session_path / "events.jsonl"
-        if events_file.exists():
-            with open(events_file) as f:
-                for line in f:
-                    if line.strip():
-                        events.append(json.loads(line))
-
-        # Load metrics
-        metrics = []
         metrics_file = session_path / "metrics.jsonl"
-        if metrics_file.exists():
-            with open(metrics_file) as f:
-                for line in f:
-                    if line.strip():
-                        metrics.append(json.loads(line))
 
         # Get artifacts
         artifacts = []
@@ -166,7 +151,7 @@ def export_aiop_auto(
 
         # Look for run_start and run_end events as fallback
         if not started_at or not completed_at:
-            for event in events:
+            for event in _iter_jsonl(events_file):
                 if event.get("event") == "run_start" and not started_at:
                     started_at = event.get("timestamp")
                 elif event.get("event") in ["run_end", "run_error"] and not completed_at:
@@ -191,8 +176,8 @@ def export_aiop_auto(
         aiop = build_aiop_func(
             session_data=session_data,
             manifest=manifest,
-            events=events,
-            metrics=metrics,
+            events=_iter_jsonl(events_file),
+            metrics=_iter_jsonl(metrics_file),
             artifacts=artifacts,
             config=config,
             show_progress=False,
@@ -277,6 +262,16 @@ def export_aiop_auto(
         return False, str(e)
 
 
+def _iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a JSONL file one at a time (nothing if the file does not exist)."""
+    if not path.exists():
+        return
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 def _export_annex(
     session_id: str, annex_dir: str, annex_config: dict[str, Any], session_path: Path | None = None
 ) -> int:
@@ -10,6 +10,7 @@ from .fingerprint import combine_fingerprints, compute_fingerprint
 from .mode_mapper import ModeMapper
 from .params_resolver import ParamsResolver
 from .session_logging import log_event
+from .sql_fusion import optimize_sql_steps
 
 COMMON_SECRET_NAMES = {
     "password",
@@ -37,15 +38,18 @@ COMMON_SECRET_NAMES = {
 class CompilerV0:
     """Minimal compiler for linear pipelines only."""
 
-    def __init__(self, fs_contract, pipeline_slug: str):
+    def __init__(self, fs_contract, pipeline_slug: str, optimize: bool = False):
         """Initialize compiler.
 
         Args:
             fs_contract: FilesystemContract instance for path resolution (required)
             pipeline_slug: Pipeline slug for building paths (required)
+            optimize: Fuse DuckDB transform chains and push projections into MySQL
+                extractors (see :mod:`osiris.core.sql_fusion`)
         """
         self.fs_contract = fs_contract
         self.pipeline_slug = pipeline_slug
+        self.optimize = optimize
         self.manifest_hash = None
         self.manifest_short = None
         self.resolver = ParamsResolver()
@@ -134,6 +138,9 @@ class CompilerV0:
             # Generate per-step configs
             configs = self._generate_configs(resolved_oml)
 
+            if self.optimize:
+                manifest, configs = self._optimize_sql_steps(manifest, configs)
+
             # Write outputs
             self._write_outputs(manifest, configs, resolved_oml, profile)
 
@@ -190,8 +197,9 @@ class CompilerV0:
         # Registry fingerprint (static for MVP)
         self.fingerprints["registry_fp"] = compute_fingerprint("registry-v0.1")
 
-        # Compiler fingerprint
-        self.fingerprints["compiler_fp"] = compute_fingerprint("osiris-compiler/0.1")
+        # Compiler fingerprint (optimized manifests differ, so the pass is part of the compiler identity)
+        compiler_id = "osiris-compiler/0.1+sql-fusion" if self.optimize else "osiris-compiler/0.1"
+        self.fingerprints["compiler_fp"] = compute_fingerprint(compiler_id)
 
         # Params fingerprint
         params_bytes = canonical_json(self.resolver.get_effective_params()).encode("utf-8")
@@ -306,10 +314,16 @@ class CompilerV0:
         if "metadata" in oml:
             manifest["metadata"] = oml["metadata"]
 
-        # Compute manifest fingerprint (exclude ephemeral fields for determinism)
+        self._fingerprint_manifest(manifest)
+
+        return manifest
+
+    def _fingerprint_manifest(self, manifest: dict) -> None:
+        """Compute the manifest fingerprint (exclude ephemeral fields for determinism)."""
         import copy
 
         manifest_for_fp = copy.deepcopy(manifest)
+        manifest_for_fp["pipeline"]["fingerprints"].pop("manifest_fp", None)
         if "meta" in manifest_for_fp:
             # Remove timestamp to ensure deterministic fingerprints
             manifest_for_fp["meta"].pop("generated_at", None)
@@ -318,7 +332,21 @@ class CompilerV0:
         manifest["pipeline"]["fingerprints"]["manifest_fp"] = compute_fingerprint(manifest_bytes)
         self.fingerprints["manifest_fp"] = manifest["pipeline"]["fingerprints"]["manifest_fp"]
 
-        return manifest
+    def _optimize_sql_steps(self, manifest: dict, configs: dict[str, dict]) -> tuple[dict, dict[str, dict]]:
+        """Apply SQL fusion / pushdown and record the rewrites in the manifest and fingerprints."""
+        steps, configs, rewrites = optimize_sql_steps(manifest["steps"], configs)
+        if not rewrites:
+            return manifest, configs
+
+        manifest["steps"] = steps
+        manifest["meta"]["optimizations"] = rewrites
+        optimizer_fp = compute_fingerprint(canonical_json(rewrites).encode("utf-8"))
+        manifest["pipeline"]["fingerprints"]["optimizer_fp"] = optimizer_fp
+        self.fingerprints["optimizer_fp"] = optimizer_fp
+        self._fingerprint_manifest(manifest)
+
+        log_event("sql_steps_optimized", rewrites=len(rewrites), steps=len(steps))
+        return manifest, configs
 
     def _generate_configs(self, oml: dict) -> dict[str, dict]:
         """Generate per-step configurations."""
@@ -1,6 +1,6 @@
 """Driver interface and registry for runtime execution."""
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 import hashlib
 import importlib
@@ -9,6 +9,9 @@ from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
+# Default number of rows per batch when a driver produces a RowStream
+DEFAULT_STREAM_BATCH_SIZE = 10000
+
 
 class Driver(Protocol):
     """Protocol for pipeline step drivers.
@@ -37,6 +40,131 @@ class Driver(Protocol):
         ...
 
 
+@dataclass(frozen=True)
+class ColumnSchema:
+    """Column metadata carried by a RowStream (ADR 0022)."""
+
+    name: str
+    type: str = "unknown"
+    nullable: bool = True
+
+
+class RowStream:
+    """Single-pass stream of DataFrame batches exchanged between drivers (ADR 0022).
+
+    Producers wrap a batch generator instead of materializing a full DataFrame, so
+    peak memory is bounded by the batch size rather than the table size. Consumers
+    iterate ``iter_batches()`` (or rows via ``__iter__``); ``to_dataframe()`` is the
+    compatibility path for consumers that need the whole table.
+
+    A stream can only be consumed once. Work that depends on the stream being fully
+    read (metrics, state) should happen inside the producer's generator after its
+    last batch.
+    """
+
+    def __init__(
+        self,
+        batches: Iterable[Any],
+        *,
+        columns: list[ColumnSchema] | None = None,
+        estimated_row_count: int | None = None,
+    ):
+        """Initialize stream.
+
+        Args:
+            batches: Iterable (usually a generator) yielding pandas DataFrames
+            columns: Column definitions if known before the first batch
+            estimated_row_count: Estimated rows if known (for progress tracking)
+        """
+        self._batches = batches
+        self._columns = list(columns) if columns is not None else None
+        self.estimated_row_count = estimated_row_count
+        self.rows_streamed = 0
+        self._consumed = False
+
+    @property
+    def columns(self) -> list[ColumnSchema]:
+        """Column definitions (inferred from the first batch when not declared)."""
+        return list(self._columns or [])
+
+    @property
+    def consumed(self) -> bool:
+        """True once iteration has started."""
+        return self._consumed
+
+    def iter_batches(self) -> Iterator[Any]:
+        """Yield DataFrame batches.
+
+        Raises:
+            RuntimeError: If the stream was already consumed
+        """
+        if self._consumed:
+            raise RuntimeError("RowStream can only be consumed once")
+        self._consumed = True
+
+        for batch in self._batches:
+            if self._columns is None:
+                self._columns = [ColumnSchema(name=str(col), type=str(dtype)) for col, dtype in batch.dtypes.items()]
+            self.rows_streamed += len(batch)
+            yield batch
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Yield rows as dictionaries."""
+        for batch in self.iter_batches():
+            yield from batch.to_dict("records")
+
+    def to_dataframe(self) -> Any:
+        """Materialize the remaining stream into a single DataFrame."""
+        import pandas as pd
+
+        frames = list(self.iter_batches())
+        if not frames:
+            return pd.DataFrame(columns=[col.name for col in self.columns])
+        if len(frames) == 1:
+            return frames[0].reset_index(drop=True)
+        return pd.concat(frames, ignore_index=True)
+
+    def close(self) -> None:
+        """Release producer resources (cursors, connections) without consuming."""
+        close = getattr(self._batches, "close", None)
+        if callable(close):
+            close()
+
+    @classmethod
+    def from_dataframe(cls, df: Any, batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> "RowStream":
+        """Wrap an in-memory DataFrame as a stream of ``batch_size`` row slices."""
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+        def _slices() -> Iterator[Any]:
+            for start in range(0, len(df), batch_size):
+                yield df.iloc[start : start + batch_size]
+
+        columns = [ColumnSchema(name=str(col), type=str(dtype)) for col, dtype in df.dtypes.items()]
+        return cls(_slices(), columns=columns, estimated_row_count=len(df))
+
+
+def is_tabular_input(value: Any) -> bool:
+    """Return True if value is a DataFrame or RowStream handed over between steps."""
+    if isinstance(value, RowStream):
+        return True
+    try:
+        import pandas as pd
+    except ImportError:  # pragma: no cover - pandas optional in runtime
+        return False
+    return isinstance(value, pd.DataFrame)
+
+
+def streaming_requested(ctx: Any) -> bool:
+    """Return True if the runner asked the driver to return a RowStream instead of a DataFrame.
+
+    Runners set ``ctx.streaming = True`` only when every consumer of the step can read a
+    RowStream; contexts without the attribute (e.g. the E2B ProxyWorker) get DataFrames.
+    """
+    # Identity check so permissive test doubles (e.g. MagicMock) do not opt in implicitly
+    return getattr(ctx, "streaming", False) is True
+
+
 @dataclass
 class DriverRegistrationSummary:
     """Summary of driver registry population from component specifications."""
@@ -0,0 +1,162 @@
+"""Run-scoped DuckDB database shared by consecutive ``duckdb.processor`` steps.
+
+Without a session every DuckDB step opens its own ``:memory:`` database, registers
+its pandas inputs and converts the result back to pandas with ``fetchdf()``. A
+chain of SQL transforms therefore round-trips through pandas at every hop.
+
+:class:`DuckDBSession` owns one in-memory database for the whole run. When a
+DuckDB step only feeds other DuckDB steps, the runner asks the driver to keep the
+result inside the session: the query is materialized into a table and the step
+output is a :class:`DuckDBTable` handle instead of a DataFrame. Downstream DuckDB
+steps read that table through a view, so no pandas conversion happens until a
+non-DuckDB consumer needs the data.
+
+Each step works on its own cursor (``connection.cursor()``), which is safe to use
+from the runner's worker threads; tables live in the shared ``main`` catalog.
+``threads`` and ``memory_limit`` bound the database, and ``temp_directory`` lets
+DuckDB spill operators and materialized tables to disk when the limit is reached.
+"""
+
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DUCKDB_THREADS_ENV = "OSIRIS_DUCKDB_THREADS"
+DUCKDB_MEMORY_LIMIT_ENV = "OSIRIS_DUCKDB_MEMORY_LIMIT"
+
+
+def threads_from_env(default: int | None = None) -> int | None:
+    """Return the DuckDB worker thread count from ``OSIRIS_DUCKDB_THREADS``."""
+    raw = os.getenv(DUCKDB_THREADS_ENV, "").strip()
+    if not raw:
+        return default
+    try:
+        threads = int(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {DUCKDB_THREADS_ENV}={raw!r}; expected a positive integer")
+        return default
+    if threads < 1:
+        logger.warning(f"Ignoring invalid {DUCKDB_THREADS_ENV}={raw!r}; expected a positive integer")
+        return default
+    return threads
+
+
+def memory_limit_from_env(default: str | None = None) -> str | None:
+    """Return the DuckDB memory limit (e.g. ``4GB``) from ``OSIRIS_DUCKDB_MEMORY_LIMIT``."""
+    return os.getenv(DUCKDB_MEMORY_LIMIT_ENV, "").strip() or default
+
+
+def quote_ident(name: str) -> str:
+    """Quote a DuckDB identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class DuckDBTable:
+    """Handle to a step output materialized as a table in a :class:`DuckDBSession`."""
+
+    def __init__(self, session: "DuckDBSession", name: str, row_count: int):
+        self.session = session
+        self.name = name
+        self.row_count = row_count
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __repr__(self) -> str:
+        return f"DuckDBTable(name={self.name!r}, rows={self.row_count})"
+
+    def to_dataframe(self) -> Any:
+        """Fetch the table into a pandas DataFrame."""
+        cursor = self.session.cursor()
+        try:
+            return cursor.execute(f"SELECT * FROM {quote_ident(self.name)}").fetchdf()
+        finally:
+            cursor.close()
+
+    def drop(self) -> None:
+        """Drop the table from the session (no-op if already dropped or the session is closed)."""
+        self.session.drop(self.name)
+
+
+class DuckDBSession:
+    """Lazily opened in-memory DuckDB database shared across the steps of one run."""
+
+    def __init__(
+        self,
+        *,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+        temp_directory: str | Path | None = None,
+    ):
+        """Initialize the session; the database is opened on first use.
+
+        Args:
+            threads: DuckDB worker threads (None = DuckDB default, all cores)
+            memory_limit: DuckDB memory limit such as ``"4GB"`` (None = DuckDB default)
+            temp_directory: Directory DuckDB spills to when exceeding ``memory_limit``
+        """
+        if threads is not None and threads < 1:
+            raise ValueError(f"threads must be >= 1, got {threads}")
+
+        self.threads = threads
+        self.memory_limit = memory_limit
+        self.temp_directory = Path(temp_directory) if temp_directory is not None else None
+        self._conn = None
+        self._closed = False
+        self._tables: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """DuckDB configuration passed to ``duckdb.connect``."""
+        config: dict[str, Any] = {}
+        if self.threads is not None:
+            config["threads"] = self.threads
+        if self.memory_limit:
+            config["memory_limit"] = self.memory_limit
+        if self.temp_directory is not None:
+            config["temp_directory"] = str(self.temp_directory)
+        return config
+
+    def cursor(self) -> Any:
+        """Return a new cursor on the shared database (one per step / thread)."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("DuckDB session is closed")
+            if self._conn is None:
+                import duckdb  # noqa: PLC0415 - only needed when a DuckDB step runs
+
+                self._conn = duckdb.connect(":memory:", config=self.config)
+                logger.debug(f"Opened run-scoped DuckDB session ({self.config or 'default settings'})")
+            return self._conn.cursor()
+
+    def materialize(self, step_id: str, cursor: Any, query: str) -> DuckDBTable:
+        """Run ``query`` on ``cursor`` and store its result as the output table of ``step_id``."""
+        name = f"_osiris_{step_id}"
+        cursor.execute(f"CREATE OR REPLACE TABLE {quote_ident(name)} AS {query}")
+        row_count = cursor.execute(f"SELECT count(*) FROM {quote_ident(name)}").fetchone()[0]
+        with self._lock:
+            self._tables.add(name)
+        return DuckDBTable(self, name, int(row_count))
+
+    def drop(self, name: str) -> None:
+        """Drop a materialized table."""
+        with self._lock:
+            if self._closed or name not in self._tables:
+                return
+            self._tables.discard(name)
+            self._conn.execute(f"DROP TABLE IF EXISTS {quote_ident(name)}")
+        logger.debug(f"Dropped DuckDB session table {name}")
+
+    def close(self) -> None:
+        """Close the database, discarding all materialized tables."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+            self._tables.clear()
+            self._closed = True
@@ -271,9 +271,11 @@ class FilesystemContract:
         return {
             "base": index_dir,
             "runs": index_dir / "runs.jsonl",
+            "runs_db": index_dir / "runs.sqlite",
             "by_pipeline": index_dir / "by_pipeline",
             "latest": index_dir / "latest",
             "counters": index_dir / "counters.sqlite",
+            "state": index_dir / "state.sqlite",
         }
 
     def ensure_dir(self, path: Path) -> Path:
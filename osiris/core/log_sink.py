@@ -0,0 +1,252 @@
+"""Buffered, asynchronous writer for session JSONL streams.
+
+:class:`JsonlSink` takes records (already redacted dicts) from any thread and
+hands them to a background writer thread through a bounded queue. The writer
+serializes each record to one JSON line and keeps one open append handle per
+stream (``events.jsonl``, ``metrics.jsonl``, ...). Encoded lines are batched per
+stream and written out when either policy triggers:
+
+* **size** - the buffered bytes reach ``flush_bytes`` (``0`` writes every record)
+* **time** - the oldest buffered record is ``flush_interval`` seconds old
+
+Every flush appends whole lines with one write per stream, so readers and other
+processes appending to the same file never observe a partial line.
+
+Records are never dropped: a full queue blocks the producer. A record the writer
+cannot serialize or write is reported on stderr and the writer keeps draining.
+:meth:`JsonlSink.flush` blocks until everything queued so far is on disk,
+:meth:`JsonlSink.close` drains and closes the handles (waiting at most
+``DEFAULT_CLOSE_TIMEOUT`` seconds), and sinks still open when the interpreter exits
+(including after an unhandled exception) are drained by an ``atexit`` hook.
+"""
+
+import atexit
+import json
+from pathlib import Path
+import queue
+import sys
+import threading
+import time
+from typing import Any
+
+DEFAULT_MAX_QUEUE = 10000
+DEFAULT_FLUSH_BYTES = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_CLOSE_TIMEOUT = 10.0
+
+_RECORD = "record"
+_FLUSH = "flush"
+_CLOSE = "close"
+
+
+def make_serializable(obj: Any) -> Any:
+    """Convert ``obj`` to JSON-compatible types, stringifying anything else."""
+    if isinstance(obj, dict):
+        return {k: make_serializable(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [make_serializable(item) for item in obj]
+    if isinstance(obj, str | int | float | bool) or obj is None:
+        return obj
+    return str(obj)
+
+
+def encode_record(record: dict[str, Any]) -> str:
+    """Encode ``record`` as one compact JSON line (including the newline)."""
+    return json.dumps(make_serializable(record), separators=(",", ":")) + "\n"
+
+
+class _Stream:
+    """Open append handle and pending lines for one JSONL file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.handle = open(path, "ab", buffering=0)  # noqa: SIM115 - kept open for the sink's lifetime
+        self.pending: list[bytes] = []
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        data = memoryview(b"".join(self.pending))
+        self.pending.clear()
+        while data:
+            data = data[self.handle.write(data) :]
+
+
+class JsonlSink:
+    """Background JSONL writer with one open handle per stream and size / time flush policies."""
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """Start the writer thread.
+
+        Args:
+            max_queue: Records that may wait for the writer before producers block
+            flush_bytes: Buffered bytes that trigger a write (0 = write every record)
+            flush_interval: Maximum seconds a record stays buffered
+        """
+        if max_queue < 1:
+            raise ValueError(f"max_queue must be >= 1, got {max_queue}")
+        if flush_bytes < 0 or flush_interval < 0:
+            raise ValueError("flush_bytes and flush_interval must be >= 0")
+
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # Writer-thread state
+        self._streams: dict[Path, _Stream] = {}
+        self._pending_bytes = 0
+        self._oldest_pending: float | None = None
+
+        self._thread = threading.Thread(target=self._run, name="osiris-log-sink", daemon=True)
+        self._thread.start()
+        _register(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, path: Path, record: dict[str, Any]) -> bool:
+        """Queue ``record`` for ``path``; blocks while the queue is full.
+
+        The record must not be mutated afterwards, it is serialized on the writer thread.
+
+        Returns:
+            False if the sink is closed and the caller has to write the record itself
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            self._queue.put((_RECORD, Path(path), record))
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every record queued before this call has been written.
+
+        Returns:
+            True if the drain completed within ``timeout``
+        """
+        with self._lock:
+            if self._closed or not self._thread.is_alive():
+                return True
+            done = threading.Event()
+            self._queue.put((_FLUSH, None, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = DEFAULT_CLOSE_TIMEOUT) -> bool:
+        """Drain all queued records, close the file handles and stop the writer thread.
+
+        Returns:
+            True if the writer thread finished within ``timeout``
+        """
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+            done = threading.Event()
+            self._queue.put((_CLOSE, None, done))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done.wait(timeout)
+        self._thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        _unregister(self)
+        return not self._thread.is_alive()
+
+    # Writer thread
+
+    def _run(self) -> None:
+        while True:
+            kind, payload = None, None
+            try:
+                timeout = None
+                if self._oldest_pending is not None:
+                    timeout = max(0.0, self._oldest_pending + self.flush_interval - time.monotonic())
+                try:
+                    kind, path, payload = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self._flush_streams()
+                    continue
+                self._handle(kind, path, payload)
+            except Exception as e:  # noqa: BLE001 - one failing record must not stop the drain
+                print(f"WARNING: Log sink writer error: {e}", file=sys.stderr)
+            finally:
+                if kind in (_FLUSH, _CLOSE):
+                    payload.set()
+            if kind == _CLOSE:
+                return
+
+    def _handle(self, kind: str, path: Path | None, payload: Any) -> None:
+        if kind == _RECORD:
+            self._buffer(path, payload)
+            if self._pending_bytes >= self.flush_bytes or self._interval_elapsed():
+                self._flush_streams()
+            return
+
+        try:
+            self._flush_streams()
+        finally:
+            if kind == _CLOSE:
+                for stream in self._streams.values():
+                    stream.handle.close()
+                self._streams.clear()
+
+    def _interval_elapsed(self) -> bool:
+        return self._oldest_pending is not None and time.monotonic() - self._oldest_pending >= self.flush_interval
+
+    def _buffer(self, path: Path, record: dict[str, Any]) -> None:
+        try:
+            line = encode_record(record).encode("utf-8")
+        except Exception as e:  # noqa: BLE001 - a bad record must not stop the writer thread
+            print(f"WARNING: Could not serialize record for {path.name}: {e}", file=sys.stderr)
+            return
+
+        stream = self._streams.get(path)
+        if stream is None:
+            try:
+                stream = self._streams[path] = _Stream(path)
+            except OSError as e:
+                print(f"WARNING: Could not write {path.name}: {e}", file=sys.stderr)
+                return
+
+        stream.pending.append(line)
+        self._pending_bytes += len(line)
+        if self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
+
+    def _flush_streams(self) -> None:
+        for stream in self._streams.values():
+            try:
+                stream.flush()
+            except OSError as e:
+                print(f"WARNING: Could not write {stream.path.name}: {e}", file=sys.stderr)
+        self._pending_bytes = 0
+        self._oldest_pending = None
+
+
+_open_sinks: set[JsonlSink] = set()
+_open_sinks_lock = threading.Lock()
+
+
+def _register(sink: JsonlSink) -> None:
+    with _open_sinks_lock:
+        _open_sinks.add(sink)
+
+
+def _unregister(sink: JsonlSink) -> None:
+    with _open_sinks_lock:
+        _open_sinks.discard(sink)
+
+
+@atexit.register
+def _drain_open_sinks() -> None:
+    """Write out whatever open sinks still hold when the interpreter exits."""
+    with _open_sinks_lock:
+        sinks = list(_open_sinks)
+    for sink in sinks:
+        sink.close(timeout=5.0)
@@ -12,12 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Advanced redaction system with configurable privacy levels."""
+"""Advanced redaction system with configurable privacy levels.
+
+Redaction runs on every event and metric, so :class:`Redactor` keeps a compiled
+plan: the decisions that depend only on a field name (secret, numeric metric,
+fingerprint, path, ...) are computed once per name and cached, relativized paths
+are cached per value, and values are first matched against the key-like formats
+(one combined token pattern plus the generic key pattern) so the exclusion
+heuristics only run for the rare candidates.
+"""
 
 import os
 from pathlib import Path
 import re
-from typing import Any
+from typing import Any, NamedTuple
 
 # Privacy levels
 PRIVACY_STANDARD = "standard"
@@ -88,6 +96,51 @@ KEY_PATTERN = re.compile(r"\b(?=.*[A-Z])(?=.*[a-z])(?=.*[0-9])[A-Za-z0-9_\-]{32,
 # Pattern for detecting absolute paths
 ABSOLUTE_PATH_PATTERN = re.compile(r"^(/[^/]+(?:/[^/]+)*|[A-Z]:\\[^\\]+(?:\\[^\\]+)*)$")
 
+# Known token formats: Slack (xoxp-, xoxb-, xoxa-, xoxr-), AWS access keys, GitHub (ghp_, ghs_, gho_, ...)
+TOKEN_PATTERN = re.compile(r"^(?:xox[pbar]-[\d\-a-zA-Z]+$|AKIA[A-Z0-9]{16}$|gh[pousr]_[A-Za-z0-9]{36,}$)")
+
+HEX_HASH_PATTERN = re.compile(r"^[a-fA-F0-9]{16,}$")
+FINGERPRINT_VALUE_PATTERN = re.compile(r"^[a-fA-F0-9]{32,64}$")
+SESSION_ID_PATTERN = re.compile(r"^\d{8}_\d{6}_[a-f0-9]{8}$")
+
+# Words that mark descriptive identifiers such as event names ("cache_hit", "run_start")
+IDENTIFIER_PARTS = (
+    "start",
+    "complete",
+    "error",
+    "validation",
+    "build",
+    "load",
+    "cache",
+    "context",
+    "request",
+    "response",
+    "init",
+    "end",
+)
+
+# Shortest string any key-like format can match (AWS access keys); Slack tokens can be shorter
+MIN_KEY_LENGTH = 20
+
+PATH_FIELDS = frozenset({"path", "file", "file_path", "dir", "directory", "out", "output"})
+LONG_TEXT_FIELDS = frozenset({"prompt", "message", "content", "text", "body"})
+# Cache keys and session/event identifiers are never masked
+PASSTHROUGH_FIELDS = frozenset({"key", "session", "session_id", "event", "event_type", "command"})
+
+# Bound for the per-redactor caches; cleared when exceeded
+MAX_CACHE_ENTRIES = 4096
+
+
+class _KeyPlan(NamedTuple):
+    """Redaction decisions that depend only on the field name."""
+
+    numeric: bool
+    secret: bool
+    fingerprint: bool
+    path: bool
+    long_text: bool
+    passthrough: bool
+
 
 class Redactor:
     """Configurable redaction system for sensitive data."""
@@ -101,6 +154,8 @@ class Redactor:
         """
         self.privacy_level = privacy_level
         self.repo_root = repo_root or self._find_repo_root()
+        self._key_plans: dict[Any, _KeyPlan] = {}
+        self._relative_paths: dict[str, str] = {}
 
     @staticmethod
     def _find_repo_root() -> Path:
@@ -176,7 +231,7 @@ class Redactor:
         if not isinstance(value, str) or len(value) < 16:
             return value
         # Check if it looks like a hash (hex characters)
-        if re.match(r"^[a-fA-F0-9]{16,}$", value):
+        if HEX_HASH_PATTERN.match(value):
             return f"{value[:8]}..."
         return value
 
@@ -189,6 +244,14 @@ class Redactor:
         if not ("/" in value or "\\" in value):
             return value
 
+        cached = self._relative_paths.get(value)
+        if cached is None:
+            if len(self._relative_paths) >= MAX_CACHE_ENTRIES:
+                self._relative_paths.clear()
+            cached = self._relative_paths[value] = self._relativize_absolute_path(value)
+        return cached
+
+    def _relativize_absolute_path(self, value: str) -> str:
         try:
             path = Path(value)
             if path.is_absolute():
@@ -213,50 +276,42 @@ class Redactor:
         if not isinstance(value, str):
             return False
 
+        # Only strings matching a known token format or the generic key pattern can be keys;
+        # the exclusions below all answer False, so they only need to run for those candidates
+        if len(value) < MIN_KEY_LENGTH and not value.startswith("xox"):
+            return False
+        if not (TOKEN_PATTERN.match(value) or KEY_PATTERN.match(value)):
+            return False
+
         # Skip if it's a known fingerprint (already handled)
-        if re.match(r"^[a-fA-F0-9]{32,64}$", value):
+        if FINGERPRINT_VALUE_PATTERN.match(value):
             return False
 
         # Skip common event names and identifiers
         # Event names typically have underscores and are descriptive
-        if "_" in value and any(
-            part in value.lower()
-            for part in [
-                "start",
-                "complete",
-                "error",
-                "validation",
-                "build",
-                "load",
-                "cache",
-                "context",
-                "request",
-                "response",
-                "init",
-                "end",
-            ]
-        ):
-            return False
+        if "_" in value:
+            value_lower = value.lower()
+            if any(part in value_lower for part in IDENTIFIER_PARTS):
+                return False
 
         # Skip session IDs (date_time_hash format)
-        if re.match(r"^\d{8}_\d{6}_[a-f0-9]{8}$", value):
-            return False
-
-        # Check for known token patterns
-        # Slack tokens (xoxp-, xoxb-, xoxa-, xoxr-)
-        if re.match(r"^xox[pbar]-[\d\-a-zA-Z]+$", value):
-            return True
-
-        # AWS access keys
-        if re.match(r"^AKIA[A-Z0-9]{16}$", value):
-            return True
-
-        # GitHub tokens (ghp_, ghs_, gho_, etc)
-        if re.match(r"^gh[pousr]_[A-Za-z0-9]{36,}$", value):
-            return True
-
-        # Check for generic key-like pattern (long mixed-case strings with numbers)
-        return bool(KEY_PATTERN.match(value))
+        return not SESSION_ID_PATTERN.match(value)
+
+    def _key_plan(self, key: Any) -> _KeyPlan:
+        """Return the cached redaction decisions for a field name."""
+        plan = self._key_plans.get(key)
+        if plan is None:
+            if len(self._key_plans) >= MAX_CACHE_ENTRIES:
+                self._key_plans.clear()
+            plan = self._key_plans[key] = _KeyPlan(
+                numeric=self._is_numeric_metric(key),
+                secret=self._is_secret_field(key),
+                fingerprint=self._is_fingerprint_field(key),
+                path=key in PATH_FIELDS,
+                long_text=key in LONG_TEXT_FIELDS,
+                passthrough=key in PASSTHROUGH_FIELDS,
+            )
+        return plan
 
     def redact_value(self, key: str, value: Any, parent_key: str | None = None) -> Any:  # noqa: ARG002
         """Redact a single value based on its key and content.
@@ -273,43 +328,38 @@ class Redactor:
         if value is None or isinstance(value, bool):
             return value
 
+        plan = self._key_plan(key)
+
         # Preserve numeric metrics FIRST (before checking for secrets)
-        if isinstance(value, int | float) and self._is_numeric_metric(key):
+        if plan.numeric and isinstance(value, int | float):
             return value
 
         # Check if field is a secret
-        if self._is_secret_field(key):
+        if plan.secret:
             return MASK_FULL
 
+        if not isinstance(value, str):
+            return value
+
         # Handle fingerprints
-        if self._is_fingerprint_field(key) and isinstance(value, str):
+        if plan.fingerprint:
             return self._shorten_fingerprint(value)
 
         # Handle paths
-        if key in ["path", "file", "file_path", "dir", "directory", "out", "output"] and isinstance(value, str):
+        if plan.path:
             value = self._relativize_path(value)
 
-        # Check for key-like values in string
-        if isinstance(value, str):
-            # In strict mode, mask long text fields and raw prompts
-            if (
-                self.privacy_level == PRIVACY_STRICT
-                and key in ["prompt", "message", "content", "text", "body"]
-                and len(value) > 256
-            ):
-                return f"{value[:50]}... [REDACTED - {len(value)} chars]"
+        # In strict mode, mask long text fields and raw prompts
+        if plan.long_text and self.privacy_level == PRIVACY_STRICT and len(value) > 256:
+            return f"{value[:50]}... [REDACTED - {len(value)} chars]"
 
-            # Special handling for cache keys and similar - don't mask them
-            if key == "key":
-                return value
-
-            # Special handling for session and event fields - don't mask their values
-            if key in ["session", "session_id", "event", "event_type", "command"]:
-                return value
+        # Cache keys, session and event fields are never masked
+        if plan.passthrough:
+            return value
 
-            # Check if value looks like a key (but not in certain contexts)
-            if self._looks_like_key(value) and not self._is_fingerprint_field(key):
-                return MASK_FULL
+        # Check if value looks like a key
+        if self._looks_like_key(value):
+            return MASK_FULL
 
         return value
 
@@ -331,11 +381,12 @@ class Redactor:
             if isinstance(value, dict):
                 redacted[key] = self.redact_dict(value, parent_key=key)
             elif isinstance(value, list):
+                item_key = f"{key}_item"
                 redacted[key] = [
                     (
                         self.redact_dict(item, parent_key=key)
                         if isinstance(item, dict)
-                        else self.redact_value(f"{key}_item", item, parent_key=key)
+                        else self.redact_value(item_key, item, parent_key=key)
                     )
                     for item in value
                 ]
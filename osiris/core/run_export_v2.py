@@ -16,7 +16,7 @@
 """PR2 - Evidence Layer implementation for AIOP."""
 
 import builtins
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 import contextlib
 import copy
 from datetime import datetime
@@ -24,8 +24,11 @@ from functools import lru_cache
 import gzip
 import io
 import json
+from operator import itemgetter
 from pathlib import Path
 import re
+import sqlite3
+from typing import Any
 
 
 def build_evidence_layer(
@@ -89,270 +92,45 @@ def generate_evidence_id(type: str, step_id: str, name: str, ts_ms: int) -> str:
     return f"ev.{type}.{name}.{step_or_run}.{ts_ms}"
 
 
-def build_timeline(events: list[dict], density: str = "medium") -> list[dict]:
+def build_timeline(events: Iterable[dict], density: str = "medium") -> list[dict]:
     """Build chronologically sorted timeline.
 
     Args:
-        events: List of event dictionaries
+        events: Event dictionaries (any iterable, consumed once)
         density: Timeline density level (low/medium/high)
 
     Returns:
         Chronologically sorted list of timeline events with evidence IDs
     """
+    allowed_types = _TIMELINE_DENSITY_TYPES.get(density)  # high density keeps all events
     timeline = []
-
     for event in events:
-        # Extract key fields - support both 'type' and 'event' fields
-        event_type = event.get("type", "") or event.get("event", "")
-        if not event_type:  # Skip events without type
-            continue
-
-        step_id = event.get("step_id", "")
-        timestamp = event.get("ts", "")
-
-        # Use event type directly if already canonical, otherwise map it
-        if event_type in [
-            "START",
-            "STEP_START",
-            "METRICS",
-            "STEP_COMPLETE",
-            "COMPLETE",
-            "ERROR",
-            "DEBUG",
-            "TRACE",
-        ]:
-            canonical_type = event_type
-        else:
-            canonical_type = _get_canonical_event_type(event_type)
-
-        # Generate evidence ID
-        ts_ms = _timestamp_to_ms(timestamp)
-        evidence_id = generate_evidence_id("event", step_id, event_type.lower(), ts_ms)
-
-        timeline.append(
-            {
-                "@id": evidence_id,
-                "ts": timestamp,
-                "type": canonical_type,
-                "step_id": step_id if step_id else None,
-                "data": _sanitize_event_data(event),
-            }
-        )
+        entry = _timeline_entry(event)
+        if entry is not None and (allowed_types is None or entry["type"] in allowed_types):
+            timeline.append(entry)
 
     # Sort chronologically
     timeline.sort(key=lambda x: x["ts"])
-
-    # Apply density filter
-    if density == "low":
-        # Keep only major events
-        major_types = ["START", "COMPLETE", "STEP_START", "STEP_COMPLETE", "ERROR"]
-        timeline = [e for e in timeline if e["type"] in major_types]
-    elif density == "medium":
-        # low + METRICS
-        allowed_types = ["START", "COMPLETE", "STEP_START", "STEP_COMPLETE", "ERROR", "METRICS"]
-        timeline = [e for e in timeline if e["type"] in allowed_types]
-    # high density keeps all events
-
     return timeline
 
 
-def aggregate_metrics(metrics: list[dict], topk: int = 100, events: list[dict] = None) -> dict:
+def aggregate_metrics(metrics: Iterable[dict], topk: int = 100, events: Iterable[dict] | None = None) -> dict:
     """Aggregate and prioritize metrics.
 
     Args:
-        metrics: List of metric dictionaries
+        metrics: Metric dictionaries (any iterable, consumed once)
         topk: Maximum number of step metrics to return
-        events: Optional list of event dictionaries (for calculating durations)
+        events: Optional event dictionaries (for calculating durations)
 
     Returns:
-        Dictionary with total_rows, total_duration_ms, steps, and rows_source.
-        If events provided, also includes durations.wall_ms and durations.active_ms
+        Dictionary with total_rows, total_duration_ms, active_duration_ms, steps, and rows_source
     """
-    # Track totals and per-step metrics
-    total_rows = 0
-    total_duration_ms = 0
-    active_duration_ms = 0
-    step_metrics = {}
-    rows_source = "calculated"  # Track how we determined total_rows
-
-    # Calculate total wall time from RUN_START/RUN_COMPLETE events
-    run_start_time = None
-    run_complete_time = None
-    step_timings = {}  # Track STEP_START/COMPLETE pairs
-    cleanup_total_rows = None  # Initialize here
-
-    # Process events for timing information
-    if events:
-        for event in events:
-            event_type = event.get("event_type") or event.get("event", "")
-            timestamp = event.get("timestamp", "")
-
-            # Track RUN_START/RUN_COMPLETE for wall time
-            if event_type == "RUN_START":
-                if timestamp:
-                    with contextlib.suppress(builtins.BaseException):
-                        run_start_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            elif event_type == "RUN_COMPLETE":
-                if timestamp:
-                    with contextlib.suppress(builtins.BaseException):
-                        run_complete_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-
-            # Track STEP_START/STEP_COMPLETE for active duration
-            elif event_type == "STEP_START":
-                step_id = event.get("step_id", "")
-                if step_id and timestamp:
-                    with contextlib.suppress(builtins.BaseException):
-                        step_timings[step_id] = {"start": datetime.fromisoformat(timestamp.replace("Z", "+00:00"))}
-            elif event_type == "STEP_COMPLETE":
-                step_id = event.get("step_id", "")
-                if step_id and timestamp and step_id in step_timings:
-                    try:
-                        end_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                        if "start" in step_timings[step_id]:
-                            duration = (end_time - step_timings[step_id]["start"]).total_seconds() * 1000
-                            step_timings[step_id]["duration_ms"] = int(duration)
-                    except Exception:
-                        pass
-
-            # Check for cleanup_complete event (highest authority for rows)
-            if event.get("event") == "cleanup_complete" and "total_rows" in event:
-                cleanup_total_rows = event["total_rows"]
-                rows_source = "cleanup_complete"
-
-    # Calculate wall time if we have both start and complete
-    if run_start_time and run_complete_time:
-        total_duration_ms = int((run_complete_time - run_start_time).total_seconds() * 1000)
-
-    # Track the last write operation's rows for total_rows
-    last_writer_rows = 0
-    export_step_rows = 0
-
+    aggregator = _MetricsAggregator()
+    for event in events or ():
+        aggregator.add_event(event)
     for metric in metrics:
-        step_id = metric.get("step_id", "")
-
-        # Handle direct field access (not nested under "metric")
-        rows_read = metric.get("rows_read", 0) if "rows_read" in metric else 0
-        rows_written = metric.get("rows_written", 0) if "rows_written" in metric else 0
-        rows_out = metric.get("rows_out", 0) if "rows_out" in metric else 0
-        duration_ms = metric.get("duration_ms", 0) if "duration_ms" in metric else 0
-
-        # Also handle nested under "metric" field for compatibility
-        name = metric.get("metric", "")
-        value = metric.get("value", 0)
-
-        if name == "rows_read":
-            rows_read = value
-        elif name == "rows_written":
-            rows_written = value
-        elif name == "rows_out":
-            rows_out = value
-        elif name == "duration_ms":
-            duration_ms = value
-
-        # Track export step and last writer for total_rows calculation
-        # Use the export step if present, otherwise the last writer
-        if step_id and "export" in step_id.lower() and rows_written > 0:
-            export_step_rows = rows_written
-        elif rows_written > 0:
-            last_writer_rows = rows_written
-        if isinstance(duration_ms, int | float) and duration_ms > 0:
-            total_duration_ms += duration_ms
-
-        # Aggregate per-step metrics
-        if step_id:
-            if step_id not in step_metrics:
-                step_metrics[step_id] = {
-                    "rows_read": None,
-                    "rows_written": None,
-                    "rows_out": None,
-                    "duration_ms": None,
-                }
-
-            # Update step metrics - sum if already present
-            if rows_read > 0:
-                if step_metrics[step_id]["rows_read"] is None:
-                    step_metrics[step_id]["rows_read"] = rows_read
-                else:
-                    step_metrics[step_id]["rows_read"] += rows_read
-            if rows_written > 0:
-                if step_metrics[step_id]["rows_written"] is None:
-                    step_metrics[step_id]["rows_written"] = rows_written
-                else:
-                    step_metrics[step_id]["rows_written"] += rows_written
-            if rows_out > 0:
-                if step_metrics[step_id]["rows_out"] is None:
-                    step_metrics[step_id]["rows_out"] = rows_out
-                else:
-                    step_metrics[step_id]["rows_out"] += rows_out
-            if duration_ms > 0:
-                if step_metrics[step_id]["duration_ms"] is None:
-                    step_metrics[step_id]["duration_ms"] = duration_ms
-                else:
-                    step_metrics[step_id]["duration_ms"] += duration_ms
-
-    # Merge duration data from events if not in metrics
-    for step_id, timing_data in step_timings.items():
-        if "duration_ms" in timing_data:
-            if step_id not in step_metrics:
-                step_metrics[step_id] = {
-                    "rows_read": None,
-                    "rows_written": None,
-                    "rows_out": None,
-                    "duration_ms": timing_data["duration_ms"],
-                }
-            elif step_metrics[step_id].get("duration_ms") is None:
-                # Use event-based duration if no metric duration
-                step_metrics[step_id]["duration_ms"] = timing_data["duration_ms"]
-
-    # Calculate active duration as sum of all step durations
-    active_duration_ms = 0
-    for step_data in step_metrics.values():
-        if step_data.get("duration_ms"):
-            active_duration_ms += step_data["duration_ms"]
-
-    # Sort steps by duration desc, then rows desc, then step_id asc
-    sorted_steps = sorted(
-        step_metrics.items(),
-        key=lambda x: (
-            -(x[1]["duration_ms"] or 0),
-            -((x[1]["rows_read"] or 0) + (x[1]["rows_written"] or 0) + (x[1]["rows_out"] or 0)),
-            x[0],
-        ),
-    )
-
-    # Apply topk limit to steps
-    limited_steps = dict(sorted_steps[:topk])
-
-    # Determine total_rows using deterministic rule:
-    # 1. Use cleanup_complete.total_rows if available (highest authority)
-    # 2. Otherwise use export step if present
-    # 3. Otherwise use last writer's rows
-    # 4. Otherwise sum all terminal writers (if no single last writer)
-    if cleanup_total_rows is not None:
-        total_rows = cleanup_total_rows
-        rows_source = "cleanup_complete"
-    elif export_step_rows > 0:
-        total_rows = export_step_rows
-        rows_source = "export_step"
-    elif last_writer_rows > 0:
-        total_rows = last_writer_rows
-        rows_source = "last_writer"
-    else:
-        # Sum rows_written from all steps (fallback)
-        total_rows = sum(
-            step.get("rows_written", 0)
-            for step in step_metrics.values()
-            if isinstance(step.get("rows_written"), int | float)
-        )
-        rows_source = "sum_writers"
-
-    return {
-        "total_rows": total_rows if total_rows > 0 else 0,
-        "total_duration_ms": total_duration_ms if total_duration_ms > 0 else 0,
-        "active_duration_ms": active_duration_ms if active_duration_ms > 0 else 0,
-        "steps": limited_steps,
-        "rows_source": rows_source,  # Track how we determined total_rows
-    }
+        aggregator.add_metric(metric)
+    return aggregator.result(topk)
 
 
 def canonicalize_json(data: dict) -> str:
@@ -399,6 +177,9 @@ def apply_truncation(data: dict, max_bytes: int) -> tuple[dict, bool]:
     Keep strategy: first_K + last_K for events, aggregates for metrics, refs for artifacts.
     Deterministic outcome; never break JSON-LD shape.
 
+    ``data`` is never modified: only the containers a step replaces are copied,
+    everything else is shared between ``data`` and the result.
+
     Args:
         data: Data dictionary to truncate
         max_bytes: Maximum size in bytes
@@ -406,180 +187,508 @@ def apply_truncation(data: dict, max_bytes: int) -> tuple[dict, bool]:
     Returns:
         Tuple of (truncated_data, was_truncated)
     """
-    # Check initial size
-    json_str = canonicalize_json(data)
-    current_size = len(json_str.encode("utf-8"))
+    return _truncate(data, max_bytes, _json_size(data))
+
+
+# Internal helper functions (not part of PR2 public API)
+
 
+# Timeline event types kept per density level ("high", like any other level, keeps everything)
+_TIMELINE_DENSITY_TYPES = {
+    "low": frozenset({"START", "COMPLETE", "STEP_START", "STEP_COMPLETE", "ERROR"}),
+    "medium": frozenset({"START", "COMPLETE", "STEP_START", "STEP_COMPLETE", "ERROR", "METRICS"}),
+}
+
+_CANONICAL_EVENT_TYPES = frozenset(
+    {"START", "STEP_START", "METRICS", "STEP_COMPLETE", "COMPLETE", "ERROR", "DEBUG", "TRACE"}
+)
+
+# Truncation never keeps more than the first and last 100 timeline events
+_TIMELINE_KEEP_MAX = 100
+
+# Nesting depth of the evidence sections (aiop -> "evidence" -> section) and of timeline items
+_SECTION_DEPTH = 2
+_TIMELINE_ITEM_DEPTH = 3
+
+# canonicalize_json without the indentation (key order does not change the size)
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ": "))
+
+
+def _timeline_entry(event: dict) -> dict | None:
+    """Build the timeline entry for one event (None for events without a type)."""
+    # Support both 'type' and 'event' fields
+    event_type = event.get("type", "") or event.get("event", "")
+    if not event_type:
+        return None
+
+    step_id = event.get("step_id", "")
+    timestamp = event.get("ts", "")
+
+    # Use event type directly if already canonical, otherwise map it
+    if event_type in _CANONICAL_EVENT_TYPES:
+        canonical_type = event_type
+    else:
+        canonical_type = _get_canonical_event_type(event_type)
+
+    ts_ms = _timestamp_to_ms(timestamp)
+    return {
+        "@id": generate_evidence_id("event", step_id, event_type.lower(), ts_ms),
+        "ts": timestamp,
+        "type": canonical_type,
+        "step_id": step_id if step_id else None,
+        "data": _sanitize_event_data(event),
+    }
+
+
+def _error_entry(event: dict) -> dict | None:
+    """Build the evidence error entry for an error event (None for other events)."""
+    if not ("error" in event.get("event", "").lower() or event.get("level") == "ERROR"):
+        return None
+
+    ts_ms = _timestamp_to_ms(event.get("ts", ""))
+    step_id = event.get("step_id", "")
+    return {
+        "@id": generate_evidence_id("event", step_id, "error", ts_ms),
+        "step_id": step_id if step_id else None,
+        "message": event.get("error", event.get("msg", "Unknown error")),
+        "severity": "error",
+        "ts": event.get("ts", ""),
+    }
+
+
+def _json_size(value: Any, depth: int = 0) -> int:
+    """Size in bytes of ``value`` as canonical JSON, nested ``depth`` levels deep in a document.
+
+    The C encoder produces the compact text (same separators, no indentation) and
+    the newline and indentation bytes are added from the shape of the containers,
+    which is exact and much faster than the pure-Python indenting encoder.
+    """
+    text = _COMPACT_ENCODER.encode(value)
+    size = len(text) if text.isascii() else len(text.encode("utf-8"))
+    return size + _indent_bytes(value, depth)
+
+
+def _indent_bytes(value: Any, level: int) -> int:
+    """Newline and indentation bytes canonical JSON puts inside a container at nesting ``level``."""
+    if isinstance(value, dict):
+        children = value.values()
+    elif isinstance(value, list | tuple):
+        children = value
+    else:
+        return 0
+    if not children:
+        return 0
+
+    # "\n" + indent before every child and before the closing bracket
+    size = len(children) * (2 * level + 3) + 2 * level + 1
+    for child in children:
+        if isinstance(child, dict | list | tuple):
+            size += _indent_bytes(child, level + 1)
+    return size
+
+
+def _truncation_keep_count(ratio: float) -> int:
+    """Number of first/last timeline events to keep for a size ``ratio`` over the limit."""
+    if ratio > 10:
+        return 5
+    if ratio > 5:
+        return 10
+    if ratio > 2:
+        return 20
+    if ratio > 1.5:
+        return 50
+    return _TIMELINE_KEEP_MAX
+
+
+class _TimelineWindow:
+    """Timeline entries of a run, reduced to its first and last events once over the size budget.
+
+    While the entries fit in ``budget`` bytes all of them are kept. Past that the
+    document is bound to be truncated, which never keeps more than the first and
+    last ``_TIMELINE_KEEP_MAX`` events, so only those are retained; the others are
+    counted (events and canonical JSON bytes) so the full document size stays known.
+    """
+
+    def __init__(self, budget: int):
+        self.count = 0
+        self.dropped_events = 0
+        self.dropped_bytes = 0
+        self._budget = budget
+        self._bytes = 0
+        self._bounded = False
+        # ((ts, arrival), entry, size): arrival keeps the order of equal timestamps stable
+        self._entries: list[tuple[tuple, dict, int]] = []
+
+    def add(self, entry: dict) -> None:
+        size = _json_size(entry, _TIMELINE_ITEM_DEPTH)
+        self._entries.append(((entry["ts"], self.count), entry, size))
+        self.count += 1
+
+        if not self._bounded:
+            # Each item is preceded by "\n" + indentation in the list
+            self._bytes += size + 2 * _TIMELINE_ITEM_DEPTH + 1
+            self._bounded = self._bytes > self._budget
+        elif len(self._entries) > 4 * _TIMELINE_KEEP_MAX:
+            self._prune()
+
+    def _prune(self) -> None:
+        self._entries.sort(key=itemgetter(0))
+        middle = self._entries[_TIMELINE_KEEP_MAX:-_TIMELINE_KEEP_MAX]
+        self.dropped_events += len(middle)
+        # A dropped item takes its "\n" + indentation and "," separator with it
+        self.dropped_bytes += sum(size + 2 * _TIMELINE_ITEM_DEPTH + 2 for _, _, size in middle)
+        del self._entries[_TIMELINE_KEEP_MAX:-_TIMELINE_KEEP_MAX]
+
+    def items(self) -> list[dict]:
+        """Chronologically sorted entries: all of them, or the first and last _TIMELINE_KEEP_MAX."""
+        if self._bounded and len(self._entries) > 2 * _TIMELINE_KEEP_MAX:
+            self._prune()
+        else:
+            self._entries.sort(key=itemgetter(0))
+        return [entry for _, entry, _ in self._entries]
+
+
+class _MetricsAggregator:
+    """Online form of aggregate_metrics, fed one event or metric at a time.
+
+    Only run/step timings and per-step sums are kept, so memory is bounded by the
+    number of steps rather than the number of records. Events are expected before
+    metrics, as the run wall time is the base the metric durations are added to.
+    """
+
+    def __init__(self) -> None:
+        self.step_metrics: dict[str, dict] = {}
+        self.step_timings: dict[str, dict] = {}  # Track STEP_START/COMPLETE pairs
+        self.run_start_time: datetime | None = None
+        self.run_complete_time: datetime | None = None
+        self.cleanup_total_rows = None
+        self.total_duration_ms = None
+        self.last_writer_rows = 0
+        self.export_step_rows = 0
+
+    def add_event(self, event: dict) -> None:
+        event_type = event.get("event_type") or event.get("event", "")
+        timestamp = event.get("timestamp", "")
+
+        # Track RUN_START/RUN_COMPLETE for wall time
+        if event_type == "RUN_START":
+            if timestamp:
+                with contextlib.suppress(builtins.BaseException):
+                    self.run_start_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        elif event_type == "RUN_COMPLETE":
+            if timestamp:
+                with contextlib.suppress(builtins.BaseException):
+                    self.run_complete_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+        # Track STEP_START/STEP_COMPLETE for active duration
+        elif event_type == "STEP_START":
+            step_id = event.get("step_id", "")
+            if step_id and timestamp:
+                with contextlib.suppress(builtins.BaseException):
+                    self.step_timings[step_id] = {"start": datetime.fromisoformat(timestamp.replace("Z", "+00:00"))}
+        elif event_type == "STEP_COMPLETE":
+            step_id = event.get("step_id", "")
+            if step_id and timestamp and step_id in self.step_timings:
+                try:
+                    end_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+                    if "start" in self.step_timings[step_id]:
+                        duration = (end_time - self.step_timings[step_id]["start"]).total_seconds() * 1000
+                        self.step_timings[step_id]["duration_ms"] = int(duration)
+                except Exception:
+                    pass
+
+        # Check for cleanup_complete event (highest authority for rows)
+        if event.get("event") == "cleanup_complete" and "total_rows" in event:
+            self.cleanup_total_rows = event["total_rows"]
+
+    def _wall_ms(self) -> int:
+        if self.run_start_time and self.run_complete_time:
+            return int((self.run_complete_time - self.run_start_time).total_seconds() * 1000)
+        return 0
+
+    def add_metric(self, metric: dict) -> None:
+        if self.total_duration_ms is None:
+            self.total_duration_ms = self._wall_ms()
+
+        step_id = metric.get("step_id", "")
+
+        # Handle direct field access (not nested under "metric")
+        rows_read = metric.get("rows_read", 0) if "rows_read" in metric else 0
+        rows_written = metric.get("rows_written", 0) if "rows_written" in metric else 0
+        rows_out = metric.get("rows_out", 0) if "rows_out" in metric else 0
+        duration_ms = metric.get("duration_ms", 0) if "duration_ms" in metric else 0
+
+        # Also handle nested under "metric" field for compatibility
+        name = metric.get("metric", "")
+        value = metric.get("value", 0)
+
+        if name == "rows_read":
+            rows_read = value
+        elif name == "rows_written":
+            rows_written = value
+        elif name == "rows_out":
+            rows_out = value
+        elif name == "duration_ms":
+            duration_ms = value
+
+        # Track export step and last writer for total_rows calculation
+        # Use the export step if present, otherwise the last writer
+        if step_id and "export" in step_id.lower() and rows_written > 0:
+            self.export_step_rows = rows_written
+        elif rows_written > 0:
+            self.last_writer_rows = rows_written
+        if isinstance(duration_ms, int | float) and duration_ms > 0:
+            self.total_duration_ms += duration_ms
+
+        # Aggregate per-step metrics - sum if already present
+        if step_id:
+            step = self.step_metrics.setdefault(
+                step_id, {"rows_read": None, "rows_written": None, "rows_out": None, "duration_ms": None}
+            )
+            for key, amount in (
+                ("rows_read", rows_read),
+                ("rows_written", rows_written),
+                ("rows_out", rows_out),
+                ("duration_ms", duration_ms),
+            ):
+                if amount > 0:
+                    step[key] = amount if step[key] is None else step[key] + amount
+
+    def result(self, topk: int) -> dict:
+        """Return the aggregated metrics with the top ``topk`` steps."""
+        total_duration_ms = self._wall_ms() if self.total_duration_ms is None else self.total_duration_ms
+        step_metrics = {step_id: dict(step) for step_id, step in self.step_metrics.items()}
+
+        # Merge duration data from events if not in metrics
+        for step_id, timing_data in self.step_timings.items():
+            if "duration_ms" in timing_data:
+                if step_id not in step_metrics:
+                    step_metrics[step_id] = {
+                        "rows_read": None,
+                        "rows_written": None,
+                        "rows_out": None,
+                        "duration_ms": timing_data["duration_ms"],
+                    }
+                elif step_metrics[step_id].get("duration_ms") is None:
+                    # Use event-based duration if no metric duration
+                    step_metrics[step_id]["duration_ms"] = timing_data["duration_ms"]
+
+        # Calculate active duration as sum of all step durations
+        active_duration_ms = 0
+        for step_data in step_metrics.values():
+            if step_data.get("duration_ms"):
+                active_duration_ms += step_data["duration_ms"]
+
+        # Sort steps by duration desc, then rows desc, then step_id asc
+        sorted_steps = sorted(
+            step_metrics.items(),
+            key=lambda x: (
+                -(x[1]["duration_ms"] or 0),
+                -((x[1]["rows_read"] or 0) + (x[1]["rows_written"] or 0) + (x[1]["rows_out"] or 0)),
+                x[0],
+            ),
+        )
+
+        # Determine total_rows using deterministic rule:
+        # 1. Use cleanup_complete.total_rows if available (highest authority)
+        # 2. Otherwise use export step if present
+        # 3. Otherwise use last writer's rows
+        # 4. Otherwise sum all terminal writers (if no single last writer)
+        if self.cleanup_total_rows is not None:
+            total_rows = self.cleanup_total_rows
+            rows_source = "cleanup_complete"
+        elif self.export_step_rows > 0:
+            total_rows = self.export_step_rows
+            rows_source = "export_step"
+        elif self.last_writer_rows > 0:
+            total_rows = self.last_writer_rows
+            rows_source = "last_writer"
+        else:
+            # Sum rows_written from all steps (fallback)
+            total_rows = sum(
+                step.get("rows_written", 0)
+                for step in step_metrics.values()
+                if isinstance(step.get("rows_written"), int | float)
+            )
+            rows_source = "sum_writers"
+
+        return {
+            "total_rows": total_rows if total_rows > 0 else 0,
+            "total_duration_ms": total_duration_ms if total_duration_ms > 0 else 0,
+            "active_duration_ms": active_duration_ms if active_duration_ms > 0 else 0,
+            "steps": dict(sorted_steps[:topk]),
+            "rows_source": rows_source,  # Track how we determined total_rows
+        }
+
+
+def _stream_evidence(
+    events: Iterable[dict], metrics: Iterable[dict], density: str, topk: int, max_bytes: int
+) -> tuple[_TimelineWindow, dict, list[dict]]:
+    """Redact events, then metrics, and fold them into the evidence sections in a single pass.
+
+    Returns:
+        Tuple of (timeline window, aggregated metrics, errors)
+    """
+    allowed_types = _TIMELINE_DENSITY_TYPES.get(density)
+    timeline = _TimelineWindow(max_bytes)
+    aggregator = _MetricsAggregator()
+    errors = []
+
+    for event in events:
+        event = redact_secrets(event)
+        entry = _timeline_entry(event)
+        if entry is not None and (allowed_types is None or entry["type"] in allowed_types):
+            timeline.add(entry)
+        aggregator.add_event(event)
+        error = _error_entry(event)
+        if error is not None:
+            errors.append(error)
+
+    for metric in metrics:
+        aggregator.add_metric(redact_secrets(metric))
+
+    return timeline, aggregator.result(topk), errors
+
+
+def _truncate(
+    data: dict, max_bytes: int, current_size: int, timeline_dropped: tuple[int, int] = (0, 0)
+) -> tuple[dict, bool]:
+    """apply_truncation for a document whose canonical size is already known.
+
+    The size is kept up to date from the sections each step replaces, so the
+    document is never re-serialized as a whole.
+
+    Args:
+        data: Data dictionary to truncate
+        max_bytes: Maximum size in bytes
+        current_size: Canonical JSON size of ``data`` in bytes, dropped timeline events included
+        timeline_dropped: (events, bytes) left out of ``data["evidence"]["timeline"]``, which
+            then holds only the first and last ``_TIMELINE_KEEP_MAX`` events (see _TimelineWindow)
+
+    Returns:
+        Tuple of (truncated_data, was_truncated)
+    """
     if current_size <= max_bytes:
         return data, False
 
-    # Make a copy to modify
-    result = copy.deepcopy(data)
+    result = dict(data)
+    evidence = None
+    if isinstance(result.get("evidence"), dict):
+        evidence = result["evidence"] = dict(result["evidence"])
     was_truncated = False
 
+    def replace(section: str, value: Any) -> None:
+        nonlocal current_size
+        current_size += _json_size(value, _SECTION_DEPTH) - _json_size(evidence[section], _SECTION_DEPTH)
+        evidence[section] = value
+
     # Determine how aggressive truncation should be
-    ratio = current_size / max_bytes
-    if ratio > 10:
-        keep_count = 5
-    elif ratio > 5:
-        keep_count = 10
-    elif ratio > 2:
-        keep_count = 20
-    elif ratio > 1.5:
-        keep_count = 50
-    else:
-        keep_count = 100
+    keep_count = _truncation_keep_count(current_size / max_bytes)
 
     # Handle evidence.timeline specifically
-    if "evidence" in result and "timeline" in result["evidence"]:
-        timeline = result["evidence"]["timeline"]
-
-        # If timeline is a list
-        if isinstance(timeline, list) and len(timeline) > keep_count * 2:
-            original_count = len(timeline)
-            # Keep first K and last K events
+    if evidence is not None and isinstance(evidence.get("timeline"), list):
+        timeline = evidence["timeline"]
+        original_count = len(timeline) + timeline_dropped[0]
+        if original_count > keep_count * 2:
+            # Keep first K and last K events, in object form with marker
             kept_events = timeline[:keep_count] + timeline[-keep_count:]
-
-            # Convert to object form with marker
-            result["evidence"]["timeline"] = {
-                "items": kept_events,
-                "truncated": True,
-                "dropped_events": original_count - len(kept_events),
-            }
+            current_size -= timeline_dropped[1]
+            replace(
+                "timeline",
+                {"items": kept_events, "truncated": True, "dropped_events": original_count - len(kept_events)},
+            )
             was_truncated = True
 
-    # Check size after timeline truncation
-    json_str = canonicalize_json(result)
-    current_size = len(json_str.encode("utf-8"))
-
     if current_size <= max_bytes:
         return result, was_truncated
 
     # Handle evidence.metrics
-    if "evidence" in result and "metrics" in result["evidence"]:
-        metrics = result["evidence"]["metrics"]
+    if evidence is not None and "metrics" in evidence:
+        metrics = evidence["metrics"]
 
         # Drop detailed step metrics if present
         if "steps" in metrics and len(metrics["steps"]) > 10:
             original_step_count = len(metrics["steps"])
             # Keep only top 10 steps (they're already sorted by priority)
-            step_items = list(metrics["steps"].items())[:10]
-            metrics["steps"] = dict(step_items)
+            metrics = {**metrics, "steps": dict(list(metrics["steps"].items())[:10])}
             metrics["truncated"] = True
             metrics["aggregates_only"] = True
             metrics["dropped_series"] = original_step_count - 10
+            replace("metrics", metrics)
             was_truncated = True
 
-        # Recheck size after initial metrics truncation
-        json_str = canonicalize_json(result)
-        current_size = len(json_str.encode("utf-8"))
-
         # If still too large, remove steps entirely
         if current_size > max_bytes and "steps" in metrics:
-            dropped_count = len(metrics.get("steps", {}))
-            del metrics["steps"]
+            metrics = dict(metrics)
+            dropped_count = len(metrics.pop("steps"))
             metrics["truncated"] = True
             metrics["aggregates_only"] = True
             metrics["dropped_series"] = dropped_count
+            replace("metrics", metrics)
             was_truncated = True
 
-    # Check size after metrics truncation
-    json_str = canonicalize_json(result)
-    current_size = len(json_str.encode("utf-8"))
-
     if current_size <= max_bytes:
         return result, was_truncated
 
-    # Handle evidence.artifacts
-    if "evidence" in result and "artifacts" in result["evidence"]:
-        artifacts = result["evidence"]["artifacts"]
-
-        # Convert to truncated form if it's a list
-        if isinstance(artifacts, list) and len(artifacts) > 10:
-            kept_artifacts = artifacts[:10]
-            result["evidence"]["artifacts"] = {
-                "files": kept_artifacts,
-                "truncated": True,
-                "content_omitted": True,
-            }
-            was_truncated = True
+    # Handle evidence.artifacts: convert to truncated form if it's a list
+    if evidence is not None and isinstance(evidence.get("artifacts"), list) and len(evidence["artifacts"]) > 10:
+        replace("artifacts", {"files": evidence["artifacts"][:10], "truncated": True, "content_omitted": True})
+        was_truncated = True
 
-    # Final size check - if still too large, apply more aggressive truncation
-    json_str = canonicalize_json(result)
-    current_size = len(json_str.encode("utf-8"))
+    # If still too large, apply more aggressive truncation until nothing changes
+    while current_size > max_bytes and evidence is not None:
+        previous_size = current_size
 
-    while current_size > max_bytes:
-        # More aggressive truncation for timeline
-        if "evidence" in result and "timeline" in result["evidence"]:
-            timeline = result["evidence"]["timeline"]
+        if "timeline" in evidence:
+            timeline = evidence["timeline"]
 
-            # First convert list to object if not already done
+            # First convert list to object if not already done, keeping very few items
             if isinstance(timeline, list):
-                # Convert to object form with aggressive truncation
-                original_count = len(timeline)
-                # Keep very few items when over limit
                 kept_items = timeline[:5] + timeline[-5:] if len(timeline) > 10 else timeline
-                result["evidence"]["timeline"] = {
-                    "items": kept_items,
-                    "truncated": True,
-                    "dropped_events": original_count - len(kept_items),
-                }
+                timeline = {"items": kept_items, "truncated": True, "dropped_events": len(timeline) - len(kept_items)}
                 was_truncated = True
-                timeline = result["evidence"]["timeline"]
 
             if isinstance(timeline, dict) and "items" in timeline:
+                timeline = dict(timeline)
                 items = timeline["items"]
                 if len(items) > 10:
                     # Progressively reduce items
                     timeline["items"] = items[:5] + items[-5:]
                     timeline["dropped_events"] = timeline.get("dropped_events", 0) + (len(items) - 10)
-                    was_truncated = True
                 elif len(items) > 2:
                     # Keep just first and last
                     timeline["items"] = [items[0], items[-1]]
                     timeline["dropped_events"] = timeline.get("dropped_events", 0) + (len(items) - 2)
-                    was_truncated = True
                 else:
                     # Remove all items
                     timeline["items"] = []
                     timeline["dropped_events"] = timeline.get("dropped_events", 0) + len(items)
                     timeline["all_dropped"] = True
-                    was_truncated = True
+                was_truncated = True
 
-        # Handle artifacts - convert to object form if needed
-        if "evidence" in result and "artifacts" in result["evidence"]:
-            artifacts = result["evidence"]["artifacts"]
+            if timeline is not evidence["timeline"]:
+                replace("timeline", timeline)
 
-            # Convert list to object if still a list
+        # Handle artifacts - convert to object form if needed
+        if "artifacts" in evidence:
+            artifacts = evidence["artifacts"]
             if isinstance(artifacts, list) or isinstance(artifacts, dict) and artifacts.get("files"):
-                result["evidence"]["artifacts"] = {
-                    "files": [],
-                    "truncated": True,
-                    "content_omitted": True,
-                    "all_dropped": True,
-                }
+                replace("artifacts", {"files": [], "truncated": True, "content_omitted": True, "all_dropped": True})
                 was_truncated = True
 
         # Remove errors if present and still too large
-        if "evidence" in result and "errors" in result["evidence"] and result["evidence"]["errors"]:
-            result["evidence"]["errors"] = []
+        if evidence.get("errors"):
+            replace("errors", [])
             was_truncated = True
 
-        # Recheck size
-        json_str = canonicalize_json(result)
-        new_size = len(json_str.encode("utf-8"))
-
-        # If we didn't make progress, break to avoid infinite loop
-        if new_size >= current_size:
+        # If we didn't make progress, stop to avoid an infinite loop
+        if current_size >= previous_size:
             break
-        current_size = new_size
 
     return result, was_truncated
 
 
-# Internal helper functions (not part of PR2 public API)
-
-
+@lru_cache(maxsize=4096)
 def _sanitize_id_component(text: str) -> str:
     """Sanitize text for use in evidence IDs.
 
@@ -611,43 +720,22 @@ def _timestamp_to_ms(timestamp: str) -> int:
 
 def _sanitize_event_data(event: dict) -> dict:
     """Remove sensitive and redundant fields from event data."""
+    return {key: value for key, value in event.items() if not _is_omitted_event_field(key)}
+
+
+@lru_cache(maxsize=4096)
+def _is_omitted_event_field(key: str) -> bool:
+    """Whether an event field is left out of timeline data."""
     sensitive_fields = ["password", "token", "key", "secret", "credential"]
     redundant_fields = ["ts", "session", "event"]
 
-    sanitized = {}
-    for key, value in event.items():
-        # Skip sensitive fields
-        if any(s in key.lower() for s in sensitive_fields):
-            continue
-        # Skip redundant fields
-        if key in redundant_fields:
-            continue
-        sanitized[key] = value
-
-    return sanitized
+    # Skip sensitive fields and redundant fields
+    return any(s in key.lower() for s in sensitive_fields) or key in redundant_fields
 
 
-def _extract_errors(events: list[dict]) -> list[dict]:
+def _extract_errors(events: Iterable[dict]) -> list[dict]:
     """Extract error events from event list."""
-    errors = []
-
-    for event in events:
-        if "error" in event.get("event", "").lower() or event.get("level") == "ERROR":
-            ts_ms = _timestamp_to_ms(event.get("ts", ""))
-            step_id = event.get("step_id", "")
-            evidence_id = generate_evidence_id("event", step_id, "error", ts_ms)
-
-            errors.append(
-                {
-                    "@id": evidence_id,
-                    "step_id": step_id if step_id else None,
-                    "message": event.get("error", event.get("msg", "Unknown error")),
-                    "severity": "error",
-                    "ts": event.get("ts", ""),
-                }
-            )
-
-    return errors
+    return [error for error in map(_error_entry, events) if error is not None]
 
 
 def _build_artifact_list(artifacts: list[Path]) -> list[dict]:
@@ -1385,6 +1473,63 @@ def build_narrative_layer(
 # ============================================================================
 
 
+# Denylist of secret field names (case-insensitive)
+# These are checked for exact matches or as suffixes (e.g., "user_password")
+_SECRET_FIELD_PATTERNS = frozenset(
+    {
+        "password",
+        "token",
+        "api_key",
+        "secret",
+        "authorization",
+        "private_key",
+        "auth_token",
+        "access_token",
+        "refresh_token",
+        "bearer_token",
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_secret_field(field_name: str) -> bool:
+    """Check if field name contains secret patterns."""
+    field_lower = field_name.lower()
+
+    # Special handling for "key" - only match if it's part of a compound word
+    if field_lower == "key":
+        return False  # Plain 'key' is not a secret
+
+    # Special negative cases - field names that should NOT be treated as secrets
+    # even though they contain secret patterns
+    safe_fields = {
+        "no_password",
+        "without_password",
+        "skip_password",
+        "ignore_password",
+        "has_password",
+        "use_password",
+        "password_required",
+        "password_field",
+        "password_column",
+    }
+    if field_lower in safe_fields:
+        return False
+
+    # Check for exact matches or if pattern is in the field name
+    for pattern in _SECRET_FIELD_PATTERNS:
+        if pattern in field_lower:
+            # Special case: 'secret' should match 'secret_key' but not 'secrets'
+            if pattern == "secret" and field_lower == "secrets":
+                continue
+            return True
+
+    # Also check for common suffixes with underscore or camelCase
+    if field_lower.endswith("_key") or field_lower.endswith("_secret"):
+        return True
+    return "Key" in field_name and (field_name.endswith("Key") or "ApiKey" in field_name or "SecretKey" in field_name)
+
+
 def redact_secrets(data: dict) -> dict:
     """Recursively redact secret fields in-place (returns sanitized copy).
 
@@ -1399,59 +1544,6 @@ def redact_secrets(data: dict) -> dict:
     Returns:
         Sanitized copy with secrets redacted
     """
-    # Denylist of secret field names (case-insensitive)
-    # These are checked for exact matches or as suffixes (e.g., "user_password")
-    secret_patterns = {
-        "password",
-        "token",
-        "api_key",
-        "secret",
-        "authorization",
-        "private_key",
-        "auth_token",
-        "access_token",
-        "refresh_token",
-        "bearer_token",
-    }
-
-    def _is_secret_field(field_name: str) -> bool:
-        """Check if field name contains secret patterns."""
-        field_lower = field_name.lower()
-
-        # Special handling for "key" - only match if it's part of a compound word
-        if field_lower == "key":
-            return False  # Plain 'key' is not a secret
-
-        # Special negative cases - field names that should NOT be treated as secrets
-        # even though they contain secret patterns
-        safe_fields = {
-            "no_password",
-            "without_password",
-            "skip_password",
-            "ignore_password",
-            "has_password",
-            "use_password",
-            "password_required",
-            "password_field",
-            "password_column",
-        }
-        if field_lower in safe_fields:
-            return False
-
-        # Check for exact matches or if pattern is in the field name
-        for pattern in secret_patterns:
-            if pattern in field_lower:
-                # Special case: 'secret' should match 'secret_key' but not 'secrets'
-                if pattern == "secret" and field_lower == "secrets":
-                    continue
-                return True
-
-        # Also check for common suffixes with underscore or camelCase
-        if field_lower.endswith("_key") or field_lower.endswith("_secret"):
-            return True
-        return "Key" in field_name and (
-            field_name.endswith("Key") or "ApiKey" in field_name or "SecretKey" in field_name
-        )
 
     def _redact_connection_string(value: str) -> str:
         """Redact credentials from connection strings and query parameters."""
@@ -1495,8 +1587,11 @@ def redact_secrets(data: dict) -> dict:
             if "://" in value:
                 return _redact_connection_string(value)
             return value
-        else:
+        elif value is None or isinstance(value, int | float):
             return value
+        else:
+            # Other objects (tuples, sets, ...) are copied as they are
+            return copy.deepcopy(value)
 
     def _redact_dict(d: dict) -> dict:
         """Recursively redact dictionary."""
@@ -1515,15 +1610,13 @@ def redact_secrets(data: dict) -> dict:
                 result[key] = _redact_value(value)
         return result
 
-    # Make a deep copy and handle different input types
-    data_copy = copy.deepcopy(data)
-
-    if isinstance(data_copy, dict):
-        return _redact_dict(data_copy)
-    elif isinstance(data_copy, list):
-        return [_redact_value(item) for item in data_copy]
+    # Dicts and lists are rebuilt by the traversal, so the input is never shared or modified
+    if isinstance(data, dict):
+        return _redact_dict(data)
+    elif isinstance(data, list):
+        return [_redact_value(item) for item in data]
     else:
-        return data_copy
+        return copy.deepcopy(data)
 
 
 def export_annex_shards(
@@ -2075,6 +2168,18 @@ def _find_previous_run_by_manifest(
     by_pipeline_dir = config.get("index", {}).get("by_pipeline_dir", "aiop/index/by_pipeline")
     index_path = Path(by_pipeline_dir) / f"{manifest_hash}.jsonl"
 
+    # Indexed lookup in the SQLite copy of runs.jsonl (holds the same records as by_pipeline/)
+    runs_jsonl = Path(config.get("index", {}).get("runs_jsonl", "aiop/index/runs.jsonl"))
+    if index_path.exists() and runs_jsonl.exists():
+        from osiris.core.run_index import RunIndexStore
+
+        store = RunIndexStore(runs_jsonl.with_suffix(".sqlite"), runs_jsonl, ts_fields=("started_at", "ended_at"))
+        try:
+            store.sync()
+            return store.latest_run(manifest_hash, ("completed", "success"), exclude_session_id=current_session_id)
+        except (sqlite3.Error, OSError):
+            pass  # Fall back to scanning the JSONL index
+
     # Try legacy location as fallback for backward compatibility
     if not index_path.exists():
         legacy_path = Path("logs/aiop/index/by_pipeline") / f"{manifest_hash}.jsonl"
@@ -2113,8 +2218,8 @@ def _find_previous_run_by_manifest(
 def build_aiop(
     session_data: dict,
     manifest: dict,
-    events: list[dict],
-    metrics: list[dict],
+    events: Iterable[dict],
+    metrics: Iterable[dict],
     artifacts: list,
     config: dict,
     show_progress: bool = False,
@@ -2130,11 +2235,16 @@ def build_aiop(
     - enforce size with apply_truncation; if truncated, set metadata.truncated=true
     - return the final dict (Core) and optionally annex manifest info if used.
 
+    Events and metrics are consumed in a single pass and never held as a whole:
+    metrics are aggregated as they arrive, and once the timeline outgrows
+    max_core_bytes only its first and last events are kept (truncation keeps no
+    more), with the size of the rest accounted for as the document is built.
+
     Args:
         session_data: Session information (session_id, started_at, etc.)
         manifest: Pipeline manifest
-        events: List of event dictionaries
-        metrics: List of metric dictionaries
+        events: Event dictionaries, e.g. streamed from events.jsonl (consumed once)
+        metrics: Metric dictionaries, e.g. streamed from metrics.jsonl (consumed once)
         artifacts: List of artifact paths or dicts
         config: Configuration dictionary with max_core_bytes, timeline_density, etc.
         show_progress: Whether to show progress indicators
@@ -2163,17 +2273,15 @@ def build_aiop(
         with progress:
             task_id = progress.add_task("Redacting secrets...", total=None)
             # Redact secrets from all inputs first
+            # (events and metrics are redacted one by one as they stream into the evidence layer)
             session_data = redact_secrets(session_data)
             manifest = redact_secrets(manifest)
-            events = [redact_secrets(event) for event in events]
-            metrics = [redact_secrets(metric) for metric in metrics]
             progress.update(task_id, description="Secrets redacted")
     else:
         # Redact secrets from all inputs first
+        # (events and metrics are redacted one by one as they stream into the evidence layer)
         session_data = redact_secrets(session_data)
         manifest = redact_secrets(manifest)
-        events = [redact_secrets(event) for event in events]
-        metrics = [redact_secrets(metric) for metric in metrics]
 
     # Convert artifact paths to Path objects if needed
     artifact_paths = []
@@ -2199,9 +2307,10 @@ def build_aiop(
         with progress:
             # Build evidence layer (PR2)
             task_id = progress.add_task("Building evidence layer...", total=None)
-            timeline = build_timeline(events, density=timeline_density)
-            aggregated_metrics = aggregate_metrics(metrics, topk=metrics_topk, events=events)
-            errors = _extract_errors(events)
+            timeline_window, aggregated_metrics, errors = _stream_evidence(
+                events, metrics, timeline_density, metrics_topk, max_bytes
+            )
+            timeline = timeline_window.items()
             artifact_list = _build_artifact_list(artifact_paths)
 
             evidence = {
@@ -2272,9 +2381,10 @@ def build_aiop(
             progress.update(task_id, description="Narrative layer complete")
     else:
         # Build evidence layer (PR2)
-        timeline = build_timeline(events, density=timeline_density)
-        aggregated_metrics = aggregate_metrics(metrics, topk=metrics_topk, events=events)
-        errors = _extract_errors(events)
+        timeline_window, aggregated_metrics, errors = _stream_evidence(
+            events, metrics, timeline_density, metrics_topk, max_bytes
+        )
+        timeline = timeline_window.items()
         artifact_list = _build_artifact_list(artifact_paths)
 
         evidence = {
@@ -2376,7 +2486,7 @@ def build_aiop(
                 "total_rows": aggregated_metrics.get("total_rows", 0),
             },
             "size_hints": {
-                "timeline_events": len(timeline),
+                "timeline_events": timeline_window.count,
                 "metrics_steps": len(aggregated_metrics.get("steps", {})),
                 "artifacts": len(artifact_list),
                 "max_core_bytes": config.get("max_core_bytes", 300000),
@@ -2392,15 +2502,19 @@ def build_aiop(
     aiop["metadata"]["llm_primer"] = _build_llm_primer()
     aiop["controls"] = _build_controls(session_id)
 
-    # Apply truncation if needed
-    truncated_aiop, was_truncated = apply_truncation(aiop, max_bytes)
+    # Apply truncation if needed; events the timeline window left out still count towards the size
+    truncated_aiop, was_truncated = _truncate(
+        aiop,
+        max_bytes,
+        _json_size(aiop) + timeline_window.dropped_bytes,
+        (timeline_window.dropped_events, timeline_window.dropped_bytes),
+    )
 
     if was_truncated:
         truncated_aiop["metadata"]["truncated"] = True
 
     # Calculate final size
-    final_json = canonicalize_json(truncated_aiop)
-    truncated_aiop["metadata"]["size_bytes"] = len(final_json.encode("utf-8"))
+    truncated_aiop["metadata"]["size_bytes"] = _json_size(truncated_aiop)
 
     return truncated_aiop
 
@@ -12,16 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Run index management for tracking pipeline executions (ADR-0028)."""
-
+"""Run index management for tracking pipeline executions (ADR-0028).
+
+``runs.jsonl`` (plus ``by_pipeline/<slug>.jsonl``) stays the append-only record
+of runs and the export format. Lookups go through :class:`RunIndexStore`, a
+SQLite copy of ``runs.jsonl`` with indexes on run_id, pipeline_slug,
+manifest_hash and run_ts. The store imports the lines appended since its last
+sync (tracked as a byte offset), so it also picks up runs written by tools that
+only append to the JSONL file, and is rebuilt from scratch when the JSONL file
+is replaced or truncated.
+"""
+
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 import fcntl
 import json
+import logging
 import os
 from pathlib import Path
+import sqlite3
+import threading
 from typing import Any
 
+from .sqlite_store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+RUNS_DB_FILENAME = "runs.sqlite"
+
 
 @dataclass
 class RunRecord:
@@ -49,6 +68,216 @@ class RunRecord:
         return asdict(self)
 
 
+class RunIndexStore(SQLiteStore):
+    """SQLite copy of a runs JSONL file, synced incrementally by byte offset."""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS runs (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT,
+            session_id TEXT,
+            pipeline_slug TEXT,
+            profile TEXT,
+            manifest_hash TEXT,
+            status TEXT,
+            run_ts TEXT NOT NULL,
+            tags TEXT NOT NULL,
+            record TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_runs_run_id ON runs (run_id)",
+        "CREATE INDEX IF NOT EXISTS idx_runs_pipeline ON runs (pipeline_slug, seq)",
+        "CREATE INDEX IF NOT EXISTS idx_runs_manifest ON runs (manifest_hash, run_ts)",
+        "CREATE INDEX IF NOT EXISTS idx_runs_run_ts ON runs (run_ts)",
+        """
+        CREATE TABLE IF NOT EXISTS sync_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """,
+    )
+
+    def __init__(self, db_path: Path, source_jsonl: Path, ts_fields: tuple[str, ...] = ("run_ts",)):
+        """Initialize the store (the database is created on first use).
+
+        Args:
+            db_path: Path to the SQLite database
+            source_jsonl: JSONL file the store mirrors
+            ts_fields: Record fields used as the run timestamp (first non-empty wins)
+        """
+        super().__init__(db_path)
+        self.source_jsonl = Path(source_jsonl)
+        self.ts_fields = ts_fields
+
+    def sync(self) -> int:
+        """Import the complete lines appended to the JSONL file since the last sync.
+
+        Returns:
+            Number of records imported
+        """
+        conn = self._connect()
+        try:
+            # Cheap check without the write lock: nothing appended since the last sync
+            if self._read_state(conn) == self._source_state():
+                return 0
+
+            conn.execute("BEGIN IMMEDIATE")
+            # Stat again under the lock so a concurrent sync that replaced the file is not undone
+            source_state = self._source_state()
+            offset, inode = self._read_state(conn)
+            if inode != source_state[1] or source_state[0] < offset:
+                # Replaced or truncated: start over
+                conn.execute("DELETE FROM runs")
+                offset = 0
+
+            rows = []
+            if source_state[0] > offset:
+                with open(self.source_jsonl, "rb") as f:
+                    f.seek(offset)
+                    data = f.read()
+                # A line still being written is picked up by the next sync
+                end = data.rfind(b"\n") + 1
+                for line in data[:end].splitlines():
+                    if not line.strip():
+                        continue
+                    try:
+                        rows.append(self._row(json.loads(line)))
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping malformed line in {self.source_jsonl}")
+                offset += end
+
+            conn.executemany(
+                """
+                INSERT INTO runs (run_id, session_id, pipeline_slug, profile, manifest_hash, status, run_ts, tags, record)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                [("offset", str(offset)), ("inode", source_state[1])],
+            )
+            conn.commit()
+            return len(rows)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def rebuild(self) -> int:
+        """Drop the copy and re-import the whole JSONL file.
+
+        Returns:
+            Number of records imported
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM runs")
+            conn.execute("DELETE FROM sync_state")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return self.sync()
+
+    def iter_records(
+        self,
+        *,
+        run_id: str | None = None,
+        pipeline_slug: str | None = None,
+        profile: str | None = None,
+        tag: str | None = None,
+        run_ts_from: str | None = None,
+        newest_first: bool = True,
+    ) -> Iterator[tuple[str, str]]:
+        """Yield ``(run_ts, record_json)`` of matching runs in append order.
+
+        Records are returned as JSON text so callers only decode the ones they keep.
+        ``run_ts_from`` keeps runs whose ``run_ts`` text sorts at or after it (or is
+        empty) and is answered from ``idx_runs_run_ts`` unless a run ID or pipeline
+        index applies.
+        """
+        clauses, params = [], []
+        for column, value in (("run_id", run_id), ("pipeline_slug", pipeline_slug), ("profile", profile)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if tag:
+            clauses.append("EXISTS (SELECT 1 FROM json_each(runs.tags) WHERE json_each.value = ?)")
+            params.append(tag)
+        if run_ts_from:
+            clauses.append("(run_ts >= ? OR run_ts = '')")
+            params.append(run_ts_from)
+
+        sql = "SELECT run_ts, record FROM runs"
+        if run_ts_from and not (run_id or pipeline_slug):
+            # A one-sided range looks unselective to the planner, which would rather scan in seq order
+            sql += " INDEXED BY idx_runs_run_ts"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY seq {'DESC' if newest_first else 'ASC'}"
+
+        conn = self._connect()
+        try:
+            yield from conn.execute(sql, params)
+        finally:
+            conn.close()
+
+    def latest_run(
+        self, manifest_hash: str, statuses: tuple[str, ...], exclude_session_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Return the run with the newest timestamp for a manifest hash (earliest appended on ties).
+
+        Args:
+            manifest_hash: Manifest hash to look up
+            statuses: Accepted run statuses
+            exclude_session_id: Session whose runs are skipped
+        """
+        sql = f"SELECT record FROM runs WHERE manifest_hash = ? AND status IN ({', '.join('?' for _ in statuses)})"
+        params: list[Any] = [manifest_hash, *statuses]
+        if exclude_session_id:
+            sql += " AND session_id IS NOT ?"
+            params.append(exclude_session_id)
+        sql += " ORDER BY run_ts DESC, seq ASC LIMIT 1"
+
+        conn = self._connect()
+        try:
+            row = conn.execute(sql, params).fetchone()
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
+
+    def _source_state(self) -> tuple[int, str]:
+        try:
+            stat = self.source_jsonl.stat()
+        except FileNotFoundError:
+            return (0, "")
+        return (stat.st_size, str(stat.st_ino))
+
+    def _read_state(self, conn: sqlite3.Connection) -> tuple[int, str]:
+        state = dict(conn.execute("SELECT key, value FROM sync_state"))
+        return int(state.get("offset", 0)), state.get("inode", "")
+
+    def _row(self, record: dict[str, Any]) -> tuple:
+        run_ts = next((record[name] for name in self.ts_fields if record.get(name)), "")
+        return (
+            record.get("run_id"),
+            record.get("session_id"),
+            record.get("pipeline_slug"),
+            record.get("profile"),
+            record.get("manifest_hash"),
+            record.get("status"),
+            str(run_ts),
+            json.dumps(record.get("tags") or []),
+            json.dumps(record, separators=(",", ":")),
+        )
+
+
 class RunIndexWriter:
     """Thread-safe and process-safe writer for run indexes."""
 
@@ -64,6 +293,7 @@ class RunIndexWriter:
         self.runs_jsonl = index_dir / "runs.jsonl"
         self.by_pipeline_dir = index_dir / "by_pipeline"
         self.latest_dir = index_dir / "latest"
+        self.store = RunIndexStore(index_dir / RUNS_DB_FILENAME, self.runs_jsonl)
 
         self.by_pipeline_dir.mkdir(parents=True, exist_ok=True)
         self.latest_dir.mkdir(parents=True, exist_ok=True)
@@ -75,6 +305,7 @@ class RunIndexWriter:
         - .osiris/index/runs.jsonl (all runs)
         - .osiris/index/by_pipeline/<slug>.jsonl (per-pipeline)
         - .osiris/index/latest/<slug>.txt (latest manifest pointer)
+        - .osiris/index/runs.sqlite (synced from runs.jsonl)
 
         Args:
             record: Run record to append
@@ -93,6 +324,12 @@ class RunIndexWriter:
         pipeline_index = self.by_pipeline_dir / f"{record.pipeline_slug}.jsonl"
         self._append_jsonl(pipeline_index, record.to_dict())
 
+        # Sync the SQLite copy; runs.jsonl is the record, readers catch up if this fails
+        try:
+            self.store.sync()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not update run index database: {e}")
+
         # Update latest pointer
         self._update_latest_pointer(
             record.pipeline_slug, record.build_manifest_path, record.manifest_hash, record.profile
@@ -150,18 +387,22 @@ class RunIndexWriter:
         """
         latest_file = self.latest_dir / f"{pipeline_slug}.txt"
 
-        # Write atomically using temp file
-        temp_file = latest_file.with_suffix(".tmp")
+        # Write atomically using a temp file unique to this writer (concurrent runs update the same pointer)
+        temp_file = latest_file.with_name(f".{latest_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
 
-        with open(temp_file, "w") as f:
-            f.write(f"{manifest_path}\n")
-            f.write(f"{manifest_hash}\n")
-            f.write(f"{profile}\n")
-            f.flush()
-            os.fsync(f.fileno())
+        try:
+            with open(temp_file, "w") as f:
+                f.write(f"{manifest_path}\n")
+                f.write(f"{manifest_hash}\n")
+                f.write(f"{profile}\n")
+                f.flush()
+                os.fsync(f.fileno())
 
-        # Atomic rename
-        temp_file.replace(latest_file)
+            # Atomic rename
+            temp_file.replace(latest_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
 
 
 class RunIndexReader:
@@ -177,47 +418,96 @@ class RunIndexReader:
         self.runs_jsonl = index_dir / "runs.jsonl"
         self.by_pipeline_dir = index_dir / "by_pipeline"
         self.latest_dir = index_dir / "latest"
+        self.store = RunIndexStore(index_dir / RUNS_DB_FILENAME, self.runs_jsonl)
 
-    def list_runs(
-        self, pipeline_slug: str | None = None, profile: str | None = None, limit: int = 20
-    ) -> list[RunRecord]:
-        """List runs with optional filtering.
-
-        Args:
-            pipeline_slug: Filter by pipeline slug
-            profile: Filter by profile
-            limit: Maximum number of runs to return
-
-        Returns:
-            List of run records (newest first)
-        """
-        records = []
+    def _synced_store(self) -> RunIndexStore | None:
+        """Return the store after catching up with runs.jsonl, or None to scan the JSONL files."""
+        if not self.runs_jsonl.exists():
+            return None
+        try:
+            self.store.sync()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Run index database unavailable, scanning JSONL: {e}")
+            return None
+        return self.store
 
-        # Choose index file
+    def _iter_jsonl(self, pipeline_slug: str | None = None) -> Iterator[dict[str, Any]]:
+        """Yield raw records from the JSONL index, newest first."""
         if pipeline_slug:
             index_file = self.by_pipeline_dir / f"{pipeline_slug}.jsonl"
         else:
             index_file = self.runs_jsonl
 
         if not index_file.exists():
-            return []
+            return
 
-        # Read records
+        records = []
         with open(index_file) as f:
             for line in f:
                 if line.strip():
-                    record_dict = json.loads(line)
-                    record = RunRecord(**record_dict)
+                    records.append(json.loads(line))
+        yield from reversed(records)
 
-                    # Apply filters
-                    if profile and record.profile != profile:
-                        continue
+    def _iter_records(
+        self,
+        *,
+        run_id: str | None = None,
+        pipeline_slug: str | None = None,
+        profile: str | None = None,
+        tag: str | None = None,
+        run_ts_from: str | None = None,
+        newest_first: bool = True,
+    ) -> Iterator[tuple[str, str | dict[str, Any]]]:
+        """Yield ``(run_ts, record)`` for matching runs; record is JSON text when it comes from the store.
 
-                    records.append(record)
+        ``run_ts_from`` only narrows the store query; callers still apply their exact time filter.
+        """
+        store = self._synced_store()
+        if store is not None:
+            yielded = False
+            try:
+                for row in store.iter_records(
+                    run_id=run_id,
+                    pipeline_slug=pipeline_slug,
+                    profile=profile,
+                    tag=tag,
+                    run_ts_from=run_ts_from,
+                    newest_first=newest_first,
+                ):
+                    yielded = True
+                    yield row
+                return
+            except sqlite3.Error as e:
+                if yielded:
+                    raise
+                logger.debug(f"Run index query failed, scanning JSONL: {e}")
+
+        records = self._iter_jsonl(pipeline_slug)
+        if not newest_first:
+            records = reversed(list(records))
+        for record_dict in records:
+            if run_id and record_dict.get("run_id") != run_id:
+                continue
+            if profile and record_dict.get("profile") != profile:
+                continue
+            if tag and tag not in record_dict.get("tags", []):
+                continue
+            yield record_dict.get("run_ts", ""), record_dict
 
-        # Sort newest first and limit
-        records.reverse()
-        return records[:limit]
+    def list_runs(
+        self, pipeline_slug: str | None = None, profile: str | None = None, limit: int = 20
+    ) -> list[RunRecord]:
+        """List runs with optional filtering.
+
+        Args:
+            pipeline_slug: Filter by pipeline slug
+            profile: Filter by profile
+            limit: Maximum number of runs to return
+
+        Returns:
+            List of run records (newest first)
+        """
+        return self.query_runs(pipeline_slug=pipeline_slug, profile=profile, limit=limit)
 
     def get_run(self, run_id: str) -> RunRecord | None:
         """Get specific run by ID.
@@ -231,12 +521,9 @@ class RunIndexReader:
         if not self.runs_jsonl.exists():
             return None
 
-        with open(self.runs_jsonl) as f:
-            for line in f:
-                if line.strip():
-                    record_dict = json.loads(line)
-                    if record_dict.get("run_id") == run_id:
-                        return RunRecord(**record_dict)
+        # First recorded run with this ID
+        for _, record in self._iter_records(run_id=run_id, newest_first=False):
+            return _to_run_record(record)
 
         return None
 
@@ -270,7 +557,7 @@ class RunIndexReader:
         profile: str | None = None,
         tag: str | None = None,
         since: datetime | None = None,
-        limit: int = 100,
+        limit: int | None = 100,
     ) -> list[RunRecord]:
         """Query runs with multiple filters.
 
@@ -279,53 +566,52 @@ class RunIndexReader:
             profile: Filter by profile
             tag: Filter by tag
             since: Filter by start time (runs started after this time)
-            limit: Maximum number of runs to return
+            limit: Maximum number of runs to return (None = all)
 
         Returns:
             List of matching run records (newest first)
         """
-        records = []
+        records: list[RunRecord] = []
+        if limit is not None and limit <= 0:
+            return records
+
+        records_iter = self._iter_records(
+            pipeline_slug=pipeline_slug,
+            profile=profile,
+            tag=tag,
+            run_ts_from=_run_ts_lower_bound(since) if since else None,
+        )
+        for run_ts, record in records_iter:
+            if since and run_ts:
+                try:
+                    run_time = datetime.fromisoformat(run_ts.replace("Z", "+00:00"))
+                    if run_time < since:
+                        continue
+                except ValueError:
+                    continue
 
-        # Choose index file
-        if pipeline_slug:
-            index_file = self.by_pipeline_dir / f"{pipeline_slug}.jsonl"
-        else:
-            index_file = self.runs_jsonl
+            records.append(_to_run_record(record))
+            if limit is not None and len(records) >= limit:
+                break
 
-        if not index_file.exists():
-            return []
+        return records
 
-        # Read records
-        with open(index_file) as f:
-            for line in f:
-                if line.strip():
-                    record_dict = json.loads(line)
 
-                    # Apply filters
-                    if profile and record_dict.get("profile") != profile:
-                        continue
+def _run_ts_lower_bound(since: datetime) -> str:
+    """Lowest ``run_ts`` text a run started at or after ``since`` can have.
+
+    ``run_ts`` is ISO 8601 text written with mixed UTC offsets and separators, so the
+    bound is the date of ``since`` less the largest UTC offset (14 hours). It only
+    prunes rows in SQL; the exact comparison stays in ``query_runs``.
+    """
+    if since.tzinfo is not None:
+        since = since.astimezone(UTC).replace(tzinfo=None)
+    return (since - timedelta(hours=14)).date().isoformat()
+
 
-                    if tag:
-                        tags = record_dict.get("tags", [])
-                        if tag not in tags:
-                            continue
-
-                    if since:
-                        run_ts = record_dict.get("run_ts", "")
-                        if run_ts:
-                            try:
-                                run_time = datetime.fromisoformat(run_ts.replace("Z", "+00:00"))
-                                if run_time < since:
-                                    continue
-                            except ValueError:
-                                continue
-
-                    record = RunRecord(**record_dict)
-                    records.append(record)
-
-        # Sort newest first and limit
-        records.reverse()
-        return records[:limit]
+def _to_run_record(record: str | dict[str, Any]) -> RunRecord:
+    """Build a RunRecord from a store row (JSON text) or a parsed JSONL record."""
+    return RunRecord(**(json.loads(record) if isinstance(record, str) else record))
 
 
 def latest_manifest_path(index_dir: Path, pipeline_slug: str) -> Path | None:
@@ -1,5 +1,6 @@
 """Minimal local runner for compiled manifests."""
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 import json
 import logging
@@ -11,26 +12,79 @@ import yaml
 
 from ..components.registry import ComponentRegistry
 from .config import ConfigError, parse_connection_ref, resolve_connection
-from .driver import DriverRegistry
-from .session_logging import log_event, log_metric
+from .driver import DriverRegistry, RowStream
+from .duckdb_session import DuckDBSession, DuckDBTable, memory_limit_from_env, threads_from_env
+from .session_logging import get_current_session, log_event, log_metric
+from .spill import SpillManager, budget_from_env, format_from_env, read_spilled
+from .state_store import PipelineStateStore
 
 logger = logging.getLogger(__name__)
 
+DUCKDB_COMPONENT = "duckdb.processor"
+
 
 class RunnerV0:
-    """Minimal sequential runner for linear pipelines."""
+    """Minimal runner for compiled pipelines.
+
+    Steps run sequentially in manifest order by default. With ``max_parallel > 1``
+    the runner schedules the step DAG (``needs`` edges) onto a bounded thread pool.
+
+    Cached step outputs are reference counted over the DAG and released once their
+    last consumer finished; with a memory budget they spill to the step's artifacts
+    directory (see :mod:`osiris.core.spill`).
+
+    ``duckdb.processor`` steps share one run-scoped DuckDB database; outputs consumed
+    only by other DuckDB steps stay in it as tables (see :mod:`osiris.core.duckdb_session`).
 
-    def __init__(self, manifest_path: str, output_dir: str | Path, fs_contract=None):
+    With a :class:`~osiris.core.state_store.PipelineStateStore`, stored step state is
+    injected as ``inputs["state"]``; returned ``state`` dicts are committed together
+    once every step (including downstream writers) succeeded. Drivers may call
+    ``ctx.checkpoint(state)`` to persist progress that a failed run resumes from.
+    """
+
+    def __init__(
+        self,
+        manifest_path: str,
+        output_dir: str | Path,
+        fs_contract=None,
+        max_parallel: int = 1,
+        memory_budget_mb: float | None = None,
+        *,
+        duckdb_threads: int | None = None,
+        duckdb_memory_limit: str | None = None,
+        state_store: PipelineStateStore | None = None,
+    ):
         """Initialize runner with output directory.
 
         Args:
             manifest_path: Path to the manifest file
             output_dir: Artifacts directory (only used if fs_contract not provided)
             fs_contract: Optional FilesystemContract for path resolution
+            max_parallel: Maximum number of steps executed concurrently (1 = sequential)
+            memory_budget_mb: Budget for cached DataFrames before spilling to disk
+                (defaults to OSIRIS_SPILL_BUDGET_MB; unset = unlimited)
+            duckdb_threads: Threads of the shared DuckDB session (defaults to OSIRIS_DUCKDB_THREADS)
+            duckdb_memory_limit: Memory limit of the shared DuckDB session, e.g. "4GB"
+                (defaults to OSIRIS_DUCKDB_MEMORY_LIMIT); DuckDB spills to the artifacts dir beyond it
+            state_store: Store for incremental step state (None = state is neither injected nor persisted)
         """
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be >= 1, got {max_parallel}")
+        if memory_budget_mb is not None and memory_budget_mb < 0:
+            raise ValueError(f"memory_budget_mb must be >= 0, got {memory_budget_mb}")
+        if duckdb_threads is not None and duckdb_threads < 1:
+            raise ValueError(f"duckdb_threads must be >= 1, got {duckdb_threads}")
+
         self.manifest_path = Path(manifest_path)
         self.output_dir = Path(output_dir)
         self.fs_contract = fs_contract
+        self.max_parallel = max_parallel
+        self.memory_budget_bytes = (
+            int(memory_budget_mb * 1024 * 1024) if memory_budget_mb is not None else budget_from_env()
+        )
+        self.duckdb_threads = duckdb_threads if duckdb_threads is not None else threads_from_env()
+        self.duckdb_memory_limit = duckdb_memory_limit or memory_limit_from_env()
+        self.state_store = state_store
 
         # Ensure output_dir is absolute to avoid CWD issues
         if not self.output_dir.is_absolute():
@@ -40,6 +94,10 @@ class RunnerV0:
         self.components = {}
         self.events = []
         self.results = {}  # Step results cache
+        self.spill_manager: SpillManager | None = None
+        self.duckdb_session: DuckDBSession | None = None
+        self.pending_state: dict[str, dict[str, Any]] = {}  # Step states committed after a successful run
+        self.streaming_components: set[str] = set()  # Components whose spec declares streaming
         self.driver_registry = self._build_driver_registry()
 
         # Log artifact base for debugging
@@ -72,6 +130,10 @@ class RunnerV0:
                 error,
             )
 
+        self.streaming_components = {
+            name for name, spec in specs.items() if (spec.get("capabilities") or {}).get("streaming")
+        }
+
         return registry
 
     def run(self) -> bool:
@@ -85,6 +147,7 @@ class RunnerV0:
             # Load manifest
             with open(self.manifest_path) as f:
                 self.manifest = yaml.safe_load(f)
+            self.pending_state = {}
 
             # Log run start
             self._log_event(
@@ -93,14 +156,36 @@ class RunnerV0:
                     "manifest_path": str(self.manifest_path),
                     "pipeline_id": self.manifest["pipeline"]["id"],
                     "profile": self.manifest["meta"].get("profile", "default"),
+                    "max_parallel": self.max_parallel,
                 },
             )
 
-            # Execute steps in order
-            for step in self.manifest["steps"]:
-                if not self._execute_step(step):
-                    self._log_event("run_error", {"step_id": step["id"], "message": "Step execution failed"})
+            self.spill_manager = SpillManager(
+                self.manifest["steps"],
+                self.output_dir,
+                memory_budget_bytes=self.memory_budget_bytes,
+                spill_format=format_from_env(),
+                on_spill=self._on_output_spilled,
+            )
+
+            if any(self._step_driver(step) == DUCKDB_COMPONENT for step in self.manifest["steps"]):
+                self.duckdb_session = DuckDBSession(
+                    threads=self.duckdb_threads,
+                    memory_limit=self.duckdb_memory_limit,
+                    temp_directory=self.output_dir / "_duckdb_tmp",
+                )
+
+            if self.max_parallel > 1:
+                if not self._run_dag(self.manifest["steps"]):
                     return False
+            else:
+                # Execute steps in order
+                for step in self.manifest["steps"]:
+                    if not self._execute_step(step):
+                        self._log_event("run_error", {"step_id": step["id"], "message": "Step execution failed"})
+                        return False
+
+            self._commit_state()
 
             # Log run complete
             self._log_event(
@@ -110,6 +195,7 @@ class RunnerV0:
                     "steps_executed": len(self.manifest["steps"]),
                 },
             )
+            log_metric("cache_peak_bytes", self.spill_manager.peak_bytes, unit="bytes")
 
             return True
 
@@ -120,6 +206,105 @@ class RunnerV0:
             logger.error(f"Runner error: {str(e)}")
             self._log_event("run_error", {"error": str(e)})
             return False
+        finally:
+            if self.duckdb_session is not None:
+                self.duckdb_session.close()
+
+    def _run_dag(self, steps: list[dict[str, Any]]) -> bool:
+        """Execute steps concurrently, starting each one once all its ``needs`` completed.
+
+        Ready steps are submitted in manifest order, so scheduling is deterministic for a
+        given set of completions. After the first failure no new steps are started; steps
+        already in flight are allowed to finish.
+
+        Args:
+            steps: Manifest steps (already topologically ordered by the compiler)
+
+        Returns:
+            True if every step succeeded, False otherwise
+        """
+        order = {step["id"]: index for index, step in enumerate(steps)}
+        steps_by_id = {step["id"]: step for step in steps}
+
+        # Only edges to steps in this manifest gate scheduling (mirrors sequential mode)
+        pending = {step["id"]: {need for need in step.get("needs") or [] if need in order} for step in steps}
+        dependents: dict[str, list[str]] = {step_id: [] for step_id in order}
+        for step_id, needs in pending.items():
+            for need in needs:
+                dependents[need].append(step_id)
+
+        ready = [step_id for step_id in order if not pending[step_id]]
+        completed: set[str] = set()
+        failed_step: str | None = None
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="osiris-step") as pool:
+            running: dict[Any, str] = {}
+
+            while ready or running:
+                while ready and failed_step is None and len(running) < self.max_parallel:
+                    step_id = ready.pop(0)
+                    running[pool.submit(self._execute_step, steps_by_id[step_id])] = step_id
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: order[running[f]]):
+                    step_id = running.pop(future)
+                    if not future.result():
+                        failed_step = failed_step or step_id
+                        continue
+
+                    completed.add(step_id)
+                    for dependent in dependents[step_id]:
+                        pending[dependent].discard(step_id)
+                        if not pending[dependent]:
+                            ready.append(dependent)
+
+                ready.sort(key=order.__getitem__)
+
+        if failed_step is not None:
+            self._log_event("run_error", {"step_id": failed_step, "message": "Step execution failed"})
+            return False
+
+        if len(completed) != len(steps):
+            blocked = sorted(set(order) - completed, key=order.__getitem__)
+            self._log_event(
+                "run_error",
+                {"step_id": blocked[0], "message": f"Dependency cycle detected among steps: {', '.join(blocked)}"},
+            )
+            return False
+
+        return True
+
+    @property
+    def pipeline_slug(self) -> str:
+        return (self.manifest or {}).get("pipeline", {}).get("id", "unknown")
+
+    def _load_state(self, step_id: str) -> dict[str, Any] | None:
+        """Stored state (or last checkpoint) for a step, if any."""
+        if self.state_store is None:
+            return None
+        state = self.state_store.load(self.pipeline_slug, step_id)
+        if state is not None:
+            logger.debug(f"Step {step_id}: Injecting stored state")
+        return state
+
+    def _checkpoint_state(self, step_id: str, state: dict[str, Any]) -> None:
+        """Persist mid-step progress so a failed run resumes from here."""
+        if self.state_store is None:
+            return
+        self.state_store.checkpoint(self.pipeline_slug, step_id, state)
+        self._log_event("state_checkpoint", {"step_id": step_id})
+
+    def _commit_state(self) -> None:
+        """Atomically commit the states returned by all steps of a successful run."""
+        if self.state_store is None or not self.pending_state:
+            return
+        session = get_current_session()
+        run_id = session.session_id if session is not None else None
+        self.state_store.commit(self.pipeline_slug, self.pending_state, run_id=run_id)
+        self._log_event("state_committed", {"steps": sorted(self.pending_state)})
 
     def _log_event(self, event_type: str, data: dict[str, Any]):
         """Log an event."""
@@ -130,6 +315,13 @@ class RunnerV0:
         # Also emit to session logging
         log_event(event_type, **data)
 
+    def _on_output_spilled(self, step_id: str, path: Path, df: Any) -> None:
+        """Record a spilled step output."""
+        self._log_event(
+            "output_spilled",
+            {"step_id": step_id, "path": str(path), "rows": len(df), "format": path.suffix.lstrip(".")},
+        )
+
     def _emit_inputs_resolved(
         self,
         *,
@@ -138,6 +330,7 @@ class RunnerV0:
         key: str,
         rows: int,
         from_memory: bool,
+        from_spill: bool = False,
     ) -> None:
         """Emit inputs_resolved telemetry mirroring sandbox semantics."""
 
@@ -148,6 +341,8 @@ class RunnerV0:
             "rows": rows,
             "from_memory": from_memory,
         }
+        if from_spill:
+            payload["from_spill"] = True
 
         self._log_event("inputs_resolved", payload)
 
@@ -157,6 +352,10 @@ class RunnerV0:
         if data is None:
             return 0
 
+        if isinstance(data, RowStream):
+            # Streams are not counted up front; rows are reported by the consumer
+            return int(data.estimated_row_count or 0)
+
         try:
             import pandas as pd  # type: ignore
 
@@ -170,6 +369,42 @@ class RunnerV0:
         except Exception:
             return 0
 
+    def _should_stream(self, step: dict[str, Any]) -> bool:
+        """Decide whether a step may hand its output to its consumer as a RowStream.
+
+        Streams are single-pass, so this requires exactly one downstream consumer and
+        both components must declare ``capabilities.streaming`` in their specs.
+        """
+        if not self.manifest or not self.streaming_components:
+            return False
+
+        driver_name = step.get("driver") or step.get("component", "unknown")
+        if driver_name not in self.streaming_components:
+            return False
+
+        consumers = [s for s in self.manifest.get("steps", []) if step["id"] in (s.get("needs") or [])]
+        if len(consumers) != 1:
+            return False
+
+        consumer_driver = consumers[0].get("driver") or consumers[0].get("component", "unknown")
+        return consumer_driver in self.streaming_components
+
+    @staticmethod
+    def _step_driver(step: dict[str, Any]) -> str:
+        return step.get("driver") or step.get("component", "unknown")
+
+    def _keep_in_duckdb(self, step: dict[str, Any]) -> bool:
+        """Decide whether a DuckDB step may keep its output as a table in the shared session.
+
+        Only when every downstream consumer is itself a DuckDB step; anything else
+        needs a pandas DataFrame.
+        """
+        if self.duckdb_session is None or self._step_driver(step) != DUCKDB_COMPONENT:
+            return False
+
+        consumers = [s for s in self.manifest.get("steps", []) if step["id"] in (s.get("needs") or [])]
+        return bool(consumers) and all(self._step_driver(s) == DUCKDB_COMPONENT for s in consumers)
+
     def _write_cleaned_config_artifact(self, clean_config: dict[str, Any], cleaned_path: Path) -> bool:
         """Persist cleaned config artifact with masked secrets.
 
@@ -404,11 +639,14 @@ class RunnerV0:
 
             # Prepare inputs based on step dependencies
             inputs = None
+            stored_state = self._load_state(step_id)
+            if stored_state is not None:
+                inputs = {"state": stored_state}
             if "needs" in step and step["needs"]:
                 from .step_naming import build_dataframe_keys
 
                 # Collect inputs from upstream steps
-                inputs = {}
+                inputs = inputs or {}
 
                 # Build safe DataFrame keys with collision detection
                 upstream_ids = [uid for uid in step["needs"] if uid in self.results]
@@ -422,37 +660,82 @@ class RunnerV0:
                         inputs[upstream_id] = upstream_result
 
                         # If result contains DataFrame, also register with safe key
-                        if "df" in upstream_result:
+                        df = upstream_result.get("df")
+                        from_spill = df is None and upstream_result.get("df_path") is not None
+                        if from_spill:
+                            df = read_spilled(upstream_result["df_path"])
+                        elif isinstance(df, DuckDBTable) and driver_name != DUCKDB_COMPONENT:
+                            df = df.to_dataframe()
+                        if df is not None:
                             safe_key = df_keys[upstream_id]
-                            inputs[safe_key] = upstream_result["df"]
+                            inputs[safe_key] = df
 
                             # Log for debugging
-                            rows = self._count_rows(upstream_result["df"])
+                            rows = self._count_rows(df)
                             logger.debug(f"Step {step_id}: Registered {safe_key} with {rows} rows from {upstream_id}")
                             self._emit_inputs_resolved(
                                 step_id=step_id,
                                 from_step=upstream_id,
                                 key=safe_key,
                                 rows=rows,
-                                from_memory=True,
+                                from_memory=not from_spill,
+                                from_spill=from_spill,
                             )
 
             # Create context for metrics and output
             class RunnerContext:
-                def __init__(self, output_dir):
+                def __init__(
+                    self, output_dir, streaming=False, duckdb_session=None, keep_in_duckdb=False, on_checkpoint=None
+                ):
                     self.output_dir = output_dir
+                    self.streaming = streaming
+                    self.duckdb_session = duckdb_session
+                    self.keep_in_duckdb = keep_in_duckdb
+                    self._on_checkpoint = on_checkpoint
 
                 def log_metric(self, name: str, value: Any, **kwargs):
                     log_metric(name, value, **kwargs)
 
-            ctx = RunnerContext(output_dir)
+                def checkpoint(self, state: dict[str, Any]) -> None:
+                    if self._on_checkpoint is not None:
+                        self._on_checkpoint(state)
+
+            ctx = RunnerContext(
+                output_dir,
+                streaming=self._should_stream(step),
+                duckdb_session=self.duckdb_session,
+                keep_in_duckdb=self._keep_in_duckdb(step),
+                on_checkpoint=lambda state: self._checkpoint_state(step_id, state),
+            )
 
             # Run the driver
-            result = driver.run(step_id=step_id, config=config, inputs=inputs, ctx=ctx)
+            try:
+                result = driver.run(step_id=step_id, config=config, inputs=inputs, ctx=ctx)
+            finally:
+                # Release producers of streams handed to this step (no-op once exhausted)
+                for value in (inputs or {}).values():
+                    if isinstance(value, RowStream):
+                        value.close()
+
+            # Streamed state is filled in place once consumed, so keep the dict itself
+            if result and isinstance(result.get("state"), dict):
+                self.pending_state[step_id] = result["state"]
 
             # Cache result if it contains data
             if result and "df" in result:
                 self.results[step_id] = result
+                if self.spill_manager is not None:
+                    self.spill_manager.track(step_id, result)
+
+            # Upstream outputs no longer needed by any pending step can be dropped
+            if self.spill_manager is not None:
+                self.spill_manager.release(step_id)
+
+                # Session tables are not tracked by the spill manager; drop them after their last consumer
+                for upstream_id in step.get("needs") or []:
+                    upstream_df = self.results.get(upstream_id, {}).get("df")
+                    if isinstance(upstream_df, DuckDBTable) and self.spill_manager.refcount(upstream_id) == 0:
+                        upstream_df.drop()
 
             return True, None
 
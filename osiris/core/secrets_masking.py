@@ -14,6 +14,7 @@
 
 """Secrets masking for secure logging."""
 
+from functools import lru_cache
 import re
 from typing import Any
 
@@ -62,6 +63,46 @@ STRUCTURAL_KEYS = {
 
 MASK_VALUE = "***"
 
+# Sensitive words recognized in free text (log lines, reprs, E2B stdout)
+STRING_SENSITIVE_WORDS = [
+    "password",
+    "passwd",
+    "pwd",
+    "token",
+    "api_key",
+    "apikey",
+    "secret",
+    "authorization",
+    "auth",
+    "credential",
+    "private_key",
+    "privatekey",
+    "access_key",
+    "session_key",
+    "encryption_key",
+    "key",
+]
+
+_WORDS = "|".join(STRING_SENSITIVE_WORDS)
+
+# Substitutions applied in order by mask_sensitive_string
+STRING_MASK_PATTERNS = [
+    # JSON-like: "key": "value"
+    (re.compile(r'("(?:' + _WORDS + r')"\s*:\s*")([^"]+)(")', re.IGNORECASE), r"\1" + MASK_VALUE + r"\3"),
+    # Config-like: key=value
+    (re.compile(r"(\b(?:" + _WORDS + r")\s*=\s*)([^\s,}]+)", re.IGNORECASE), r"\1" + MASK_VALUE),
+    # Log message: key: value (like "password: secret")
+    (re.compile(r"(\b(?:" + _WORDS + r")\s*:\s*)([^\s,}]+)", re.IGNORECASE), r"\1" + MASK_VALUE),
+    # URL-like: key:value@host
+    (re.compile(r"(:(?:" + _WORDS + r"))([^@\s&]+)", re.IGNORECASE), r"\1" + MASK_VALUE),
+    # Query params: ?key=value or &key=value
+    (re.compile(r"([?&](?:" + _WORDS + r")=)([^&\s]+)", re.IGNORECASE), r"\1" + MASK_VALUE),
+]
+
+# Every sensitive word contains one of these, so ASCII text without them needs no substitution
+# (non-ASCII text always goes through the patterns, IGNORECASE folds e.g. "\u017f" to "s")
+STRING_MASK_HINTS = ("key", "passw", "pwd", "token", "secret", "auth", "credential")
+
 
 def mask_sensitive_value(key: str, value: Any) -> Any:
     """Mask sensitive values based on key name.
@@ -73,15 +114,17 @@ def mask_sensitive_value(key: str, value: Any) -> Any:
     Returns:
         Masked value if key is sensitive, original value otherwise
     """
-    # Never mask structural keys
-    if isinstance(key, str):
-        if key.lower() in STRUCTURAL_KEYS:
-            return value
-        if SENSITIVE_REGEX.search(key):
-            return MASK_VALUE
+    if isinstance(key, str) and _is_sensitive_key(key):
+        return MASK_VALUE
     return value
 
 
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    # Never mask structural keys
+    return key.lower() not in STRUCTURAL_KEYS and bool(SENSITIVE_REGEX.search(key))
+
+
 def mask_sensitive_dict(data: dict[str, Any]) -> dict[str, Any]:
     """Recursively mask sensitive fields in a dictionary.
 
@@ -115,46 +158,14 @@ def mask_sensitive_string(text: str) -> str:
     Returns:
         String with sensitive patterns masked
     """
-    # Simple patterns without anchors for string matching
-    simple_patterns = [
-        "password",
-        "passwd",
-        "pwd",
-        "token",
-        "api_key",
-        "apikey",
-        "secret",
-        "authorization",
-        "auth",
-        "credential",
-        "private_key",
-        "privatekey",
-        "access_key",
-        "session_key",
-        "encryption_key",
-        "key",
-    ]
-
-    # Multiple patterns to handle different formats
-    patterns = [
-        # JSON-like: "key": "value"
-        (
-            r'("(?:' + "|".join(simple_patterns) + r')"\s*:\s*")([^"]+)(")',
-            r"\1" + MASK_VALUE + r"\3",
-        ),
-        # Config-like: key=value
-        (r"(\b(?:" + "|".join(simple_patterns) + r")\s*=\s*)([^\s,}]+)", r"\1" + MASK_VALUE),
-        # Log message: key: value (like "password: secret")
-        (r"(\b(?:" + "|".join(simple_patterns) + r")\s*:\s*)([^\s,}]+)", r"\1" + MASK_VALUE),
-        # URL-like: key:value@host
-        (r"(:(?:" + "|".join(simple_patterns) + r"))([^@\s&]+)", r"\1" + MASK_VALUE),
-        # Query params: ?key=value or &key=value
-        (r"([?&](?:" + "|".join(simple_patterns) + r")=)([^&\s]+)", r"\1" + MASK_VALUE),
-    ]
+    if text.isascii():
+        lowered = text.lower()
+        if not any(hint in lowered for hint in STRING_MASK_HINTS):
+            return text
 
     result = text
-    for pattern, replacement in patterns:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    for pattern, replacement in STRING_MASK_PATTERNS:
+        result = pattern.sub(replacement, result)
 
     return result
 
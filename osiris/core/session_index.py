@@ -0,0 +1,204 @@
+"""SQLite summary index of the sessions under a logs directory.
+
+:class:`osiris.core.session_reader.SessionReader` used to rebuild every session
+summary from ``events.jsonl`` / ``metrics.jsonl`` on each ``osiris logs list``.
+The index keeps one row per session with the summary fields ``list_sessions``
+filters and orders on stored as columns (the full summary as JSON next to them),
+so listing becomes a single indexed query with ``WHERE`` / ``ORDER BY`` / ``LIMIT``.
+
+Rows are written when a session closes and backfilled by the reader for sessions
+it finds on disk but not in the index. Each row carries a signature of the files
+the summary was built from (size and mtime); a session whose files changed since
+is re-read, one whose directory disappeared is dropped.
+
+The database lives next to the sessions (``<logs_dir>/.session_index.sqlite``),
+is process-safe via SQLite WAL mode and can be deleted at any time; it is rebuilt
+on the next listing.
+"""
+
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+from typing import Any
+
+from .sqlite_store import SQLiteStore
+
+SESSION_INDEX_FILENAME = ".session_index.sqlite"
+
+# Bump when the stored summary shape changes; rows with another version are re-read
+INDEX_VERSION = 1
+
+_COLUMNS = ("started_at", "finished_at", "status", "pipeline_name", "adapter_type", "duration_ms")
+
+# Entries of a session directory that SessionReader.read_session derives the summary from
+SIGNATURE_ENTRIES = ("events.jsonl", "metrics.jsonl", "metadata.json", "commands.jsonl", "artifacts", "remote")
+
+
+def session_signature(session_path: Path) -> str:
+    """Fingerprint the files a session summary is built from (stat only, nothing is read).
+
+    Directories (``artifacts/``, ``remote/``) contribute their direct children as
+    well, since the summary counts per-step artifact files and reads remote logs.
+    """
+    parts = [f"v{INDEX_VERSION}"]
+    for name in SIGNATURE_ENTRIES:
+        entry = session_path / name
+        try:
+            st = entry.stat()
+            parts.append(f"{name}:{st.st_size}:{st.st_mtime_ns}")
+            if entry.is_dir():
+                for child in sorted(entry.iterdir()):
+                    st = child.stat()
+                    parts.append(f"{name}/{child.name}:{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            continue
+    return "|".join(parts)
+
+
+class SessionIndex(SQLiteStore):
+    """Summary rows for the sessions of one logs directory."""
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            started_at TEXT,
+            finished_at TEXT,
+            status TEXT,
+            pipeline_name TEXT,
+            adapter_type TEXT,
+            duration_ms INTEGER,
+            labels TEXT NOT NULL,
+            summary TEXT NOT NULL,
+            signature TEXT NOT NULL,
+            indexed_at TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions (COALESCE(started_at, ''), session_id)",
+        "CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions (status)",
+        "CREATE INDEX IF NOT EXISTS idx_sessions_pipeline ON sessions (pipeline_name)",
+    )
+
+    def __init__(self, db_path: str | Path):
+        """Initialize the index (the database is created on first use).
+
+        Args:
+            db_path: Path to the SQLite database, usually ``<logs_dir>/.session_index.sqlite``
+        """
+        super().__init__(db_path)
+
+    def signatures(self) -> dict[str, str]:
+        """Return ``{session_id: signature}`` for every indexed session."""
+        if not self.db_path.exists():
+            return {}
+
+        conn = self._connect()
+        try:
+            return dict(conn.execute("SELECT session_id, signature FROM sessions"))
+        finally:
+            conn.close()
+
+    def upsert(self, summaries: list[tuple[dict[str, Any], str]]) -> None:
+        """Store ``(summary, signature)`` pairs in one transaction.
+
+        Args:
+            summaries: Session summaries as dicts (``dataclasses.asdict``) with their file signatures
+        """
+        if not summaries:
+            return
+
+        now = datetime.now(UTC).isoformat()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                f"""
+                INSERT INTO sessions (session_id, {", ".join(_COLUMNS)}, labels, summary, signature, indexed_at)
+                VALUES (?, {", ".join("?" for _ in _COLUMNS)}, ?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE
+                SET {", ".join(f"{col} = excluded.{col}" for col in _COLUMNS)},
+                    labels = excluded.labels,
+                    summary = excluded.summary,
+                    signature = excluded.signature,
+                    indexed_at = excluded.indexed_at
+            """,
+                [
+                    (
+                        summary["session_id"],
+                        *(summary.get(col) for col in _COLUMNS),
+                        json.dumps(summary.get("labels") or []),
+                        json.dumps(summary, default=str),
+                        signature,
+                        now,
+                    )
+                    for summary, signature in summaries
+                ],
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def remove(self, session_ids: list[str]) -> None:
+        """Drop the rows of sessions that no longer exist."""
+        if not session_ids or not self.db_path.exists():
+            return
+
+        conn = self._connect()
+        try:
+            conn.executemany("DELETE FROM sessions WHERE session_id = ?", [(sid,) for sid in session_ids])
+            conn.commit()
+        finally:
+            conn.close()
+
+    def query(
+        self,
+        *,
+        limit: int | None = None,
+        status: str | None = None,
+        pipeline: str | None = None,
+        label: str | None = None,
+        since: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return stored summaries, newest first, with filters and limit applied in SQL.
+
+        Args:
+            limit: Maximum number of sessions (None or 0 = all)
+            status: Only sessions with this status
+            pipeline: Only sessions of this pipeline name
+            label: Only sessions carrying this label
+            since: Only sessions started at or after this ISO timestamp
+        """
+        if not self.db_path.exists():
+            return []
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if pipeline is not None:
+            clauses.append("pipeline_name = ?")
+            params.append(pipeline)
+        if label is not None:
+            clauses.append("EXISTS (SELECT 1 FROM json_each(sessions.labels) WHERE json_each.value = ?)")
+            params.append(label)
+        if since is not None:
+            clauses.append("started_at >= ?")
+            params.append(since)
+
+        sql = "SELECT summary FROM sessions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY COALESCE(started_at, '') DESC, session_id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        conn = self._connect()
+        try:
+            return [json.loads(row[0]) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
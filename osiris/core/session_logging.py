@@ -30,8 +30,12 @@ import time
 from typing import Any
 import uuid
 
+from .log_sink import DEFAULT_CLOSE_TIMEOUT, JsonlSink, encode_record
 from .redaction import create_redactor
 
+# Events that mark a durable boundary: a buffered session drains its sink after logging them
+DRAIN_EVENTS = frozenset({"step_complete", "step_error", "run_complete", "run_error"})
+
 
 class SessionContext:
     """Manages session-scoped logging and artifact collection."""
@@ -48,6 +52,8 @@ class SessionContext:
         run_id: str | None = None,
         run_ts: datetime | None = None,
         manifest_short: str | None = None,
+        *,
+        buffered: bool = False,
     ):
         """Initialize session context.
 
@@ -62,6 +68,8 @@ class SessionContext:
             run_id: Run identifier (used with fs_contract).
             run_ts: Run timestamp (used with fs_contract).
             manifest_short: Short manifest hash (used with fs_contract).
+            buffered: Write events and metrics through a background JsonlSink instead of
+                appending synchronously; drained at step boundaries and on close().
         """
         self.session_id = session_id or self._generate_session_id()
         self.start_time = datetime.now(UTC)
@@ -71,6 +79,8 @@ class SessionContext:
         # Event filtering: None or ["*"] means log all events
         self.allowed_events = allowed_events or ["*"]
 
+        self._sink = JsonlSink() if buffered else None
+
         # Set up paths based on whether we have a filesystem contract
         if fs_contract and pipeline_slug and run_id and manifest_short:
             # Use filesystem contract paths
@@ -82,6 +92,7 @@ class SessionContext:
                 profile=profile,
             )
             self.session_dir = paths["base"]
+            self._logs_root: Path | None = None  # resolved from the contract when the session is indexed
             self.osiris_log = paths["osiris_log"]
             self.debug_log = paths["debug_log"]
             self.events_log = paths["events"]
@@ -96,6 +107,7 @@ class SessionContext:
             # Legacy path mode - DEPRECATED, will be removed
             self.base_logs_dir = base_logs_dir or Path("run_logs")  # Changed default from logs to run_logs
             self.session_dir = self.base_logs_dir / self.session_id
+            self._logs_root = self.base_logs_dir
 
             # File paths
             self.osiris_log = self.session_dir / "osiris.log"
@@ -273,23 +285,7 @@ class SessionContext:
             # Redact sensitive data using new redactor
             event_data = self.redactor.redact_dict(event_data)
 
-            # Convert non-serializable objects to strings
-            def make_serializable(obj):
-                if isinstance(obj, dict):
-                    return {k: make_serializable(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [make_serializable(item) for item in obj]
-                elif isinstance(obj, str | int | float | bool) or obj is None:
-                    return obj
-                else:
-                    return str(obj)
-
-            event_data = make_serializable(event_data)
-
-            # Write to events.jsonl
-            with open(self.events_log, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event_data, separators=(",", ":")) + "\n")
-                f.flush()  # Ensure data is written immediately
+            self._write_record(self.events_log, event_data)
 
         except (OSError, PermissionError) as e:
             # Fallback to stderr if we can't write events
@@ -298,6 +294,9 @@ class SessionContext:
             # JSON serialization error
             print(f"WARNING: Could not serialize event {event_name}: {e}", file=sys.stderr)
 
+        if event_name in DRAIN_EVENTS:
+            self.flush()
+
     def log_metric(self, metric: str, value: Any, **kwargs) -> None:
         """Log a metric to metrics.jsonl.
 
@@ -318,23 +317,7 @@ class SessionContext:
             # Redact sensitive data using new redactor
             metric_data = self.redactor.redact_dict(metric_data)
 
-            # Convert non-serializable objects to strings
-            def make_serializable(obj):
-                if isinstance(obj, dict):
-                    return {k: make_serializable(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [make_serializable(item) for item in obj]
-                elif isinstance(obj, str | int | float | bool) or obj is None:
-                    return obj
-                else:
-                    return str(obj)
-
-            metric_data = make_serializable(metric_data)
-
-            # Write to metrics.jsonl
-            with open(self.metrics_log, "a", encoding="utf-8") as f:
-                f.write(json.dumps(metric_data, separators=(",", ":")) + "\n")
-                f.flush()  # Ensure data is written immediately
+            self._write_record(self.metrics_log, metric_data)
 
         except (OSError, PermissionError) as e:
             # Fallback to stderr if we can't write metrics
@@ -343,6 +326,20 @@ class SessionContext:
             # JSON serialization error
             print(f"WARNING: Could not serialize metric {metric}: {e}", file=sys.stderr)
 
+    def _write_record(self, path: Path, record: dict[str, Any]) -> None:
+        """Append a redacted record to a JSONL stream, through the sink when buffered."""
+        if self._sink is not None and self._sink.write(path, record):
+            return
+        line = encode_record(record)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()  # Ensure data is written immediately
+
+    def flush(self) -> None:
+        """Block until all buffered events and metrics are written (no-op when unbuffered)."""
+        if self._sink is not None:
+            self._sink.flush()
+
     def save_config(self, config: dict[str, Any]) -> None:
         """Save configuration to cfg.json (with secrets masked).
 
@@ -423,9 +420,36 @@ class SessionContext:
 
         self.log_metric("session_duration_seconds", duration_seconds)
 
+        # Drain buffered records; later writes fall back to synchronous appends
+        if self._sink is not None and not self._sink.close(timeout=DEFAULT_CLOSE_TIMEOUT):
+            print(f"WARNING: Log writer for session {self.session_id} did not finish draining", file=sys.stderr)
+
+        self._index_session()
+
         # Clean up logging handlers
         self.cleanup_logging()
 
+    def _index_session(self) -> None:
+        """Record the closed session in the session index of its logs directory (best effort)."""
+        if self._fallback_temp_dir is not None:
+            return
+
+        try:
+            logs_root = self._logs_root
+            if logs_root is None:
+                fs_config = self.fs_contract.fs_config
+                logs_root = fs_config.resolve_path(fs_config.run_logs_dir)
+            if not isinstance(logs_root, Path) or not isinstance(self.session_dir, Path):
+                return
+
+            # Imported here: the session index is not shipped to E2B sandboxes, which use SessionContext too
+            from .session_reader import SessionReader  # noqa: PLC0415
+
+            session_id = self.session_dir.resolve().relative_to(logs_root.resolve())
+            SessionReader(str(logs_root)).index_session(str(session_id))
+        except Exception as e:  # noqa: BLE001 - the index is rebuilt on the next listing
+            logging.getLogger(__name__).debug(f"Could not index session {self.session_id}: {e}")
+
     def __enter__(self):
         """Context manager entry."""
         return self
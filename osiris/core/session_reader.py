@@ -4,12 +4,18 @@ This module provides functionality to read session data from the ./logs director
 aggregate metrics, compute summaries, and handle redaction of sensitive information.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 import json
+import logging
 from pathlib import Path
 import re
+import sqlite3
 from typing import Any
 
+from osiris.core.session_index import SESSION_INDEX_FILENAME, SessionIndex, session_signature
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SessionSummary:
@@ -90,13 +96,16 @@ class SessionReader:
         (re.compile(r"Bearer\s+[A-Za-z0-9\-._~+/]+"), "Bearer ***"),
     ]
 
-    def __init__(self, logs_dir: str = "./logs"):
+    def __init__(self, logs_dir: str = "./logs", *, use_index: bool = True):
         """Initialize SessionReader with logs directory path.
 
         Args:
             logs_dir: Path to the logs directory (default: ./logs)
+            use_index: Serve list_sessions from the session index in the logs directory
         """
         self.logs_dir = Path(logs_dir)
+        self.use_index = use_index
+        self.index = SessionIndex(self.logs_dir / SESSION_INDEX_FILENAME)
 
     def _is_writer_driver(self, driver_name: str, step_id: str = "") -> bool:
         """Determine if a driver is a writer based on name patterns.
@@ -126,13 +135,28 @@ class SessionReader:
         # Default to extractor (safer to avoid double counting)
         return False
 
-    def list_sessions(self, limit: int | None = None) -> list[SessionSummary]:
+    def list_sessions(
+        self,
+        limit: int | None = None,
+        *,
+        status: str | None = None,
+        pipeline: str | None = None,
+        label: str | None = None,
+        since: str | None = None,
+    ) -> list[SessionSummary]:
         """List all sessions, ordered by newest first.
 
         Supports both flat (legacy) and nested (FilesystemContract v1) structures.
+        Summaries come from the session index; only sessions missing from it (or whose
+        files changed since they were indexed) are read from disk. Without a usable
+        index every session is read, as before.
 
         Args:
             limit: Maximum number of sessions to return
+            status: Only sessions with this status
+            pipeline: Only sessions of this pipeline name
+            label: Only sessions carrying this label
+            since: Only sessions started at or after this ISO timestamp
 
         Returns:
             List of SessionSummary objects, newest first
@@ -140,57 +164,106 @@ class SessionReader:
         if not self.logs_dir.exists():
             return []
 
-        sessions = []
+        session_ids = [str(path.relative_to(self.logs_dir)) for path in self._find_session_dirs(self.logs_dir)]
+        filters = {"status": status, "pipeline": pipeline, "label": label, "since": since}
 
-        # Recursively find all session directories (supports nested FilesystemContract structure)
-        def find_session_dirs(root: Path, max_depth: int = 5) -> list[Path]:
-            """Recursively find directories containing session files."""
-            session_dirs = []
+        if self.use_index:
+            try:
+                self._refresh_index(session_ids)
+                return [SessionSummary(**row) for row in self.index.query(limit=limit, **filters)]
+            except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+                logger.debug(f"Session index unavailable, scanning sessions: {e}")
 
-            if max_depth == 0:
-                return session_dirs
+        sessions = []
+        for session_id in session_ids:
+            summary = self.read_session(session_id)
+            if summary and self._matches(summary, **filters):
+                sessions.append(summary)
 
-            for item in root.iterdir():
-                if not item.is_dir():
-                    continue
-                if item.name.startswith(".") or item.name.startswith("@"):
-                    continue  # Skip hidden and special directories
+        # Sort by started_at (newest first), with deterministic fallback
+        sessions.sort(key=lambda s: (s.started_at or "", s.session_id), reverse=True)
 
-                # Check if this directory is a session (has events.jsonl or metrics.jsonl)
-                has_events = (item / "events.jsonl").exists()
-                has_metrics = (item / "metrics.jsonl").exists()
+        if limit:
+            sessions = sessions[:limit]
 
-                if has_events or has_metrics:
-                    session_dirs.append(item)
-                else:
-                    # Recurse into subdirectories
-                    session_dirs.extend(find_session_dirs(item, max_depth - 1))
+        return sessions
 
-            return session_dirs
+    def index_session(self, session_id: str) -> SessionSummary | None:
+        """Read one session and store its summary in the session index.
 
-        # Find all session directories
-        session_paths = find_session_dirs(self.logs_dir)
+        Called when a session closes so the next listing does not have to read it.
 
-        # Read session summaries
-        for session_path in session_paths:
-            # Get relative path for session ID
-            try:
-                rel_path = session_path.relative_to(self.logs_dir)
-                str(rel_path).replace("/", "_")  # Convert path to ID
+        Args:
+            session_id: Session directory relative to the logs directory
 
-                summary = self.read_session(str(rel_path))
+        Returns:
+            The indexed summary, or None if the session does not exist
+        """
+        signature = session_signature(self.logs_dir / session_id)
+        summary = self.read_session(session_id)
+        if summary:
+            self.index.upsert([(asdict(summary), signature)])
+        return summary
+
+    def _refresh_index(self, session_ids: list[str]) -> None:
+        """Index sessions that are new or changed on disk and drop vanished ones."""
+        indexed = self.index.signatures()
+        current = set(session_ids)
+
+        stale = []
+        for session_id in session_ids:
+            # Signature first: if the session is written to while it is read, the next listing re-reads it
+            signature = session_signature(self.logs_dir / session_id)
+            if indexed.get(session_id) != signature:
+                summary = self.read_session(session_id)
                 if summary:
-                    sessions.append(summary)
-            except ValueError:
+                    stale.append((asdict(summary), signature))
+
+        self.index.upsert(stale)
+        self.index.remove([session_id for session_id in indexed if session_id not in current])
+
+    @staticmethod
+    def _matches(
+        summary: SessionSummary,
+        *,
+        status: str | None,
+        pipeline: str | None,
+        label: str | None,
+        since: str | None,
+    ) -> bool:
+        """Apply the list_sessions filters to a summary read from disk."""
+        if status is not None and summary.status != status:
+            return False
+        if pipeline is not None and summary.pipeline_name != pipeline:
+            return False
+        if label is not None and label not in summary.labels:
+            return False
+        return since is None or (summary.started_at is not None and summary.started_at >= since)
+
+    def _find_session_dirs(self, root: Path, max_depth: int = 5) -> list[Path]:
+        """Recursively find directories containing session files (supports nested FilesystemContract structure)."""
+        session_dirs: list[Path] = []
+
+        if max_depth == 0:
+            return session_dirs
+
+        for item in root.iterdir():
+            if not item.is_dir():
                 continue
+            if item.name.startswith(".") or item.name.startswith("@"):
+                continue  # Skip hidden and special directories
 
-        # Sort by started_at (newest first), with deterministic fallback
-        sessions.sort(key=lambda s: (s.started_at or "", s.session_id), reverse=True)
+            # Check if this directory is a session (has events.jsonl or metrics.jsonl)
+            has_events = (item / "events.jsonl").exists()
+            has_metrics = (item / "metrics.jsonl").exists()
 
-        if limit:
-            sessions = sessions[:limit]
+            if has_events or has_metrics:
+                session_dirs.append(item)
+            else:
+                # Recurse into subdirectories
+                session_dirs.extend(self._find_session_dirs(item, max_depth - 1))
 
-        return sessions
+        return session_dirs
 
     def read_session(self, session_id: str) -> SessionSummary | None:
         """Read and aggregate data for a single session.
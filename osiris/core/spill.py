@@ -0,0 +1,252 @@
+"""Memory-budgeted spilling of step outputs shared by the local and E2B runtimes.
+
+Both runtimes cache each step's ``{"df": DataFrame, ...}`` result until its
+downstream consumers ran. :class:`SpillManager` tracks those cached outputs with a
+reference count derived from the manifest ``needs`` edges, releases an output as
+soon as its last consumer finished, and spills DataFrames to disk (Parquet or
+Arrow IPC) whenever the resident set exceeds a configurable memory budget.
+
+Spilling mutates the cached output dict in place: ``df`` is replaced by
+``df_path`` and ``spilled`` is set, which is the layout consumers already read.
+"""
+
+from collections.abc import Callable, Iterable
+import logging
+import math
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SPILL_BUDGET_ENV = "OSIRIS_SPILL_BUDGET_MB"
+SPILL_FORMAT_ENV = "OSIRIS_SPILL_FORMAT"
+SPILL_FORMATS = {"parquet": "parquet", "arrow": "arrow"}
+
+
+def budget_from_env(default: int | None = None) -> int | None:
+    """Return the spill memory budget in bytes from ``OSIRIS_SPILL_BUDGET_MB``.
+
+    Unset or invalid values fall back to ``default`` (``None`` = unlimited).
+    """
+    raw = os.getenv(SPILL_BUDGET_ENV, "").strip()
+    if not raw:
+        return default
+    try:
+        megabytes = float(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {SPILL_BUDGET_ENV}={raw!r}; expected a number of megabytes")
+        return default
+    return max(0, int(megabytes * 1024 * 1024))
+
+
+def format_from_env(default: str = "parquet") -> str:
+    """Return the spill file format from ``OSIRIS_SPILL_FORMAT`` (parquet or arrow)."""
+    value = os.getenv(SPILL_FORMAT_ENV, "").strip().lower()
+    if value in SPILL_FORMATS:
+        return value
+    if value:
+        logger.warning(f"Ignoring unsupported {SPILL_FORMAT_ENV}={value!r}; using {default}")
+    return default
+
+
+def estimate_frame_bytes(df: Any) -> int:
+    """Best-effort resident size of a DataFrame including object payloads."""
+    try:
+        return int(df.memory_usage(index=True, deep=True).sum())
+    except Exception:  # pragma: no cover - non-pandas frames
+        return 0
+
+
+def read_spilled(path: str | Path) -> Any:
+    """Load a spilled DataFrame written by :class:`SpillManager`."""
+    import pandas as pd
+
+    path = Path(path)
+    if path.suffix == ".arrow":
+        import pyarrow as pa
+
+        with pa.memory_map(str(path), "r") as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+    return pd.read_parquet(path)
+
+
+class SpillManager:
+    """Reference-counted cache accounting with spill-to-disk under a memory budget.
+
+    The reference count of an output is the number of manifest steps listing it in
+    ``needs`` that have not finished yet. Outputs nobody consumes are kept until the
+    run ends (callers may still report them) but are the first to be spilled.
+
+    When the budget is exceeded the output whose next consumer runs furthest in the
+    future (manifest order) is spilled first.
+    """
+
+    def __init__(
+        self,
+        steps: Iterable[dict[str, Any]],
+        spill_dir: str | Path,
+        *,
+        memory_budget_bytes: int | None = None,
+        spill_format: str = "parquet",
+        keep_spill_files: bool = False,
+        on_spill: Callable[[str, Path, Any], None] | None = None,
+    ):
+        """Initialize the manager.
+
+        Args:
+            steps: Manifest steps (``id`` and optional ``needs``)
+            spill_dir: Base directory; spills go to ``<spill_dir>/<step_id>/output.<ext>``
+            memory_budget_bytes: Resident byte budget for cached DataFrames (None = unlimited)
+            spill_format: ``parquet`` or ``arrow`` (Arrow IPC file)
+            keep_spill_files: Keep spill files after release (when they are published artifacts)
+            on_spill: Callback ``(step_id, path, df)`` invoked after an output was spilled
+        """
+        if spill_format not in SPILL_FORMATS:
+            raise ValueError(f"Unsupported spill format '{spill_format}' (expected one of: {', '.join(SPILL_FORMATS)})")
+        if memory_budget_bytes is not None and memory_budget_bytes < 0:
+            raise ValueError(f"memory_budget_bytes must be >= 0, got {memory_budget_bytes}")
+
+        self.spill_dir = Path(spill_dir)
+        self.memory_budget_bytes = memory_budget_bytes
+        self.spill_format = spill_format
+        self.keep_spill_files = keep_spill_files
+        self.on_spill = on_spill
+
+        steps = list(steps)
+        self._order = {step["id"]: index for index, step in enumerate(steps)}
+        self._pending: dict[str, set[str]] = {}
+        for step in steps:
+            for upstream_id in step.get("needs") or []:
+                if upstream_id in self._order:
+                    self._pending.setdefault(upstream_id, set()).add(step["id"])
+
+        self._outputs: dict[str, dict[str, Any]] = {}
+        self._resident: dict[str, int] = {}
+        self._lock = threading.RLock()
+
+        self.bytes_in_memory = 0
+        self.peak_bytes = 0
+        self.spilled_steps: list[str] = []
+        self.released_steps: list[str] = []
+
+    def refcount(self, step_id: str) -> int:
+        """Number of consumers of ``step_id`` that have not finished yet."""
+        with self._lock:
+            return len(self._pending.get(step_id, ()))
+
+    def track(self, step_id: str, output: dict[str, Any]) -> bool:
+        """Start accounting for a cached step output.
+
+        Outputs without a pandas DataFrame under ``df`` (e.g. RowStreams) are ignored.
+
+        Returns:
+            True if the output was spilled to stay within the budget
+        """
+        df = output.get("df")
+        if not _is_dataframe(df):
+            return False
+
+        with self._lock:
+            nbytes = estimate_frame_bytes(df)
+            self._outputs[step_id] = output
+            self._resident[step_id] = nbytes
+            self.bytes_in_memory += nbytes
+            self.peak_bytes = max(self.peak_bytes, self.bytes_in_memory)
+            self._enforce_budget()
+            return output.get("spilled") is True
+
+    def release(self, consumer_id: str) -> list[str]:
+        """Mark ``consumer_id`` finished and free outputs whose refcount dropped to zero.
+
+        Returns:
+            Step ids whose outputs were released
+        """
+        released = []
+        with self._lock:
+            for producer_id, consumers in self._pending.items():
+                if consumer_id not in consumers:
+                    continue
+                consumers.discard(consumer_id)
+                if not consumers and producer_id in self._outputs:
+                    self._free(producer_id)
+                    released.append(producer_id)
+        return released
+
+    def stats(self) -> dict[str, Any]:
+        """Summary counters for telemetry."""
+        with self._lock:
+            return {
+                "bytes_in_memory": self.bytes_in_memory,
+                "peak_bytes": self.peak_bytes,
+                "spilled": len(self.spilled_steps),
+                "released": len(self.released_steps),
+            }
+
+    def _next_use(self, step_id: str) -> float:
+        consumers = self._pending.get(step_id)
+        if not consumers:
+            return math.inf
+        return min(self._order.get(consumer, math.inf) for consumer in consumers)
+
+    def _enforce_budget(self) -> None:
+        if self.memory_budget_bytes is None:
+            return
+        while self.bytes_in_memory > self.memory_budget_bytes and self._resident:
+            victim = max(self._resident, key=lambda sid: (self._next_use(sid), self._order.get(sid, -1)))
+            self._spill(victim)
+
+    def _spill(self, step_id: str) -> None:
+        output = self._outputs[step_id]
+        df = output["df"]
+        step_dir = self.spill_dir / step_id
+        step_dir.mkdir(parents=True, exist_ok=True)
+        path = step_dir / f"output.{SPILL_FORMATS[self.spill_format]}"
+
+        if self.spill_format == "arrow":
+            import pyarrow as pa
+
+            table = pa.Table.from_pandas(df)
+            with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        else:
+            df.to_parquet(path)
+
+        # Publish the path before dropping the frame so concurrent readers always find one of them
+        output["df_path"] = path
+        output["spilled"] = True
+        output.pop("df", None)
+
+        self.bytes_in_memory -= self._resident.pop(step_id)
+        self.spilled_steps.append(step_id)
+        logger.debug(f"Spilled output of step {step_id} to {path} ({len(df)} rows)")
+
+        if self.on_spill is not None:
+            self.on_spill(step_id, path, df)
+
+    def _free(self, step_id: str) -> None:
+        output = self._outputs.pop(step_id)
+        nbytes = self._resident.pop(step_id, None)
+        if nbytes is not None:
+            self.bytes_in_memory -= nbytes
+            output.pop("df", None)
+
+        spill_path = output.get("df_path")
+        if spill_path is not None and not self.keep_spill_files:
+            Path(spill_path).unlink(missing_ok=True)
+            output.pop("df_path", None)
+
+        output["released"] = True
+        self.released_steps.append(step_id)
+        logger.debug(f"Released output of step {step_id}")
+
+
+def _is_dataframe(value: Any) -> bool:
+    if value is None:
+        return False
+    try:
+        import pandas as pd
+    except ImportError:  # pragma: no cover - pandas optional in runtime
+        return False
+    return isinstance(value, pd.DataFrame)
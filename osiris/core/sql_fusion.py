@@ -0,0 +1,284 @@
+"""Compile-time SQL optimization of manifest steps.
+
+:func:`optimize_sql_steps` rewrites the compiled steps and their configs before
+they are written out:
+
+* **Fusion** - a ``duckdb.processor`` step whose only input is another
+  ``duckdb.processor`` step (and which is that step's only consumer) absorbs the
+  upstream query as a CTE named after the ``df_<step>`` key it used to read. The
+  upstream step disappears, so its result is never materialized. Chains collapse
+  into the last step, which keeps its id so downstream steps are unaffected.
+* **Pushdown** - when a ``duckdb.processor`` step is the only consumer of a
+  ``mysql.extractor`` and its query is a plain ``SELECT col, ... FROM df_<step>``
+  with an optional ``WHERE`` of simple predicates, the extractor query is wrapped
+  to select only the referenced columns and to apply the ``IS [NOT] NULL``
+  predicates in MySQL. Only single-table extractor queries with unique output
+  column names are wrapped; MySQL rejects derived tables with duplicate column
+  names (error 1060), which a join such as ``SELECT * FROM a JOIN b`` produces. The DuckDB query is left unchanged and re-applies the same
+  projection and filter, so results are identical; comparisons against literals
+  are not pushed because MySQL and DuckDB coerce mixed types differently.
+
+Every rewrite is returned as a record so the compiler can store it in the
+manifest and fold it into the fingerprints.
+"""
+
+import re
+from typing import Any
+
+from .step_naming import build_dataframe_keys
+
+DUCKDB_COMPONENT = "duckdb.processor"
+MYSQL_EXTRACTOR = "mysql.extractor"
+
+# Keys that do not affect how a DuckDB step executes its query
+_FUSION_NEUTRAL_KEYS = {"query", "component", "mode"}
+
+_LEADING_COMMENTS = re.compile(r"\A(?:\s+|--[^\n]*(?:\n|\Z)|/\*.*?\*/)*", re.DOTALL)
+_WITH_PREFIX = re.compile(r"\AWITH\s+(RECURSIVE\s+)?", re.IGNORECASE)
+# Statements that may follow / sit inside a WITH clause (not DESCRIBE, PIVOT, COPY, ...)
+_QUERY_START = re.compile(r"\A(?:\(|(?:SELECT|WITH|FROM|VALUES)\b)", re.IGNORECASE)
+
+_IDENT = r"[A-Za-z_][A-Za-z0-9_]*"
+_SELECT_ITEM = re.compile(rf"\A({_IDENT})(?:\s+AS\s+{_IDENT})?\Z", re.IGNORECASE)
+_NULL_PREDICATE = re.compile(rf"\A({_IDENT})\s+IS\s+(NOT\s+)?NULL\Z", re.IGNORECASE)
+_COMPARISON_PREDICATE = re.compile(
+    rf"\A({_IDENT})\s*(?:=|<>|!=|<=|>=|<|>)\s*(?:-?\d+(?:\.\d+)?|'[^']*')\Z", re.IGNORECASE
+)
+_SIMPLE_SELECT = re.compile(
+    rf"\ASELECT\s+(?P<items>.+?)\s+FROM\s+(?P<source>{_IDENT})(?:\s+WHERE\s+(?P<where>.+?))?\Z",
+    re.IGNORECASE | re.DOTALL,
+)
+_MYSQL_IDENT = rf"(?:{_IDENT}|`[^`]+`)"
+_MYSQL_SELECT_ITEM = re.compile(
+    rf"\A(?:{_MYSQL_IDENT}\.)?({_MYSQL_IDENT})(?:\s+AS\s+({_MYSQL_IDENT}))?\Z", re.IGNORECASE
+)
+# SELECT ... FROM one table [alias] [WHERE / GROUP BY / ORDER BY / LIMIT ...]; joins and comma lists do not match
+_SINGLE_TABLE_SELECT = re.compile(
+    rf"\ASELECT\s+(?P<items>[^()]+?)\s+FROM\s+{_MYSQL_IDENT}(?:\.{_MYSQL_IDENT})?"
+    rf"(?:\s+(?:AS\s+)?(?!(?:WHERE|GROUP|ORDER|LIMIT|JOIN|INNER|LEFT|RIGHT|CROSS|NATURAL|STRAIGHT_JOIN)\b){_IDENT})?"
+    r"(?:\s+(?:WHERE|GROUP\s+BY|ORDER\s+BY|LIMIT)\b.*)?\Z",
+    re.IGNORECASE | re.DOTALL,
+)
+_SQL_KEYWORDS = {"distinct", "all", "from", "where", "select", "and", "or", "not", "null", "is", "as"}
+
+
+def optimize_sql_steps(
+    steps: list[dict[str, Any]], configs: dict[str, dict[str, Any]]
+) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]], list[dict[str, Any]]]:
+    """Fuse DuckDB chains and push projections / null filters into MySQL extractors.
+
+    Args:
+        steps: Manifest steps in topological order (``id``, ``driver``, ``needs``)
+        configs: Per-step configs keyed by step id
+
+    Returns:
+        (steps, configs, rewrites); inputs are not modified
+    """
+    steps = [dict(step) for step in steps]
+    configs = {step_id: dict(config) for step_id, config in configs.items()}
+    rewrites: list[dict[str, Any]] = []
+
+    _fuse_duckdb_chains(steps, configs, rewrites)
+    _push_down_into_mysql(steps, configs, rewrites)
+
+    return steps, configs, rewrites
+
+
+def _consumers(steps: list[dict[str, Any]]) -> dict[str, list[str]]:
+    consumers: dict[str, list[str]] = {step["id"]: [] for step in steps}
+    for step in steps:
+        for need in step.get("needs") or []:
+            if need in consumers:
+                consumers[need].append(step["id"])
+    return consumers
+
+
+def _single_statement(query: Any) -> str | None:
+    """Return ``query`` without trailing semicolons, or None if it is not one statement."""
+    if not isinstance(query, str):
+        return None
+    query = query.strip().rstrip(";").strip()
+    if not query or ";" in query:
+        return None
+    return query
+
+
+def _is_query(sql: str) -> bool:
+    """True if ``sql`` (after leading comments) is a SELECT-style query usable with CTEs."""
+    return bool(_QUERY_START.match(sql[_LEADING_COMMENTS.match(sql).end() :]))
+
+
+def _fuse_duckdb_chains(
+    steps: list[dict[str, Any]], configs: dict[str, dict[str, Any]], rewrites: list[dict[str, Any]]
+) -> None:
+    by_id = {step["id"]: step for step in steps}
+    consumers = _consumers(steps)
+
+    for step in list(steps):
+        needs = step.get("needs") or []
+        if step["driver"] != DUCKDB_COMPONENT or len(needs) != 1:
+            continue
+        upstream = by_id.get(needs[0])
+        if upstream is None or upstream["driver"] != DUCKDB_COMPONENT or consumers[upstream["id"]] != [step["id"]]:
+            continue
+
+        config, upstream_config = configs[step["id"]], configs[upstream["id"]]
+        if _execution_settings(config) != _execution_settings(upstream_config):
+            continue
+
+        query = _single_statement(config.get("query"))
+        upstream_query = _single_statement(upstream_config.get("query"))
+        if query is None or upstream_query is None or not (_is_query(query) and _is_query(upstream_query)):
+            continue
+
+        cte_name = build_dataframe_keys([upstream["id"]])[upstream["id"]]
+        upstream_needs = upstream.get("needs") or []
+        if cte_name in build_dataframe_keys(upstream_needs).values():
+            continue
+
+        config["query"] = _prepend_cte(cte_name, upstream_query, query)
+        step["needs"] = list(upstream_needs)
+        step["fused_steps"] = upstream.get("fused_steps", [upstream["id"]]) + [step["id"]]
+
+        for need in upstream_needs:
+            if need in consumers:
+                consumers[need] = [step["id"] if c == upstream["id"] else c for c in consumers[need]]
+        steps.remove(upstream)
+        del by_id[upstream["id"]], consumers[upstream["id"]], configs[upstream["id"]]
+
+        rewrites.append({"type": "fuse", "step": step["id"], "absorbed": upstream["id"], "cte": cte_name})
+
+
+def _execution_settings(config: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in config.items() if key not in _FUSION_NEUTRAL_KEYS}
+
+
+def _prepend_cte(name: str, cte_query: str, query: str) -> str:
+    """Make ``cte_query`` available to ``query`` as ``WITH name AS (...)``, merging existing WITH clauses."""
+    # The newline keeps a trailing "-- comment" in cte_query from swallowing the parenthesis
+    cte = f"{name} AS (\n{cte_query}\n)"
+    body = query[_LEADING_COMMENTS.match(query).end() :]
+    existing = _WITH_PREFIX.match(body)
+    if existing:
+        recursive = "RECURSIVE " if existing.group(1) else ""
+        return f"WITH {recursive}{cte},\n{body[existing.end():]}"
+    return f"WITH {cte}\n{body}"
+
+
+def _push_down_into_mysql(
+    steps: list[dict[str, Any]], configs: dict[str, dict[str, Any]], rewrites: list[dict[str, Any]]
+) -> None:
+    by_id = {step["id"]: step for step in steps}
+    consumers = _consumers(steps)
+
+    for step in steps:
+        needs = step.get("needs") or []
+        if step["driver"] != DUCKDB_COMPONENT or len(needs) != 1:
+            continue
+        extractor = by_id.get(needs[0])
+        if extractor is None or extractor["driver"] != MYSQL_EXTRACTOR or consumers[extractor["id"]] != [step["id"]]:
+            continue
+
+        extractor_config = configs[extractor["id"]]
+        extractor_query = _single_statement(extractor_config.get("query"))
+        if extractor_query is None or not _has_unique_output_columns(extractor_query):
+            continue
+
+        source = build_dataframe_keys([extractor["id"]])[extractor["id"]]
+        parsed = _parse_simple_select(configs[step["id"]].get("query"), source)
+        if parsed is None:
+            continue
+        columns, null_filters = parsed
+
+        partition_by = extractor_config.get("partition_by")
+        if partition_by and partition_by.lower() not in {col.lower() for col in columns}:
+            # Partition ranges are computed on the wrapped query, so the key must survive
+            columns.append(partition_by)
+
+        select_list = ", ".join(_quote_mysql(col) for col in columns)
+        pushed = f"SELECT {select_list} FROM ({extractor_query}) AS _osiris_src"
+        if null_filters:
+            pushed += " WHERE " + " AND ".join(
+                f"{_quote_mysql(col)} IS {'NOT ' if negated else ''}NULL" for col, negated in null_filters
+            )
+        extractor_config["query"] = pushed
+
+        rewrites.append(
+            {
+                "type": "pushdown",
+                "step": extractor["id"],
+                "consumer": step["id"],
+                "columns": columns,
+                "filters": [f"{col} IS {'NOT ' if negated else ''}NULL" for col, negated in null_filters],
+            }
+        )
+
+
+def _has_unique_output_columns(query: str) -> bool:
+    """True if ``query`` is a single-table SELECT whose output column names are known to be unique.
+
+    That holds for ``SELECT *`` and for plain column lists without repeated names
+    (MySQL compares column names case-insensitively). Anything else, e.g. joins,
+    expressions or subqueries, is rejected.
+    """
+    match = _SINGLE_TABLE_SELECT.match(query[_LEADING_COMMENTS.match(query).end() :])
+    if match is None:
+        return False
+    items = match.group("items").strip()
+    if items == "*":
+        return True
+    names = []
+    for item in items.split(","):
+        item_match = _MYSQL_SELECT_ITEM.match(item.strip())
+        if item_match is None:
+            return False
+        names.append((item_match.group(2) or item_match.group(1)).strip("`").lower())
+    return len(names) == len(set(names))
+
+
+def _parse_simple_select(query: Any, source: str) -> tuple[list[str], list[tuple[str, bool]]] | None:
+    """Parse ``SELECT col [AS alias], ... FROM source [WHERE pred AND ...]``.
+
+    Returns the referenced columns (first-use order) and the ``IS [NOT] NULL``
+    predicates, or None if the query uses anything beyond that grammar.
+    """
+    query = _single_statement(query)
+    if query is None:
+        return None
+    match = _SIMPLE_SELECT.match(query)
+    if match is None or match.group("source").lower() != source.lower():
+        return None
+
+    columns: list[str] = []
+
+    def reference(column: str) -> bool:
+        if column.lower() in _SQL_KEYWORDS:
+            return False
+        if column.lower() not in {col.lower() for col in columns}:
+            columns.append(column)
+        return True
+
+    for item in match.group("items").split(","):
+        item_match = _SELECT_ITEM.match(item.strip())
+        if item_match is None or not reference(item_match.group(1)):
+            return None
+
+    null_filters: list[tuple[str, bool]] = []
+    where = match.group("where")
+    if where:
+        for predicate in re.split(r"\s+AND\s+", where.strip(), flags=re.IGNORECASE):
+            null_match = _NULL_PREDICATE.match(predicate)
+            if null_match:
+                if not reference(null_match.group(1)):
+                    return None
+                null_filters.append((null_match.group(1), bool(null_match.group(2))))
+                continue
+            comparison = _COMPARISON_PREDICATE.match(predicate)
+            if comparison is None or not reference(comparison.group(1)):
+                return None
+
+    return columns, null_filters
+
+
+def _quote_mysql(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
@@ -0,0 +1,38 @@
+"""Shared connection setup for the small SQLite stores Osiris keeps next to its files.
+
+:class:`SQLiteStore` creates the database on first use: it makes the parent
+directory, switches the file to WAL mode with ``synchronous=NORMAL`` (readers
+never block the single writer, other processes included) and runs the
+subclass's ``SCHEMA`` statements once per instance. Every :meth:`SQLiteStore._connect`
+call returns a fresh connection the caller closes.
+"""
+
+from pathlib import Path
+import sqlite3
+
+CONNECT_TIMEOUT = 10.0
+
+
+class SQLiteStore:
+    """Base for stores backed by one SQLite file; subclasses define ``SCHEMA``."""
+
+    SCHEMA: tuple[str, ...] = ()
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path)
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=CONNECT_TIMEOUT)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                for statement in self.SCHEMA:
+                    conn.execute(statement)
+                conn.commit()
+            finally:
+                conn.close()
+            self._ready = True
+        return sqlite3.connect(str(self.db_path), timeout=CONNECT_TIMEOUT)
@@ -14,12 +14,14 @@
 
 """SQLite-based state store implementation."""
 
+from datetime import UTC, datetime
 import json
 from pathlib import Path
 import sqlite3
 from typing import Any
 
 from .interfaces import IStateStore
+from .sqlite_store import SQLiteStore
 
 
 class SQLiteStateStore(IStateStore):
@@ -36,15 +38,13 @@ class SQLiteStateStore(IStateStore):
         self.conn = sqlite3.connect(str(self.db_path))
 
         # Create state table
-        self.conn.execute(
-            """
+        self.conn.execute("""
             CREATE TABLE IF NOT EXISTS state (
                 key TEXT PRIMARY KEY,
                 value TEXT,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
-        """
-        )
+        """)
         self.conn.commit()
 
     def set(self, key: str, value: Any) -> None:
@@ -79,3 +79,135 @@ class SQLiteStateStore(IStateStore):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+class PipelineStateStore(SQLiteStore):
+    """Durable incremental state for pipeline steps, keyed by pipeline slug and step id.
+
+    Extractors such as ``posthog.extractor`` return a ``state`` dict (SEEK cursors,
+    dedup caches). The runner injects the stored state as ``inputs["state"]`` on the
+    next run and commits the new states of all steps in one transaction once the
+    whole run succeeded, so a failed downstream writer never advances a cursor.
+
+    Checkpoints are written while a step is still extracting. They are kept apart
+    from committed state, take precedence when loading (a failed run resumes from
+    its last checkpoint) and are cleared when the step's state is committed.
+
+    Process-safe via SQLite (WAL mode), like :class:`osiris.core.run_ids.CounterStore`.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS step_state (
+            pipeline_slug TEXT NOT NULL,
+            step_id TEXT NOT NULL,
+            state TEXT NOT NULL,
+            run_id TEXT,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (pipeline_slug, step_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS step_checkpoint (
+            pipeline_slug TEXT NOT NULL,
+            step_id TEXT NOT NULL,
+            state TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (pipeline_slug, step_id)
+        )
+        """,
+    )
+
+    def __init__(self, db_path: str | Path):
+        """Initialize the store (the database is created on first use).
+
+        Args:
+            db_path: Path to the SQLite database, usually ``.osiris/index/state.sqlite``
+        """
+        super().__init__(db_path)
+
+    def load(self, pipeline_slug: str, step_id: str) -> dict[str, Any] | None:
+        """Return the state to resume from: the last checkpoint, else the committed state."""
+        if not self.db_path.exists():
+            return None
+
+        conn = self._connect()
+        try:
+            for table in ("step_checkpoint", "step_state"):
+                row = conn.execute(
+                    f"SELECT state FROM {table} WHERE pipeline_slug = ? AND step_id = ?",
+                    (pipeline_slug, step_id),
+                ).fetchone()
+                if row is not None:
+                    return json.loads(row[0])
+            return None
+        finally:
+            conn.close()
+
+    def checkpoint(self, pipeline_slug: str, step_id: str, state: dict[str, Any]) -> None:
+        """Durably record mid-extraction progress of a step."""
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT INTO step_checkpoint (pipeline_slug, step_id, state, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(pipeline_slug, step_id) DO UPDATE
+                SET state = excluded.state,
+                    updated_at = excluded.updated_at
+            """,
+                (pipeline_slug, step_id, json.dumps(state, default=str), datetime.now(UTC).isoformat()),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def commit(self, pipeline_slug: str, states: dict[str, dict[str, Any]], run_id: str | None = None) -> None:
+        """Atomically store the final states of several steps and drop their checkpoints."""
+        if not states:
+            return
+
+        now = datetime.now(UTC).isoformat()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for step_id, state in states.items():
+                conn.execute(
+                    """
+                    INSERT INTO step_state (pipeline_slug, step_id, state, run_id, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(pipeline_slug, step_id) DO UPDATE
+                    SET state = excluded.state,
+                        run_id = excluded.run_id,
+                        updated_at = excluded.updated_at
+                """,
+                    (pipeline_slug, step_id, json.dumps(state, default=str), run_id, now),
+                )
+                conn.execute(
+                    "DELETE FROM step_checkpoint WHERE pipeline_slug = ? AND step_id = ?", (pipeline_slug, step_id)
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def clear(self, pipeline_slug: str, step_id: str | None = None) -> None:
+        """Forget committed state and checkpoints (one step or the whole pipeline)."""
+        if not self.db_path.exists():
+            return
+
+        conn = self._connect()
+        try:
+            for table in ("step_state", "step_checkpoint"):
+                if step_id is None:
+                    conn.execute(f"DELETE FROM {table} WHERE pipeline_slug = ?", (pipeline_slug,))
+                else:
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE pipeline_slug = ? AND step_id = ?",
+                        (pipeline_slug, step_id),
+                    )
+            conn.commit()
+        finally:
+            conn.close()
@@ -6,6 +6,18 @@ from typing import Any
 import duckdb
 import pandas as pd
 
+from osiris.core.duckdb_session import DuckDBTable, quote_ident
+
+
+def _is_arrow_backed(df: pd.DataFrame) -> bool:
+    """True if every column of ``df`` is stored in Arrow memory (``pd.ArrowDtype``)."""
+    return len(df.columns) > 0 and all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+def _connection_config(config: dict[str, Any]) -> dict[str, Any]:
+    """DuckDB settings for a step-local connection (``threads``, ``memory_limit``, ``temp_directory``)."""
+    return {key: config[key] for key in ("threads", "memory_limit", "temp_directory") if config.get(key) is not None}
+
 
 class DuckDBProcessorDriver:
     """DuckDB processor driver for executing SQL transformations on DataFrames."""
@@ -27,28 +39,56 @@ class DuckDBProcessorDriver:
             step_id: Step identifier
             config: Configuration containing 'query' SQL string
             inputs: Optional inputs with keys starting with 'df_' containing input DataFrames
-            ctx: Execution context for logging metrics
+                (or DuckDBTable handles produced by upstream DuckDB steps in the same session)
+            ctx: Execution context for logging metrics; may provide ``duckdb_session`` (shared
+                run-scoped database) and ``keep_in_duckdb`` (only DuckDB steps consume the output)
 
         Returns:
-            Dictionary with 'df' key containing transformed DataFrame
+            Dictionary with 'df' key containing transformed DataFrame, or a DuckDBTable
+            when ``ctx.keep_in_duckdb`` is set
         """
         # Get SQL query from config
         query = config.get("query", "").strip()
         if not query:
             raise ValueError(f"Step {step_id}: Missing 'query' in config")
 
+        session = getattr(ctx, "duckdb_session", None)
+        keep_in_duckdb = session is not None and getattr(ctx, "keep_in_duckdb", False) is True
+
+        conn = None
         try:
-            # Create in-memory DuckDB connection
-            conn = duckdb.connect(":memory:")
+            if session is not None:
+                # Run-scoped database shared with the other DuckDB steps of this run
+                conn = session.cursor()
+            else:
+                # Create in-memory DuckDB connection
+                conn = duckdb.connect(":memory:", config=_connection_config(config))
 
             # Register all DataFrames from inputs dict
             registered = []
+            arrow_inputs = False
             if inputs:
                 for key, value in inputs.items():
-                    if key.startswith("df_") and isinstance(value, pd.DataFrame):
-                        conn.register(key, value)
-                        registered.append(key)
-                        self.logger.debug(f"Step {step_id}: Registered table '{key}' with {len(value)} rows")
+                    if not key.startswith("df_"):
+                        continue
+                    if isinstance(value, DuckDBTable):
+                        # Upstream DuckDB step kept its result in the session: read it in place
+                        conn.execute(
+                            f"CREATE OR REPLACE TEMP VIEW {quote_ident(key)} AS SELECT * FROM {quote_ident(value.name)}"
+                        )
+                    elif isinstance(value, pd.DataFrame):
+                        if _is_arrow_backed(value):
+                            # Hand the Arrow buffers to DuckDB without converting through NumPy
+                            import pyarrow as pa  # noqa: PLC0415 - only for Arrow-backed inputs
+
+                            conn.register(key, pa.Table.from_pandas(value, preserve_index=False))
+                            arrow_inputs = True
+                        else:
+                            conn.register(key, value)
+                    else:
+                        continue
+                    registered.append(key)
+                    self.logger.debug(f"Step {step_id}: Registered table '{key}' with {len(value)} rows")
 
             # Allow empty inputs for data generation queries (e.g., generate_series)
             if registered:
@@ -58,10 +98,17 @@ class DuckDBProcessorDriver:
 
             # Execute the SQL query
             self.logger.debug(f"Step {step_id}: Executing DuckDB query")
-            result = conn.execute(query).fetchdf()
-
-            # Close connection
-            conn.close()
+            if keep_in_duckdb:
+                # Only DuckDB steps consume this output: keep it as a session table
+                result = session.materialize(step_id, conn, query)
+            elif arrow_inputs:
+                # Keep Arrow-backed pipelines in Arrow memory
+                arrow_result = conn.execute(query).arrow()
+                if hasattr(arrow_result, "read_all"):  # DuckDB >= 1.4 returns a RecordBatchReader
+                    arrow_result = arrow_result.read_all()
+                result = arrow_result.to_pandas(types_mapper=pd.ArrowDtype)
+            else:
+                result = conn.execute(query).fetchdf()
 
             # Log metrics
             total_rows_read = sum(len(inputs[key]) for key in registered) if registered else 0
@@ -77,3 +124,7 @@ class DuckDBProcessorDriver:
             self.logger.error(f"Step {step_id}: DuckDB execution failed: {e}")
             self.logger.error(f"Query was: {query[:500]}...")  # Log first 500 chars of query
             raise RuntimeError(f"DuckDB transformation failed: {e}") from e
+        finally:
+            # Close connection (or this step's cursor on the session)
+            if conn is not None:
+                conn.close()
@@ -1,16 +1,84 @@
 """Filesystem CSV extractor driver implementation."""
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+import glob
+import io
+import itertools
 import logging
 from pathlib import Path
 import subprocess
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from osiris.core.config import parse_connection_ref, resolve_connection
+from osiris.core.driver import DEFAULT_STREAM_BATCH_SIZE, RowStream, streaming_requested
 
 logger = logging.getLogger(__name__)
 
+DTYPE_BACKENDS = {"numpy", "pyarrow"}
+
+# pandas dtype names that map to Arrow strings rather than pa.type_for_alias()
+_ARROW_STRING_DTYPES = {"str", "object", "string"}
+
+# Smallest byte range worth handing to a worker when splitting one large file
+MIN_SPLIT_BYTES = 16 * 1024 * 1024
+
+# Encodings in which b"\n" always marks a line end, so byte ranges can be aligned on it
+_SPLITTABLE_ENCODINGS = {"utf-8", "ascii", "latin-1", "iso-8859-1"}
+_COMPRESSED_SUFFIXES = {".gz", ".bz2", ".zip", ".xz", ".zst", ".tar"}
+
+
+def _read_csv_file(path: Path, read_params: dict[str, Any]) -> pd.DataFrame | None:
+    """Parse one CSV file; runs in a worker process. Returns None for empty files."""
+    try:
+        return pd.read_csv(path, **read_params)
+    except pd.errors.EmptyDataError:
+        return None
+
+
+def _read_csv_byte_range(path: Path, start: int, end: int, read_params: dict[str, Any]) -> pd.DataFrame | None:
+    """Parse the lines of ``path`` that start within ``[start, end)``; runs in a worker process.
+
+    A line that crosses ``end`` is finished by this range, and the next range skips
+    it, so every line is parsed exactly once.
+    """
+    with open(path, "rb") as f:
+        if start > 0:
+            # Skip the tail of a line that started in the previous range
+            f.seek(start - 1)
+            f.readline()
+        position = f.tell()
+        if position >= end:
+            return None
+        data = f.read(end - position)
+        if not data.endswith(b"\n"):
+            data += f.readline()
+    if not data.strip():
+        return None
+    return pd.read_csv(io.BytesIO(data), **read_params)
+
+
+def _common_dtypes(frames: list[pd.DataFrame]) -> dict[Any, Any]:
+    """Dtypes for the columns whose inferred dtype differs between ``frames``.
+
+    A column that is numeric everywhere gets the common numeric dtype (ints next to
+    floats or NaNs become float64, as in a single read); any other disagreement
+    keeps the raw text, like pandas does for a column mixing numbers and strings.
+    """
+    common: dict[Any, Any] = {}
+    for column in frames[0].columns:
+        dtypes = {frame[column].dtype for frame in frames}
+        if len(dtypes) == 1:
+            continue
+        if all(dtype.kind in "iuf" for dtype in dtypes):
+            common[column] = np.result_type(*dtypes)
+        else:
+            common[column] = str
+    return common
+
 
 class FilesystemCsvExtractorDriver:
     """Driver for extracting data from CSV files."""
@@ -33,7 +101,8 @@ class FilesystemCsvExtractorDriver:
             ctx: Execution context for logging metrics
 
         Returns:
-            {"df": DataFrame} with CSV data
+            {"df": DataFrame} with CSV data, or {"df": RowStream} of ``chunk_size``
+            row batches when the runner requests streaming
         """
         # Resolve connection if provided
         base_dir = None
@@ -74,12 +143,12 @@ class FilesystemCsvExtractorDriver:
         # Resolve path (with base_dir from connection if available)
         resolved_path = self._resolve_path(file_path, ctx, base_dir=base_dir)
 
-        # Validate file exists
-        if not resolved_path.exists():
-            raise FileNotFoundError(f"Step {step_id}: CSV file not found: {resolved_path}")
+        # A glob pattern or directory expands to several files, read in sorted order
+        files = self._expand_files(step_id, resolved_path)
 
-        if not resolved_path.is_file():
-            raise ValueError(f"Step {step_id}: Path is not a file: {resolved_path}")
+        workers = int(config.get("workers", 1))
+        if workers < 1:
+            raise ValueError(f"Step {step_id}: 'workers' must be >= 1, got {workers}")
 
         # Extract CSV parsing options with defaults
         delimiter = config.get("delimiter", ",")
@@ -107,10 +176,15 @@ class FilesystemCsvExtractorDriver:
         skip_blank_lines = config.get("skip_blank_lines", True)
         compression = config.get("compression", "infer")
 
+        dtype_backend = config.get("dtype_backend", "numpy")
+        if dtype_backend not in DTYPE_BACKENDS:
+            raise ValueError(f"Step {step_id}: Invalid dtype_backend '{dtype_backend}'. Expected numpy or pyarrow")
+        if dtype_backend == "pyarrow":
+            return self._read_arrow(step_id, files, config, header, ctx)
+
         try:
-            # Build pandas read_csv parameters
+            # Build pandas read_csv parameters (the file is passed separately)
             read_params = {
-                "filepath_or_buffer": resolved_path,
                 "sep": delimiter,
                 "encoding": encoding,
                 "header": header,
@@ -140,14 +214,36 @@ class FilesystemCsvExtractorDriver:
             if compression != "infer":  # Only include if not the default
                 read_params["compression"] = compression
 
-            # Read CSV file
-            logger.info(f"Step {step_id}: Reading CSV from {resolved_path}")
-            df = pd.read_csv(**read_params)
+            if streaming_requested(ctx):
+                chunk_size = int(config.get("chunk_size", DEFAULT_STREAM_BATCH_SIZE))
+                logger.info(f"Step {step_id}: Streaming CSV from {resolved_path} in chunks of {chunk_size}")
+                if len(files) == 1:
+                    # Creating the reader parses the header, so empty/invalid files fail here
+                    readers = [pd.read_csv(files[0], **read_params, chunksize=chunk_size)]
+                else:
+                    # Shards are opened one at a time; empty ones are skipped
+                    opened = (self._open_chunked(path, read_params, chunk_size) for path in files)
+                    readers = (reader for reader in opened if reader is not None)
+                return {"df": RowStream(self._stream_chunks(step_id, readers, columns, ctx, limit=limit))}
+
+            # Read CSV file(s)
+            if len(files) > 1:
+                logger.info(f"Step {step_id}: Reading {len(files)} CSV files matching {resolved_path}")
+                df = self._read_files(files, read_params, workers)
+            elif config.get("split_large_files") and self._can_split(files[0], config, workers):
+                logger.info(f"Step {step_id}: Reading CSV from {resolved_path} in {workers} byte ranges")
+                df = self._read_byte_ranges(files[0], read_params, workers, has_header=header == 0)
+            else:
+                logger.info(f"Step {step_id}: Reading CSV from {resolved_path}")
+                df = pd.read_csv(files[0], **read_params)
 
             # Reorder columns if specific columns were requested
-            if columns is not None and isinstance(columns, list):
+            if columns is not None and isinstance(columns, list) and len(df.columns):
                 # Preserve the order specified in columns parameter
                 df = df[columns]
+            if limit is not None and len(df) > limit:
+                # nrows applies per file
+                df = df.head(limit)
 
             # Log metrics
             rows_read = len(df)
@@ -183,6 +279,322 @@ class FilesystemCsvExtractorDriver:
             logger.error(f"Step {step_id}: {error_msg}")
             raise RuntimeError(error_msg) from e
 
+    def _stream_chunks(
+        self, step_id: str, readers: Iterable[Any], columns: list[str] | None, ctx: Any, *, limit: int | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """Yield CSV chunks from pandas TextFileReaders in turn and report rows_read when exhausted."""
+        rows_read = 0
+        for reader in readers:
+            with reader:
+                for raw_chunk in reader:
+                    # Preserve the order specified in columns parameter
+                    chunk = raw_chunk[columns] if isinstance(columns, list) else raw_chunk
+                    if limit is not None:
+                        chunk = chunk.iloc[: limit - rows_read]
+                    rows_read += len(chunk)
+                    if len(chunk):
+                        yield chunk
+                    if limit is not None and rows_read >= limit:
+                        break
+            if limit is not None and rows_read >= limit:
+                break
+
+        logger.info(f"Step {step_id}: Streamed {rows_read} rows from CSV file")
+        if ctx and hasattr(ctx, "log_metric"):
+            ctx.log_metric("rows_read", rows_read, tags={"step": step_id})
+
+    @staticmethod
+    def _open_chunked(path: Path, read_params: dict[str, Any], chunk_size: int) -> Any:
+        """Open a chunked reader for ``path``, or None if the file is empty."""
+        try:
+            return pd.read_csv(path, **read_params, chunksize=chunk_size)
+        except pd.errors.EmptyDataError:
+            logger.warning(f"Skipping empty CSV file: {path}")
+            return None
+
+    @staticmethod
+    def _read_files(files: list[Path], read_params: dict[str, Any], workers: int) -> pd.DataFrame:
+        """Parse several files, in a process pool when ``workers`` > 1, and concatenate them in order."""
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+                frames = list(pool.map(_read_csv_file, files, itertools.repeat(read_params)))
+        else:
+            frames = [_read_csv_file(path, read_params) for path in files]
+
+        frames = [frame for frame in frames if frame is not None]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    @staticmethod
+    def _can_split(path: Path, config: dict, workers: int) -> bool:
+        """True if ``path`` can be split into byte ranges aligned on newlines.
+
+        Requires an uncompressed file in an ASCII-compatible encoding with at most
+        a first-row header, and no options that count rows from the file start.
+        Quoted fields must not contain newlines.
+        """
+        header = config.get("header", True)
+        compression = config.get("compression", "infer")
+        compressed = compression not in ("infer", None) or path.suffix.lower() in _COMPRESSED_SUFFIXES
+        return (
+            workers > 1
+            and not compressed
+            and config.get("encoding", "utf-8") in _SPLITTABLE_ENCODINGS
+            and header in (True, False, 0)
+            and not config.get("skip_rows")
+            and config.get("limit") is None
+            and config.get("comment") is None
+            and path.stat().st_size >= 2 * MIN_SPLIT_BYTES
+        )
+
+    @staticmethod
+    def _read_byte_ranges(path: Path, read_params: dict[str, Any], workers: int, *, has_header: bool) -> pd.DataFrame:
+        """Parse one large file as ``workers`` byte ranges in a process pool."""
+        range_params = {**read_params, "header": None}
+        data_start = 0
+        if has_header:
+            # Ranges carry no header line, so name the columns up front
+            range_params["names"] = list(
+                pd.read_csv(path, nrows=0, sep=read_params["sep"], encoding=read_params["encoding"]).columns
+            )
+            with open(path, "rb") as f:
+                f.readline()
+                data_start = f.tell()
+
+        size = path.stat().st_size
+        ranges = max(1, min(workers, (size - data_start) // MIN_SPLIT_BYTES))
+        step = -(-(size - data_start) // ranges)
+        starts = [data_start + i * step for i in range(ranges)]
+        ends = [min(start + step, size) for start in starts]
+
+        with ProcessPoolExecutor(max_workers=ranges) as pool:
+            frames = list(
+                pool.map(_read_csv_byte_range, itertools.repeat(path), starts, ends, itertools.repeat(range_params))
+            )
+
+            # Each range inferred its own dtypes; ranges that disagree with the others are
+            # parsed again with the dtypes of the whole file, so the result does not depend
+            # on where the file was split
+            parsed = [frame for frame in frames if frame is not None]
+            user_dtype = read_params.get("dtype")
+            common = {}
+            if len(parsed) > 1 and (user_dtype is None or isinstance(user_dtype, dict)):
+                # Columns typed by the config are already consistent
+                parse_dates = read_params.get("parse_dates")
+                configured = set(user_dtype or ()) | set(parse_dates if isinstance(parse_dates, list) else ())
+                common = {col: dtype for col, dtype in _common_dtypes(parsed).items() if col not in configured}
+            if common:
+                expected = {column: np.dtype(object if dtype is str else dtype) for column, dtype in common.items()}
+                retry = [
+                    index
+                    for index, frame in enumerate(frames)
+                    if frame is not None and any(frame[col].dtype != dtype for col, dtype in expected.items())
+                ]
+                retry_params = {**range_params, "dtype": {**(user_dtype or {}), **common}}
+                reparsed = pool.map(
+                    _read_csv_byte_range,
+                    itertools.repeat(path),
+                    [starts[index] for index in retry],
+                    [ends[index] for index in retry],
+                    itertools.repeat(retry_params),
+                )
+                for index, frame in zip(retry, reparsed, strict=True):
+                    frames[index] = frame
+
+        frames = [frame for frame in frames if frame is not None]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=range_params.get("names"))
+
+    def _read_arrow(self, step_id: str, files: list[Path], config: dict, header: int | None, ctx: Any) -> dict:
+        """Read the CSV file(s) with the multithreaded ``pyarrow.csv`` reader into Arrow-backed DataFrames.
+
+        Columns use ``pd.ArrowDtype``, so strings stay in Arrow buffers instead of
+        Python objects. When streaming, the column types of each file are inferred
+        from its first block.
+        """
+        import pyarrow as pa  # noqa: PLC0415 - optional dtype_backend
+        from pyarrow import csv as pa_csv  # noqa: PLC0415
+
+        read_options, parse_options, convert_options = self._arrow_csv_options(step_id, config, header)
+        compression = config.get("compression", "infer")
+        limit = config.get("limit")
+        options = {"read_options": read_options, "parse_options": parse_options, "convert_options": convert_options}
+
+        def open_source(path: Path) -> Any:
+            return pa.input_stream(str(path), compression="detect" if compression == "infer" else compression)
+
+        def open_reader(path: Path) -> tuple[Any, Any] | None:
+            source = open_source(path)
+            try:
+                return source, pa_csv.open_csv(source, **options)
+            except pa.ArrowInvalid as e:
+                source.close()
+                if "Empty CSV file" not in str(e) or len(files) == 1:
+                    raise
+                logger.warning(f"Step {step_id}: Skipping empty CSV file: {path}")
+                return None
+
+        tables = []
+        try:
+            if streaming_requested(ctx):
+                chunk_size = int(config.get("chunk_size", DEFAULT_STREAM_BATCH_SIZE))
+                logger.info(f"Step {step_id}: Streaming CSV from {files[0]} with pyarrow in chunks of {chunk_size}")
+                # Opening the first reader parses its header and first block, so invalid files fail here
+                first = open_reader(files[0])
+                rest = (open_reader(path) for path in files[1:])
+                readers = (reader for reader in itertools.chain([first], rest) if reader is not None)
+                batches = self._stream_arrow_batches(step_id, readers, chunk_size, limit=limit, header=header, ctx=ctx)
+                return {"df": RowStream(batches)}
+
+            logger.info(f"Step {step_id}: Reading {len(files)} CSV file(s) from {files[0]} with pyarrow")
+            for path in files:
+                try:
+                    with open_source(path) as source:
+                        tables.append(pa_csv.read_csv(source, **options))
+                except pa.ArrowInvalid as e:
+                    if "Empty CSV file" not in str(e):
+                        raise
+                    logger.warning(f"Step {step_id}: CSV file is empty: {path}")
+        except pa.ArrowInvalid as e:
+            if "Empty CSV file" not in str(e):
+                error_msg = f"CSV parsing failed: {str(e)}"
+                logger.error(f"Step {step_id}: {error_msg}")
+                raise RuntimeError(error_msg) from e
+            logger.warning(f"Step {step_id}: CSV file is empty: {files[0]}")
+
+        table = pa.concat_tables(tables, promote_options="permissive") if tables else pa.table({})
+        if limit is not None:
+            table = table.slice(0, limit)
+        df = self._arrow_to_pandas(table, header)
+
+        rows_read = len(df)
+        logger.info(f"Step {step_id}: Read {rows_read} rows from CSV file")
+        if ctx and hasattr(ctx, "log_metric"):
+            ctx.log_metric("rows_read", rows_read, tags={"step": step_id})
+
+        return {"df": df}
+
+    def _arrow_csv_options(self, step_id: str, config: dict, header: int | None) -> tuple[Any, Any, Any]:
+        """Translate the pandas-style config into ``pyarrow.csv`` read, parse and convert options."""
+        import pyarrow as pa  # noqa: PLC0415 - optional dtype_backend
+        from pyarrow import csv as pa_csv  # noqa: PLC0415
+
+        if config.get("comment") is not None:
+            raise ValueError(f"Step {step_id}: 'comment' is not supported with dtype_backend 'pyarrow'")
+
+        dtype = config.get("dtype") or {}
+        if not isinstance(dtype, dict):
+            raise ValueError(f"Step {step_id}: 'dtype' must be a column mapping with dtype_backend 'pyarrow'")
+
+        # pyarrow skips rows before looking for the header, so a header row index is more skipped rows
+        skip_rows = int(config.get("skip_rows") or 0) + (header or 0)
+        read_options = pa_csv.ReadOptions(
+            use_threads=True,
+            encoding=config.get("encoding", "utf-8"),
+            skip_rows=skip_rows,
+            autogenerate_column_names=header is None,
+        )
+
+        on_bad_lines = config.get("on_bad_lines", "error")
+        invalid_row_handler = None
+        if on_bad_lines in ("skip", "warn"):
+
+            def invalid_row_handler(row: Any) -> str:
+                if on_bad_lines == "warn":
+                    logger.warning(f"Step {step_id}: Skipping bad CSV line {row.number}: {row.text[:100]}")
+                return "skip"
+
+        parse_options = pa_csv.ParseOptions(
+            delimiter=config.get("delimiter", ","),
+            ignore_empty_lines=config.get("skip_blank_lines", True),
+            invalid_row_handler=invalid_row_handler,
+        )
+
+        column_types = {
+            name: pa.string() if str(value) in _ARROW_STRING_DTYPES else pa.type_for_alias(str(value).lower())
+            for name, value in dtype.items()
+        }
+        parse_dates = config.get("parse_dates")
+        if isinstance(parse_dates, list):
+            for name in parse_dates:
+                column_types.setdefault(name, pa.timestamp("ns"))
+
+        convert_options = pa_csv.ConvertOptions(
+            column_types=column_types,
+            null_values=list(pa_csv.ConvertOptions().null_values) + list(config.get("na_values") or []),
+            strings_can_be_null=True,
+            include_columns=config.get("columns") or None,
+        )
+        return read_options, parse_options, convert_options
+
+    def _stream_arrow_batches(
+        self,
+        step_id: str,
+        readers: Iterable[tuple[Any, Any]],
+        chunk_size: int,
+        *,
+        limit: int | None,
+        header: int | None,
+        ctx: Any,
+    ) -> Iterator[pd.DataFrame]:
+        """Re-chunk each file's pyarrow record batches into ``chunk_size`` row DataFrames."""
+        import pyarrow as pa  # noqa: PLC0415 - optional dtype_backend
+
+        rows_read = 0
+        for source, reader in readers:
+            pending = pa.Table.from_batches([], schema=reader.schema)
+            with source:
+                for batch in reader:
+                    rows = batch if limit is None else batch.slice(0, limit - rows_read - pending.num_rows)
+                    pending = pa.concat_tables([pending, pa.Table.from_batches([rows])])
+                    while pending.num_rows >= chunk_size:
+                        rows_read += chunk_size
+                        yield self._arrow_to_pandas(pending.slice(0, chunk_size), header)
+                        pending = pending.slice(chunk_size)
+                    if limit is not None and rows_read + pending.num_rows >= limit:
+                        break
+
+            if pending.num_rows:
+                rows_read += pending.num_rows
+                yield self._arrow_to_pandas(pending, header)
+            if limit is not None and rows_read >= limit:
+                break
+
+        logger.info(f"Step {step_id}: Streamed {rows_read} rows from CSV file")
+        if ctx and hasattr(ctx, "log_metric"):
+            ctx.log_metric("rows_read", rows_read, tags={"step": step_id})
+
+    @staticmethod
+    def _arrow_to_pandas(table: Any, header: int | None) -> pd.DataFrame:
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        if header is None:
+            # Match pandas' integer column labels for header-less files
+            df.columns = range(len(df.columns))
+        return df
+
+    @staticmethod
+    def _expand_files(step_id: str, path: Path) -> list[Path]:
+        """Expand a glob pattern or directory into the sorted list of CSV files to read.
+
+        An existing path is taken literally, so names such as ``report[1].csv`` are not
+        treated as patterns.
+        """
+        if not path.exists():
+            if glob.has_magic(str(path)):
+                files = sorted(Path(match) for match in glob.glob(str(path)) if Path(match).is_file())
+                if not files:
+                    raise FileNotFoundError(f"Step {step_id}: No CSV files match: {path}")
+                return files
+            raise FileNotFoundError(f"Step {step_id}: CSV file not found: {path}")
+
+        if path.is_dir():
+            files = sorted(path.glob("*.csv"))
+            if not files:
+                raise FileNotFoundError(f"Step {step_id}: No CSV files in directory: {path}")
+            return files
+
+        if not path.is_file():
+            raise ValueError(f"Step {step_id}: Path is not a file: {path}")
+        return [path]
+
     def _resolve_path(self, file_path: str, ctx: Any, base_dir: str | None = None) -> Path:
         """Resolve file path to absolute Path object.
 
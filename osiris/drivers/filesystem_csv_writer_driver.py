@@ -1,24 +1,38 @@
 """Filesystem CSV writer driver implementation."""
 
+from collections.abc import Iterator
+import csv
+import gzip
+import io
 import logging
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import pandas as pd
 
+from osiris.core.driver import RowStream, is_tabular_input
+
 logger = logging.getLogger(__name__)
 
+OUTPUT_FORMATS = {"csv", "parquet", "arrow"}
+COMPRESSIONS = {"none", "gzip", "zstd"}
+QUOTING = {"minimal": csv.QUOTE_MINIMAL, "all": csv.QUOTE_ALL, "nonnumeric": csv.QUOTE_NONNUMERIC}
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+
 
 class FilesystemCsvWriterDriver:
-    """Driver for writing DataFrames to CSV files."""
+    """Driver for writing DataFrames (or RowStreams of DataFrame batches) to CSV, Parquet or Arrow IPC files."""
 
     def run(self, *, step_id: str, config: dict, inputs: dict | None = None, ctx: Any = None) -> dict:
-        """Write DataFrame to CSV file.
+        """Write DataFrame to CSV file (or Parquet / Arrow IPC with ``format``).
+
+        Columns are always written in sorted order so output is deterministic.
 
         Args:
             step_id: Step identifier
             config: Must contain 'path' and optional CSV settings
-            inputs: Must contain 'df' key with DataFrame to write
+            inputs: Must contain 'df' key with DataFrame or RowStream to write
             ctx: Execution context for logging metrics
 
         Returns:
@@ -33,7 +47,7 @@ class FilesystemCsvWriterDriver:
         df = None
         df_key = None
         for key, value in inputs.items():
-            if (key.startswith("df_") or key == "df") and isinstance(value, pd.DataFrame):
+            if (key.startswith("df_") or key == "df") and is_tabular_input(value):
                 df = value
                 df_key = key
                 break
@@ -44,7 +58,10 @@ class FilesystemCsvWriterDriver:
                 f"Expected key 'df' or starting with 'df_'. Got: {list(inputs.keys())}"
             )
 
-        logger.debug(f"Step {step_id}: Using DataFrame from {df_key} ({len(df)} rows)")
+        if isinstance(df, RowStream):
+            logger.debug(f"Step {step_id}: Using RowStream from {df_key}")
+        else:
+            logger.debug(f"Step {step_id}: Using DataFrame from {df_key} ({len(df)} rows)")
 
         # Get configuration
         file_path = config.get("path")
@@ -57,6 +74,25 @@ class FilesystemCsvWriterDriver:
         header = config.get("header", True)
         newline_config = config.get("newline", "lf")
 
+        output_format = config.get("format", "csv")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Step {step_id}: Invalid format '{output_format}'. Expected csv, parquet or arrow")
+
+        compression = config.get("compression", "none")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Step {step_id}: Invalid compression '{compression}'. Expected none, gzip or zstd")
+        if output_format == "arrow" and compression == "gzip":
+            raise ValueError(f"Step {step_id}: Arrow IPC files support 'zstd' compression, not 'gzip'")
+
+        quoting = config.get("quoting", "minimal")
+        if quoting not in QUOTING:
+            raise ValueError(f"Step {step_id}: Invalid quoting '{quoting}'. Expected minimal, all or nonnumeric")
+
+        chunk_size = int(config.get("chunk_size", DEFAULT_CHUNK_SIZE))
+        row_group_size = int(config.get("row_group_size", DEFAULT_ROW_GROUP_SIZE))
+        if chunk_size < 1 or row_group_size < 1:
+            raise ValueError(f"Step {step_id}: 'chunk_size' and 'row_group_size' must be >= 1")
+
         # Resolve path
         output_path = Path(file_path)
         if not output_path.is_absolute():
@@ -64,31 +100,195 @@ class FilesystemCsvWriterDriver:
             output_path = Path.cwd() / output_path
 
         # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Sort columns lexicographically for deterministic output
-        df_sorted = df[sorted(df.columns)]
+        if config.get("create_dirs", True):
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        elif not output_path.parent.is_dir():
+            raise FileNotFoundError(f"Step {step_id}: Output directory does not exist: {output_path.parent}")
 
         # Map newline config to actual character
         newline_map = {"lf": "\n", "crlf": "\r\n", "cr": "\r"}
         lineterminator = newline_map.get(newline_config, "\n")
 
-        # Write CSV
-        logger.info(f"Writing CSV to {output_path}")
-        df_sorted.to_csv(
-            output_path,
-            sep=delimiter,
-            encoding=encoding,
-            header=header,
-            index=False,
-            lineterminator=lineterminator,
-        )
+        csv_options = {
+            "sep": delimiter,
+            "index": False,
+            "lineterminator": lineterminator,
+            "quoting": QUOTING[quoting],
+            "chunksize": chunk_size,
+        }
+
+        if isinstance(df, RowStream):
+            batches = df.iter_batches()
+            known_columns = [col.name for col in df.columns]
+        else:
+            batches = iter([df])
+            known_columns = list(df.columns)
+
+        logger.info(f"Writing {output_format.upper()} to {output_path}")
+        if output_format == "csv":
+            rows_written = self._write_csv(
+                batches,
+                output_path,
+                known_columns=known_columns,
+                header=header,
+                encoding=encoding,
+                compression=compression,
+                csv_options=csv_options,
+            )
+        else:
+            rows_written = self._write_columnar(
+                batches,
+                output_path,
+                known_columns=known_columns,
+                output_format=output_format,
+                compression=compression,
+                row_group_size=row_group_size,
+            )
 
         # Log metrics
-        rows_written = len(df)
         logger.info(f"Step {step_id}: Wrote {rows_written} rows to {output_path}")
 
         if ctx and hasattr(ctx, "log_metric"):
             ctx.log_metric("rows_written", rows_written)
 
         return {}
+
+    def _write_csv(
+        self,
+        batches: Iterator[pd.DataFrame],
+        output_path: Path,
+        *,
+        known_columns: list[str],
+        header: bool,
+        encoding: str,
+        compression: str,
+        csv_options: dict,
+    ) -> int:
+        """Append batches to the (optionally compressed) CSV file, writing the header once.
+
+        Column order is fixed by the first batch (sorted lexicographically), so
+        streamed output is identical to writing the materialized DataFrame.
+        ``to_csv(columns=...)`` selects the columns while writing each
+        ``chunk_size`` slice instead of copying the frame in sorted order first.
+        """
+        columns: list[str] | None = None
+        rows_written = 0
+
+        with _open_text(output_path, compression, encoding) as f:
+            for batch in batches:
+                first = columns is None
+                if first:
+                    columns = sorted(batch.columns)
+                _aligned(batch, columns).to_csv(f, columns=columns, header=header and first, **csv_options)
+                rows_written += len(batch)
+
+            if columns is None:
+                # Empty stream: still emit the header when column metadata is known
+                empty = pd.DataFrame(columns=sorted(known_columns))
+                empty.to_csv(f, header=header, **csv_options)
+
+        return rows_written
+
+    def _write_columnar(
+        self,
+        batches: Iterator[pd.DataFrame],
+        output_path: Path,
+        *,
+        known_columns: list[str],
+        output_format: str,
+        compression: str,
+        row_group_size: int,
+    ) -> int:
+        """Write batches to a Parquet or Arrow IPC file in row groups of ``row_group_size`` rows.
+
+        Batches are buffered until a full row group is available, so the file
+        layout does not depend on how the input was batched. The schema is
+        fixed by the first batch; later batches are cast to it.
+        """
+        import pyarrow as pa  # noqa: PLC0415 - optional output formats
+
+        writer = None
+        schema = None
+        pending: list[Any] = []
+        pending_rows = 0
+        rows_written = 0
+        columns: list[str] | None = None
+
+        def flush(final: bool = False) -> None:
+            nonlocal pending, pending_rows
+            table = pa.concat_tables(pending)
+            offset = 0
+            while table.num_rows - offset >= row_group_size or (final and offset < table.num_rows):
+                self._write_table(writer, output_format, table.slice(offset, row_group_size))
+                offset += row_group_size
+            rest = table.slice(offset)
+            pending, pending_rows = ([rest] if rest.num_rows else []), rest.num_rows
+
+        try:
+            for batch in batches:
+                if columns is None:
+                    columns = sorted(batch.columns)
+                table = pa.Table.from_pandas(_aligned(batch, columns), columns=columns, preserve_index=False)
+                if schema is None:
+                    schema = table.schema
+                    writer = self._open_columnar(output_path, output_format, schema, compression)
+                elif not table.schema.equals(schema):
+                    table = table.cast(schema)
+                pending.append(table)
+                pending_rows += table.num_rows
+                rows_written += table.num_rows
+                if pending_rows >= row_group_size:
+                    flush()
+
+            if writer is None:
+                # Empty input: write a file with the known column names and no rows
+                schema = pa.schema([(name, pa.null()) for name in sorted(known_columns)])
+                writer = self._open_columnar(output_path, output_format, schema, compression)
+            elif pending:
+                flush(final=True)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return rows_written
+
+    @staticmethod
+    def _open_columnar(output_path: Path, output_format: str, schema: Any, compression: str) -> Any:
+        import pyarrow as pa  # noqa: PLC0415 - optional output formats
+
+        if output_format == "parquet":
+            import pyarrow.parquet as pq  # noqa: PLC0415
+
+            return pq.ParquetWriter(str(output_path), schema, compression=compression)
+
+        options = pa.ipc.IpcWriteOptions(compression=None if compression == "none" else compression)
+        return pa.ipc.new_file(str(output_path), schema, options=options)
+
+    @staticmethod
+    def _write_table(writer: Any, output_format: str, table: Any) -> None:
+        if output_format == "parquet":
+            writer.write_table(table, row_group_size=table.num_rows)
+        else:
+            writer.write_table(table, max_chunksize=table.num_rows)
+
+
+def _aligned(batch: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Return ``batch`` if it has all ``columns``, else a copy with the missing ones as NaN."""
+    if all(col in batch.columns for col in columns):
+        return batch
+    return batch.reindex(columns=columns)
+
+
+def _open_text(output_path: Path, compression: str, encoding: str) -> IO[str]:
+    """Open ``output_path`` for text writing, compressing with gzip or zstd."""
+    if compression == "gzip":
+        # mtime=0 keeps compressed output byte-identical across runs
+        raw = gzip.GzipFile(output_path, "wb", mtime=0)
+        return io.TextIOWrapper(raw, encoding=encoding, newline="")
+    if compression == "zstd":
+        try:
+            import zstandard  # noqa: PLC0415 - optional dependency
+        except ImportError as e:
+            raise RuntimeError("zstd compression requires the 'zstandard' package") from e
+        return zstandard.open(output_path, "wt", encoding=encoding, newline="")
+    return open(output_path, "w", encoding=encoding, newline="")  # noqa: SIM115 - returned to a with block
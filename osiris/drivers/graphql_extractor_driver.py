@@ -1,6 +1,8 @@
 """GraphQL API extractor driver implementation."""
 
 import base64
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import time
 from typing import Any
@@ -8,10 +10,17 @@ from typing import Any
 from jsonpath_ng import parse as jsonpath_parse
 import pandas as pd
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+from osiris.core.driver import RowStream, streaming_requested
 
 logger = logging.getLogger(__name__)
 
 
+PAGINATION_MODES = {"cursor", "offset", "page"}
+DEFAULT_CHUNK_SIZE = 10000
+
+
 class GraphQLExtractorDriver:
     """Driver for extracting data from GraphQL APIs."""
 
@@ -28,6 +37,9 @@ class GraphQLExtractorDriver:
     ) -> dict:
         """Extract data from GraphQL API.
 
+        Every page is fetched with a single request; its records are normalized
+        into DataFrame chunks of ``chunk_size`` rows as they arrive.
+
         Args:
             step_id: Step identifier
             config: Must contain 'endpoint', 'query', and optional auth/pagination config
@@ -35,7 +47,7 @@ class GraphQLExtractorDriver:
             ctx: Execution context for logging metrics
 
         Returns:
-            {"df": DataFrame} with GraphQL query results
+            {"df": DataFrame} with GraphQL query results (RowStream when the runner requests streaming)
         """
         # Get required configuration
         endpoint = config.get("endpoint")
@@ -46,8 +58,21 @@ class GraphQLExtractorDriver:
         if not query:
             raise ValueError(f"Step {step_id}: 'query' is required in config")
 
+        pagination_mode = config.get("pagination_mode", "cursor")
+        if pagination_mode not in PAGINATION_MODES:
+            raise ValueError(
+                f"Step {step_id}: Invalid pagination_mode '{pagination_mode}'. Expected cursor, offset or page"
+            )
+        if pagination_mode == "offset" and not config.get("pagination_page_size"):
+            raise ValueError(f"Step {step_id}: 'pagination_page_size' is required for offset pagination")
+
+        chunk_size = int(config.get("chunk_size", DEFAULT_CHUNK_SIZE))
+        if chunk_size < 1:
+            raise ValueError(f"Step {step_id}: 'chunk_size' must be >= 1")
+
         # Initialize session
-        self.session = self._create_session(config)
+        session = self.session = self._create_session(config)
+        stats = {"requests": 0, "pages": 0, "rows": 0}
 
         try:
             # Log start
@@ -62,79 +87,87 @@ class GraphQLExtractorDriver:
                     },
                 )
 
-            # Execute query (with pagination if enabled)
-            # Nested try block to ensure session cleanup even on exceptions
+            if config.get("pagination_enabled", False):
+                pages = self._iter_pages(step_id, endpoint, query, config, ctx=ctx, stats=stats)
+            else:
+                pages = self._iter_single_page(step_id, endpoint, query, config, ctx=ctx, stats=stats)
+            chunks = self._iter_df_chunks(pages, chunk_size, flatten=config.get("flatten_result", True), stats=stats)
+
+            if streaming_requested(ctx):
+                # The stream owns the session from here on and closes it when exhausted or closed
+                return {"df": RowStream(self._stream(step_id, chunks, session, stats, ctx))}
+
             try:
-                all_data = []
-                requests_made = 0
-                pages_fetched = 0
+                df_chunks = list(chunks)
+            finally:
+                # ALWAYS close session, even on exception
+                self._close_session(session)
 
-                if config.get("pagination_enabled", False):
-                    all_data, requests_made, pages_fetched = self._execute_paginated_query(
-                        step_id, endpoint, query, config, ctx
-                    )
-                else:
-                    result_data, requests_made = self._execute_single_query(step_id, endpoint, query, config, ctx)
-                    all_data = [result_data] if result_data else []
-                    pages_fetched = 1 if result_data else 0
+            df = pd.concat(df_chunks, ignore_index=True) if df_chunks else pd.DataFrame()
+            self._log_completion(step_id, stats, ctx)
+            return {"df": df}
 
-                # Combine all data
-                if not all_data:
-                    df = pd.DataFrame()
-                else:
-                    # Flatten and combine data from all pages
-                    combined_data = []
-                    for page_data in all_data:
-                        if isinstance(page_data, list):
-                            combined_data.extend(page_data)
-                        else:
-                            combined_data.append(page_data)
-
-                    df = (
-                        pd.json_normalize(combined_data)
-                        if config.get("flatten_result", True)
-                        else pd.DataFrame(combined_data)
-                    )
+        except Exception as e:
+            self._close_session(session)
+            raise self._extraction_error(step_id, e, ctx) from e
 
-                # Log metrics
-                rows_read = len(df)
-                logger.info(
-                    f"Step {step_id}: Extracted {rows_read} rows from GraphQL API ({pages_fetched} pages, {requests_made} requests)"
-                )
+    def _stream(
+        self, step_id: str, chunks: Iterator[pd.DataFrame], session: requests.Session, stats: dict, ctx: Any
+    ) -> Iterator[pd.DataFrame]:
+        try:
+            yield from chunks
+        except Exception as e:
+            raise self._extraction_error(step_id, e, ctx) from e
+        finally:
+            self._close_session(session)
+        self._log_completion(step_id, stats, ctx)
+
+    def _close_session(self, session: requests.Session) -> None:
+        session.close()
+        if self.session is session:
+            self.session = None
+
+    def _extraction_error(self, step_id: str, error: Exception, ctx: Any) -> RuntimeError:
+        if isinstance(error, requests.exceptions.RequestException):
+            error_msg = f"GraphQL API request failed: {str(error)}"
+        else:
+            error_msg = f"GraphQL extraction failed: {type(error).__name__}: {str(error)}"
+        logger.error(f"Step {step_id}: {error_msg}")
+        if ctx and hasattr(ctx, "log_event"):
+            ctx.log_event("extraction.error", {"error": error_msg})
+        return RuntimeError(error_msg)
 
-                if ctx and hasattr(ctx, "log_metric"):
-                    ctx.log_metric("rows_read", rows_read)
-                    ctx.log_metric("requests_made", requests_made)
-                    ctx.log_metric("pages_fetched", pages_fetched)
+    def _log_completion(self, step_id: str, stats: dict, ctx: Any) -> None:
+        rows_read, pages_fetched, requests_made = stats["rows"], stats["pages"], stats["requests"]
+        logger.info(
+            f"Step {step_id}: Extracted {rows_read} rows from GraphQL API ({pages_fetched} pages, {requests_made} requests)"
+        )
 
-                if ctx and hasattr(ctx, "log_event"):
-                    ctx.log_event(
-                        "extraction.complete", {"rows": rows_read, "pages": pages_fetched, "requests": requests_made}
-                    )
+        if ctx and hasattr(ctx, "log_metric"):
+            ctx.log_metric("rows_read", rows_read)
+            ctx.log_metric("requests_made", requests_made)
+            ctx.log_metric("pages_fetched", pages_fetched)
 
-                return {"df": df}
+        if ctx and hasattr(ctx, "log_event"):
+            ctx.log_event("extraction.complete", {"rows": rows_read, "pages": pages_fetched, "requests": requests_made})
 
-            finally:
-                # ALWAYS close session, even on exception
-                if self.session:
-                    self.session.close()
-                    self.session = None
+    @staticmethod
+    def _iter_df_chunks(pages: Iterator[Any], chunk_size: int, *, flatten: bool, stats: dict) -> Iterator[pd.DataFrame]:
+        """Normalize page records into DataFrames of up to ``chunk_size`` rows."""
+        buffer: list[Any] = []
 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"GraphQL API request failed: {str(e)}"
-            logger.error(f"Step {step_id}: {error_msg}")
-            if ctx and hasattr(ctx, "log_event"):
-                ctx.log_event("extraction.error", {"error": error_msg})
-            # Session already closed in inner finally block
-            raise RuntimeError(error_msg) from e
+        def to_frame(records: list[Any]) -> pd.DataFrame:
+            stats["rows"] += len(records)
+            return pd.json_normalize(records) if flatten else pd.DataFrame(records)
 
-        except Exception as e:
-            error_msg = f"GraphQL extraction failed: {type(e).__name__}: {str(e)}"
-            logger.error(f"Step {step_id}: {error_msg}")
-            if ctx and hasattr(ctx, "log_event"):
-                ctx.log_event("extraction.error", {"error": error_msg})
-            # Session already closed in inner finally block
-            raise RuntimeError(error_msg) from e
+        for page_data in pages:
+            buffer.extend(_page_records(page_data))
+            while len(buffer) >= chunk_size:
+                records, buffer = buffer[:chunk_size], buffer[chunk_size:]
+                yield to_frame(records)
+
+        if buffer:
+            yield to_frame(buffer)
 
     def _create_session(self, config: dict) -> requests.Session:
         """Create configured requests session."""
@@ -166,13 +199,19 @@ class GraphQLExtractorDriver:
         session.headers.setdefault("Content-Type", "application/json")
         session.headers.setdefault("User-Agent", "Osiris GraphQL Extractor/1.0")
 
+        # Parallel page fetching shares the session, so size its connection pool accordingly
+        parallel_requests = int(config.get("parallel_requests", 1))
+        if parallel_requests > DEFAULT_POOLSIZE:
+            adapter = HTTPAdapter(pool_maxsize=parallel_requests)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
         return session
 
-    def _execute_single_query(
-        self, step_id: str, endpoint: str, query: str, config: dict, ctx: Any = None
-    ) -> tuple[Any, int]:
-        """Execute a single GraphQL query."""
-        variables = config.get("variables", {})
+    def _execute_query(
+        self, step_id: str, endpoint: str, query: str, variables: dict, *, config: dict, ctx: Any = None
+    ) -> dict:
+        """POST one GraphQL request (with retries) and return the full response body."""
         timeout = config.get("timeout", 30)
         max_retries = config.get("max_retries", 3)
         retry_delay = config.get("retry_delay", 1.0)
@@ -206,11 +245,7 @@ class GraphQLExtractorDriver:
                         {"status_code": response.status_code, "response_size": len(response.content)},
                     )
 
-                # Extract data using configured path
-                data_path = config.get("data_path", "data")
-                extracted_data = self._extract_data_from_response(response_data, data_path)
-
-                return extracted_data, 1
+                return response_data
 
             except Exception as e:
                 last_exception = e
@@ -226,15 +261,43 @@ class GraphQLExtractorDriver:
         # If we get here, all retries failed
         raise last_exception
 
-    def _execute_paginated_query(
+    def _execute_single_query(
         self, step_id: str, endpoint: str, query: str, config: dict, ctx: Any = None
-    ) -> tuple[list[Any], int, int]:
-        """Execute a paginated GraphQL query."""
-        all_data = []
-        total_requests = 0
-        pages_fetched = 0
-
+    ) -> tuple[Any, int]:
+        """Execute a single GraphQL query."""
+        response_data = self._execute_query(
+            step_id, endpoint, query, config.get("variables", {}), config=config, ctx=ctx
+        )
+        # Extract data using configured path
+        return self._extract_data_from_response(response_data, config.get("data_path", "data")), 1
+
+    def _iter_single_page(
+        self, step_id: str, endpoint: str, query: str, config: dict, *, ctx: Any, stats: dict
+    ) -> Iterator[Any]:
+        result_data, requests_made = self._execute_single_query(step_id, endpoint, query, config, ctx)
+        stats["requests"] += requests_made
+        if result_data:
+            stats["pages"] += 1
+            yield result_data
+
+    def _iter_pages(
+        self, step_id: str, endpoint: str, query: str, config: dict, *, ctx: Any, stats: dict
+    ) -> Iterator[Any]:
+        """Yield the extracted data of each page."""
+        if config.get("pagination_mode", "cursor") == "cursor":
+            yield from self._iter_cursor_pages(step_id, endpoint, query, config, ctx=ctx, stats=stats)
+        else:
+            yield from self._iter_numbered_pages(step_id, endpoint, query, config, ctx=ctx, stats=stats)
+        logger.info(
+            f"Step {step_id}: Completed paginated extraction: {stats['pages']} pages, {stats['requests']} requests"
+        )
+
+    def _iter_cursor_pages(
+        self, step_id: str, endpoint: str, query: str, config: dict, *, ctx: Any, stats: dict
+    ) -> Iterator[Any]:
+        """Cursor pagination: data and pageInfo are read from the same response."""
         # Pagination configuration
+        data_path = config.get("data_path", "data")
         pagination_path = config.get("pagination_path", "data.pageInfo")
         cursor_field = config.get("pagination_cursor_field", "endCursor")
         has_next_field = config.get("pagination_has_next_field", "hasNextPage")
@@ -243,73 +306,97 @@ class GraphQLExtractorDriver:
 
         # Start with initial variables
         current_variables = config.get("variables", {}).copy()
-        has_next_page = True
 
         logger.info(f"Step {step_id}: Starting paginated GraphQL extraction (max_pages={max_pages or 'unlimited'})")
 
-        while has_next_page and (max_pages == 0 or pages_fetched < max_pages):
-            # Update query with current variables
-            temp_config = config.copy()
-            temp_config["variables"] = current_variables
-
-            # Execute single page
-            page_data, requests_for_page = self._execute_single_query(step_id, endpoint, query, temp_config, ctx)
-
-            total_requests += requests_for_page
-            pages_fetched += 1
+        while max_pages == 0 or stats["pages"] < max_pages:
+            response_data = self._execute_query(step_id, endpoint, query, current_variables, config=config, ctx=ctx)
+            stats["requests"] += 1
+            stats["pages"] += 1
 
+            page_data = self._extract_data_from_response(response_data, data_path)
+            self._log_page(ctx, stats["pages"], current_variables.get(cursor_variable), page_data)
             if page_data:
-                all_data.append(page_data)
-
-            if ctx and hasattr(ctx, "log_event"):
-                ctx.log_event(
-                    "extraction.page",
-                    {
-                        "page": pages_fetched,
-                        "cursor": current_variables.get(cursor_variable),
-                        "data_count": len(page_data) if isinstance(page_data, list) else 1,
-                    },
-                )
+                yield page_data
 
-            # Get pagination info for next page
+            # Get pagination info for next page from the same response
             try:
-                # Execute the query again to get the full response for pagination info
-                temp_config_for_pagination = config.copy()
-                temp_config_for_pagination["variables"] = current_variables
-                temp_config_for_pagination["data_path"] = ""  # Get full response
-
-                # Re-execute to get pagination info (this is a limitation - ideally we'd cache the response)
-                payload = {"query": query, "variables": current_variables}
-
-                response = self.session.post(
-                    endpoint, json=payload, timeout=config.get("timeout", 30), verify=config.get("validate_ssl", True)
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                # Extract pagination info
                 pagination_info = self._extract_data_from_response(response_data, pagination_path)
+            except RuntimeError as e:
+                logger.warning(f"Step {step_id}: Failed to get pagination info, stopping pagination: {e}")
+                break
 
-                if not pagination_info:
-                    logger.info(f"Step {step_id}: No pagination info found at path '{pagination_path}', stopping")
-                    break
-
-                has_next_page = pagination_info.get(has_next_field, False)
-                next_cursor = pagination_info.get(cursor_field)
+            if not isinstance(pagination_info, dict) or not pagination_info:
+                logger.info(f"Step {step_id}: No pagination info found at path '{pagination_path}', stopping")
+                break
 
-                if has_next_page and next_cursor:
-                    current_variables[cursor_variable] = next_cursor
-                    logger.info(f"Step {step_id}: Fetching next page with cursor: {next_cursor}")
-                else:
-                    logger.info(f"Step {step_id}: Reached end of pages (hasNext={has_next_page}, cursor={next_cursor})")
-                    break
+            has_next_page = pagination_info.get(has_next_field, False)
+            next_cursor = pagination_info.get(cursor_field)
 
-            except Exception as e:
-                logger.warning(f"Step {step_id}: Failed to get pagination info, stopping pagination: {e}")
+            if has_next_page and next_cursor:
+                current_variables[cursor_variable] = next_cursor
+                logger.info(f"Step {step_id}: Fetching next page with cursor: {next_cursor}")
+            else:
+                logger.info(f"Step {step_id}: Reached end of pages (hasNext={has_next_page}, cursor={next_cursor})")
                 break
 
-        logger.info(f"Step {step_id}: Completed paginated extraction: {pages_fetched} pages, {total_requests} requests")
-        return all_data, total_requests, pages_fetched
+    def _iter_numbered_pages(
+        self, step_id: str, endpoint: str, query: str, config: dict, *, ctx: Any, stats: dict
+    ) -> Iterator[Any]:
+        """Offset / page-number pagination, optionally ``parallel_requests`` pages at a time.
+
+        Page variables are known up front, so a wave of pages is requested
+        concurrently and yielded in order. The first empty or short page ends
+        the extraction; later pages of the same wave are discarded.
+        """
+        data_path = config.get("data_path", "data")
+        mode = config.get("pagination_mode")
+        variable = config.get("pagination_variable_name", "offset" if mode == "offset" else "page")
+        page_size = config.get("pagination_page_size")
+        page_size_variable = config.get("pagination_page_size_variable")
+        start = config.get("pagination_start", 0 if mode == "offset" else 1)
+        max_pages = config.get("max_pages", 0)  # 0 means unlimited
+        parallel = max(1, int(config.get("parallel_requests", 1)))
+        base_variables = config.get("variables", {}).copy()
+        if page_size and page_size_variable:
+            base_variables[page_size_variable] = page_size
+
+        def page_value(index: int) -> int:
+            return start + index * page_size if mode == "offset" else start + index
+
+        def fetch(index: int) -> Any:
+            variables = {**base_variables, variable: page_value(index)}
+            response_data = self._execute_query(step_id, endpoint, query, variables, config=config, ctx=ctx)
+            return self._extract_data_from_response(response_data, data_path)
+
+        logger.info(
+            f"Step {step_id}: Starting {mode} paginated GraphQL extraction "
+            f"(max_pages={max_pages or 'unlimited'}, parallel_requests={parallel})"
+        )
+
+        index = 0
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="graphql-page") as executor:
+            while max_pages == 0 or index < max_pages:
+                wave = range(index, index + parallel if max_pages == 0 else min(index + parallel, max_pages))
+                results = executor.map(fetch, wave) if parallel > 1 else (fetch(i) for i in wave)
+                for page_index, page_data in zip(wave, results, strict=False):
+                    stats["requests"] += 1
+                    stats["pages"] += 1
+                    self._log_page(ctx, stats["pages"], page_value(page_index), page_data)
+                    records = _page_records(page_data)
+                    if records:
+                        yield page_data
+                    if not records or (page_size and len(records) < page_size):
+                        return
+                index = wave.stop
+
+    @staticmethod
+    def _log_page(ctx: Any, page: int, cursor: Any, page_data: Any) -> None:
+        if ctx and hasattr(ctx, "log_event"):
+            ctx.log_event(
+                "extraction.page",
+                {"page": page, "cursor": cursor, "data_count": len(page_data) if isinstance(page_data, list) else 1},
+            )
 
     def _extract_data_from_response(self, response_data: dict, data_path: str) -> Any:
         """Extract data from GraphQL response using JSONPath."""
@@ -418,3 +505,10 @@ class GraphQLExtractorDriver:
                 results["checks"]["authentication"] = f"{auth_type} authentication configured"
 
         return results
+
+
+def _page_records(page_data: Any) -> list[Any]:
+    """Records of one page: lists as-is, a single object as one record, empty results as none."""
+    if not page_data:
+        return []
+    return page_data if isinstance(page_data, list) else [page_data]
@@ -1,13 +1,92 @@
 """MySQL extractor driver implementation."""
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import cache
 import logging
+import queue
+import threading
 from typing import Any
 
 import pandas as pd
+from pymysql.constants import FIELD_TYPE
+import pymysql.cursors
+import pymysql.err
 import sqlalchemy as sa
 
+from osiris.core.driver import DEFAULT_STREAM_BATCH_SIZE, RowStream, streaming_requested
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_PARTITIONS = 4
+
+DTYPE_BACKENDS = {"numpy", "pyarrow"}
+
+# A partition is the slice query and its bind parameters
+Partition = tuple[sa.TextClause, dict[str, Any]]
+
+
+def _quote_ident(name: str) -> str:
+    """Backtick-quote a MySQL identifier."""
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def _split_range(low: Any, high: Any, partitions: int) -> list[Any]:
+    """Split ``[low, high]`` into at most ``partitions`` ranges and return their boundaries.
+
+    Boundaries are ascending and unique, so narrow ranges produce fewer partitions.
+    """
+    if isinstance(low, datetime):
+        points = [low + (high - low) * i / partitions for i in range(partitions)]
+    elif isinstance(low, date):
+        start, end = low.toordinal(), high.toordinal()
+        points = [date.fromordinal(start + (end - start) * i // partitions) for i in range(partitions)]
+    elif isinstance(low, int) and not isinstance(low, bool):
+        points = [low + (high - low) * i // partitions for i in range(partitions)]
+    else:
+        raise ValueError(f"partition_by column must be an integer, date or datetime column, got {type(low).__name__}")
+    return sorted(set(points)) + [high]
+
+
+@cache
+def _arrow_types() -> dict[int, Any]:
+    """Arrow types for MySQL column type codes; other columns are inferred from values."""
+    import pyarrow as pa  # noqa: PLC0415 - optional dtype_backend
+
+    integer, floating, string, timestamp = pa.int64(), pa.float64(), pa.string(), pa.timestamp("us")
+    return {
+        FIELD_TYPE.TINY: integer,
+        FIELD_TYPE.SHORT: integer,
+        FIELD_TYPE.INT24: integer,
+        FIELD_TYPE.LONG: integer,
+        FIELD_TYPE.LONGLONG: integer,
+        FIELD_TYPE.YEAR: integer,
+        FIELD_TYPE.FLOAT: floating,
+        FIELD_TYPE.DOUBLE: floating,
+        FIELD_TYPE.DATE: pa.date32(),
+        FIELD_TYPE.DATETIME: timestamp,
+        FIELD_TYPE.TIMESTAMP: timestamp,
+        FIELD_TYPE.VARCHAR: string,
+        FIELD_TYPE.VAR_STRING: string,
+        FIELD_TYPE.STRING: string,
+        FIELD_TYPE.JSON: string,
+        FIELD_TYPE.ENUM: string,
+        FIELD_TYPE.SET: string,
+    }
+
+
+def _arrow_array(values: Any, arrow_type: Any) -> Any:
+    """Build an Arrow array from one column of cursor rows."""
+    import pyarrow as pa  # noqa: PLC0415 - optional dtype_backend
+
+    if arrow_type is not None:
+        try:
+            return pa.array(values, type=arrow_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            pass  # e.g. binary-collated strings, unsigned BIGINT, zero dates
+    return pa.array(values)
+
 
 class MySQLExtractorDriver:
     """Driver for extracting data from MySQL databases."""
@@ -29,7 +108,8 @@ class MySQLExtractorDriver:
             ctx: Execution context for logging metrics
 
         Returns:
-            {"df": DataFrame} with query results
+            {"df": DataFrame} with query results, or {"df": RowStream} of
+            ``batch_size`` row batches when the runner requests streaming
         """
         # Get query
         query = config.get("query")
@@ -51,24 +131,60 @@ class MySQLExtractorDriver:
         if not database:
             raise ValueError(f"Step {step_id}: 'database' is required in connection")
 
+        partition_by = config.get("partition_by")
+        partitions = int(config.get("partitions", DEFAULT_PARTITIONS))
+        if partition_by and partitions < 1:
+            raise ValueError(f"Step {step_id}: 'partitions' must be >= 1, got {partitions}")
+        batch_size = int(config.get("batch_size", DEFAULT_STREAM_BATCH_SIZE))
+
+        dtype_backend = config.get("dtype_backend", "numpy")
+        if dtype_backend not in DTYPE_BACKENDS:
+            raise ValueError(f"Step {step_id}: Invalid dtype_backend '{dtype_backend}'. Expected numpy or pyarrow")
+        arrow = dtype_backend == "pyarrow"
+
         # Create engine with separate URLs for logging and connection
         # Masked URL for logging/errors (SAFE to log)
         masked_url = f"mysql+pymysql://{user}:***@{host}:{port}/{database}"  # noqa: F841  # Reserved for stack traces
         # Real URL for connection ONLY (NEVER log this!)
         connection_url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}"
-        engine = sa.create_engine(connection_url)
+        if partition_by:
+            # One pooled connection per partition
+            engine = sa.create_engine(connection_url, pool_size=partitions, max_overflow=0)
+        else:
+            engine = sa.create_engine(connection_url)
 
         try:
-            # Test connection first
-            logger.info(f"Testing MySQL connection for step {step_id}: {user}@{host}:{port}/{database}")
-            with engine.connect() as conn:
-                # Test basic connection
-                result = conn.execute(sa.text("SELECT 1 as test"))
-                result.fetchone()
+            slices = None
+            if partition_by:
+                # The MIN/MAX query doubles as the connection test
+                logger.info(f"Planning partitions for step {step_id}: {user}@{host}:{port}/{database}")
+                slices = self._plan_partitions(step_id, query, partition_by, partitions, engine)
+            else:
+                # Test connection first
+                logger.info(f"Testing MySQL connection for step {step_id}: {user}@{host}:{port}/{database}")
+                with engine.connect() as conn:
+                    # Test basic connection
+                    result = conn.execute(sa.text("SELECT 1 as test"))
+                    result.fetchone()
+
+            if streaming_requested(ctx):
+                logger.info(f"Streaming MySQL query for step {step_id} in batches of {batch_size}")
+                if slices:
+                    batches = self._stream_partitions(step_id, slices, engine, batch_size, ctx, arrow=arrow)
+                else:
+                    batches = self._stream_batches(step_id, query, engine, batch_size, ctx, arrow=arrow)
+                stream = RowStream(batches)
+                engine = None  # Disposed by the stream once exhausted or closed
+                return {"df": stream}
 
             # Execute query
             logger.info(f"Executing MySQL query for step {step_id}")
-            df = pd.read_sql_query(query, engine)
+            if slices:
+                df = self._read_partitions(slices, engine, batch_size, arrow=arrow)
+            elif arrow:
+                df = pd.concat(self._iter_arrow_frames(query, None, engine, batch_size), ignore_index=True)
+            else:
+                df = pd.read_sql_query(query, engine)
 
             # Log metrics
             rows_read = len(df)
@@ -79,7 +195,7 @@ class MySQLExtractorDriver:
 
             return {"df": df}
 
-        except sa.exc.OperationalError as e:
+        except (sa.exc.OperationalError, pymysql.err.OperationalError) as e:
             # Connection/network issues - use generic error + masked debug logging
             error_msg = f"MySQL connection failed for step {step_id}"
             logger.error(error_msg)
@@ -90,7 +206,7 @@ class MySQLExtractorDriver:
             logger.debug(f"Connection error details: {mask_sensitive_string(str(e))}")
             raise RuntimeError(error_msg) from e
 
-        except sa.exc.ProgrammingError as e:
+        except (sa.exc.ProgrammingError, pymysql.err.ProgrammingError) as e:
             # SQL syntax or permission issues
             error_msg = f"MySQL query failed: {str(e)}"
             logger.error(f"Step {step_id}: {error_msg}")
@@ -103,4 +219,180 @@ class MySQLExtractorDriver:
             raise RuntimeError(error_msg) from e
 
         finally:
+            if engine is not None:
+                engine.dispose()
+
+    def _stream_batches(
+        self, step_id: str, query: str, engine: sa.Engine, batch_size: int, ctx: Any, *, arrow: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """Yield query results in batches using an unbuffered server-side cursor."""
+        rows_read = 0
+        try:
+            for chunk in self._iter_frames(query, None, engine, batch_size, arrow=arrow):
+                rows_read += len(chunk)
+                yield chunk
+
+            logger.info(f"Step {step_id}: Streamed {rows_read} rows from MySQL")
+            if ctx and hasattr(ctx, "log_metric"):
+                ctx.log_metric("rows_read", rows_read)
+        finally:
+            engine.dispose()
+
+    def _plan_partitions(
+        self, step_id: str, query: str, column: str, partitions: int, engine: sa.Engine
+    ) -> list[Partition]:
+        """Discover MIN/MAX of ``column`` and build one range query per partition.
+
+        The query is wrapped in a derived table; MySQL merges simple derived tables,
+        so the range predicates still reach indexes on the base table. Rows where
+        ``column`` is NULL go to the first partition.
+        """
+        source = query.strip().rstrip(";")
+        quoted = _quote_ident(column)
+        bounds_sql = f"SELECT MIN({quoted}) AS low, MAX({quoted}) AS high FROM ({source}) AS _osiris_src"  # nosec B608
+        with engine.connect() as conn:
+            low, high = conn.execute(sa.text(bounds_sql)).one()
+
+        base_sql = f"SELECT * FROM ({source}) AS _osiris_src"  # nosec B608
+        if low is None:
+            # Empty result or only NULLs: nothing to split
+            return [(sa.text(base_sql), {})]
+
+        boundaries = _split_range(low, high, partitions)
+        slices = []
+        for index, (lower, upper) in enumerate(zip(boundaries, boundaries[1:], strict=False)):
+            last = index == len(boundaries) - 2
+            condition = f"{quoted} >= :lower AND {quoted} {'<=' if last else '<'} :upper"
+            if index == 0:
+                condition = f"({condition}) OR {quoted} IS NULL"
+            slices.append((sa.text(f"{base_sql} WHERE {condition}"), {"lower": lower, "upper": upper}))
+
+        logger.info(f"Step {step_id}: Split {column} range [{low}, {high}] into {len(slices)} partitions")
+        return slices
+
+    def _iter_frames(
+        self,
+        sql: str | sa.TextClause,
+        params: dict[str, Any] | None,
+        engine: sa.Engine,
+        batch_size: int,
+        *,
+        arrow: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield query results in ``fetchmany`` batches from an unbuffered server-side cursor."""
+        if arrow:
+            yield from self._iter_arrow_frames(sql, params, engine, batch_size)
+            return
+        with engine.connect().execution_options(stream_results=True) as conn:
+            yield from pd.read_sql_query(sql, conn, params=params, chunksize=batch_size)
+
+    @staticmethod
+    def _iter_arrow_frames(
+        sql: str | sa.TextClause, params: dict[str, Any] | None, engine: sa.Engine, batch_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Yield Arrow-backed batches built column-wise from raw cursor rows.
+
+        Rows come straight from a PyMySQL ``SSCursor``, skipping SQLAlchemy row objects
+        and pandas object columns. An empty result yields one empty, typed batch.
+        """
+        import pyarrow as pa  # noqa: PLC0415 - optional dtype_backend
+
+        if isinstance(sql, sa.TextClause):
+            # Renders :name binds as %(name)s and doubles literal "%", so PyMySQL must format it
+            sql = str(sql.compile(dialect=engine.dialect))
+            params = params or {}
+
+        with engine.connect() as conn:
+            cursor = conn.connection.dbapi_connection.cursor(pymysql.cursors.SSCursor)
+            try:
+                cursor.execute(sql, params)
+                names = [column[0] for column in cursor.description]
+                types = [_arrow_types().get(column[1]) for column in cursor.description]
+                empty = True
+                while rows := cursor.fetchmany(batch_size):
+                    empty = False
+                    arrays = [_arrow_array(values, types[i]) for i, values in enumerate(zip(*rows, strict=True))]
+                    yield pa.Table.from_arrays(arrays, names=names).to_pandas(types_mapper=pd.ArrowDtype)
+                if empty:
+                    schema = pa.schema(
+                        [(name, arrow_type or pa.null()) for name, arrow_type in zip(names, types, strict=True)]
+                    )
+                    yield schema.empty_table().to_pandas(types_mapper=pd.ArrowDtype)
+            finally:
+                cursor.close()
+
+    def _read_partitions(
+        self, slices: list[Partition], engine: sa.Engine, batch_size: int, *, arrow: bool = False
+    ) -> pd.DataFrame:
+        """Fetch all partitions concurrently and concatenate them in key order."""
+
+        def fetch(partition: Partition) -> list[pd.DataFrame]:
+            return list(self._iter_frames(*partition, engine, batch_size, arrow=arrow))
+
+        with ThreadPoolExecutor(max_workers=len(slices), thread_name_prefix="mysql-partition") as executor:
+            frames = [frame for chunks in executor.map(fetch, slices) for frame in chunks]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def _stream_partitions(
+        self,
+        step_id: str,
+        slices: list[Partition],
+        engine: sa.Engine,
+        batch_size: int,
+        ctx: Any,
+        *,
+        arrow: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield batches from all partitions as they arrive.
+
+        Batches from different partitions interleave. The hand-off queue holds at most
+        two batches per partition, so slow consumers stall the fetchers instead of
+        buffering the table.
+        """
+        batches: queue.Queue = queue.Queue(maxsize=2 * len(slices))
+        stop = threading.Event()
+        done = object()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch(partition: Partition) -> None:
+            try:
+                for chunk in self._iter_frames(*partition, engine, batch_size, arrow=arrow):
+                    if not put(chunk):
+                        return
+            except Exception as e:  # Re-raised in the consumer
+                put(e)
+            finally:
+                put(done)
+
+        rows_read = 0
+        executor = ThreadPoolExecutor(max_workers=len(slices), thread_name_prefix="mysql-partition")
+        try:
+            for partition in slices:
+                executor.submit(fetch, partition)
+
+            remaining = len(slices)
+            while remaining:
+                item = batches.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    rows_read += len(item)
+                    yield item
+
+            logger.info(f"Step {step_id}: Streamed {rows_read} rows from MySQL in {len(slices)} partitions")
+            if ctx and hasattr(ctx, "log_metric"):
+                ctx.log_metric("rows_read", rows_read)
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
             engine.dispose()
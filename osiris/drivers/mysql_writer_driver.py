@@ -0,0 +1,347 @@
+"""MySQL writer driver implementation."""
+
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
+import itertools
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pymysql
+from pymysql.connections import Connection
+
+from osiris.core.driver import RowStream, is_tabular_input
+from osiris.core.session_logging import log_event, log_metric
+
+logger = logging.getLogger(__name__)
+
+WRITE_MODES = {"append", "replace", "upsert"}
+
+
+class _CountingConnection(Connection):
+    """PyMySQL connection that counts the bytes written to the server socket."""
+
+    bytes_sent = 0
+
+    def _write_bytes(self, data):
+        self.bytes_sent += len(data)
+        return super()._write_bytes(data)
+
+
+def _quote_ident(name: str) -> str:
+    """Backtick-quote a MySQL identifier."""
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def _column_values(column: pd.Series) -> list[Any]:
+    """Convert a column to Python values PyMySQL can escape (missing values become None)."""
+    dtype = column.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        # MySQL DATETIME has no zone; store UTC
+        column = column.dt.tz_convert("UTC").dt.tz_localize(None)
+        dtype = column.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return column.tolist()
+        if dtype.kind == "f":
+            return column.astype(object).where(column.notna(), None).tolist()
+        if dtype.kind == "M":
+            return [None if value is pd.NaT else value.to_pydatetime() for value in column]
+
+    values = column.astype(object).tolist()
+    for i, raw in enumerate(values):
+        value = raw.item() if isinstance(raw, np.generic) else raw
+        if isinstance(value, pd.Timestamp):
+            value = value.to_pydatetime()
+        elif value is pd.NaT or (not isinstance(value, list | dict | tuple | set) and pd.isna(value)):
+            value = None
+        values[i] = value
+    return values
+
+
+def _frame_rows(frame: pd.DataFrame) -> list[tuple[Any, ...]]:
+    """Rows of ``frame`` as parameter tuples, converted column by column."""
+    columns = [_column_values(frame.iloc[:, position]) for position in range(len(frame.columns))]
+    return list(zip(*columns, strict=True))
+
+
+def _load_data_field(value: Any) -> str:
+    """Render a value for ``LOAD DATA ... OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''``.
+
+    NULL is the bare word ``NULL``; strings are always enclosed, so the string
+    ``"NULL"`` and empty strings survive the round trip. Binary values are written
+    as bare hex digits, which ``_load_data`` decodes with ``UNHEX()``. Aware
+    datetimes are stored as naive UTC, like the ``INSERT`` path does.
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int | float):
+        return repr(value)
+    if isinstance(value, bytes | bytearray):
+        return value.hex()
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        return value.isoformat(" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+class MySQLWriterDriver:
+    """Driver for writing DataFrames (or RowStreams of DataFrame batches) to MySQL tables."""
+
+    def run(self, *, step_id: str, config: dict, inputs: dict | None = None, ctx: Any = None) -> dict:
+        """Write input rows to a MySQL table.
+
+        Appends and replaces use multi-row ``INSERT`` statements (PyMySQL rewrites
+        ``executemany`` into one statement per batch); upserts add
+        ``AS new ON DUPLICATE KEY UPDATE`` (row aliases need MySQL 8.0.19+). With ``load_data_local`` appends and replaces are
+        streamed with ``LOAD DATA LOCAL INFILE`` instead. Everything except
+        ``truncate_before`` runs in a single transaction.
+
+        Args:
+            step_id: Step identifier
+            config: Must contain 'table' and 'resolved_connection'
+            inputs: Must contain a 'df' / 'df_*' key with a DataFrame or RowStream
+            ctx: Execution context for logging metrics
+
+        Returns:
+            {} (empty dict for writers)
+        """
+        if not inputs:
+            raise ValueError(f"Step {step_id}: MySQLWriterDriver requires inputs with DataFrame")
+
+        df = None
+        df_key = None
+        for key, value in inputs.items():
+            if (key.startswith("df_") or key == "df") and is_tabular_input(value):
+                df = value
+                df_key = key
+                break
+
+        if df is None:
+            raise ValueError(
+                f"Step {step_id}: MySQLWriterDriver requires DataFrame input. "
+                f"Expected key 'df' or starting with 'df_'. Got: {list(inputs.keys())}"
+            )
+        logger.debug(f"Step {step_id}: Using {type(df).__name__} from {df_key}")
+
+        table = config.get("table")
+        if not table:
+            raise ValueError(f"Step {step_id}: 'table' is required in config")
+
+        mode = config.get("mode", config.get("write_mode", "append"))
+        if mode not in WRITE_MODES:
+            raise ValueError(f"Step {step_id}: Invalid mode '{mode}'. Expected append, replace, or upsert")
+
+        upsert_keys = config.get("upsert_keys") or config.get("primary_key") or []
+        if isinstance(upsert_keys, str):
+            upsert_keys = [upsert_keys]
+        if mode == "upsert" and not upsert_keys:
+            raise ValueError(f"Step {step_id}: 'upsert_keys' is required when mode is 'upsert'")
+
+        batch_size = int(config.get("batch_size", 1000))
+        if batch_size < 1:
+            raise ValueError(f"Step {step_id}: 'batch_size' must be >= 1, got {batch_size}")
+
+        load_data_local = bool(config.get("load_data_local", False))
+        if load_data_local and mode == "upsert":
+            raise ValueError(f"Step {step_id}: 'load_data_local' supports append and replace modes only")
+
+        conn_info = config.get("resolved_connection", {})
+        if not conn_info:
+            raise ValueError(f"Step {step_id}: 'resolved_connection' is required")
+        if not conn_info.get("database"):
+            raise ValueError(f"Step {step_id}: 'database' is required in connection")
+
+        schema = config.get("schema") or conn_info.get("schema")
+        target = f"{_quote_ident(schema)}.{_quote_ident(table)}" if schema else _quote_ident(table)
+
+        stream = df if isinstance(df, RowStream) else RowStream.from_dataframe(df, batch_size)
+        total_rows = stream.estimated_row_count
+
+        if ctx:
+            log_event(
+                "write.start",
+                step_id=step_id,
+                table=table,
+                mode=mode,
+                rows=total_rows,
+                batch_size=batch_size,
+                channel="load_data" if load_data_local else "insert",
+            )
+
+        start_time = time.perf_counter()
+        rows_written = 0
+        conn = self._connect(conn_info, local_infile=load_data_local)
+        try:
+            with conn.cursor() as cur:
+                frames = stream.iter_batches()
+                first_frame = next(frames, None)
+
+                if config.get("create_table") and first_frame is not None:
+                    cur.execute(self._create_table_sql(first_frame, target, upsert_keys))
+
+                if mode == "replace":
+                    if config.get("truncate_before"):
+                        # Faster, but TRUNCATE commits implicitly in MySQL
+                        cur.execute(f"TRUNCATE TABLE {target}")
+                    else:
+                        cur.execute(f"DELETE FROM {target}")  # nosec B608 - quoted identifier
+
+                if first_frame is not None:
+                    columns = [str(col) for col in first_frame.columns]
+                    batches = self._iter_row_batches(itertools.chain([first_frame], frames), columns, batch_size)
+                    for batch_index, batch in enumerate(batches, start=1):
+                        if load_data_local:
+                            self._load_data(cur, target, columns, batch)
+                        else:
+                            cur.executemany(self._insert_sql(target, columns, mode, upsert_keys), batch)
+                        rows_written += len(batch)
+
+                        if ctx and batch_index % 10 == 0:
+                            log_event(
+                                "write.progress", step_id=step_id, rows_written=rows_written, total_rows=total_rows
+                            )
+
+            conn.commit()
+        except pymysql.MySQLError as e:
+            conn.rollback()
+            error_msg = f"MySQL write failed: {type(e).__name__}: {e}"
+            logger.error(f"Step {step_id}: {error_msg}")
+            if ctx:
+                log_event("write.error", step_id=step_id, error=error_msg)
+            raise RuntimeError(error_msg) from e
+        finally:
+            conn.close()
+
+        duration_s = time.perf_counter() - start_time
+        bytes_sent = getattr(conn, "bytes_sent", 0)
+        rows_per_sec = round(rows_written / duration_s, 1) if duration_s > 0 else float(rows_written)
+        logger.info(f"Step {step_id}: Wrote {rows_written} rows to {table} ({rows_per_sec} rows/s)")
+
+        if ctx:
+            log_metric("rows_written", rows_written, step_id=step_id)
+            log_metric("duration_ms", int(duration_s * 1000), step_id=step_id)
+            log_metric("rows_per_sec", rows_per_sec, step_id=step_id)
+            log_metric("bytes_sent", bytes_sent, step_id=step_id)
+            log_event(
+                "write.complete",
+                step_id=step_id,
+                table=table,
+                rows_written=rows_written,
+                duration_ms=int(duration_s * 1000),
+                bytes_sent=bytes_sent,
+            )
+
+        return {}
+
+    def _connect(self, conn_info: dict[str, Any], *, local_infile: bool) -> Connection:
+        return _CountingConnection(
+            host=conn_info.get("host", "localhost"),
+            port=int(conn_info.get("port", 3306)),
+            user=conn_info.get("user", "root"),
+            password=conn_info.get("password", ""),
+            database=conn_info["database"],
+            charset="utf8mb4",
+            autocommit=False,
+            local_infile=local_infile,
+        )
+
+    @staticmethod
+    def _iter_row_batches(
+        frames: Iterator[pd.DataFrame], columns: list[str], batch_size: int
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """Convert frames one at a time and cut them into batches of at most ``batch_size`` rows."""
+        for frame in frames:
+            aligned = frame if [str(col) for col in frame.columns] == columns else frame.reindex(columns=columns)
+            for start in range(0, len(aligned.index), batch_size):
+                yield _frame_rows(aligned.iloc[start : start + batch_size])
+
+    @staticmethod
+    def _insert_sql(target: str, columns: list[str], mode: str, upsert_keys: list[str]) -> str:
+        # "%" is PyMySQL's placeholder character and must be doubled inside identifiers
+        target = target.replace("%", "%%")
+        quoted = [_quote_ident(col).replace("%", "%%") for col in columns]
+        sql = f"INSERT INTO {target} ({', '.join(quoted)}) VALUES ({', '.join(['%s'] * len(columns))})"
+        if mode == "upsert":
+            # Row alias instead of the VALUES() function deprecated since MySQL 8.0.20
+            updates = [q for col, q in zip(columns, quoted, strict=True) if col not in upsert_keys] or quoted[:1]
+            sql += " AS new ON DUPLICATE KEY UPDATE " + ", ".join(f"{q} = new.{q}" for q in updates)
+        return sql  # nosec B608 - identifiers are quoted, values are parameters
+
+    @staticmethod
+    def _load_data(cur: Any, target: str, columns: list[str], batch: list[tuple[Any, ...]]) -> None:
+        """Stream one batch through a temporary CSV file with ``LOAD DATA LOCAL INFILE``.
+
+        Columns holding binary values in this batch are written hex-encoded into user
+        variables and decoded with ``UNHEX()``, since raw bytes cannot pass through the
+        utf8mb4 text file.
+        """
+        binary = [
+            position
+            for position in range(len(columns))
+            if any(isinstance(row[position], bytes | bytearray) for row in batch)
+        ]
+        fd, path = tempfile.mkstemp(prefix="osiris_mysql_", suffix=".csv")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                for row in batch:
+                    fields = list(row) if binary else row
+                    for position in binary:
+                        value = fields[position]
+                        if value is not None and not isinstance(value, bytes | bytearray):
+                            fields[position] = str(value).encode("utf-8")
+                    f.write(",".join([_load_data_field(value) for value in fields]))
+                    f.write("\n")
+            # The file name is a parameter, so "%" in identifiers must be doubled
+            targets = [_quote_ident(col).replace("%", "%%") for col in columns]
+            assignments = []
+            for position in binary:
+                assignments.append(f"{targets[position]} = UNHEX(@osiris_hex_{position})")
+                targets[position] = f"@osiris_hex_{position}"
+            sql = (
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {target.replace('%', '%%')} CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                f"LINES TERMINATED BY '\\n' ({', '.join(targets)})"
+            )
+            if assignments:
+                sql += " SET " + ", ".join(assignments)
+            cur.execute(sql, (path,))
+        finally:
+            Path(path).unlink(missing_ok=True)
+
+    @staticmethod
+    def _create_table_sql(df: pd.DataFrame, target: str, primary_key: list[str]) -> str:
+        """CREATE TABLE IF NOT EXISTS statement inferred from DataFrame dtypes."""
+        definitions = []
+        for col in df.columns:
+            dtype = df[col].dtype
+            kind = dtype.kind if isinstance(dtype, np.dtype) else getattr(dtype, "kind", "O")
+            if kind == "b":
+                sql_type = "BOOLEAN"
+            elif kind == "i":
+                sql_type = "BIGINT"
+            elif kind == "u":
+                sql_type = "BIGINT UNSIGNED"
+            elif kind == "f":
+                sql_type = "DOUBLE"
+            elif kind == "M" or isinstance(dtype, pd.DatetimeTZDtype):
+                sql_type = "DATETIME(6)"
+            elif col in primary_key:
+                # TEXT columns cannot be keys without a prefix length
+                sql_type = "VARCHAR(255)"
+            else:
+                sql_type = "TEXT"
+            definitions.append(f"{_quote_ident(col)} {sql_type}")
+        if primary_key:
+            definitions.append(f"PRIMARY KEY ({', '.join(_quote_ident(col) for col in primary_key)})")
+        return f"CREATE TABLE IF NOT EXISTS {target} ({', '.join(definitions)})"
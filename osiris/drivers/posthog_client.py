@@ -5,11 +5,19 @@ Handles all interactions with PostHog API (HogQL Query API, Persons API, etc.)
 
 Implements SEEK-based pagination strategy (not OFFSET) to avoid performance
 degradation on large datasets. Uses timestamp + uuid for deterministic pagination.
+
+Large event backfills can be split into time windows that are paged concurrently
+(see ``PostHogClient.iterate_events_backfill``); a shared ``TokenBucket`` keeps the
+combined request rate within PostHog's limits.
 """
 
-from collections.abc import Iterator
-from datetime import UTC, datetime
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from functools import partial
 import logging
+import queue
+import threading
 import time
 from typing import Any
 from urllib.parse import urljoin
@@ -52,6 +60,11 @@ def _validate_and_escape_event_type(event_type: str) -> str:
     return event_type.replace("'", "''")
 
 
+def _escape_hogql_string(value: str) -> str:
+    """Escape a value for use inside a single-quoted HogQL string literal."""
+    return str(value).replace("\\", "\\\\").replace("'", "\\'")
+
+
 # Custom exceptions
 class PostHogClientError(Exception):
     """Base exception for PostHog API errors"""
@@ -79,12 +92,53 @@ class PostHogNetworkError(PostHogClientError):
     pass
 
 
+class TokenBucket:
+    """Thread-safe token bucket shared by all requests of one client.
+
+    Tokens refill at ``rate`` per second up to ``capacity``; ``acquire()`` blocks
+    until a token is available. ``pause()`` holds back every caller, e.g. after a 429.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity < 1:
+            raise ValueError(f"Invalid token bucket: rate={rate}, capacity={capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping as needed. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds`` (and drop accumulated burst tokens)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
 class PostHogClient:
     """Client for PostHog HogQL Query API and Persons API"""
 
     # Rate limiting: PostHog allows 2,400 requests/hour
     RATE_LIMIT_PER_HOUR = 2400
     REQUEST_TIMEOUT = 30.0
+    # Upper bound for concurrent backfill workers (also the HTTP connection pool size)
+    MAX_BACKFILL_WORKERS = 16
 
     def __init__(self, base_url: str, api_key: str, project_id: str):
         """
@@ -103,6 +157,11 @@ class PostHogClient:
 
         # Rate limiting tracking
         self._request_times: list[float] = []
+        self._rate_lock = threading.Lock()
+        # Shared token bucket; set for concurrent backfills (None = serial, sliding window only)
+        self.rate_limiter: TokenBucket | None = None
+        # Successful HogQL queries (pages) issued by this client
+        self.pages_fetched = 0
 
     def _create_session(self) -> requests.Session:
         """Create requests session with retry logic for non-rate-limit errors"""
@@ -113,7 +172,7 @@ class PostHogClient:
             total=3, backoff_factor=1.0, status_forcelist=[500, 502, 503, 504], allowed_methods=["GET", "POST"]
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.MAX_BACKFILL_WORKERS)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
@@ -170,13 +229,16 @@ class PostHogClient:
         while retry_count <= max_retries:
             try:
                 # Rate limit check before making request
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
                 self._check_rate_limit()
 
                 logger.debug(f"Executing HogQL query: {query[:100]}...")
                 response = self.session.post(url, headers=headers, json=payload, timeout=timeout)
 
                 # Track request time for rate limiting
-                self._request_times.append(time.time())
+                with self._rate_lock:
+                    self._request_times.append(time.time())
 
                 if response.status_code == 401:
                     raise PostHogAuthenticationError("Invalid API key (401)")
@@ -200,11 +262,16 @@ class PostHogClient:
                         f"Rate limited (429). Retry {retry_count}/{max_retries} "
                         f"after {sleep_time}s (Retry-After: {retry_after}s)"
                     )
+                    if self.rate_limiter is not None:
+                        # Back off every concurrent worker, not just this one
+                        self.rate_limiter.pause(sleep_time)
                     time.sleep(sleep_time)
                     continue
 
                 response.raise_for_status()
                 result = response.json()
+                with self._rate_lock:
+                    self.pages_fetched += 1
 
                 logger.debug(f"Query succeeded. Results: {len(result.get('results', []))} rows")
                 return result
@@ -380,6 +447,166 @@ class PostHogClient:
                 logger.error(f"Rate limit hit during event iteration: {e}")
                 raise
 
+    def iterate_events_backfill(
+        self,
+        since: datetime,
+        until: datetime,
+        *,
+        windows: int,
+        max_workers: int | None = None,
+        event_types: list[str] | None = None,
+        page_size: int = 1000,
+        last_timestamp: str | None = None,
+        last_uuid: str | None = None,
+        requests_per_second: float | None = None,
+        prefetch_pages: int = 2,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate through events by paging ``windows`` time slices of [since, until) concurrently
+
+        Each slice is a regular SEEK-paginated ``iterate_events`` stream run in a worker
+        thread. Slices are disjoint and ascending, so yielding them one after another
+        gives the same timestamp/uuid order as ``iterate_events``. Workers prefetch at
+        most ``prefetch_pages`` pages per slice ahead of the consumer, which bounds memory.
+        All requests share a token bucket (``requests_per_second``, default
+        RATE_LIMIT_PER_HOUR / 3600, with one minute of burst).
+
+        Args:
+            since: Start timestamp (datetime, timezone-aware)
+            until: End timestamp (datetime, timezone-aware)
+            windows: Number of time slices
+            max_workers: Concurrent slices (default min(windows, 4), capped at MAX_BACKFILL_WORKERS)
+            event_types: Filter by event types (optional)
+            page_size: Rows per page (100-10000)
+            last_timestamp: Resume after this timestamp (applied to every slice)
+            last_uuid: Resume after this UUID (applied to every slice)
+            requests_per_second: Combined request rate of all workers
+            prefetch_pages: Pages buffered per slice before its worker waits
+
+        Yields:
+            Individual event dicts
+
+        Raises:
+            PostHogAuthenticationError: If auth fails
+            PostHogRateLimitError: If rate limited
+            PostHogClientError: On other errors
+        """
+        if windows < 1:
+            raise ValueError(f"windows must be >= 1, got {windows}")
+        workers = max(1, min(max_workers or min(windows, 4), windows, self.MAX_BACKFILL_WORKERS))
+
+        self._use_rate_limiter(requests_per_second, workers)
+
+        slices = self._split_time_range(since, until, windows)
+        logger.info(
+            f"Starting event backfill: {self._to_iso_string(since)} to {self._to_iso_string(until)}, "
+            f"{len(slices)} windows, {workers} workers, page_size={page_size}"
+        )
+
+        sources = [
+            partial(
+                self.iterate_events,
+                since=window_since,
+                until=window_until,
+                event_types=event_types,
+                page_size=page_size,
+                last_timestamp=last_timestamp,
+                last_uuid=last_uuid,
+            )
+            for window_since, window_until in slices
+        ]
+
+        started = time.monotonic()
+        total_yielded = 0
+        for row in self._iterate_concurrently(
+            sources, workers=workers, page_size=page_size, prefetch_pages=prefetch_pages
+        ):
+            yield row
+            total_yielded += 1
+
+        elapsed = time.monotonic() - started
+        logger.info(f"Event backfill complete. Total yielded: {total_yielded} in {elapsed:.1f}s")
+
+    def _use_rate_limiter(self, requests_per_second: float | None, workers: int) -> None:
+        """Install the shared token bucket for concurrent scans (one minute of burst)."""
+        if self.rate_limiter is None:
+            rate = requests_per_second or self.RATE_LIMIT_PER_HOUR / 3600
+            self.rate_limiter = TokenBucket(rate=rate, capacity=max(workers, rate * 60))
+
+    def _iterate_concurrently(
+        self,
+        sources: list[Callable[[], Iterator[dict[str, Any]]]],
+        *,
+        workers: int,
+        page_size: int,
+        prefetch_pages: int = 2,
+    ) -> Iterator[dict[str, Any]]:
+        """Run row iterators in worker threads and yield their rows source by source.
+
+        Each source buffers at most ``prefetch_pages`` pages ahead of the consumer.
+        Sources are submitted in order, so the source being consumed always has a
+        worker. Closing the generator stops the workers at their next page.
+        """
+        done = object()
+        stop = threading.Event()
+        queues: list[queue.Queue] = [queue.Queue(maxsize=max(1, prefetch_pages)) for _ in sources]
+
+        def put(out: queue.Queue, item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    out.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fill(source: Callable[[], Iterator[dict[str, Any]]], out: queue.Queue) -> None:
+            try:
+                page: list[dict[str, Any]] = []
+                for row in source():
+                    page.append(row)
+                    if len(page) >= page_size:
+                        if not put(out, page):
+                            return
+                        page = []
+                if page and not put(out, page):
+                    return
+                put(out, done)
+            except Exception as e:
+                put(out, e)
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="posthog-scan")
+        try:
+            for source, out in zip(sources, queues, strict=True):
+                executor.submit(fill, source, out)
+
+            for out in queues:
+                while True:
+                    item = out.get()
+                    if item is done:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield from item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _split_time_range(since: datetime, until: datetime, windows: int) -> list[tuple[datetime, datetime]]:
+        """Split [since, until) into up to ``windows`` contiguous slices on whole-second boundaries.
+
+        HogQL bounds are formatted with second precision, so fractional boundaries
+        would make neighbouring slices overlap.
+        """
+        since = since.replace(microsecond=0)
+        until = until.replace(microsecond=0)
+        span = int((until - since).total_seconds())
+        if span <= 0:
+            return [(since, until)]
+        bounds = sorted({since + timedelta(seconds=span * i // windows) for i in range(windows)} | {until})
+        return list(zip(bounds, bounds[1:], strict=False))
+
     def iterate_persons(
         self, page_size: int = 1000, last_created_at: str | None = None, last_id: str | None = None
     ) -> Iterator[dict[str, Any]]:
@@ -607,15 +834,31 @@ class PostHogClient:
                 logger.error(f"Rate limit hit during session iteration: {e}")
                 raise
 
-    def iterate_person_distinct_ids(self, page_size: int = 1000) -> Iterator[dict[str, Any]]:
+    def iterate_person_distinct_ids(
+        self,
+        page_size: int = 1000,
+        *,
+        partitions: int = 1,
+        max_workers: int | None = None,
+        requests_per_second: float | None = None,
+    ) -> Iterator[dict[str, Any]]:
         """
         Iterate through person_distinct_ids (full table scan, no time filter)
 
-        This table is typically small and maps distinct_id to person_id.
-        No timestamp field available, so we can't do incremental loading.
+        This table maps distinct_id to person_id. No timestamp field is available,
+        so we can't do incremental loading. Pages use keyset pagination on the
+        unique distinct_id (WHERE distinct_id > last ORDER BY distinct_id), so every
+        page costs the same instead of re-reading OFFSET rows.
+
+        With ``partitions > 1`` the table is split by ``cityHash64(distinct_id) % N``
+        and the partitions are scanned concurrently (sharing a token bucket like
+        ``iterate_events_backfill``); rows are yielded partition by partition.
 
         Args:
             page_size: Rows per page (100-10000)
+            partitions: Number of hash partitions (1 = single scan)
+            max_workers: Concurrent partitions (default min(partitions, 4))
+            requests_per_second: Combined request rate of all workers
 
         Yields:
             Individual mapping dicts with distinct_id and person_id
@@ -625,44 +868,79 @@ class PostHogClient:
             PostHogRateLimitError: If rate limited
             PostHogClientError: On other errors
         """
-        logger.info(f"Starting person_distinct_ids iteration (full table): page_size={page_size}")
+        if partitions < 1:
+            raise ValueError(f"partitions must be >= 1, got {partitions}")
+
+        logger.info(
+            f"Starting person_distinct_ids iteration (full table): page_size={page_size}, partitions={partitions}"
+        )
+        started = time.monotonic()
+        pages_before = self.pages_fetched
+
+        if partitions == 1:
+            rows = self._scan_person_distinct_ids(page_size)
+        else:
+            workers = max(1, min(max_workers or min(partitions, 4), partitions, self.MAX_BACKFILL_WORKERS))
+            self._use_rate_limiter(requests_per_second, workers)
+            sources = [
+                partial(self._scan_person_distinct_ids, page_size, partition=(index, partitions))
+                for index in range(partitions)
+            ]
+            rows = self._iterate_concurrently(sources, workers=workers, page_size=page_size)
+
+        total_yielded = 0
+        for row in rows:
+            yield row
+            total_yielded += 1
+
+        elapsed = time.monotonic() - started
+        pages = self.pages_fetched - pages_before
+        logger.info(
+            f"person_distinct_ids iteration complete. Total rows: {total_yielded}, "
+            f"{pages} pages in {elapsed:.1f}s ({pages / elapsed if elapsed > 0 else 0.0:.1f} pages/s)"
+        )
 
-        # Simple offset pagination (no timestamp for SEEK)
-        offset = 0
+    def _scan_person_distinct_ids(
+        self, page_size: int, partition: tuple[int, int] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Keyset-paginated scan of person_distinct_ids, optionally of one hash partition."""
+        where_parts = []
+        if partition is not None:
+            index, count = partition
+            where_parts.append(f"cityHash64(distinct_id) % {count} = {index}")
+
+        last_distinct_id: str | None = None
+        page_num = 0
 
         while True:
             try:
-                # ORDER BY ensures deterministic row order for OFFSET pagination
-                # Without it, ClickHouse may return rows in different orders between requests
+                seek = [f"distinct_id > '{_escape_hogql_string(last_distinct_id)}'"] if last_distinct_id else []
+                where_clause = "WHERE " + " AND ".join(where_parts + seek) if where_parts or seek else ""
                 query = (
                     f"SELECT distinct_id, person_id "  # nosec B608
-                    f"FROM person_distinct_ids "
-                    f"ORDER BY person_id ASC, distinct_id ASC "
-                    f"LIMIT {page_size} OFFSET {offset}"
+                    f"FROM person_distinct_ids {where_clause} "
+                    f"ORDER BY distinct_id ASC "
+                    f"LIMIT {page_size}"
                 )
 
-                logger.debug(f"Fetching person_distinct_ids offset={offset}...")
+                logger.debug(f"Fetching person_distinct_ids page {page_num + 1} (partition={partition})...")
                 result = self.execute_hogql_query(query)
 
                 rows = result.get("results", [])
                 columns = result.get("columns", [])
 
                 if not rows:
-                    logger.info(f"person_distinct_ids iteration complete. Total offset: {offset}")
                     break
 
-                logger.debug(f"Offset {offset}: {len(rows)} rows")
-
                 # Convert list rows to dicts
                 for row in rows:
-                    mapping_dict = dict(zip(columns, row, strict=False))
-                    yield mapping_dict
+                    yield dict(zip(columns, row, strict=False))
 
                 if len(rows) < page_size:
-                    logger.info(f"Final page. Total rows: {offset + len(rows)}")
                     break
 
-                offset += len(rows)
+                last_distinct_id = dict(zip(columns, rows[-1], strict=False)).get("distinct_id")
+                page_num += 1
 
             except PostHogRateLimitError as e:
                 logger.error(f"Rate limit hit during person_distinct_ids iteration: {e}")
@@ -702,15 +980,16 @@ class PostHogClient:
         one_hour_ago = now - 3600
 
         # Remove old request times
-        self._request_times = [t for t in self._request_times if t > one_hour_ago]
+        with self._rate_lock:
+            self._request_times = [t for t in self._request_times if t > one_hour_ago]
+            recent_requests = len(self._request_times)
 
         # If approaching limit, sleep before next request
         threshold = self.RATE_LIMIT_PER_HOUR * 0.9  # 90% of limit
-        if len(self._request_times) > threshold:
+        if recent_requests > threshold:
             sleep_time = 0.1  # Sleep 100ms between requests
             logger.warning(
-                f"Approaching rate limit ({len(self._request_times)}/{self.RATE_LIMIT_PER_HOUR}). "
-                f"Sleeping {sleep_time}s..."
+                f"Approaching rate limit ({recent_requests}/{self.RATE_LIMIT_PER_HOUR}). Sleeping {sleep_time}s..."
             )
             time.sleep(sleep_time)
 
@@ -16,10 +16,13 @@ from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 import json
 import logging
+import time
 from typing import Any
 
 import pandas as pd
 
+from osiris.core.driver import RowStream, streaming_requested
+
 logger = logging.getLogger(__name__)
 
 
@@ -255,6 +258,125 @@ def _flatten_row(row: dict[str, Any], data_type: str) -> dict[str, Any]:
         raise PostHogDriverError(f"Unknown data_type for flattening: {data_type}")
 
 
+def _iter_df_chunks(
+    iterator: Iterator[dict[str, Any]],
+    *,
+    step_id: str,
+    data_type: str,
+    deduplication_enabled: bool,
+    recent_uuids: deque,
+    progress: dict[str, Any],
+    batch_size: int = 1000,
+) -> Iterator[pd.DataFrame]:
+    """Deduplicate, flatten and batch API rows into DataFrame chunks.
+
+    Memory usage is O(batch_size). ``progress`` is updated in place with
+    rows_processed, rows_deduplicated and last_row (for state updates).
+    """
+    batch: list[dict[str, Any]] = []
+    progress.update(rows_processed=0, rows_deduplicated=0, last_row=None, chunks=0)
+
+    try:
+        # Stream rows into batches and build DataFrames incrementally
+        for row in iterator:
+            uuid_val = row.get("uuid")
+
+            # Deduplication: skip if UUID already seen
+            if deduplication_enabled and uuid_val and uuid_val in recent_uuids:
+                progress["rows_deduplicated"] += 1
+                continue
+
+            # Add UUID to cache for dedup
+            # append() auto-evicts oldest when deque exceeds maxlen (FIFO)
+            if uuid_val:
+                recent_uuids.append(uuid_val)
+
+            # Append to current batch
+            batch.append(row)
+            progress["last_row"] = row  # Track for state update
+
+            # When batch reaches threshold, flatten and convert to DataFrame
+            if len(batch) >= batch_size:
+                # Flatten batch rows (in-memory, bounded by batch_size)
+                df_chunk = pd.DataFrame([_flatten_row(r, data_type) for r in batch])
+                progress["rows_processed"] += len(batch)
+                progress["chunks"] += 1
+                batch = []  # Clear batch to free memory
+
+                logger.info(
+                    f"[{step_id}] Processed {progress['rows_processed']} rows "
+                    f"({progress['chunks']} chunks, dedup: {progress['rows_deduplicated']})"
+                )
+                yield df_chunk
+
+        # Process final batch
+        if batch:
+            df_chunk = pd.DataFrame([_flatten_row(r, data_type) for r in batch])
+            progress["rows_processed"] += len(batch)
+            progress["chunks"] += 1
+            logger.info(f"[{step_id}] Final batch: {len(batch)} rows")
+            yield df_chunk
+
+    except (PostHogAuthenticationError, PostHogRateLimitError) as e:
+        logger.error(f"[{step_id}] API error: {e}")
+        raise
+
+
+def _log_extraction_metrics(
+    ctx, progress: dict[str, Any], *, rows_output: int, columns: int, client: Any = None, started: float = 0.0
+) -> None:
+    """Emit extraction metrics once all chunks were produced."""
+    ctx.log_metric("rows_read", progress["rows_processed"])
+    ctx.log_metric("rows_deduplicated", progress["rows_deduplicated"])
+    ctx.log_metric("rows_output", rows_output)
+    ctx.log_metric("columns", columns)
+    pages = getattr(client, "pages_fetched", None)
+    if isinstance(pages, int) and started:
+        elapsed = time.monotonic() - started
+        ctx.log_metric("pages_fetched", pages)
+        ctx.log_metric("pages_per_second", round(pages / elapsed, 2) if elapsed > 0 else 0.0)
+
+
+def _build_new_state(
+    data_type: str, last_row: dict[str, Any] | None, previous: dict[str, Any], recent_uuids: deque
+) -> dict[str, Any]:
+    """Build the data-type-specific state for the next run.
+
+    Falls back to the previous cursor values when no rows were extracted.
+    """
+    # Build data-type-specific state based on the data type's unique fields
+    if data_type == "events":
+        # Events: uuid (unique ID) + timestamp (time)
+        type_state = {
+            "last_timestamp": last_row.get("timestamp") if last_row else previous.get("last_timestamp"),
+            "last_uuid": last_row.get("uuid") if last_row else previous.get("last_uuid"),
+        }
+    elif data_type == "persons":
+        # Persons: id (unique ID) + created_at (time)
+        type_state = {
+            "last_created_at": last_row.get("created_at") if last_row else previous.get("last_created_at"),
+            "last_id": last_row.get("id") if last_row else previous.get("last_id"),
+        }
+    elif data_type == "sessions":
+        # Sessions: session_id (unique ID) + $start_timestamp (time)
+        type_state = {
+            "last_start_timestamp": (
+                last_row.get("$start_timestamp") if last_row else previous.get("last_start_timestamp")
+            ),
+            "last_session_id": last_row.get("session_id") if last_row else previous.get("last_session_id"),
+        }
+    else:
+        # person_distinct_ids: No pagination state (full table scan)
+        type_state = {}
+
+    # Build new state with data-type-specific nested state
+    return {
+        f"{data_type}_state": type_state,
+        # No slicing needed - deque already maintains exactly 10k newest UUIDs via FIFO
+        "recent_uuids": list(recent_uuids),
+    }
+
+
 def run(*, step_id: str, config: dict[str, Any], inputs: dict[str, Any], ctx) -> dict[str, Any]:
     """
     Main Osiris driver entry point - TRUE STREAMING implementation.
@@ -273,6 +395,14 @@ def run(*, step_id: str, config: dict[str, Any], inputs: dict[str, Any], ctx) ->
             - initial_since: Initial start timestamp (ISO 8601)
             - page_size: Rows per page (100-10000, default 1000)
             - deduplication_enabled: Enable UUID deduplication (default True)
+            - checkpoint_every_pages: Call ctx.checkpoint(state) every N pages while streaming
+              (default 0 = only the final state is returned)
+            - backfill_windows: Split the events time range into N windows paged concurrently
+              (default 1 = serial)
+            - scan_partitions: Scan person_distinct_ids as N hash partitions concurrently (default 1)
+            - backfill_workers: Concurrent windows / partitions (default min(N, 4))
+            - max_requests_per_second: Combined request rate of concurrent workers
+              (default 2400/hour, PostHog's query API limit)
         inputs: Input state dict with:
             - state: Data-type-specific nested state:
                 - events_state: {last_timestamp, last_uuid}
@@ -284,8 +414,9 @@ def run(*, step_id: str, config: dict[str, Any], inputs: dict[str, Any], ctx) ->
 
     Returns:
         Dict with:
-            - df: pandas.DataFrame with extracted data
-            - state: Updated state for next run (data-type-specific nested structure)
+            - df: pandas.DataFrame with extracted data (RowStream when the runner requests streaming)
+            - state: Updated state for next run (data-type-specific nested structure); for streams
+              it is filled in place once the stream is exhausted
 
     Raises:
         PostHogDriverError: On configuration or connection errors
@@ -330,6 +461,25 @@ def run(*, step_id: str, config: dict[str, Any], inputs: dict[str, Any], ctx) ->
 
         deduplication_enabled = config.get("deduplication_enabled", True)
 
+        checkpoint_every_pages = config.get("checkpoint_every_pages", 0)
+        if not isinstance(checkpoint_every_pages, int) or checkpoint_every_pages < 0:
+            raise PostHogDriverError(
+                f"checkpoint_every_pages must be a non-negative integer, got {checkpoint_every_pages}"
+            )
+
+        backfill_windows = config.get("backfill_windows", 1)
+        if not isinstance(backfill_windows, int) or backfill_windows < 1:
+            raise PostHogDriverError(f"backfill_windows must be a positive integer, got {backfill_windows}")
+        scan_partitions = config.get("scan_partitions", 1)
+        if not isinstance(scan_partitions, int) or scan_partitions < 1:
+            raise PostHogDriverError(f"scan_partitions must be a positive integer, got {scan_partitions}")
+        backfill_workers = config.get("backfill_workers")
+        if backfill_workers is not None and (not isinstance(backfill_workers, int) or backfill_workers < 1):
+            raise PostHogDriverError(f"backfill_workers must be a positive integer, got {backfill_workers}")
+        max_requests_per_second = config.get("max_requests_per_second")
+        if max_requests_per_second is not None and max_requests_per_second <= 0:
+            raise PostHogDriverError(f"max_requests_per_second must be positive, got {max_requests_per_second}")
+
         # ===== Load state from inputs (data-type-specific) =====
         state_input = (inputs or {}).get("state", {})
 
@@ -407,97 +557,112 @@ def run(*, step_id: str, config: dict[str, Any], inputs: dict[str, Any], ctx) ->
 
         # ===== Create API client =====
         client = PostHogClient(base_url, api_key, project_id)
+        started = time.monotonic()
 
         # ===== TRUE STREAMING: Incremental DataFrame building =====
         # Instead of accumulating all rows in memory, we build DataFrames incrementally
         # Memory usage: O(batch_size) = O(1000) instead of O(total_rows)
-        batch_size = 1000
-        batch: list[dict[str, Any]] = []
-        df_chunks: list[pd.DataFrame] = []  # Accumulate DataFrame chunks, not raw rows
-        deduplicated_count = 0
-        total_rows_processed = 0
-        last_row: dict[str, Any] | None = None  # Track last row for state update
+        if data_type == "events" and backfill_windows > 1:
+            # Time-sliced backfill: windows are paged concurrently and merged in timestamp/uuid order
+            iterator: Iterator[dict[str, Any]] = client.iterate_events_backfill(
+                since=actual_since,
+                until=until,
+                windows=backfill_windows,
+                max_workers=backfill_workers,
+                event_types=event_types if event_types else None,
+                page_size=page_size,
+                last_timestamp=last_timestamp,
+                last_uuid=last_uuid,
+                requests_per_second=max_requests_per_second,
+            )
 
-        try:
-            if data_type == "events":
-                # Iterate events with SEEK-based pagination
-                iterator: Iterator[dict[str, Any]] = client.iterate_events(
-                    since=actual_since,
-                    until=until,
-                    event_types=event_types if event_types else None,
-                    page_size=page_size,
-                    last_timestamp=last_timestamp,
-                    last_uuid=last_uuid,
-                )
+        elif data_type == "events":
+            # Iterate events with SEEK-based pagination
+            iterator = client.iterate_events(
+                since=actual_since,
+                until=until,
+                event_types=event_types if event_types else None,
+                page_size=page_size,
+                last_timestamp=last_timestamp,
+                last_uuid=last_uuid,
+            )
 
-            elif data_type == "persons":
-                # Iterate persons with SEEK-based pagination
-                # Persons use: id (string) + created_at (timestamp)
-                iterator = client.iterate_persons(page_size=page_size, last_created_at=last_created_at, last_id=last_id)
+        elif data_type == "persons":
+            # Iterate persons with SEEK-based pagination
+            # Persons use: id (string) + created_at (timestamp)
+            iterator = client.iterate_persons(page_size=page_size, last_created_at=last_created_at, last_id=last_id)
 
-            elif data_type == "sessions":
-                # Sessions extraction with SEEK-based pagination
-                # Sessions use: session_id (string) + $start_timestamp (timestamp)
-                iterator = client.iterate_sessions(
-                    since=actual_since,
-                    until=until,
-                    page_size=page_size,
-                    last_start_timestamp=last_start_timestamp,
-                    last_session_id=last_session_id,
+        elif data_type == "sessions":
+            # Sessions extraction with SEEK-based pagination
+            # Sessions use: session_id (string) + $start_timestamp (timestamp)
+            iterator = client.iterate_sessions(
+                since=actual_since,
+                until=until,
+                page_size=page_size,
+                last_start_timestamp=last_start_timestamp,
+                last_session_id=last_session_id,
+            )
+
+        elif data_type == "person_distinct_ids":
+            # NEW: Person distinct IDs (full table scan, no time filter)
+            # Keyset pagination on distinct_id, optionally split into concurrent hash partitions
+            iterator = client.iterate_person_distinct_ids(
+                page_size=page_size,
+                partitions=scan_partitions,
+                max_workers=backfill_workers,
+                requests_per_second=max_requests_per_second,
+            )
+
+        else:
+            raise PostHogDriverError(f"Unhandled data_type: {data_type}")
+
+        progress: dict[str, Any] = {}
+        chunks = _iter_df_chunks(
+            iterator,
+            step_id=step_id,
+            data_type=data_type,
+            deduplication_enabled=deduplication_enabled,
+            recent_uuids=recent_uuids,
+            progress=progress,
+        )
+
+        if streaming_requested(ctx):
+            # State is only final once the consumer exhausted the stream; the returned
+            # dict is filled in place at that point (it holds the input state until then).
+            new_state = {f"{data_type}_state": dict(type_state), "recent_uuids": list(recent_uuids)}
+
+            # Resuming after a yield means the consumer has taken the chunk, so the cursor
+            # of its last row is safe to checkpoint (person_distinct_ids has no cursor).
+            checkpoint_rows = page_size * checkpoint_every_pages
+            if data_type == "person_distinct_ids" or not hasattr(ctx, "checkpoint"):
+                checkpoint_rows = 0
+
+            def _stream() -> Iterator[pd.DataFrame]:
+                columns = 0
+                checkpointed_rows = 0
+                for df_chunk in chunks:
+                    columns = max(columns, len(df_chunk.columns))
+                    yield df_chunk
+
+                    if checkpoint_rows and progress["rows_processed"] - checkpointed_rows >= checkpoint_rows:
+                        ctx.checkpoint(_build_new_state(data_type, progress.get("last_row"), type_state, recent_uuids))
+                        checkpointed_rows = progress["rows_processed"]
+                        logger.info(f"[{step_id}] Checkpointed state after {checkpointed_rows} rows")
+
+                _log_extraction_metrics(
+                    ctx,
+                    progress,
+                    rows_output=progress["rows_processed"],
+                    columns=columns,
+                    client=client,
+                    started=started,
                 )
+                new_state.update(_build_new_state(data_type, progress.get("last_row"), type_state, recent_uuids))
+                logger.info(f"[{step_id}] Stream complete, updated state for {data_type}")
+
+            return {"df": RowStream(_stream()), "state": new_state}
 
-            elif data_type == "person_distinct_ids":
-                # NEW: Person distinct IDs (full table scan, no time filter)
-                iterator = client.iterate_person_distinct_ids(page_size=config.get("page_size", 1000))
-
-            else:
-                raise PostHogDriverError(f"Unhandled data_type: {data_type}")
-
-            # Stream rows into batches and build DataFrames incrementally
-            for row in iterator:
-                uuid_val = row.get("uuid")
-
-                # Deduplication: skip if UUID already seen
-                if deduplication_enabled and uuid_val and uuid_val in recent_uuids:
-                    deduplicated_count += 1
-                    continue
-
-                # Add UUID to cache for dedup
-                # append() auto-evicts oldest when deque exceeds maxlen (FIFO)
-                if uuid_val:
-                    recent_uuids.append(uuid_val)
-
-                # Append to current batch
-                batch.append(row)
-                last_row = row  # Track for state update
-
-                # When batch reaches threshold, flatten and convert to DataFrame
-                if len(batch) >= batch_size:
-                    # Flatten batch rows (in-memory, bounded by batch_size)
-                    flattened_batch = [_flatten_row(r, data_type) for r in batch]
-                    # Convert to DataFrame chunk
-                    df_chunk = pd.DataFrame(flattened_batch)
-                    df_chunks.append(df_chunk)
-
-                    total_rows_processed += len(batch)
-                    batch = []  # Clear batch to free memory
-
-                    logger.info(
-                        f"[{step_id}] Processed {total_rows_processed} rows "
-                        f"({len(df_chunks)} chunks, dedup: {deduplicated_count})"
-                    )
-
-            # Process final batch
-            if batch:
-                flattened_batch = [_flatten_row(r, data_type) for r in batch]
-                df_chunk = pd.DataFrame(flattened_batch)
-                df_chunks.append(df_chunk)
-                total_rows_processed += len(batch)
-                logger.info(f"[{step_id}] Final batch: {len(batch)} rows")
-
-        except (PostHogAuthenticationError, PostHogRateLimitError) as e:
-            logger.error(f"[{step_id}] API error: {e}")
-            raise
+        df_chunks = list(chunks)
 
         # ===== Concatenate DataFrame chunks =====
         if not df_chunks:
@@ -510,48 +675,20 @@ def run(*, step_id: str, config: dict[str, Any], inputs: dict[str, Any], ctx) ->
             logger.info(f"[{step_id}] Created DataFrame with {len(df)} rows, " f"{len(df.columns)} columns")
 
         # ===== Log metrics =====
-        ctx.log_metric("rows_read", total_rows_processed)
-        ctx.log_metric("rows_deduplicated", deduplicated_count)
-        ctx.log_metric("rows_output", len(df))
-        ctx.log_metric("columns", len(df.columns) if not df.empty else 0)
+        _log_extraction_metrics(
+            ctx,
+            progress,
+            rows_output=len(df),
+            columns=len(df.columns) if not df.empty else 0,
+            client=client,
+            started=started,
+        )
 
         # ===== Update state for next run (data-type-specific) =====
-        # Build data-type-specific state based on the data type's unique fields
-        # Use last_row tracked during iteration instead of indexing into all_rows
-        if data_type == "events":
-            # Events: uuid (unique ID) + timestamp (time)
-            type_state = {
-                "last_timestamp": last_row.get("timestamp") if last_row else last_timestamp,
-                "last_uuid": last_row.get("uuid") if last_row else last_uuid,
-            }
-        elif data_type == "persons":
-            # Persons: id (unique ID) + created_at (time)
-            type_state = {
-                "last_created_at": last_row.get("created_at") if last_row else last_created_at,
-                "last_id": last_row.get("id") if last_row else last_id,
-            }
-        elif data_type == "sessions":
-            # Sessions: session_id (unique ID) + $start_timestamp (time)
-            type_state = {
-                "last_start_timestamp": last_row.get("$start_timestamp") if last_row else last_start_timestamp,
-                "last_session_id": last_row.get("session_id") if last_row else last_session_id,
-            }
-        elif data_type == "person_distinct_ids":
-            # person_distinct_ids: No pagination state (full table scan)
-            type_state = {}
-        else:
-            # Unknown data type - preserve empty state
-            type_state = {}
-
-        # Build new state with data-type-specific nested state
-        new_state = {
-            f"{data_type}_state": type_state,
-            # No slicing needed - deque already maintains exactly 10k newest UUIDs via FIFO
-            "recent_uuids": list(recent_uuids),
-        }
+        new_state = _build_new_state(data_type, progress.get("last_row"), type_state, recent_uuids)
 
         # Log state update with data-type-specific fields
-        state_summary = ", ".join(f"{k}={v}" for k, v in type_state.items())
+        state_summary = ", ".join(f"{k}={v}" for k, v in new_state[f"{data_type}_state"].items())
         logger.info(
             f"[{step_id}] Updated state: {state_summary}, " f"uuid_cache_size={len(new_state.get('recent_uuids', []))}"
         )
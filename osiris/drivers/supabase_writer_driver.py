@@ -1,13 +1,19 @@
 """Supabase writer driver for runtime execution."""
 
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import contextlib
 from datetime import date, datetime
 from decimal import Decimal
+import io
+import itertools
+import json
 import logging
 import os
 from pathlib import Path
 import secrets
 import socket
+import threading
 import time
 from types import SimpleNamespace
 from typing import Any
@@ -19,15 +25,114 @@ import pandas as pd
 import requests
 
 from ..connectors.supabase.client import SupabaseClient
-from ..core.driver import Driver
+from ..core.driver import Driver, RowStream, is_tabular_input
 from ..core.session_logging import log_event, log_metric
 
 logger = logging.getLogger(__name__)
 
+# Incoming primary keys are copied into the replace-cleanup temp table in chunks of this many rows
+_KEY_COPY_CHUNK_SIZE = 100_000
+
+# Above this many keys the HTTP SQL cleanup stages keys in chunks instead of sending one statement
+_HTTP_KEY_CHUNK_SIZE = 10_000
+
 # Module-level state tracking (for test cleanup)
 _module_clients: list = []
 
 
+# Python scalars that serialize as-is (skips the per-value checks for object columns)
+_PASSTHROUGH_TYPES = frozenset({str, int, bool})
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert a single cell to a JSON-friendly Python value."""
+    # Handle NaN/None
+    if pd.isna(value):
+        return None
+    # Handle datetime types
+    if isinstance(value, pd.Timestamp | np.datetime64):
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    # Handle numeric types
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    # Pass through other types
+    return value
+
+
+def _serialize_column(values: np.ndarray) -> list[Any]:
+    """Convert one column of ``DataFrame.values`` to JSON-friendly Python values by dtype."""
+    kind = values.dtype.kind
+    if kind in "iub":
+        return values.tolist()
+    if kind == "f":
+        result = values.tolist()
+        for position in np.flatnonzero(np.isnan(values)):
+            result[position] = None
+        return result
+    if kind == "M":
+        # Whole-second values format like Timestamp.isoformat(); others keep the scalar path
+        seconds = values.astype("datetime64[s]")
+        result = np.datetime_as_string(seconds).astype(object)
+        result[np.isnat(values)] = None
+        for position in np.flatnonzero((seconds != values) & ~np.isnat(values)):
+            result[position] = pd.Timestamp(values[position]).isoformat()
+        return result.tolist()
+    return [value if type(value) in _PASSTHROUGH_TYPES else _serialize_value(value) for value in values]
+
+
+def _copy_csv_field(value: Any) -> str:
+    """Render one serialized record value as a field of a ``COPY ... (FORMAT csv)`` stream.
+
+    NULL is the unquoted empty field; every string is quoted so that empty strings
+    stay distinct from NULL.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        # Rows of mixed int/float frames arrive as floats; "1.0" is not valid integer input
+        return str(int(value))
+    if isinstance(value, int | float):
+        return repr(value)
+    if not isinstance(value, str):
+        value = json.dumps(value, default=str)
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _copy_csv_payload(rows: Iterable[Iterable[Any]]) -> str:
+    """Render rows of serialized values as CSV for ``COPY FROM STDIN``."""
+    lines = [",".join([_copy_csv_field(value) for value in row]) for row in rows]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a Postgres identifier for SQL sent over the HTTP SQL channel."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a Postgres string literal (standard_conforming_strings) for the HTTP SQL channel."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _http_key_recordset(target: str, primary_key: list[str], keys: Iterable[tuple[Any, ...]]) -> str:
+    """Inline ``keys`` as a recordset typed by the row type of ``target`` (aliased ``k``)."""
+    payload = json.dumps(
+        [{col: _serialize_value(value) for col, value in zip(primary_key, key, strict=True)} for key in keys],
+        default=str,
+    )
+    return f"jsonb_populate_recordset(NULL::{target}, {_quote_literal(payload)}::jsonb) AS k"
+
+
 def _reset_test_state() -> None:
     """Reset module-level state for test isolation.
 
@@ -82,6 +187,78 @@ def retry_with_backoff(func, max_attempts=3, initial_delay=1.0, max_delay=10.0):
     raise last_exception
 
 
+def _http_status(exc: BaseException) -> int | None:
+    """Best-effort HTTP status of a failed PostgREST/httpx request."""
+    for candidate in (exc, getattr(exc, "response", None)):
+        status = getattr(candidate, "status_code", None)
+        if isinstance(status, int):
+            return status
+    # postgrest APIError reports the HTTP status as its code for non-JSON error bodies
+    code = getattr(exc, "code", None)
+    if isinstance(code, str) and code.isdigit():
+        return int(code)
+    return None
+
+
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    """Retry-After header (seconds form) of a failed request, if present."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("retry-after") or headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
+class _AdaptiveThrottle:
+    """Shared pacing for concurrent batch requests.
+
+    Throttling responses (429/5xx) halve the in-flight limit and pause every worker,
+    for Retry-After when given and otherwise for an exponentially growing delay.
+    Each run of successful requests as long as the current limit raises the limit
+    by one again (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, max_in_flight: int, base_delay: float, max_delay: float = 30.0):
+        self.max_in_flight = max_in_flight
+        self.limit = max_in_flight
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.throttled = 0
+        self._delay = base_delay
+        self._in_flight = 0
+        self._successes = 0
+        self._resume_at = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while True:
+                wait_s = self._resume_at - time.monotonic()
+                if wait_s <= 0 and self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+                self._condition.wait(timeout=wait_s if wait_s > 0 else None)
+
+    def release(self, *, throttled: bool = False, retry_after: float | None = None) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+                if retry_after is None:
+                    retry_after = self._delay * (0.5 + secrets.SystemRandom().random())
+                self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+                self._delay = min(self._delay * 2, self.max_delay)
+            else:
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self.limit = min(self.max_in_flight, self.limit + 1)
+                    self._successes = 0
+                self._delay = max(self.base_delay, self._delay / 2)
+            self._condition.notify_all()
+
+
 class SupabaseWriterDriver(Driver):
     """Driver for writing data to Supabase."""
 
@@ -91,7 +268,7 @@ class SupabaseWriterDriver(Driver):
         Args:
             step_id: Identifier of the step being executed
             config: Step configuration including resolved connections
-            inputs: Input data from upstream steps (expects {"df": DataFrame})
+            inputs: Input data from upstream steps (expects {"df": DataFrame} or {"df": RowStream})
             ctx: Execution context for logging
 
         Returns:
@@ -110,7 +287,7 @@ class SupabaseWriterDriver(Driver):
         df = None
         df_key = None
         for key, value in inputs.items():
-            if (key.startswith("df_") or key == "df") and isinstance(value, pd.DataFrame):
+            if (key.startswith("df_") or key == "df") and is_tabular_input(value):
                 df = value
                 df_key = key
                 break
@@ -121,7 +298,10 @@ class SupabaseWriterDriver(Driver):
                 f"Expected key 'df' or starting with 'df_'. Got: {list(inputs.keys())}"
             )
 
-        logger.debug(f"Step {step_id}: Using DataFrame from {df_key} ({len(df)} rows)")
+        if isinstance(df, RowStream):
+            logger.debug(f"Step {step_id}: Using RowStream from {df_key}")
+        else:
+            logger.debug(f"Step {step_id}: Using DataFrame from {df_key} ({len(df)} rows)")
 
         # Extract configuration (strict - reject unknown keys)
         known_keys = {
@@ -138,6 +318,8 @@ class SupabaseWriterDriver(Driver):
             "retries",
             "prefer",
             "ddl_channel",
+            "concurrency",
+            "write_channel",
         }
 
         unknown_keys = set(config.keys()) - known_keys
@@ -181,6 +363,12 @@ class SupabaseWriterDriver(Driver):
         create_if_missing = config.get("create_if_missing", False)
         timeout = config.get("timeout", 30)
         config_retries = config.get("retries", 3)
+        concurrency = config.get("concurrency", 1)
+        if isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError(f"Step {step_id}: 'concurrency' must be a positive integer, got {concurrency!r}")
+        write_channel = config.get("write_channel", "rest").lower()
+        if write_channel not in {"rest", "copy"}:
+            raise ValueError(f"Step {step_id}: Invalid write_channel '{write_channel}'. Expected rest or copy")
         ddl_channel = config.get("ddl_channel", "auto").lower()
         if ddl_channel not in {"auto", "http_sql", "psycopg2"}:
             raise ValueError(
@@ -197,10 +385,29 @@ class SupabaseWriterDriver(Driver):
         if force_plan_env and not (has_sql_channel or has_http_channel):
             plan_only_preference = True
 
+        if write_channel == "copy" and not has_sql_channel:
+            raise ValueError(
+                f"Step {step_id}: write_channel 'copy' requires a Postgres connection "
+                "(pg_dsn or host/database/user/password)"
+            )
+
         max_retry_attempts = max(1, int(os.getenv("RETRY_MAX_ATTEMPTS", config_retries)))
         base_retry_sleep = max(0.0, float(os.getenv("RETRY_BASE_SLEEP", 1.0)))
         retries = max(0, max_retry_attempts - 1)
 
+        # Consume DataFrames and RowStreams the same way: one frame at a time
+        stream = df if isinstance(df, RowStream) else RowStream.from_dataframe(df, batch_size)
+        total_rows = stream.estimated_row_count
+        frames = stream.iter_batches()
+        first_frame = next(frames, None)
+        if first_frame is not None:
+            frames = itertools.chain([first_frame], frames)
+            schema_df = first_frame
+        elif isinstance(df, RowStream):
+            schema_df = pd.DataFrame(columns=[col.name for col in stream.columns])
+        else:
+            schema_df = df
+
         # Log operation start
         if ctx:
             log_event(
@@ -208,7 +415,7 @@ class SupabaseWriterDriver(Driver):
                 step_id=step_id,
                 table=table_name,
                 mode=write_mode,
-                rows=len(df),
+                rows=total_rows,
                 batch_size=batch_size,
             )
 
@@ -226,7 +433,8 @@ class SupabaseWriterDriver(Driver):
             output_dir.mkdir(parents=True, exist_ok=True)
 
         effective_mode = "upsert" if write_mode == "replace" else write_mode
-        primary_key_values = self._collect_primary_key_values(df, primary_key) if primary_key else []
+        # Primary keys seen across all frames (insertion-ordered), needed for replace cleanup
+        seen_primary_keys: dict[tuple[Any, ...], None] = {}
 
         force_spill = os.getenv("E2B_FORCE_SPILL", "").strip().lower() in {"1", "true", "yes"}
 
@@ -243,7 +451,7 @@ class SupabaseWriterDriver(Driver):
                     if not create_if_missing:
                         raise RuntimeError(f"Table {table_name} does not exist and create_if_missing is false")
 
-                    create_sql = self._generate_create_table_sql(df, table_name, schema, primary_key)
+                    create_sql = self._generate_create_table_sql(schema_df, table_name, schema, primary_key)
                     ddl_path = None
                     if output_dir:
                         ddl_path = output_dir / "ddl_plan.sql"
@@ -272,60 +480,94 @@ class SupabaseWriterDriver(Driver):
                         logger.info("Waiting 3s for PostgREST schema cache refresh...")
                         time.sleep(3)
 
-                # Convert DataFrame to records
-                records = self._prepare_records(df)
-
-                # Process in batches
-                for i in range(0, len(records), batch_size):
-                    batch = records[i : i + batch_size]
+                record_batches = self._iter_record_batches(
+                    frames,
+                    batch_size,
+                    primary_key=primary_key if write_mode == "replace" else None,
+                    seen_primary_keys=seen_primary_keys,
+                )
 
-                    try:
-                        # Wrap Supabase operations in retry logic
-                        def write_batch(batch_data=batch, batch_idx=i):
-                            if effective_mode == "insert":
-                                return client.table(table_name).insert(batch_data).execute()
-                            elif effective_mode == "upsert":
-                                return (
-                                    client.table(table_name)
-                                    .upsert(batch_data, on_conflict=",".join(primary_key))
-                                    .execute()
-                                )
-                            else:
-                                raise ValueError(f"Unsupported write mode: {effective_mode}")
+                if write_channel == "copy":
+                    rows_written = self._write_batches_copy(
+                        step_id=step_id,
+                        connection_config=connection_config,
+                        table_name=table_name,
+                        schema=schema,
+                        mode=effective_mode,
+                        primary_key=primary_key,
+                        record_batches=record_batches,
+                        total_rows=total_rows,
+                        ctx=ctx,
+                    )
+                elif concurrency > 1:
+                    rows_written = self._write_batches_concurrently(
+                        step_id=step_id,
+                        client=client,
+                        table_name=table_name,
+                        mode=effective_mode,
+                        primary_key=primary_key,
+                        record_batches=record_batches,
+                        concurrency=concurrency,
+                        max_attempts=max_retry_attempts,
+                        base_delay=base_retry_sleep,
+                        total_rows=total_rows,
+                        ctx=ctx,
+                    )
+                else:
+                    # Process in batches
+                    i = 0
+                    for batch in record_batches:
+                        try:
+                            # Wrap Supabase operations in retry logic
+                            def write_batch(batch_data=batch, batch_idx=i):
+                                if effective_mode == "insert":
+                                    return client.table(table_name).insert(batch_data).execute()
+                                elif effective_mode == "upsert":
+                                    return (
+                                        client.table(table_name)
+                                        .upsert(batch_data, on_conflict=",".join(primary_key))
+                                        .execute()
+                                    )
+                                else:
+                                    raise ValueError(f"Unsupported write mode: {effective_mode}")
+
+                            # Execute with retry
+                            retry_with_backoff(
+                                write_batch,
+                                max_attempts=max_retry_attempts,
+                                initial_delay=base_retry_sleep,
+                            )
 
-                        # Execute with retry
-                        retry_with_backoff(
-                            write_batch,
-                            max_attempts=max_retry_attempts,
-                            initial_delay=base_retry_sleep,
-                        )
+                            rows_written += len(batch)
 
-                        rows_written += len(batch)
+                            # Log progress
+                            if ctx and (i + batch_size) % (batch_size * 10) == 0:
+                                log_event(
+                                    "write.progress",
+                                    step_id=step_id,
+                                    rows_written=rows_written,
+                                    total_rows=total_rows,
+                                )
 
-                        # Log progress
-                        if ctx and (i + batch_size) % (batch_size * 10) == 0:
-                            log_event(
-                                "write.progress",
-                                step_id=step_id,
-                                rows_written=rows_written,
-                                total_rows=len(df),
-                            )
+                        except Exception as e:
+                            logger.error(f"Failed to write batch {i // batch_size}: {str(e)}")
+                            if retries > 0:
+                                # Simple retry logic (could be enhanced with backoff)
+                                logger.info(f"Retrying batch {i // batch_size}...")
+                                try:
+                                    if effective_mode == "insert":
+                                        client.table(table_name).insert(batch).execute()
+                                    elif effective_mode == "upsert":
+                                        client.table(table_name).upsert(
+                                            batch, on_conflict=",".join(primary_key)
+                                        ).execute()
+                                    rows_written += len(batch)
+                                except Exception as retry_e:
+                                    raise RuntimeError(f"Batch write failed after retry: {str(retry_e)}") from retry_e
+                            else:
+                                raise
 
-                    except Exception as e:
-                        logger.error(f"Failed to write batch {i // batch_size}: {str(e)}")
-                        if retries > 0:
-                            # Simple retry logic (could be enhanced with backoff)
-                            logger.info(f"Retrying batch {i // batch_size}...")
-                            try:
-                                if effective_mode == "insert":
-                                    client.table(table_name).insert(batch).execute()
-                                elif effective_mode == "upsert":
-                                    client.table(table_name).upsert(batch, on_conflict=",".join(primary_key)).execute()
-                                rows_written += len(batch)
-                            except Exception as retry_e:
-                                raise RuntimeError(f"Batch write failed after retry: {str(retry_e)}") from retry_e
-                        else:
-                            raise
+                        i += batch_size
 
                 if write_mode == "replace":
                     self._perform_replace_cleanup(
@@ -335,7 +577,7 @@ class SupabaseWriterDriver(Driver):
                         table_name=table_name,
                         schema=schema,
                         primary_key=primary_key,
-                        primary_key_values=primary_key_values,
+                        primary_key_values=seen_primary_keys.keys(),
                         ddl_channel=ddl_channel,
                         plan_only=plan_only_preference,
                     )
@@ -343,8 +585,8 @@ class SupabaseWriterDriver(Driver):
             # Calculate metrics
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
-            # Determine channel used (check last DDL operation logged)
-            channel_used = "http_rest"  # Data writes always use REST; DDL events capture channel details
+            # Data writes use REST unless COPY was requested; DDL events capture channel details
+            channel_used = "copy" if write_channel == "copy" else "http_rest"
 
             # Log metrics
             if ctx:
@@ -369,44 +611,272 @@ class SupabaseWriterDriver(Driver):
                 log_event("write.error", step_id=step_id, error=str(e))
             raise RuntimeError(f"Supabase write failed: {str(e)}") from e
 
-    def _prepare_records(self, df: pd.DataFrame) -> list[dict[str, Any]]:
+    def _write_batches_concurrently(
+        self,
+        *,
+        step_id: str,
+        client: Any,
+        table_name: str,
+        mode: str,
+        primary_key: list[str] | None,
+        record_batches: Iterator[list[dict[str, Any]]],
+        concurrency: int,
+        max_attempts: int,
+        base_delay: float,
+        total_rows: int | None,
+        ctx: Any,
+    ) -> int:
+        """Write record batches with up to ``concurrency`` requests in flight.
+
+        All requests go through the client's shared keep-alive HTTP session. Batches
+        are pulled from the generator only when a slot frees up, so at most
+        ``concurrency`` serialized batches are held at once. Progress is accounted
+        in batch order: ``rows_written`` covers the contiguous prefix of finished batches.
+
+        Returns:
+            Number of rows written
+        """
+        if mode not in {"insert", "upsert"}:
+            raise ValueError(f"Unsupported write mode: {mode}")
+        on_conflict = ",".join(primary_key) if mode == "upsert" else None
+        throttle = _AdaptiveThrottle(concurrency, base_delay)
+
+        def write_batch(batch_index: int, batch: list[dict[str, Any]]) -> int:
+            delay = base_delay
+            for attempt in range(1, max_attempts + 1):
+                throttle.acquire()
+                try:
+                    if on_conflict is None:
+                        client.table(table_name).insert(batch).execute()
+                    else:
+                        client.table(table_name).upsert(batch, on_conflict=on_conflict).execute()
+                except Exception as e:
+                    status = _http_status(e)
+                    throttled = status is not None and (status == 429 or status >= 500)
+                    throttle.release(throttled=throttled, retry_after=_retry_after_seconds(e) if throttled else None)
+                    if attempt == max_attempts:
+                        raise RuntimeError(f"Batch {batch_index} failed after {max_attempts} attempts: {e}") from e
+                    logger.warning(
+                        f"Batch {batch_index} attempt {attempt} failed (status={status}): {str(e)[:100]}. Retrying..."
+                    )
+                    if not throttled:
+                        # Throttling pauses all workers; other errors back off per batch
+                        time.sleep(delay * (0.5 + secrets.SystemRandom().random()))
+                        delay = min(delay * 2, 10.0)
+                else:
+                    throttle.release()
+                    return len(batch)
+            return 0  # max_attempts < 1: nothing attempted
+
+        rows_written = 0
+        next_index = 0  # Index of the next batch to submit
+        next_commit = 0  # Lowest batch index not yet accounted
+        finished: dict[int, int] = {}
+        in_flight: dict[Future, int] = {}
+        exhausted = False
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"supabase-{step_id}") as executor:
+            try:
+                while True:
+                    while not exhausted and len(in_flight) < concurrency:
+                        batch = next(record_batches, None)
+                        if batch is None:
+                            exhausted = True
+                            break
+                        in_flight[executor.submit(write_batch, next_index, batch)] = next_index
+                        next_index += 1
+                    if not in_flight:
+                        break
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finished[in_flight.pop(future)] = future.result()
+
+                    # Advance the ordered watermark
+                    while next_commit in finished:
+                        rows_written += finished.pop(next_commit)
+                        next_commit += 1
+                        if ctx and next_commit % 10 == 0:
+                            log_event(
+                                "write.progress",
+                                step_id=step_id,
+                                rows_written=rows_written,
+                                total_rows=total_rows,
+                            )
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+
+        if throttle.throttled:
+            logger.info(f"Step {step_id}: {throttle.throttled} throttled responses while writing {table_name}")
+        return rows_written
+
+    def _write_batches_copy(
+        self,
+        *,
+        step_id: str,
+        connection_config: dict[str, Any],
+        table_name: str,
+        schema: str,
+        mode: str,
+        primary_key: list[str] | None,
+        record_batches: Iterator[list[dict[str, Any]]],
+        total_rows: int | None,
+        ctx: Any,
+    ) -> int:
+        """Bulk load record batches over a direct Postgres connection with ``COPY FROM STDIN``.
+
+        Inserts are copied straight into the target table. Upserts are copied into a
+        temporary staging table and merged with ``INSERT ... ON CONFLICT`` at the end.
+        A key may repeat across batches, which ``ON CONFLICT DO UPDATE`` rejects, so the
+        merge keeps only the last staged row per key (``DISTINCT ON`` over a staging
+        sequence column), matching the last-write-wins result of batched upserts.
+        The whole load runs in one transaction.
+
+        Returns:
+            Number of rows written
+        """
+        if mode not in {"insert", "upsert"}:
+            raise ValueError(f"Unsupported write mode: {mode}")
+
+        from psycopg2 import sql
+
+        conn = self._connect_psycopg2(connection_config)
+        if conn is None:
+            raise RuntimeError("psycopg2 channel not configured")
+
+        target = sql.SQL("{}.{}").format(sql.Identifier(schema), sql.Identifier(table_name))
+        staging = sql.Identifier(f"_osiris_stage_{table_name}"[:63])
+        staging_seq = sql.Identifier("_osiris_stage_seq")
+        rows_written = 0
+        columns: list[str] | None = None
+
+        try:
+            with conn, conn.cursor() as cur:
+                if mode == "upsert":
+                    cur.execute(
+                        sql.SQL(
+                            "CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS, {} bigserial) ON COMMIT DROP"
+                        ).format(staging, target, staging_seq)
+                    )
+                copy_target = staging if mode == "upsert" else target
+
+                for batch_index, batch in enumerate(record_batches, start=1):
+                    if columns is None:
+                        columns = list(batch[0])
+                        copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+                            copy_target, sql.SQL(", ").join(map(sql.Identifier, columns))
+                        )
+                    payload = _copy_csv_payload([record.get(col) for col in columns] for record in batch)
+                    cur.copy_expert(copy_sql, io.StringIO(payload))
+                    rows_written += len(batch)
+
+                    if ctx and batch_index % 10 == 0:
+                        log_event(
+                            "write.progress",
+                            step_id=step_id,
+                            rows_written=rows_written,
+                            total_rows=total_rows,
+                        )
+
+                if mode == "upsert" and columns:
+                    column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+                    key_list = sql.SQL(", ").join(map(sql.Identifier, primary_key))
+                    updates = [col for col in columns if col not in primary_key]
+                    if updates:
+                        on_conflict = sql.SQL("DO UPDATE SET {}").format(
+                            sql.SQL(", ").join(
+                                sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(col)) for col in updates
+                            )
+                        )
+                    else:
+                        on_conflict = sql.SQL("DO NOTHING")
+                    cur.execute(
+                        sql.SQL(
+                            "INSERT INTO {} ({}) SELECT DISTINCT ON ({}) {} FROM {} ORDER BY {}, {} DESC "
+                            "ON CONFLICT ({}) {}"
+                        ).format(
+                            target,
+                            column_list,
+                            key_list,
+                            column_list,
+                            staging,
+                            key_list,
+                            staging_seq,
+                            key_list,
+                            on_conflict,
+                        )
+                    )
+        finally:
+            conn.close()
+
+        return rows_written
+
+    def _iter_record_batches(
+        self,
+        frames: Iterator[pd.DataFrame],
+        batch_size: int,
+        *,
+        primary_key: list[str] | None,
+        seen_primary_keys: dict[tuple[Any, ...], None],
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Serialize frames lazily into request batches of at most ``batch_size`` records.
+
+        Only one frame's records are held in memory at a time. When ``primary_key`` is
+        given, the keys of every frame are recorded in ``seen_primary_keys``.
+        """
+        for frame in frames:
+            if primary_key:
+                seen_primary_keys.update(dict.fromkeys(self._collect_primary_key_values(frame, primary_key)))
+
+            # Serialize one request batch at a time instead of the whole frame
+            row_dtype = self._row_dtype(frame) if len(frame.columns) else None
+            for start in range(0, len(frame.index), batch_size):
+                yield self._prepare_records(frame.iloc[start : start + batch_size], row_dtype=row_dtype)
+
+    def _prepare_records(self, df: pd.DataFrame, *, row_dtype: np.dtype | None = None) -> list[dict[str, Any]]:
         """Convert DataFrame to list of records with proper serialization.
 
+        Serialization is column-wise. Each column is converted at the dtype rows had
+        under the former ``iterrows()`` implementation (see ``_row_dtype``), so the
+        JSON is unchanged, e.g. ints next to floats still serialize as floats.
+
         Args:
             df: DataFrame to convert
+            row_dtype: Row dtype of the frame ``df`` was sliced from (default: ``df``'s own)
 
         Returns:
             List of dictionaries ready for Supabase API
         """
-        records = []
-        for _, row in df.iterrows():
-            record = {}
-            for col, value in row.items():
-                # Handle NaN/None
-                if pd.isna(value):
-                    record[col] = None
-                # Handle datetime types
-                elif isinstance(value, pd.Timestamp | np.datetime64):
-                    record[col] = pd.Timestamp(value).isoformat()
-                elif isinstance(value, datetime | date):
-                    record[col] = value.isoformat()
-                # Handle numeric types
-                elif isinstance(value, np.integer | np.int64 | np.int32):
-                    record[col] = int(value)
-                elif isinstance(value, np.floating | np.float64 | np.float32):
-                    if np.isnan(value):
-                        record[col] = None
-                    else:
-                        record[col] = float(value)
-                elif isinstance(value, Decimal):
-                    record[col] = float(value)
-                elif isinstance(value, np.bool_):
-                    record[col] = bool(value)
-                # Pass through other types
-                else:
-                    record[col] = value
-            records.append(record)
-        return records
+        columns = list(df.columns)
+        if not columns:
+            return [{} for _ in range(len(df.index))]
+        if len(df.index) == 0:
+            return []
+
+        common_dtype = row_dtype if row_dtype is not None else self._row_dtype(df)
+        serialized = []
+        for position in range(len(columns)):
+            column = df.iloc[:, position]
+            if common_dtype.kind == "O":
+                # Boxing to object keeps each column's own representation
+                native = isinstance(column.dtype, np.dtype) and column.dtype.kind in "iufbM"
+                values = column.to_numpy() if native else column.to_numpy(dtype=object)
+            elif common_dtype.kind == "f":
+                values = column.to_numpy(dtype=common_dtype, na_value=np.nan)  # Nullable ints with NA
+            else:
+                values = column.to_numpy(dtype=common_dtype)
+            serialized.append(_serialize_column(values))
+        return [dict(zip(columns, row, strict=True)) for row in zip(*serialized, strict=True)]
+
+    @staticmethod
+    def _row_dtype(df: pd.DataFrame) -> np.dtype:
+        """Dtype of ``df.values``: numeric columns upcast together, anything mixed is object."""
+        if all(isinstance(dtype, np.dtype) for dtype in df.dtypes):
+            return df.iloc[:1].values.dtype
+        # Extension dtypes interleave differently when values are missing
+        return df.values.dtype
 
     def _generate_create_table_sql(
         self, df: pd.DataFrame, table_name: str, schema: str, primary_key: list[str] | None
@@ -594,7 +1064,7 @@ class SupabaseWriterDriver(Driver):
         if last_error:
             raise RuntimeError(f"Table creation failed: {last_error}") from last_error
 
-    def _execute_http_sql(self, connection_config: dict[str, Any], ddl_sql: str) -> None:
+    def _execute_http_sql(self, connection_config: dict[str, Any], ddl_sql: str) -> requests.Response:
         sql_url = connection_config.get("sql_url") or connection_config.get("sql_endpoint")
         api_key = (
             connection_config.get("service_role_key")
@@ -619,6 +1089,7 @@ class SupabaseWriterDriver(Driver):
         response = self._send_http_sql_request(sql_url, payload, headers, timeout)
         if response.status_code >= 400:
             raise RuntimeError(f"HTTP SQL request failed ({response.status_code}): {response.text}")
+        return response
 
     def _send_http_sql_request(
         self, url: str, payload: dict[str, Any], headers: dict[str, str], timeout: float
@@ -836,10 +1307,7 @@ class SupabaseWriterDriver(Driver):
             return []
 
         pk_df = df[primary_key].drop_duplicates()
-        values: list[tuple[Any, ...]] = []
-        for _, row in pk_df.iterrows():
-            values.append(tuple(row[col] for col in primary_key))
-        return values
+        return list(zip(*(pk_df[col].tolist() for col in primary_key), strict=True))
 
     def _perform_replace_cleanup(
         self,
@@ -850,7 +1318,7 @@ class SupabaseWriterDriver(Driver):
         table_name: str,
         schema: str,
         primary_key: list[str] | None,
-        primary_key_values: list[tuple[Any, ...]],
+        primary_key_values: Collection[tuple[Any, ...]],
         ddl_channel: str,
         plan_only: bool,
     ) -> None:
@@ -895,8 +1363,9 @@ class SupabaseWriterDriver(Driver):
             self._ddl_attempt(
                 step_id=step_id, table=table_name, schema=schema, operation="anti_delete", channel="psycopg2"
             )
-            self._delete_all_rows_psycopg2(connection_config, table_name, schema)
+            deleted = self._delete_all_rows_psycopg2(connection_config, table_name, schema)
             self._ddl_success(step_id, table_name, schema, "anti_delete", "psycopg2")
+            self._log_rows_deleted(step_id, deleted)
             return
 
         last_error: Exception | None = None
@@ -907,14 +1376,13 @@ class SupabaseWriterDriver(Driver):
             )
             try:
                 if channel == "http_sql":
-                    if len(primary_key) > 1:
-                        raise RuntimeError("HTTP SQL anti-delete does not support composite primary keys")
                     if not self._has_http_sql_channel(connection_config):
                         raise RuntimeError("HTTP SQL channel not configured")
-                    flat_values = [value[0] for value in primary_key_values]
-                    self._delete_missing_rows_http(client, table_name, primary_key[0], flat_values)
+                    deleted = self._delete_missing_rows_http(
+                        connection_config, table_name, schema, primary_key, primary_key_values
+                    )
                 else:
-                    self._delete_missing_rows_psycopg2(
+                    deleted = self._delete_missing_rows_psycopg2(
                         connection_config,
                         table_name,
                         schema,
@@ -923,6 +1391,7 @@ class SupabaseWriterDriver(Driver):
                     )
 
                 self._ddl_success(step_id, table_name, schema, "anti_delete", channel)
+                self._log_rows_deleted(step_id, deleted)
                 return
             except Exception as exc:
                 last_error = exc
@@ -933,23 +1402,75 @@ class SupabaseWriterDriver(Driver):
         if last_error:
             raise RuntimeError(f"Replace cleanup failed: {last_error}") from last_error
 
+    @staticmethod
+    def _log_rows_deleted(step_id: str, deleted: int | None) -> None:
+        if deleted is None:
+            return
+        logger.info(f"Step {step_id}: replace cleanup deleted {deleted} rows")
+        log_metric("rows_deleted", deleted, step_id=step_id)
+
     def _delete_missing_rows_http(
         self,
-        client,
+        connection_config: dict[str, Any],
         table_name: str,
-        primary_key: str,
-        primary_key_values: list[Any],
-    ) -> None:
-        existing = client.table(table_name).select(primary_key).execute().data or []
-        existing_values = {row[primary_key] for row in existing if primary_key in row}
-        incoming_values = set(primary_key_values)
-        missing = existing_values - incoming_values
+        schema: str,
+        primary_key: list[str],
+        primary_key_values: Collection[tuple[Any, ...]],
+    ) -> int | None:
+        """Anti-join delete over the HTTP SQL channel.
 
-        if not missing:
-            return
+        Incoming keys are sent as JSON documents and typed through the table's own row
+        type, so Postgres compares them with the column types of the target. Up to
+        ``_HTTP_KEY_CHUNK_SIZE`` keys go inline into a single statement. Larger key sets
+        are inserted chunk by chunk into an unlogged key table (each HTTP request is its
+        own session, so a temporary table would not survive), which one ``DELETE``
+        anti-joins before the key table is dropped again.
 
-        for chunk in self._chunk_list(list(missing), 100):
-            client.table(table_name).delete().in_(primary_key, chunk).execute()
+        Returns:
+            Number of deleted rows, or None if the endpoint does not return result rows
+        """
+        target = f"{_quote_ident(schema)}.{_quote_ident(table_name)}"
+        match = " AND ".join(f"k.{_quote_ident(col)} = t.{_quote_ident(col)}" for col in primary_key)
+
+        if len(primary_key_values) <= _HTTP_KEY_CHUNK_SIZE:
+            keys_source = _http_key_recordset(target, primary_key, primary_key_values)
+            return self._delete_missing_rows_http_statement(connection_config, target, keys_source, match)
+
+        key_columns = ", ".join(map(_quote_ident, primary_key))
+        # Random suffix keeps concurrent replace runs on the same table apart
+        keys_name = f"_osiris_keys_{table_name}"[:54] + f"_{secrets.token_hex(4)}"
+        keys_table = f"{_quote_ident(schema)}.{_quote_ident(keys_name)}"
+        self._execute_http_sql(
+            connection_config,
+            f"CREATE UNLOGGED TABLE {keys_table} AS SELECT {key_columns} FROM {target} WITH NO DATA",
+        )
+        try:
+            for chunk in self._iter_chunks(primary_key_values, _HTTP_KEY_CHUNK_SIZE):
+                self._execute_http_sql(
+                    connection_config,
+                    f"INSERT INTO {keys_table} ({key_columns}) "
+                    f"SELECT {key_columns} FROM {_http_key_recordset(target, primary_key, chunk)}",
+                )
+            self._execute_http_sql(connection_config, f"ANALYZE {keys_table}")
+            return self._delete_missing_rows_http_statement(connection_config, target, f"{keys_table} AS k", match)
+        finally:
+            try:
+                self._execute_http_sql(connection_config, f"DROP TABLE IF EXISTS {keys_table}")
+            except Exception as exc:
+                logger.warning(f"Failed to drop replace-cleanup key table {keys_table}: {exc}")
+
+    def _delete_missing_rows_http_statement(
+        self, connection_config: dict[str, Any], target: str, keys_source: str, match: str
+    ) -> int | None:
+        delete_sql = (
+            f"WITH deleted AS (DELETE FROM {target} AS t WHERE NOT EXISTS ("
+            f"SELECT 1 FROM {keys_source} WHERE {match}) RETURNING 1) SELECT count(*) AS deleted_rows FROM deleted"
+        )
+        response = self._execute_http_sql(connection_config, delete_sql)
+        try:
+            return int(response.json()[0]["deleted_rows"])
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            return None
 
     def _delete_missing_rows_psycopg2(
         self,
@@ -957,51 +1478,52 @@ class SupabaseWriterDriver(Driver):
         table_name: str,
         schema: str,
         primary_key: list[str],
-        primary_key_values: list[tuple[Any, ...]],
-    ) -> None:
+        primary_key_values: Collection[tuple[Any, ...]],
+    ) -> int:
+        """Anti-join delete against a temporary table of the incoming keys.
 
+        Keys are streamed into the temporary table with ``COPY`` and removed rows are
+        found by one ``DELETE ... WHERE NOT EXISTS`` on the server.
+
+        Returns:
+            Number of deleted rows
+        """
         conn = self._connect_psycopg2(connection_config)
         if conn is None:
             raise RuntimeError("psycopg2 channel not configured")
 
-        with conn:
-            with conn.cursor() as cur:
-                # Use psycopg2.sql for safe identifier handling
-                from psycopg2 import sql
+        # Use psycopg2.sql for safe identifier handling
+        from psycopg2 import sql
 
-                select_sql = sql.SQL("SELECT {} FROM {}.{}").format(
-                    sql.SQL(", ").join([sql.Identifier(col) for col in primary_key]),
-                    sql.Identifier(schema),
-                    sql.Identifier(table_name),
-                )
-                cur.execute(select_sql)
-                existing = cur.fetchall()
+        target = sql.SQL("{}.{}").format(sql.Identifier(schema), sql.Identifier(table_name))
+        keys = sql.Identifier(f"_osiris_keys_{table_name}"[:63])
+        key_columns = sql.SQL(", ").join(map(sql.Identifier, primary_key))
 
-                incoming_set = set(primary_key_values)
-                missing = [row for row in existing if row not in incoming_set]
-
-                if not missing:
-                    return
-
-                chunk_size = 100
-                for chunk in self._chunk_list(missing, chunk_size):
-                    conditions = []
-                    params: list[Any] = []
-                    for row in chunk:
-                        # Build conditions with properly quoted column names
-                        condition_parts = []
-                        for col in primary_key:
-                            condition_parts.append(sql.SQL("{} = %s").format(sql.Identifier(col)))
-                        conditions.append(sql.SQL("({})").format(sql.SQL(" AND ").join(condition_parts)))
-                        params.extend(row)
-
-                    # Build DELETE statement with properly quoted identifiers
-                    delete_sql = sql.SQL("DELETE FROM {}.{} WHERE {}").format(
-                        sql.Identifier(schema), sql.Identifier(table_name), sql.SQL(" OR ").join(conditions)
+        try:
+            with conn, conn.cursor() as cur:
+                # Same column types as the target, no rows
+                cur.execute(
+                    sql.SQL("CREATE TEMP TABLE {} ON COMMIT DROP AS SELECT {} FROM {} WITH NO DATA").format(
+                        keys, key_columns, target
                     )
-                    cur.execute(delete_sql, params)
-
-            conn.commit()
+                )
+                copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(keys, key_columns)
+                for chunk in self._iter_chunks(primary_key_values, _KEY_COPY_CHUNK_SIZE):
+                    payload = _copy_csv_payload([_serialize_value(value) for value in key] for key in chunk)
+                    cur.copy_expert(copy_sql, io.StringIO(payload))
+                cur.execute(sql.SQL("ANALYZE {}").format(keys))
+
+                match = sql.SQL(" AND ").join(
+                    sql.SQL("k.{0} = t.{0}").format(sql.Identifier(col)) for col in primary_key
+                )
+                cur.execute(
+                    sql.SQL("DELETE FROM {} AS t WHERE NOT EXISTS (SELECT 1 FROM {} AS k WHERE {})").format(
+                        target, keys, match
+                    )
+                )
+                return cur.rowcount
+        finally:
+            conn.close()
 
     def _delete_all_rows_http(self, client, table_name: str, primary_key: str) -> None:
         try:
@@ -1010,7 +1532,7 @@ class SupabaseWriterDriver(Driver):
             # If primary key can be NULL, fall back to match all values
             client.table(table_name).delete().execute()
 
-    def _delete_all_rows_psycopg2(self, connection_config: dict[str, Any], table_name: str, schema: str) -> None:
+    def _delete_all_rows_psycopg2(self, connection_config: dict[str, Any], table_name: str, schema: str) -> int:
 
         conn = self._connect_psycopg2(connection_config)
         if conn is None:
@@ -1023,11 +1545,15 @@ class SupabaseWriterDriver(Driver):
 
                 delete_sql = sql.SQL("DELETE FROM {}.{}").format(sql.Identifier(schema), sql.Identifier(table_name))
                 cur.execute(delete_sql)
+                deleted = cur.rowcount
             conn.commit()
+        return deleted
 
     @staticmethod
-    def _chunk_list(values: list[Any], size: int) -> list[list[Any]]:
-        return [values[i : i + size] for i in range(0, len(values), size)]
+    def _iter_chunks(values: Iterable[Any], size: int) -> Iterator[list[Any]]:
+        iterator = iter(values)
+        while chunk := list(itertools.islice(iterator, size)):
+            yield chunk
 
     def _ddl_attempt(self, *, step_id: str, table: str, schema: str, operation: str, channel: str) -> None:
         log_event(
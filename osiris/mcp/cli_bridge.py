@@ -10,6 +10,8 @@ Security Model:
 - All operations requiring secrets are delegated via run_cli_json()
 - CLI inherits os.environ and has access to connection resolution
 - Errors are mapped to MCP-compatible format
+- When the MCP server started a worker pool (see cli_worker), calls are served by
+  persistent CLI worker processes instead of one subprocess per call
 """
 
 import asyncio
@@ -24,10 +26,70 @@ import time
 from typing import Any
 import uuid
 
+from osiris.mcp.cli_worker import CLIWorkerPool, WorkerCrashedError
 from osiris.mcp.errors import ErrorFamily, OsirisError
 
 logger = logging.getLogger(__name__)
 
+# Persistent worker pool, started by the MCP server (None = one subprocess per call)
+_worker_pool: CLIWorkerPool | None = None
+
+
+def start_worker_pool(size: int, max_requests: int = 100) -> CLIWorkerPool | None:
+    """
+    Start (pre-fork) the persistent CLI worker pool used by run_cli_json().
+
+    Workers inherit the current environment and base path, like one-shot CLI calls.
+
+    Args:
+        size: Number of worker processes
+        max_requests: Requests served by a worker before it is recycled
+
+    Returns:
+        The pool, or None if workers are not supported on this platform
+    """
+    global _worker_pool  # noqa: PLW0603
+
+    if not CLIWorkerPool.is_supported():
+        logger.info("CLI worker pool not supported on this platform; using one subprocess per call")
+        return None
+
+    stop_worker_pool()
+    _worker_pool = CLIWorkerPool(size=size, max_requests=max_requests)
+    _worker_pool.prestart(ensure_base_path(), os.environ.copy())
+    logger.debug(f"Started CLI worker pool (size={size}, max_requests={max_requests})")
+    return _worker_pool
+
+
+def stop_worker_pool() -> None:
+    """Shut down the persistent CLI worker pool, if any."""
+    global _worker_pool  # noqa: PLW0603
+
+    if _worker_pool is not None:
+        _worker_pool.shutdown()
+        _worker_pool = None
+
+
+def _execute_cli(cmd: list[str], args: list[str], base_path: Path, timeout_s: float) -> subprocess.CompletedProcess:
+    """Run a CLI invocation on a pooled worker, falling back to a one-shot subprocess."""
+    env = os.environ.copy()  # Inherit environment (secrets available here)
+    pool = _worker_pool
+    if pool is not None:
+        try:
+            return pool.execute(args + ["--json"], cwd=base_path, env=env, timeout_s=timeout_s)
+        except WorkerCrashedError as e:
+            logger.warning(f"CLI worker failed ({e}); retrying in a fresh subprocess")
+
+    return subprocess.run(
+        cmd,
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=timeout_s,
+        cwd=str(base_path),
+        env=env,
+    )
+
 
 def derive_correlation_id(request_id: str | None = None) -> str:
     """
@@ -253,16 +315,7 @@ async def run_cli_json(
     try:
         # Execute command with timeout in thread pool (non-blocking to event loop)
         # This prevents the async event loop from freezing and enables parallelization
-        result = await asyncio.to_thread(
-            subprocess.run,
-            cmd,
-            check=False,
-            capture_output=True,
-            text=True,
-            timeout=timeout_s,
-            cwd=str(base_path),
-            env=os.environ.copy(),  # Inherit environment (secrets available here)
-        )
+        result = await asyncio.to_thread(_execute_cli, cmd, args, base_path, timeout_s)
 
         # Track metrics
         bytes_in = len(json.dumps(args).encode())
@@ -0,0 +1,333 @@
+"""
+Persistent CLI worker processes for the MCP CLI bridge.
+
+Starting ``python osiris.py ... --json`` costs ~500ms of interpreter startup and
+imports per MCP tool call. A worker started with ``python -m osiris.mcp.cli_worker``
+imports the CLI once and then executes CLI invocations sent as JSON lines on stdin,
+answering with one JSON line per request on stdout:
+
+    -> {"id": 1, "args": ["mcp", "connections", "list", "--json"]}
+    <- {"id": 1, "exit_code": 0, "stdout": "...", "stderr": ""}
+
+Security Model:
+- Workers are separate processes spawned with the MCP server's environment, exactly
+  like the one-shot CLI subprocess; secrets are resolved only inside the worker
+- Workers are bound to the environment and working directory they were started with
+  and are replaced when either changes, or after ``max_requests`` invocations
+"""
+
+import contextlib
+import hashlib
+import importlib
+import io
+import itertools
+import json
+import logging
+import os
+from pathlib import Path
+import select
+import subprocess
+import sys
+import threading
+import time
+import traceback
+
+logger = logging.getLogger(__name__)
+
+READY_MESSAGE = {"ready": True}
+DEFAULT_STARTUP_TIMEOUT_S = 30.0
+
+
+class WorkerCrashedError(RuntimeError):
+    """The worker process exited or broke the protocol while serving a request."""
+
+
+def _environment_key(cwd: Path, env: dict[str, str]) -> str:
+    """Fingerprint of the execution context a worker is bound to."""
+    digest = hashlib.sha256(str(cwd).encode())
+    for name, value in sorted(env.items()):
+        digest.update(f"\0{name}={value}".encode())
+    return digest.hexdigest()
+
+
+class CLIWorker:
+    """Client side of one persistent worker process."""
+
+    def __init__(self, cwd: Path, env: dict[str, str], max_requests: int):
+        self.cwd = cwd
+        self.env = env
+        self.key = _environment_key(cwd, env)
+        self.max_requests = max_requests
+        self.requests_served = 0
+        self._ready = False
+        self._buffer = b""
+        self._ids = itertools.count(1)
+        self.process = subprocess.Popen(  # noqa: S603 - fixed interpreter and module
+            [sys.executable, "-m", "osiris.mcp.cli_worker", "--max-requests", str(max_requests)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=str(cwd),
+            env=env,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    @property
+    def exhausted(self) -> bool:
+        return self.requests_served >= self.max_requests
+
+    def execute(self, args: list[str], timeout_s: float) -> subprocess.CompletedProcess:
+        """Run one CLI invocation in the worker.
+
+        Raises:
+            subprocess.TimeoutExpired: If the worker did not start or answer in time (the worker is killed)
+            WorkerCrashedError: If the worker died or answered garbage
+        """
+        deadline = time.monotonic() + timeout_s
+        if not self._ready:
+            try:
+                ready = self._read_message(time.monotonic() + DEFAULT_STARTUP_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                # A worker that never became ready must not go back to the pool
+                self.close()
+                raise
+            if ready != READY_MESSAGE:
+                self.close()
+                raise WorkerCrashedError(f"Unexpected worker handshake: {ready!r}")
+            self._ready = True
+
+        request_id = next(self._ids)
+        payload = json.dumps({"id": request_id, "args": args}) + "\n"
+        try:
+            self.process.stdin.write(payload.encode())
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            self.close()
+            raise WorkerCrashedError(f"Worker stdin closed: {e}") from e
+
+        try:
+            response = self._read_message(deadline)
+        except subprocess.TimeoutExpired:
+            self.close()
+            raise subprocess.TimeoutExpired(args, timeout_s) from None
+
+        self.requests_served += 1
+        if not isinstance(response, dict) or response.get("id") != request_id:
+            self.close()
+            raise WorkerCrashedError(f"Unexpected worker response: {response!r}")
+
+        return subprocess.CompletedProcess(
+            args, int(response.get("exit_code", 1)), response.get("stdout", ""), response.get("stderr", "")
+        )
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        if self.alive:
+            with contextlib.suppress(OSError):
+                self.process.stdin.close()
+            try:
+                self.process.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            with contextlib.suppress(OSError):
+                stream.close()
+
+    def _read_message(self, deadline: float):
+        fd = self.process.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.process.args, 0)
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                self.close()
+                raise WorkerCrashedError(f"Worker exited with code {self.process.poll()}")
+            self._buffer += chunk
+
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            self.close()
+            raise WorkerCrashedError(f"Worker sent invalid JSON: {line[:200]!r}") from e
+
+
+class CLIWorkerPool:
+    """Bounded pool of persistent CLI workers shared by concurrent tool calls."""
+
+    def __init__(self, size: int = 2, max_requests: int = 100):
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        if max_requests < 1:
+            raise ValueError(f"max_requests must be >= 1, got {max_requests}")
+        self.size = size
+        self.max_requests = max_requests
+        self._idle: list[CLIWorker] = []
+        self._busy = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Workers need select() on pipes, which is POSIX only."""
+        return os.name == "posix"
+
+    def prestart(self, cwd: Path, env: dict[str, str]) -> None:
+        """Spawn idle workers up front so the first tool calls skip interpreter startup."""
+        with self._condition:
+            while not self._closed and len(self._idle) + self._busy < self.size:
+                self._idle.append(CLIWorker(cwd, env, self.max_requests))
+
+    def execute(
+        self, args: list[str], *, cwd: Path, env: dict[str, str], timeout_s: float
+    ) -> subprocess.CompletedProcess:
+        """Run a CLI invocation on a worker bound to ``cwd`` and ``env`` (blocking)."""
+        worker = self._acquire(cwd, env)
+        try:
+            return worker.execute(args, timeout_s)
+        finally:
+            self._release(worker)
+
+    def shutdown(self) -> None:
+        """Stop all idle workers; busy ones are stopped when returned."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for worker in idle:
+            worker.close()
+
+    def _acquire(self, cwd: Path, env: dict[str, str]) -> CLIWorker:
+        key = _environment_key(cwd, env)
+        stale: list[CLIWorker] = []
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("CLI worker pool is shut down")
+                    for worker in list(self._idle):
+                        if worker.key == key and worker.alive:
+                            self._idle.remove(worker)
+                            self._busy += 1
+                            return worker
+                    if len(self._idle) + self._busy >= self.size and self._idle:
+                        # Make room by retiring a worker bound to another environment
+                        stale.append(self._idle.pop(0))
+                    if len(self._idle) + self._busy < self.size:
+                        self._busy += 1
+                        break
+                    self._condition.wait()
+        finally:
+            for worker in stale:
+                worker.close()
+
+        try:
+            return CLIWorker(cwd, env, self.max_requests)
+        except Exception:
+            with self._condition:
+                self._busy -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, worker: CLIWorker) -> None:
+        with self._condition:
+            self._busy -= 1
+            reusable = not self._closed and worker.alive and not worker.exhausted
+            if reusable:
+                self._idle.append(worker)
+            elif not self._closed and worker.exhausted:
+                # Recycle: the replacement starts up while the pool keeps serving
+                self._idle.append(CLIWorker(worker.cwd, worker.env, self.max_requests))
+            self._condition.notify()
+        if not reusable:
+            worker.close()
+
+
+def _run_cli(args: list[str]) -> tuple[int, str, str]:
+    """Execute one CLI invocation in-process, capturing its output and exit code."""
+    cli_main = importlib.import_module("osiris.cli.main")  # Imported once by serve()
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    sys.argv = ["osiris.py", *args]
+    sys.stdin = io.StringIO()
+    exit_code = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            cli_main.main()
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException:  # noqa: BLE001 - report like an uncaught error in a subprocess
+            traceback.print_exc()
+            exit_code = 1
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def serve(max_requests: int) -> int:
+    """Worker main loop: answer JSON line requests until stdin closes or the budget is spent."""
+    # Keep a private handle on the protocol pipe and point fd 1 at stderr so that
+    # stray writes (child processes, C extensions) cannot corrupt the protocol.
+    # Likewise read requests from a private handle so commands never consume them.
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), "w", buffering=1, encoding="utf-8")
+    requests = os.fdopen(os.dup(sys.stdin.fileno()), encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, sys.stdin.fileno())
+    os.close(devnull)
+
+    cli_main = importlib.import_module("osiris.cli.main")  # Preload CLI
+    cli_main.load_cli_env()
+
+    base_environ = dict(os.environ)
+    base_cwd = os.getcwd()
+    root_logger = logging.getLogger()
+    base_handlers, base_level = list(root_logger.handlers), root_logger.level
+
+    channel.write(json.dumps(READY_MESSAGE) + "\n")
+
+    served = 0
+    for line in requests:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        exit_code, out, err = _run_cli(list(request.get("args", [])))
+        channel.write(
+            json.dumps({"id": request.get("id"), "exit_code": exit_code, "stdout": out, "stderr": err}) + "\n"
+        )
+
+        # Undo process-wide state a command may have changed
+        os.chdir(base_cwd)
+        os.environ.clear()
+        os.environ.update(base_environ)
+        for handler in root_logger.handlers:
+            if handler not in base_handlers:
+                handler.close()
+        root_logger.handlers[:] = base_handlers
+        root_logger.setLevel(base_level)
+        cli_main.json_output = False
+
+        served += 1
+        if served >= max_requests:
+            break
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(description="Persistent Osiris CLI worker (MCP bridge)")
+    parser.add_argument("--max-requests", type=int, default=100)
+    sys.exit(serve(parser.parse_args().max_requests))
@@ -127,6 +127,10 @@ class MCPConfig:
     DEFAULT_MEMORY_RETENTION_DAYS = 365
     MAX_MEMORY_RETENTION_DAYS = 730
 
+    # CLI worker pool (0 workers = one CLI subprocess per tool call)
+    DEFAULT_CLI_POOL_SIZE = 2
+    DEFAULT_CLI_POOL_MAX_REQUESTS = 100
+
     # Telemetry configuration
     TELEMETRY_ENABLED_DEFAULT = True
     TELEMETRY_BATCH_SIZE = 100
@@ -179,6 +183,12 @@ class MCPConfig:
             os.environ.get("OSIRIS_MCP_MEMORY_RETENTION_DAYS", self.DEFAULT_MEMORY_RETENTION_DAYS)
         )
 
+        # CLI worker pool
+        self.cli_pool_size = max(0, int(os.environ.get("OSIRIS_MCP_CLI_POOL_SIZE", self.DEFAULT_CLI_POOL_SIZE)))
+        self.cli_pool_max_requests = max(
+            1, int(os.environ.get("OSIRIS_MCP_CLI_POOL_MAX_REQUESTS", self.DEFAULT_CLI_POOL_MAX_REQUESTS))
+        )
+
         # Telemetry
         self.telemetry_enabled = os.environ.get(
             "OSIRIS_MCP_TELEMETRY_ENABLED", str(self.TELEMETRY_ENABLED_DEFAULT)
@@ -211,6 +221,8 @@ class MCPConfig:
             "discovery_cache_ttl_hours": self.discovery_cache_ttl_hours,
             "memory_retention_days": self.memory_retention_days,
             "telemetry_enabled": self.telemetry_enabled,
+            "cli_pool_size": self.cli_pool_size,
+            "cli_pool_max_requests": self.cli_pool_max_requests,
             "directories": {
                 "data": str(self.data_dir),
                 "state": str(self.state_dir),
@@ -14,6 +14,7 @@ from mcp.server.lowlevel import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 
+from osiris.mcp import cli_bridge
 from osiris.mcp.audit import AuditLogger
 from osiris.mcp.cache import DiscoveryCache
 from osiris.mcp.config import get_config
@@ -735,6 +736,10 @@ class OsirisMCPServer:
             telemetry = init_telemetry(enabled=True, output_dir=self.config.telemetry_dir)
             telemetry.emit_server_start(self.config.SERVER_VERSION, self.config.PROTOCOL_VERSION)
 
+        # Pre-fork persistent CLI workers so tool calls skip interpreter startup
+        if self.config.cli_pool_size > 0:
+            cli_bridge.start_worker_pool(self.config.cli_pool_size, self.config.cli_pool_max_requests)
+
         try:
             async with stdio_server() as (read_stream, write_stream):
                 # Prepare server instructions for LLM clients
@@ -777,6 +782,7 @@ class OsirisMCPServer:
                     ),
                 )
         finally:
+            cli_bridge.stop_worker_pool()
             if telemetry:
                 telemetry.emit_server_stop("shutdown")
 
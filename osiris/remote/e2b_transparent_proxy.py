@@ -494,7 +494,10 @@ class E2BTransparentProxy(ExecutionAdapter):
             "core/driver.py",
             "core/execution_adapter.py",
             "core/session_logging.py",
+            "core/log_sink.py",
             "core/redaction.py",
+            "core/spill.py",
+            "core/duckdb_session.py",
             "components/__init__.py",
             "components/registry.py",
             "components/error_mapper.py",
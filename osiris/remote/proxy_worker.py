@@ -28,6 +28,7 @@ except ModuleNotFoundError:  # pragma: no cover - optional for older runtimes
 from osiris.components.registry import ComponentRegistry
 from osiris.core.driver import DriverRegistry
 from osiris.core.execution_adapter import ExecutionContext
+from osiris.core.spill import SpillManager, budget_from_env, format_from_env, read_spilled
 from osiris.remote.rpc_protocol import (
     CleanupCommand,
     CleanupResponse,
@@ -140,6 +141,7 @@ class ProxyWorker:
         self.step_count = 0
         self.total_rows = 0
         self.step_outputs = {}  # Cache outputs for downstream steps
+        self.spill_manager: SpillManager | None = None  # Refcounts/spills step_outputs DataFrames
         self.step_rows = {}  # Track rows per step for cleanup aggregation
         self.step_drivers = {}  # Track driver type per step
         self.step_io: dict[str, dict[str, Any]] = {}
@@ -236,6 +238,7 @@ class ProxyWorker:
         """Initialize session and load drivers."""
         self.session_id = cmd.session_id
         self.manifest = cmd.manifest or {}
+        self.spill_manager = None
         self.allow_install_deps = bool(getattr(cmd, "install_deps", False))
         self.execution_start = time.time()
 
@@ -531,7 +534,6 @@ class ProxyWorker:
             )
 
             cached_output: dict[str, Any] = {}
-            force_spill = os.getenv("E2B_FORCE_SPILL", "").strip().lower() in {"1", "true", "yes"}
 
             # Extract metrics from result (if any)
             # Extractors return {"df": DataFrame} and we count rows as rows_processed
@@ -549,27 +551,9 @@ class ProxyWorker:
                         df_value = result["df"]
                         if isinstance(df_value, pd.DataFrame):
                             rows_processed = len(df_value)
-                            if force_spill:
-                                parquet_path = step_artifacts_dir / "output.parquet"
-                                df_value.to_parquet(parquet_path)
-                                self._emit_artifact_event(parquet_path, artifact_type="parquet", step_id=step_id)
-
-                                schema_path = step_artifacts_dir / "schema.json"
-                                try:
-                                    schema = {column: str(dtype) for column, dtype in df_value.dtypes.items()}
-                                    schema_path.write_text(json.dumps(schema, indent=2), encoding="utf-8")
-                                    cached_output["schema_path"] = schema_path
-                                    self._emit_artifact_event(schema_path, artifact_type="schema", step_id=step_id)
-                                except Exception as exc:  # pragma: no cover - best effort
-                                    self.logger.debug(f"Failed to write schema for {step_id}: {exc}")
-
-                                cached_output["df_path"] = parquet_path
-                                cached_output["spilled"] = True
-                                # Drop the in-memory DataFrame reference
-                                result["df"] = None
-                            else:
-                                cached_output["df"] = df_value
-                                cached_output["spilled"] = False
+                            # The spill manager moves it to disk when over budget (see below)
+                            cached_output["df"] = df_value
+                            cached_output["spilled"] = False
 
                             if driver_name.endswith(".extractor"):
                                 self.send_metric("rows_read", rows_processed, tags={"step": step_id})
@@ -617,6 +601,9 @@ class ProxyWorker:
             self.send_metric("step_duration_ms", duration_ms, tags={"step": step_id})
 
             self.step_outputs[step_id] = cached_output
+            spill_manager = self._get_spill_manager()
+            spill_manager.track(step_id, cached_output)
+            spill_manager.release(step_id)
             artifact_paths = [str(cleaned_config_path.relative_to(self.session_dir))]
             if cached_output.get("df_path"):
                 artifact_paths.append(str(cached_output["df_path"].relative_to(self.session_dir)))
@@ -729,6 +716,7 @@ class ProxyWorker:
 
             # Clear cached outputs
             self.step_outputs.clear()
+            self.spill_manager = None
             self.step_io.clear()
 
         self.send_event("cleanup_complete", steps_executed=self.step_count, total_rows=final_total_rows)
@@ -1186,6 +1174,39 @@ class ProxyWorker:
             if 0 <= idx < len(current):
                 current[idx] = "***MASKED***"
 
+    def _get_spill_manager(self) -> SpillManager:
+        """Create the spill manager for the current manifest on first use."""
+        if self.spill_manager is None:
+            force_spill = os.getenv("E2B_FORCE_SPILL", "").strip().lower() in {"1", "true", "yes"}
+            self.spill_manager = SpillManager(
+                (self.manifest or {}).get("steps", []),
+                self.artifacts_root or (self.session_dir / "artifacts"),
+                memory_budget_bytes=0 if force_spill else budget_from_env(),
+                spill_format=format_from_env(),
+                # Spill files are published as artifacts, keep them after release
+                keep_spill_files=True,
+                on_spill=self._on_output_spilled,
+            )
+        return self.spill_manager
+
+    def _on_output_spilled(self, step_id: str, path: Path, df: Any) -> None:
+        """Publish a spilled DataFrame and its schema as step artifacts."""
+        self._emit_artifact_event(path, artifact_type=path.suffix.lstrip("."), step_id=step_id)
+
+        cached_output = self.step_outputs.get(step_id, {})
+        schema_path = path.parent / "schema.json"
+        try:
+            schema = {column: str(dtype) for column, dtype in df.dtypes.items()}
+            schema_path.write_text(json.dumps(schema, indent=2), encoding="utf-8")
+            cached_output["schema_path"] = schema_path
+            self._emit_artifact_event(schema_path, artifact_type="schema", step_id=step_id)
+        except Exception as exc:  # pragma: no cover - best effort
+            self.logger.debug(f"Failed to write schema for {step_id}: {exc}")
+
+        # Outputs evicted after their step completed are added to its recorded artifacts
+        if step_id in self.step_io:
+            self.step_io[step_id]["artifacts"].append(str(path.relative_to(self.session_dir)))
+
     def _emit_artifact_event(self, path: Path, *, artifact_type: str, step_id: str | None = None) -> None:
         try:
             rel_path = path.relative_to(self.session_dir)
@@ -1220,9 +1241,7 @@ class ProxyWorker:
                 if from_key == "df" and isinstance(step_output, dict) and step_output.get("df_path"):
                     df_path = step_output["df_path"]
                     try:
-                        import pandas as pd
-
-                        df = pd.read_parquet(df_path)
+                        df = read_spilled(df_path)
                         resolved[input_key] = df
                         rows = len(df)
                         rows_total += rows
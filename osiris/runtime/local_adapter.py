@@ -24,6 +24,7 @@ from ..core.execution_adapter import (
 )
 from ..core.runner_v0 import RunnerV0
 from ..core.session_logging import log_event, log_metric
+from ..core.state_store import PipelineStateStore
 
 
 class LocalAdapter(ExecutionAdapter):
@@ -33,14 +34,18 @@ class LocalAdapter(ExecutionAdapter):
     while conforming to the ExecutionAdapter contract.
     """
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, max_parallel: int = 1, state_path: str | None = None):
         """Initialize LocalAdapter.
 
         Args:
             verbose: If True, print step progress to stdout
+            max_parallel: Maximum number of independent steps executed concurrently
+            state_path: SQLite database for incremental step state (None = state is not persisted)
         """
         self.error_context = ErrorContext(source="local")
         self.verbose = verbose
+        self.max_parallel = max_parallel
+        self.state_path = state_path
 
     def prepare(self, plan: dict[str, Any], context: ExecutionContext) -> PreparedRun:
         """Prepare local execution package.
@@ -256,7 +261,12 @@ class LocalAdapter(ExecutionAdapter):
                 core.session_logging.log_metric = verbose_log_metric
 
             # Create runner with existing implementation
-            runner = RunnerV0(manifest_path=str(manifest_path), output_dir=str(context.artifacts_dir))
+            runner = RunnerV0(
+                manifest_path=str(manifest_path),
+                output_dir=str(context.artifacts_dir),
+                max_parallel=self.max_parallel,
+                state_store=PipelineStateStore(self.state_path) if self.state_path else None,
+            )
 
             try:
                 # Execute pipeline
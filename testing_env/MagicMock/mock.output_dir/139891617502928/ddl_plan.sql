@@ -0,0 +1,4 @@
+CREATE TABLE IF NOT EXISTS public.test_table (
+    id INTEGER,
+    name TEXT
+);
\ No newline at end of file
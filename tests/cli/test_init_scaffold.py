@@ -100,6 +100,7 @@ def test_init_creates_gitignore(tmp_path):
     assert ".osiris/cache/" in content
     assert ".osiris/sessions/" in content
     assert ".osiris/index/counters.sqlite" in content
+    assert ".osiris/index/runs.sqlite-wal" in content
     assert ".env" in content
     assert "osiris_connections.yaml" in content
 
@@ -9,6 +9,14 @@ and PYTHONPATH before the MCP server starts.
 import os
 import sys
 
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _restore_cwd(monkeypatch):
+    """setup_environment() changes into OSIRIS_HOME; return to the original directory afterwards."""
+    monkeypatch.chdir(os.getcwd())
+
 
 def test_pythonpath_appends_to_existing(tmp_path):
     """Test that PYTHONPATH appends to existing value instead of replacing it."""
@@ -262,10 +262,10 @@ class TestBootstrapSpecs:
             "discover": True,
             "adHocAnalytics": True,  # execute_query implemented
             "inMemoryMove": False,
-            "streaming": False,
+            "streaming": True,  # RowStream output
             "bulkOperations": True,
             "transactions": False,
-            "partitioning": False,
+            "partitioning": True,  # partition_by range slices
             "customTransforms": False,
         }
 
@@ -274,7 +274,7 @@ class TestBootstrapSpecs:
             "discover": True,
             "adHocAnalytics": False,
             "inMemoryMove": False,
-            "streaming": False,
+            "streaming": True,  # consumes RowStream
             "bulkOperations": True,
             "transactions": True,  # uses conn.commit()
             "partitioning": False,
@@ -298,7 +298,7 @@ class TestBootstrapSpecs:
             "discover": True,
             "adHocAnalytics": False,
             "inMemoryMove": False,
-            "streaming": False,
+            "streaming": True,  # consumes RowStream
             "bulkOperations": True,
             "transactions": False,  # REST API doesn't support transactions
             "partitioning": False,
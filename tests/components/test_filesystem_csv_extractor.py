@@ -639,3 +639,235 @@ def test_comment_lines(tmp_path, mock_ctx):
     df = result["df"]
     assert len(df) == 2
     assert df["id"].tolist() == [1, 2]
+
+
+# ============================================================================
+# Arrow Backend Tests
+# ============================================================================
+
+
+def test_pyarrow_backend_returns_arrow_dtypes(sample_csv_with_nulls, mock_ctx):
+    """Test dtype_backend=pyarrow reads into Arrow-backed columns."""
+    pytest.importorskip("pyarrow")
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    config = {"path": str(sample_csv_with_nulls), "dtype_backend": "pyarrow", "columns": ["name", "id"]}
+
+    driver = FilesystemCsvExtractorDriver()
+    result = driver.run(step_id="extract_1", config=config, inputs=None, ctx=mock_ctx)
+
+    df = result["df"]
+    assert list(df.columns) == ["name", "id"]
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert str(df["name"].dtype) == "string[pyarrow]"
+    assert df["id"].tolist() == [1, 2, 3, 4]
+    assert df["name"].isna().tolist() == [False, True, False, False]
+    assert mock_ctx.metrics[-1]["value"] == 4
+
+
+def test_pyarrow_backend_options(tmp_path, mock_ctx):
+    """Test skip_rows, header row, dtype, na_values and limit with the Arrow reader."""
+    pytest.importorskip("pyarrow")
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    csv_file = tmp_path / "options.csv"
+    csv_file.write_text("junk line\nid;code\n1;001\n2;MISSING\n3;003\n")
+
+    config = {
+        "path": str(csv_file),
+        "dtype_backend": "pyarrow",
+        "delimiter": ";",
+        "skip_rows": 1,
+        "dtype": {"code": "str"},
+        "na_values": ["MISSING"],
+        "limit": 2,
+    }
+
+    driver = FilesystemCsvExtractorDriver()
+    df = driver.run(step_id="extract_1", config=config, inputs=None, ctx=mock_ctx)["df"]
+
+    assert df["id"].tolist() == [1, 2]
+    assert df["code"].iloc[0] == "001"
+    assert pd.isna(df["code"].iloc[1])
+
+
+def test_pyarrow_backend_streams_chunks(tmp_path, mock_ctx):
+    """Test Arrow record batches are re-chunked into chunk_size row batches."""
+    pytest.importorskip("pyarrow")
+    from osiris.core.driver import RowStream
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    csv_file = tmp_path / "large.csv"
+    csv_file.write_text("id,label\n" + "".join(f"{i},row{i}\n" for i in range(250)))
+    mock_ctx.streaming = True
+
+    config = {"path": str(csv_file), "dtype_backend": "pyarrow", "chunk_size": 100, "limit": 230}
+
+    driver = FilesystemCsvExtractorDriver()
+    stream = driver.run(step_id="extract_1", config=config, inputs=None, ctx=mock_ctx)["df"]
+
+    assert isinstance(stream, RowStream)
+    chunks = list(stream.iter_batches())
+    assert [len(chunk) for chunk in chunks] == [100, 100, 30]
+    assert chunks[-1]["id"].iloc[-1] == 229
+    assert mock_ctx.metrics[-1]["value"] == 230
+
+
+def test_pyarrow_backend_empty_file(tmp_path, mock_ctx):
+    """Test empty files return an empty DataFrame with the Arrow reader."""
+    pytest.importorskip("pyarrow")
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    csv_file = tmp_path / "empty.csv"
+    csv_file.write_text("")
+
+    driver = FilesystemCsvExtractorDriver()
+    result = driver.run(step_id="extract_1", config={"path": str(csv_file), "dtype_backend": "pyarrow"}, ctx=mock_ctx)
+
+    assert result["df"].empty
+
+
+def test_pyarrow_backend_rejects_comment(sample_csv, mock_ctx):
+    """Test options pyarrow.csv cannot honor are rejected."""
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    driver = FilesystemCsvExtractorDriver()
+    with pytest.raises(ValueError, match="'comment' is not supported"):
+        driver.run(
+            step_id="extract_1",
+            config={"path": str(sample_csv), "dtype_backend": "pyarrow", "comment": "#"},
+            ctx=mock_ctx,
+        )
+
+
+# ============================================================================
+# Multi-file and Parallel Reading Tests
+# ============================================================================
+
+
+@pytest.fixture
+def csv_shards(tmp_path):
+    """Create a directory of CSV shards, including an empty one."""
+    shard_dir = tmp_path / "shards"
+    shard_dir.mkdir()
+    (shard_dir / "part-002.csv").write_text("id,name\n4,Dana\n5,Eve\n")
+    (shard_dir / "part-001.csv").write_text("id,name\n1,Alice\n2,Bob\n3,Carol\n")
+    (shard_dir / "part-003.csv").write_text("")
+    (shard_dir / "notes.txt").write_text("not a csv\n")
+    return shard_dir
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_glob_reads_shards_in_sorted_order(csv_shards, mock_ctx, workers):
+    """Test glob input concatenates matching files in sorted order, in a process pool when workers > 1."""
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    config = {"path": str(csv_shards / "part-*.csv"), "workers": workers}
+
+    driver = FilesystemCsvExtractorDriver()
+    df = driver.run(step_id="extract_1", config=config, inputs=None, ctx=mock_ctx)["df"]
+
+    assert df["id"].tolist() == [1, 2, 3, 4, 5]
+    assert mock_ctx.metrics[-1]["value"] == 5
+
+
+def test_directory_path_reads_all_csv_files(csv_shards, mock_ctx):
+    """Test a directory path reads every *.csv file in it and honors limit across files."""
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    config = {"path": str(csv_shards), "columns": ["name"], "limit": 4}
+
+    driver = FilesystemCsvExtractorDriver()
+    df = driver.run(step_id="extract_1", config=config, inputs=None, ctx=mock_ctx)["df"]
+
+    assert df["name"].tolist() == ["Alice", "Bob", "Carol", "Dana"]
+
+
+def test_glob_streams_bounded_chunks_across_files(csv_shards, mock_ctx):
+    """Test streaming yields chunk_size batches file after file and stops at limit."""
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    mock_ctx.streaming = True
+    config = {"path": str(csv_shards / "*.csv"), "chunk_size": 2, "limit": 4}
+
+    driver = FilesystemCsvExtractorDriver()
+    stream = driver.run(step_id="extract_1", config=config, inputs=None, ctx=mock_ctx)["df"]
+
+    chunks = list(stream.iter_batches())
+    assert [chunk["id"].tolist() for chunk in chunks] == [[1, 2], [3], [4]]
+    assert mock_ctx.metrics[-1]["value"] == 4
+
+
+def test_glob_without_matches(tmp_path, mock_ctx):
+    """Test a glob matching nothing raises FileNotFoundError."""
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    driver = FilesystemCsvExtractorDriver()
+    with pytest.raises(FileNotFoundError, match="No CSV files match"):
+        driver.run(step_id="extract_1", config={"path": str(tmp_path / "*.csv")}, ctx=mock_ctx)
+
+
+def test_split_large_file_into_byte_ranges(tmp_path, mock_ctx, monkeypatch):
+    """Test byte-range splitting parses every line exactly once."""
+    from osiris.drivers import filesystem_csv_extractor_driver as module
+
+    monkeypatch.setattr(module, "MIN_SPLIT_BYTES", 64)
+    csv_file = tmp_path / "large.csv"
+    csv_file.write_text("id,label,value\n" + "".join(f"{i},row-{i},{i * 1.5}\n" for i in range(500)))
+
+    config = {"path": str(csv_file), "workers": 3, "split_large_files": True, "columns": ["value", "id"]}
+
+    driver = module.FilesystemCsvExtractorDriver()
+    df = driver.run(step_id="extract_1", config=config, inputs=None, ctx=mock_ctx)["df"]
+
+    assert list(df.columns) == ["value", "id"]
+    assert df["id"].tolist() == list(range(500))
+    assert df["value"].iloc[-1] == 499 * 1.5
+
+
+def test_byte_range_alignment_on_line_boundaries(tmp_path):
+    """Test ranges starting mid-line or exactly at a line start hand each line to one range."""
+    from osiris.drivers.filesystem_csv_extractor_driver import _read_csv_byte_range
+
+    csv_file = tmp_path / "rows.csv"
+    csv_file.write_bytes(b"1,a\n22,bb\n333,ccc\n")
+    params = {"header": None, "names": ["id", "s"]}
+
+    for cut in range(1, csv_file.stat().st_size):
+        parts = [_read_csv_byte_range(csv_file, 0, cut, params), _read_csv_byte_range(csv_file, cut, 99, params)]
+        ids = [i for part in parts if part is not None for i in part["id"]]
+        assert ids == [1, 22, 333], f"cut at byte {cut}"
+
+
+def test_existing_file_with_glob_characters_is_read_literally(tmp_path, mock_ctx):
+    """Test an existing file whose name contains glob characters is not treated as a pattern."""
+    from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+
+    csv_file = tmp_path / "report[1].csv"
+    csv_file.write_text("id\n1\n2\n")
+
+    driver = FilesystemCsvExtractorDriver()
+    df = driver.run(step_id="extract_1", config={"path": str(csv_file)}, inputs=None, ctx=mock_ctx)["df"]
+
+    assert df["id"].tolist() == [1, 2]
+
+
+def test_byte_ranges_share_dtypes_of_whole_file(tmp_path, mock_ctx, monkeypatch):
+    """Test column dtypes do not depend on where the file is split into byte ranges."""
+    from osiris.drivers import filesystem_csv_extractor_driver as module
+
+    monkeypatch.setattr(module, "MIN_SPLIT_BYTES", 64)
+    rows = [f"{i},{i},{i},row-{i}" for i in range(300)]
+    # Only the last range sees a string in `code` and a missing value in `amount`
+    rows[-1] = "299,x,,row-299"
+    csv_file = tmp_path / "mixed.csv"
+    csv_file.write_text("id,code,amount,label\n" + "\n".join(rows) + "\n")
+
+    config = {"path": str(csv_file), "workers": 3, "split_large_files": True}
+    driver = module.FilesystemCsvExtractorDriver()
+    df = driver.run(step_id="extract_1", config=config, inputs=None, ctx=mock_ctx)["df"]
+
+    expected = pd.read_csv(csv_file)
+    assert df.dtypes.to_dict() == expected.dtypes.to_dict()
+    assert df["code"].iloc[0] == "0"
+    pd.testing.assert_frame_equal(df, expected)
@@ -0,0 +1,47 @@
+"""Shared fixtures for core tests."""
+
+import json
+
+import pytest
+import yaml
+
+from osiris.core.runner_v0 import RunnerV0
+
+
+@pytest.fixture
+def write_manifest(tmp_path):
+    """Factory writing a compiled manifest (plus one cfg file per step) to tmp_path.
+
+    Steps are ``(step_id, driver, needs, config)`` tuples.
+    """
+
+    def _write(steps, pipeline_id="pipeline"):
+        cfg_dir = tmp_path / "cfg"
+        cfg_dir.mkdir()
+        manifest_steps = []
+        for step_id, driver, needs, config in steps:
+            (cfg_dir / f"{step_id}.json").write_text(json.dumps({"component": driver, **config}))
+            manifest_steps.append({"id": step_id, "driver": driver, "cfg_path": f"cfg/{step_id}.json", "needs": needs})
+
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text(
+            yaml.dump({"pipeline": {"id": pipeline_id}, "steps": manifest_steps, "meta": {"profile": "default"}})
+        )
+        return manifest_path
+
+    return _write
+
+
+@pytest.fixture
+def make_runner(tmp_path, monkeypatch):
+    """Factory building a RunnerV0 whose driver registry serves ``drivers`` by driver name."""
+
+    def _make(manifest_path, drivers, **kwargs):
+        monkeypatch.setattr(
+            RunnerV0,
+            "_build_driver_registry",
+            lambda self: type("Registry", (), {"get": lambda _self, name: drivers[name]})(),
+        )
+        return RunnerV0(str(manifest_path), str(tmp_path / "artifacts"), **kwargs)
+
+    return _make
@@ -0,0 +1,95 @@
+"""Tests for the run-scoped DuckDB session and zero-copy chaining in RunnerV0."""
+
+import pandas as pd
+import pytest
+
+from osiris.core.duckdb_session import DuckDBSession, DuckDBTable, memory_limit_from_env, threads_from_env
+from osiris.drivers.duckdb_processor_driver import DuckDBProcessorDriver
+
+
+class _CaptureWriter:
+    """Non-DuckDB consumer recording the inputs it receives."""
+
+    def __init__(self):
+        self.inputs = {}
+
+    def run(self, *, step_id, config, inputs=None, ctx=None):
+        self.inputs[step_id] = dict(inputs or {})
+        return {}
+
+
+@pytest.fixture
+def chain_manifest(write_manifest):
+    return write_manifest(
+        [
+            ("generate", "duckdb.processor", [], {"query": "SELECT i AS id FROM range(10) t(i)"}),
+            ("filter", "duckdb.processor", ["generate"], {"query": "SELECT id FROM df_generate WHERE id % 2 = 0"}),
+            ("scale", "duckdb.processor", ["filter"], {"query": "SELECT id * 10 AS id FROM df_filter ORDER BY id"}),
+            ("write", "capture.writer", ["scale"], {}),
+        ],
+        "chain",
+    )
+
+
+def test_chained_duckdb_steps_stay_in_session(make_runner, chain_manifest):
+    writer = _CaptureWriter()
+    drivers = {"duckdb.processor": DuckDBProcessorDriver(), "capture.writer": writer}
+    runner = make_runner(chain_manifest, drivers, duckdb_threads=2)
+
+    assert runner.run() is True
+
+    # Intermediate outputs were session tables; only the step feeding the writer produced pandas
+    assert isinstance(runner.results["generate"]["df"], DuckDBTable)
+    assert isinstance(runner.results["filter"]["df"], DuckDBTable)
+    assert isinstance(writer.inputs["write"]["df_scale"], pd.DataFrame)
+    assert writer.inputs["write"]["df_scale"]["id"].tolist() == [0, 20, 40, 60, 80]
+
+    assert runner.duckdb_session.threads == 2
+    with pytest.raises(RuntimeError, match="closed"):
+        runner.duckdb_session.cursor()
+
+
+def test_session_tables_dropped_after_last_consumer(monkeypatch, make_runner, chain_manifest):
+    drivers = {"duckdb.processor": DuckDBProcessorDriver(), "capture.writer": _CaptureWriter()}
+    runner = make_runner(chain_manifest, drivers)
+    dropped = []
+    monkeypatch.setattr(DuckDBTable, "drop", lambda self: dropped.append(self.name))
+
+    assert runner.run() is True
+
+    assert dropped == ["_osiris_generate", "_osiris_filter"]
+
+
+def test_no_session_without_duckdb_steps(write_manifest, make_runner):
+    manifest = write_manifest([("write", "capture.writer", [], {})])
+    runner = make_runner(manifest, {"capture.writer": _CaptureWriter()})
+
+    assert runner.run() is True
+    assert runner.duckdb_session is None
+
+
+def test_session_materialize_and_drop(tmp_path):
+    session = DuckDBSession(threads=1, memory_limit="256MB", temp_directory=tmp_path / "spill")
+    assert session.config == {"threads": 1, "memory_limit": "256MB", "temp_directory": str(tmp_path / "spill")}
+
+    cursor = session.cursor()
+    table = session.materialize('odd "step"', cursor, "SELECT 1 AS a UNION ALL SELECT 2")
+    cursor.close()
+
+    assert len(table) == 2
+    assert table.to_dataframe()["a"].tolist() == [1, 2]
+
+    table.drop()
+    with pytest.raises(Exception, match="does not exist"):
+        table.to_dataframe()
+    session.close()
+
+
+def test_settings_from_env(monkeypatch):
+    monkeypatch.setenv("OSIRIS_DUCKDB_THREADS", "4")
+    monkeypatch.setenv("OSIRIS_DUCKDB_MEMORY_LIMIT", "2GB")
+    assert threads_from_env() == 4
+    assert memory_limit_from_env() == "2GB"
+
+    monkeypatch.setenv("OSIRIS_DUCKDB_THREADS", "zero")
+    assert threads_from_env(default=None) is None
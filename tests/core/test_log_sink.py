@@ -0,0 +1,147 @@
+"""Tests for the buffered JSONL sink used by buffered sessions."""
+
+import json
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from osiris.core.log_sink import JsonlSink, encode_record
+
+
+def _lines(path):
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_records_are_buffered_until_flush(tmp_path):
+    sink = JsonlSink(flush_bytes=1 << 20, flush_interval=60)
+    try:
+        for i in range(100):
+            assert sink.write(tmp_path / "events.jsonl", {"event": "e", "i": i})
+            sink.write(tmp_path / "metrics.jsonl", {"metric": "m", "value": i})
+        time.sleep(0.05)
+        assert _lines(tmp_path / "events.jsonl") == []
+
+        assert sink.flush()
+
+        assert [r["i"] for r in _lines(tmp_path / "events.jsonl")] == list(range(100))
+        assert [r["value"] for r in _lines(tmp_path / "metrics.jsonl")] == list(range(100))
+    finally:
+        sink.close()
+
+
+def test_size_policy_writes_whole_lines(tmp_path):
+    path = tmp_path / "events.jsonl"
+    record = {"event": "e", "payload": "x" * 100}
+    line_size = len(encode_record(record))
+    sink = JsonlSink(flush_bytes=line_size * 10, flush_interval=60)
+    try:
+        for _ in range(25):
+            sink.write(path, record)
+        deadline = time.monotonic() + 2
+        while len(_lines(path)) < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert path.read_bytes().endswith(b"\n")
+        assert len(_lines(path)) == 20
+    finally:
+        sink.close()
+    assert len(_lines(path)) == 25
+
+
+def test_time_policy_flushes_idle_buffer(tmp_path):
+    path = tmp_path / "events.jsonl"
+    sink = JsonlSink(flush_bytes=1 << 20, flush_interval=0.05)
+    try:
+        sink.write(path, {"event": "e"})
+        deadline = time.monotonic() + 2
+        while not _lines(path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _lines(path) == [{"event": "e"}]
+    finally:
+        sink.close()
+
+
+def test_close_drains_and_rejects_later_writes(tmp_path):
+    path = tmp_path / "events.jsonl"
+    sink = JsonlSink(max_queue=4, flush_bytes=1 << 20, flush_interval=60)
+    for i in range(50):
+        sink.write(path, {"i": i})
+
+    sink.close()
+
+    assert [r["i"] for r in _lines(path)] == list(range(50))
+    assert sink.closed
+    assert sink.write(path, {"i": 50}) is False
+    assert sink.flush()
+
+
+def test_unserializable_values_are_stringified(tmp_path):
+    path = tmp_path / "events.jsonl"
+    sink = JsonlSink()
+    sink.write(path, {"event": "e", "path": tmp_path, "nested": [{"obj": object}]})
+    sink.close()
+
+    (record,) = _lines(path)
+    assert record["path"] == str(tmp_path)
+    assert record["nested"] == [{"obj": str(object)}]
+
+
+def test_writer_keeps_draining_after_a_record_fails(tmp_path, capsys):
+    path = tmp_path / "events.jsonl"
+    sink = JsonlSink(flush_bytes=0)
+    try:
+        sink.write(path, {"i": 0})
+        # Opening a path with a NUL byte raises ValueError, not OSError
+        sink.write(tmp_path / "bad\0.jsonl", {"i": -1})
+        sink.write(path, {"i": 1})
+
+        assert sink.flush(timeout=5)
+    finally:
+        assert sink.close(timeout=5)
+
+    assert [r["i"] for r in _lines(path)] == [0, 1]
+    assert "Log sink writer error" in capsys.readouterr().err
+
+
+def test_close_is_bounded_when_writer_is_stuck(tmp_path, monkeypatch):
+    sink = JsonlSink(flush_bytes=0)
+    release = threading.Event()
+    monkeypatch.setattr(sink, "_handle", lambda *_: release.wait())
+    sink.write(tmp_path / "events.jsonl", {"i": 0})
+
+    start = time.monotonic()
+    assert sink.close(timeout=0.2) is False
+    assert time.monotonic() - start < 2
+
+    release.set()
+
+
+def test_open_sink_is_drained_when_process_crashes(tmp_path):
+    path = tmp_path / "events.jsonl"
+    script = textwrap.dedent(f"""
+        from osiris.core.log_sink import JsonlSink
+
+        sink = JsonlSink(flush_bytes=1 << 20, flush_interval=60)
+        for i in range(10):
+            sink.write({str(path)!r}, {{"i": i}})
+        raise RuntimeError("boom")
+        """)
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=False)
+
+    assert result.returncode != 0
+    assert [r["i"] for r in _lines(path)] == list(range(10))
+
+
+def test_invalid_policies_are_rejected():
+    with pytest.raises(ValueError):
+        JsonlSink(max_queue=0)
+    with pytest.raises(ValueError):
+        JsonlSink(flush_interval=-1)
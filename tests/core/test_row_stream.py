@@ -0,0 +1,146 @@
+"""Tests for the RowStream data plane (ADR 0022)."""
+
+import json
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+import yaml
+
+from osiris.core.driver import ColumnSchema, RowStream, is_tabular_input, streaming_requested
+from osiris.core.runner_v0 import RunnerV0
+from osiris.drivers.filesystem_csv_extractor_driver import FilesystemCsvExtractorDriver
+from osiris.drivers.filesystem_csv_writer_driver import FilesystemCsvWriterDriver
+
+
+def test_from_dataframe_yields_bounded_batches():
+    df = pd.DataFrame({"id": range(10), "name": [f"n{i}" for i in range(10)]})
+
+    stream = RowStream.from_dataframe(df, batch_size=4)
+
+    assert stream.estimated_row_count == 10
+    assert [col.name for col in stream.columns] == ["id", "name"]
+    assert [len(batch) for batch in stream.iter_batches()] == [4, 4, 2]
+    assert stream.rows_streamed == 10
+
+
+def test_stream_is_single_pass():
+    stream = RowStream(iter([pd.DataFrame({"a": [1]})]))
+
+    assert list(stream) == [{"a": 1}]
+    with pytest.raises(RuntimeError, match="consumed once"):
+        stream.to_dataframe()
+
+
+def test_to_dataframe_concatenates_and_keeps_declared_columns():
+    batches = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})]
+    assert RowStream(iter(batches)).to_dataframe()["a"].tolist() == [1, 2, 3]
+
+    empty = RowStream(iter([]), columns=[ColumnSchema("a"), ColumnSchema("b")]).to_dataframe()
+    assert list(empty.columns) == ["a", "b"]
+    assert empty.empty
+
+
+def test_close_releases_producer():
+    released = []
+
+    def _batches():
+        try:
+            yield pd.DataFrame({"a": [1]})
+        finally:
+            released.append(True)
+
+    stream = RowStream(_batches())
+    next(stream.iter_batches())
+    stream.close()
+
+    assert released == [True]
+
+
+def test_streaming_requested_requires_explicit_flag():
+    assert streaming_requested(SimpleNamespace(streaming=True)) is True
+    assert streaming_requested(SimpleNamespace()) is False
+    assert streaming_requested(None) is False
+    assert is_tabular_input(RowStream(iter([])))
+    assert not is_tabular_input([{"a": 1}])
+
+
+def test_csv_extractor_streams_chunks(tmp_path):
+    csv_path = tmp_path / "input.csv"
+    pd.DataFrame({"id": range(250), "value": range(250)}).to_csv(csv_path, index=False)
+    metrics = []
+    ctx = SimpleNamespace(streaming=True, log_metric=lambda name, value, **kw: metrics.append((name, value)))
+
+    result = FilesystemCsvExtractorDriver().run(
+        step_id="extract", config={"path": str(csv_path), "chunk_size": 100}, ctx=ctx
+    )
+
+    stream = result["df"]
+    assert isinstance(stream, RowStream)
+    assert metrics == []  # Reported only once the stream is exhausted
+    assert [len(batch) for batch in stream.iter_batches()] == [100, 100, 50]
+    assert metrics == [("rows_read", 250)]
+
+
+def test_csv_writer_stream_output_matches_dataframe_output(tmp_path):
+    df = pd.DataFrame({"b": [1, 2, 3, 4, 5], "a": ["x", "y", "z", "w", "v"]})
+    driver = FilesystemCsvWriterDriver()
+
+    driver.run(step_id="w1", config={"path": str(tmp_path / "full.csv")}, inputs={"df_up": df})
+    driver.run(
+        step_id="w2",
+        config={"path": str(tmp_path / "stream.csv")},
+        inputs={"df_up": RowStream.from_dataframe(df, batch_size=2)},
+    )
+
+    assert (tmp_path / "stream.csv").read_bytes() == (tmp_path / "full.csv").read_bytes()
+
+
+def test_runner_streams_csv_to_csv_pipeline(tmp_path, monkeypatch):
+    """Runner hands a RowStream from a streaming extractor to a streaming writer."""
+    source = tmp_path / "source.csv"
+    pd.DataFrame({"id": range(30), "name": [f"n{i}" for i in range(30)]}).to_csv(source, index=False)
+    target = tmp_path / "target.csv"
+
+    extractor = FilesystemCsvExtractorDriver()
+    writer = FilesystemCsvWriterDriver()
+    seen_inputs = {}
+
+    class _RecordingWriter:
+        def run(self, *, step_id, config, inputs=None, ctx=None):
+            seen_inputs.update(inputs)
+            return writer.run(step_id=step_id, config=config, inputs=inputs, ctx=ctx)
+
+    drivers = {"filesystem.csv_extractor": extractor, "filesystem.csv_writer": _RecordingWriter()}
+
+    def _registry(self):
+        self.streaming_components = {"filesystem.csv_extractor", "filesystem.csv_writer"}
+        return SimpleNamespace(get=drivers.__getitem__)
+
+    monkeypatch.setattr(RunnerV0, "_build_driver_registry", _registry)
+
+    cfg_dir = tmp_path / "cfg"
+    cfg_dir.mkdir()
+    (cfg_dir / "extract.json").write_text(
+        json.dumps({"component": "filesystem.csv_extractor", "path": str(source), "chunk_size": 7})
+    )
+    (cfg_dir / "write.json").write_text(json.dumps({"component": "filesystem.csv_writer", "path": str(target)}))
+    manifest = {
+        "pipeline": {"id": "stream"},
+        "steps": [
+            {"id": "extract", "driver": "filesystem.csv_extractor", "cfg_path": "cfg/extract.json", "needs": []},
+            {"id": "write", "driver": "filesystem.csv_writer", "cfg_path": "cfg/write.json", "needs": ["extract"]},
+        ],
+        "meta": {"profile": "default"},
+    }
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(yaml.dump(manifest))
+
+    runner = RunnerV0(str(manifest_path), str(tmp_path / "artifacts"))
+    assert runner.run() is True
+
+    assert isinstance(seen_inputs["df_extract"], RowStream)
+    assert seen_inputs["df_extract"].rows_streamed == 30
+    written = pd.read_csv(target)
+    assert list(written.columns) == ["id", "name"]
+    assert written["id"].tolist() == list(range(30))
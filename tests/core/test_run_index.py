@@ -0,0 +1,194 @@
+"""Tests for the SQLite-backed run index (RunIndexStore behind RunIndexWriter / RunIndexReader)."""
+
+from datetime import UTC, datetime
+import json
+import multiprocessing
+
+from osiris.core.run_export_v2 import _find_previous_run_by_manifest
+from osiris.core.run_index import RUNS_DB_FILENAME, RunIndexReader, RunIndexStore, RunIndexWriter, RunRecord
+
+
+def _record(i: int, pipeline: str = "orders", profile: str = "dev", tags: list[str] | None = None) -> RunRecord:
+    return RunRecord(
+        run_id=f"run-{i:03d}",
+        pipeline_slug=pipeline,
+        profile=profile,
+        manifest_hash=f"{i % 3:x}" * 8,
+        manifest_short=f"{i % 3:x}" * 7,
+        run_ts=f"2025-10-{1 + i % 28:02d}T10:00:00Z",
+        status="success" if i % 4 else "failed",
+        duration_ms=100 * i,
+        run_logs_path=f"run_logs/{pipeline}/{i}",
+        aiop_path=f"aiop/{pipeline}/{i}",
+        build_manifest_path=f"build/{pipeline}/manifest.yaml",
+        tags=tags if tags is not None else (["nightly"] if i % 2 else []),
+    )
+
+
+def _populate(index_dir, count: int = 40) -> None:
+    writer = RunIndexWriter(index_dir)
+    for i in range(count):
+        writer.append(_record(i, pipeline="orders" if i % 2 else "customers", profile="prod" if i % 5 else "dev"))
+
+
+def _queries(reader: RunIndexReader) -> list:
+    since = datetime(2025, 10, 15, tzinfo=UTC)
+    return [
+        reader.list_runs(),
+        reader.list_runs(pipeline_slug="orders", limit=5),
+        reader.list_runs(profile="dev"),
+        reader.query_runs(tag="nightly"),
+        reader.query_runs(pipeline_slug="customers", profile="prod", since=since),
+        reader.query_runs(limit=None),
+        reader.get_run("run-007"),
+        reader.get_run("missing"),
+    ]
+
+
+def test_store_queries_match_jsonl_scan(tmp_path):
+    _populate(tmp_path)
+    assert (tmp_path / RUNS_DB_FILENAME).exists()
+
+    indexed = _queries(RunIndexReader(tmp_path))
+
+    # An unreadable database makes the reader fall back to scanning the JSONL files
+    (tmp_path / RUNS_DB_FILENAME).write_text("not a database")
+    assert indexed == _queries(RunIndexReader(tmp_path))
+
+    assert [r.run_id for r in indexed[1]] == ["run-039", "run-037", "run-035", "run-033", "run-031"]
+    assert indexed[6].run_id == "run-007"
+
+
+def test_jsonl_only_index_is_migrated_and_followed(tmp_path):
+    # Index written before the database existed
+    (tmp_path / "runs.jsonl").write_text("".join(json.dumps(_record(i).to_dict()) + "\n" for i in range(3)))
+    reader = RunIndexReader(tmp_path)
+
+    assert [r.run_id for r in reader.list_runs()] == ["run-002", "run-001", "run-000"]
+
+    # Appended by another tool, plus a line still being written
+    with open(tmp_path / "runs.jsonl", "a") as f:
+        f.write(json.dumps(_record(3).to_dict()) + "\n")
+        f.write('{"run_id": "run-0')
+
+    assert [r.run_id for r in reader.list_runs()] == ["run-003", "run-002", "run-001", "run-000"]
+
+
+def test_replaced_jsonl_triggers_rebuild(tmp_path):
+    _populate(tmp_path, count=5)
+    reader = RunIndexReader(tmp_path)
+    assert len(reader.list_runs()) == 5
+
+    replacement = tmp_path / "runs.jsonl.new"
+    replacement.write_text(json.dumps(_record(99).to_dict()) + "\n")
+    replacement.replace(tmp_path / "runs.jsonl")
+
+    assert [r.run_id for r in reader.list_runs()] == ["run-099"]
+
+
+def test_sync_uses_file_state_seen_under_write_lock(tmp_path):
+    _populate(tmp_path, count=5)
+    store = RunIndexStore(tmp_path / RUNS_DB_FILENAME, tmp_path / "runs.jsonl")
+    assert store.sync() == 0
+    stale_state = store._source_state()
+
+    # Another process replaces runs.jsonl and syncs between our first stat and BEGIN IMMEDIATE
+    replacement = tmp_path / "runs.jsonl.new"
+    replacement.write_text(json.dumps(_record(99).to_dict()) + "\n")
+    replacement.replace(tmp_path / "runs.jsonl")
+    assert RunIndexStore(tmp_path / RUNS_DB_FILENAME, tmp_path / "runs.jsonl").sync() == 1
+
+    states = iter([stale_state])
+    source_state = store._source_state
+    store._source_state = lambda: next(states, None) or source_state()
+
+    assert store.sync() == 0
+    assert [r.run_id for r in RunIndexReader(tmp_path).list_runs()] == ["run-099"]
+
+
+def test_rebuild_reimports_everything(tmp_path):
+    _populate(tmp_path, count=10)
+    store = RunIndexStore(tmp_path / RUNS_DB_FILENAME, tmp_path / "runs.jsonl")
+
+    assert store.rebuild() == 10
+    assert store.sync() == 0
+
+
+def _append_runs(index_dir, worker: int, count: int) -> None:
+    writer = RunIndexWriter(index_dir)
+    for i in range(count):
+        writer.append(_record(worker * 100 + i))
+
+
+def test_concurrent_writers(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_append_runs, args=(tmp_path, w, 10)) for w in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    runs = RunIndexReader(tmp_path).query_runs(limit=None)
+    assert len(runs) == 40
+    assert len({r.run_id for r in runs}) == 40
+    assert RunIndexStore(tmp_path / RUNS_DB_FILENAME, tmp_path / "runs.jsonl").sync() == 0
+
+
+def test_find_previous_run_uses_indexed_runs(tmp_path):
+    runs_jsonl = tmp_path / "index" / "runs.jsonl"
+    by_pipeline = tmp_path / "index" / "by_pipeline"
+    by_pipeline.mkdir(parents=True)
+    config = {"index": {"runs_jsonl": str(runs_jsonl), "by_pipeline_dir": str(by_pipeline)}}
+
+    runs = [
+        {"session_id": "s1", "manifest_hash": "abc", "status": "completed", "started_at": "2025-01-02T10:00:00"},
+        {"session_id": "s2", "manifest_hash": "abc", "status": "failed", "started_at": "2025-01-04T10:00:00"},
+        {"session_id": "s3", "manifest_hash": "abc", "status": "completed", "started_at": "2025-01-03T10:00:00"},
+        {"session_id": "s4", "manifest_hash": "def", "status": "completed", "started_at": "2025-01-05T10:00:00"},
+        {"session_id": "s5", "manifest_hash": "abc", "status": "success", "started_at": None, "ended_at": "2025-01-01"},
+    ]
+    runs_jsonl.write_text("".join(json.dumps(run) + "\n" for run in runs))
+    for manifest_hash in ("abc", "def"):
+        (by_pipeline / f"{manifest_hash}.jsonl").write_text(
+            "".join(json.dumps(run) + "\n" for run in runs if run["manifest_hash"] == manifest_hash)
+        )
+
+    assert _find_previous_run_by_manifest("abc", config=config)["session_id"] == "s3"
+    assert _find_previous_run_by_manifest("abc", "s3", config=config)["session_id"] == "s1"
+    assert _find_previous_run_by_manifest("def", "s4", config=config) is None
+    assert runs_jsonl.with_suffix(".sqlite").exists()
+
+
+def test_since_is_answered_from_run_ts_index(tmp_path):
+    writer = RunIndexWriter(tmp_path)
+    # Offsets and separators vary between writers; the exact filter is on parsed timestamps
+    for i, run_ts in enumerate(
+        ["2025-10-14T09:00:00Z", "2025-10-15T01:00:00+05:00", "2025-10-14T21:00:00+00:00", "2025-10-16 08:00:00Z"]
+    ):
+        writer.append(RunRecord(**{**_record(i).to_dict(), "run_ts": run_ts}))
+    since = datetime(2025, 10, 14, 19, tzinfo=UTC)
+    reader = RunIndexReader(tmp_path)
+
+    plans = []
+    connect = reader.store._connect
+
+    def traced_connect():
+        conn = connect()
+        conn.set_trace_callback(
+            lambda sql: (
+                plans.extend(conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall())
+                if sql.startswith("SELECT run_ts, record")
+                else None
+            )
+        )
+        return conn
+
+    reader.store._connect = traced_connect
+    indexed = reader.query_runs(since=since)
+
+    assert [r.run_id for r in indexed] == ["run-003", "run-002", "run-001"]
+    assert any("idx_runs_run_ts" in detail for *_, detail in plans)
+
+    (tmp_path / RUNS_DB_FILENAME).write_text("not a database")
+    assert RunIndexReader(tmp_path).query_runs(since=since) == indexed
@@ -0,0 +1,165 @@
+"""Tests for RunnerV0 DAG scheduling (--max-parallel)."""
+
+import json
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from osiris.core.runner_v0 import RunnerV0
+from osiris.core.state_store import PipelineStateStore
+
+
+class _SlowDriver:
+    """Driver that sleeps, records concurrency and returns a one-row DataFrame."""
+
+    def __init__(self, delay: float = 0.2, fail_on: str | None = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls: list[tuple[str, list[str]]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def run(self, *, step_id, config, inputs=None, ctx=None):
+        with self._lock:
+            self.calls.append((step_id, sorted(k for k in (inputs or {}) if k.startswith("df_"))))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if step_id == self.fail_on:
+                raise RuntimeError("boom")
+            return {"df": pd.DataFrame({"step": [step_id]})}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def fan_in_steps():
+    return [
+        ("extract-a", []),
+        ("extract-b", []),
+        ("extract-c", []),
+        ("join", ["extract-a", "extract-b", "extract-c"]),
+    ]
+
+
+@pytest.fixture
+def fan_in_manifest(write_manifest, fan_in_steps):
+    return write_manifest([(step_id, "stub.processor", needs, {}) for step_id, needs in fan_in_steps], "fan-in")
+
+
+def test_parallel_runs_independent_steps_concurrently(make_runner, fan_in_manifest):
+    driver = _SlowDriver()
+    runner = make_runner(fan_in_manifest, {"stub.processor": driver}, max_parallel=3)
+
+    assert runner.run() is True
+
+    assert driver.max_active == 3
+    assert driver.calls[-1] == ("join", ["df_extract_a", "df_extract_b", "df_extract_c"])
+
+
+def test_parallel_event_stream_is_consistent(make_runner, fan_in_manifest, fan_in_steps):
+    driver = _SlowDriver(delay=0.05)
+    runner = make_runner(fan_in_manifest, {"stub.processor": driver}, max_parallel=2)
+
+    assert runner.run() is True
+
+    types = [(e["type"], e["data"].get("step_id")) for e in runner.events]
+    for step_id, needs in fan_in_steps:
+        start = types.index(("step_start", step_id))
+        complete = types.index(("step_complete", step_id))
+        assert start < complete
+        for need in needs:
+            assert types.index(("step_complete", need)) < start
+    assert types[-1][0] == "run_complete"
+
+
+def test_max_parallel_one_keeps_manifest_order(make_runner, fan_in_manifest, fan_in_steps):
+    driver = _SlowDriver(delay=0)
+    runner = make_runner(fan_in_manifest, {"stub.processor": driver}, max_parallel=1)
+
+    assert runner.run() is True
+
+    assert driver.max_active == 1
+    assert [call[0] for call in driver.calls] == [step_id for step_id, _ in fan_in_steps]
+
+
+def test_parallel_failure_stops_downstream_steps(make_runner, fan_in_manifest):
+    driver = _SlowDriver(delay=0.05, fail_on="extract-b")
+    runner = make_runner(fan_in_manifest, {"stub.processor": driver}, max_parallel=3)
+
+    assert runner.run() is False
+
+    assert "join" not in [call[0] for call in driver.calls]
+    run_errors = [e for e in runner.events if e["type"] == "run_error"]
+    assert run_errors[-1]["data"]["step_id"] == "extract-b"
+
+
+def test_parallel_detects_dependency_cycle(write_manifest, make_runner):
+    manifest = write_manifest([("a", "stub.processor", ["b"], {}), ("b", "stub.processor", ["a"], {})])
+    driver = _SlowDriver(delay=0)
+    runner = make_runner(manifest, {"stub.processor": driver}, max_parallel=2)
+
+    assert runner.run() is False
+
+    assert driver.calls == []
+    assert "cycle" in runner.events[-1]["data"]["message"]
+
+
+def test_invalid_max_parallel_rejected(tmp_path):
+    with pytest.raises(ValueError, match="max_parallel"):
+        RunnerV0(str(tmp_path / "manifest.yaml"), str(tmp_path), max_parallel=0)
+
+
+class _StatefulDriver(_SlowDriver):
+    """Extractors advance a cursor in their state and checkpoint halfway."""
+
+    def __init__(self, fail_on: str | None = None):
+        super().__init__(delay=0, fail_on=fail_on)
+        self.states: dict[str, object] = {}
+
+    def run(self, *, step_id, config, inputs=None, ctx=None):
+        self.states[step_id] = (inputs or {}).get("state")
+        result = super().run(step_id=step_id, config=config, inputs=inputs, ctx=ctx)
+        if step_id.startswith("extract"):
+            cursor = ((inputs or {}).get("state") or {}).get("cursor", 0)
+            ctx.checkpoint({"cursor": cursor + 1})
+            result["state"] = {"cursor": cursor + 2}
+        return result
+
+
+@pytest.mark.parametrize("max_parallel", [1, 3])
+def test_state_is_injected_and_committed_after_success(tmp_path, make_runner, fan_in_manifest, max_parallel):
+    store = PipelineStateStore(tmp_path / "state.sqlite")
+    store.commit("fan-in", {"extract-a": {"cursor": 10}})
+    driver = _StatefulDriver()
+    runner = make_runner(fan_in_manifest, {"stub.processor": driver}, max_parallel=max_parallel, state_store=store)
+
+    assert runner.run() is True
+
+    assert driver.states["extract-a"] == {"cursor": 10}
+    assert driver.states["extract-b"] is None
+    assert driver.calls[-1] == ("join", ["df_extract_a", "df_extract_b", "df_extract_c"])
+    assert store.load("fan-in", "extract-a") == {"cursor": 12}
+    assert store.load("fan-in", "extract-c") == {"cursor": 2}
+    assert store.load("fan-in", "join") is None
+
+
+def test_failed_run_keeps_checkpoint_but_does_not_commit(tmp_path, make_runner, fan_in_manifest):
+    store = PipelineStateStore(tmp_path / "state.sqlite")
+    store.commit("fan-in", {"extract-a": {"cursor": 10}})
+    driver = _StatefulDriver(fail_on="join")
+    runner = make_runner(fan_in_manifest, {"stub.processor": driver}, max_parallel=1, state_store=store)
+
+    assert runner.run() is False
+
+    # The downstream failure leaves committed state untouched; the next run resumes from the checkpoint
+    with sqlite3.connect(tmp_path / "state.sqlite") as conn:
+        committed = dict(conn.execute("SELECT step_id, state FROM step_state").fetchall())
+    assert committed == {"extract-a": json.dumps({"cursor": 10})}
+    assert store.load("fan-in", "extract-a") == {"cursor": 11}
@@ -311,6 +311,59 @@ class TestSessionContext:
             assert run_error_event["error_message"] == "Test error"
 
 
+class TestBufferedSession:
+    """Test SessionContext(buffered=True)."""
+
+    def test_buffered_records_match_sync_output(self):
+        """Buffered and synchronous sessions write the same records."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            outputs = []
+            for buffered in (False, True):
+                session = SessionContext(session_id=f"s_{buffered}", base_logs_dir=Path(temp_dir), buffered=buffered)
+                session.log_event("step_start", step_id="extract", password="secret123", path=Path("/tmp/x"))
+                session.log_metric("rows_read", 10, step_id="extract")
+                session.close()
+
+                events = [json.loads(line) for line in session.events_log.read_text().splitlines()]
+                metrics = [json.loads(line) for line in session.metrics_log.read_text().splitlines()]
+                strip = ("ts", "session", "session_id", "session_dir", "duration_seconds", "end_time", "value")
+                outputs.append(
+                    (
+                        [{k: v for k, v in e.items() if k not in strip} for e in events],
+                        [{k: v for k, v in m.items() if k not in strip} for m in metrics],
+                    )
+                )
+
+            assert outputs[0] == outputs[1]
+            assert outputs[1][0][1]["password"] == "***"
+
+    def test_step_complete_drains_buffer(self):
+        """Events and metrics logged before step_complete are on disk once it returns."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session = SessionContext(base_logs_dir=Path(temp_dir), buffered=True)
+            try:
+                session.log_metric("rows_written", 42, step_id="write")
+                session.log_event("step_complete", step_id="write")
+
+                metrics = [json.loads(line) for line in session.metrics_log.read_text().splitlines()]
+                events = [json.loads(line)["event"] for line in session.events_log.read_text().splitlines()]
+                assert metrics[0]["value"] == 42
+                assert events[-1] == "step_complete"
+            finally:
+                session.close()
+
+    def test_logging_after_close_is_synchronous(self):
+        """Records logged after close() are appended directly."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session = SessionContext(base_logs_dir=Path(temp_dir), buffered=True)
+            session.close()
+
+            session.log_event("late_event")
+
+            events = [json.loads(line)["event"] for line in session.events_log.read_text().splitlines()]
+            assert events[-1] == "late_event"
+
+
 class TestGlobalSessionFunctions:
     """Test global session functions."""
 
@@ -0,0 +1,156 @@
+"""Tests for the step output spill manager."""
+
+import json
+
+import pandas as pd
+import pytest
+import yaml
+
+from osiris.core.runner_v0 import RunnerV0
+from osiris.core.spill import SpillManager, budget_from_env, estimate_frame_bytes, read_spilled
+
+STEPS = [
+    {"id": "a", "needs": []},
+    {"id": "b", "needs": []},
+    {"id": "c", "needs": ["b"]},
+    {"id": "d", "needs": ["a", "c"]},
+]
+
+
+def _frame(rows: int = 100) -> pd.DataFrame:
+    return pd.DataFrame({"id": range(rows), "name": [f"row-{i}" for i in range(rows)]})
+
+
+def test_refcount_releases_after_last_consumer(tmp_path):
+    manager = SpillManager(STEPS, tmp_path)
+    output_a = {"df": _frame()}
+    manager.track("a", output_a)
+
+    assert manager.refcount("a") == 1
+    assert manager.bytes_in_memory == estimate_frame_bytes(output_a["df"])
+    assert manager.release("c") == []
+    assert manager.release("d") == ["a"]
+
+    assert "df" not in output_a
+    assert output_a["released"] is True
+    assert manager.bytes_in_memory == 0
+
+
+def test_outputs_without_consumers_are_kept(tmp_path):
+    manager = SpillManager(STEPS, tmp_path)
+    output_d = {"df": _frame()}
+    manager.track("d", output_d)
+
+    assert manager.release("d") == []
+    assert "df" in output_d
+
+
+def test_budget_spills_output_needed_furthest_in_future(tmp_path):
+    size = estimate_frame_bytes(_frame())
+    manager = SpillManager(STEPS, tmp_path, memory_budget_bytes=size)
+    output_a, output_b = {"df": _frame()}, {"df": _frame()}
+
+    assert manager.track("a", output_a) is False
+    manager.track("b", output_b)
+
+    # "a" is next needed by step d, "b" already by step c
+    assert output_a["spilled"] is True
+    assert "df" not in output_a
+    assert "df" in output_b
+    assert manager.bytes_in_memory == size
+    assert manager.peak_bytes == 2 * size
+    pd.testing.assert_frame_equal(read_spilled(output_a["df_path"]), _frame())
+
+    # Releasing removes the spill file unless it is a published artifact
+    manager.release("d")
+    assert not (tmp_path / "a" / "output.parquet").exists()
+
+
+def test_arrow_ipc_spill_roundtrip_and_callback(tmp_path):
+    spilled = []
+    manager = SpillManager(
+        STEPS,
+        tmp_path,
+        memory_budget_bytes=0,
+        spill_format="arrow",
+        keep_spill_files=True,
+        on_spill=lambda step_id, path, df: spilled.append((step_id, path.name, len(df))),
+    )
+    output = {"df": _frame(7), "state": {"cursor": 1}}
+
+    assert manager.track("b", output) is True
+    assert spilled == [("b", "output.arrow", 7)]
+    assert output["state"] == {"cursor": 1}
+    pd.testing.assert_frame_equal(read_spilled(output["df_path"]), _frame(7))
+
+    manager.release("c")
+    assert (tmp_path / "b" / "output.arrow").exists()
+
+
+def test_invalid_configuration(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported spill format"):
+        SpillManager(STEPS, tmp_path, spill_format="csv")
+    with pytest.raises(ValueError, match="memory_budget_bytes"):
+        SpillManager(STEPS, tmp_path, memory_budget_bytes=-1)
+
+
+def test_budget_from_env(monkeypatch):
+    monkeypatch.delenv("OSIRIS_SPILL_BUDGET_MB", raising=False)
+    assert budget_from_env() is None
+    monkeypatch.setenv("OSIRIS_SPILL_BUDGET_MB", "1.5")
+    assert budget_from_env() == 1572864
+    monkeypatch.setenv("OSIRIS_SPILL_BUDGET_MB", "lots")
+    assert budget_from_env(42) == 42
+
+
+class _ChainDriver:
+    """Emits a frame for sources and passes the concatenated inputs through otherwise."""
+
+    def __init__(self):
+        self.seen: dict[str, int] = {}
+
+    def run(self, *, step_id, config, inputs=None, ctx=None):
+        frames = [value for key, value in (inputs or {}).items() if key.startswith("df_")]
+        self.seen[step_id] = sum(len(frame) for frame in frames)
+        if not frames:
+            return {"df": _frame(10)}
+        return {"df": pd.concat(frames, ignore_index=True)}
+
+
+def test_runner_spills_under_zero_budget_and_releases(tmp_path, monkeypatch):
+    cfg_dir = tmp_path / "cfg"
+    cfg_dir.mkdir()
+    for step in STEPS:
+        (cfg_dir / f"{step['id']}.json").write_text(json.dumps({"component": "stub.processor"}))
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(
+        yaml.dump(
+            {
+                "pipeline": {"id": "spill"},
+                "steps": [{**step, "driver": "stub.processor", "cfg_path": f"cfg/{step['id']}.json"} for step in STEPS],
+                "meta": {"profile": "default"},
+            }
+        )
+    )
+
+    driver = _ChainDriver()
+    monkeypatch.setattr(
+        RunnerV0,
+        "_build_driver_registry",
+        lambda self: type("Registry", (), {"get": lambda _self, _name: driver})(),
+    )
+    runner = RunnerV0(str(manifest_path), str(tmp_path / "artifacts"), memory_budget_mb=0)
+
+    assert runner.run() is True
+
+    assert driver.seen == {"a": 0, "b": 0, "c": 10, "d": 20}
+    spill_events = [e for e in runner.events if e["type"] == "output_spilled"]
+    assert [e["data"]["step_id"] for e in spill_events] == ["a", "b", "c", "d"]
+    resolved = [e for e in runner.events if e["type"] == "inputs_resolved"]
+    assert len(resolved) == 3
+    assert all(e["data"]["from_spill"] is True and e["data"]["from_memory"] is False for e in resolved)
+
+    # Consumed outputs are released together with their spill files; the sink output stays
+    assert runner.results["a"]["released"] is True
+    assert not (tmp_path / "artifacts" / "a" / "output.parquet").exists()
+    assert (tmp_path / "artifacts" / "d" / "output.parquet").exists()
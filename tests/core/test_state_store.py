@@ -9,7 +9,7 @@ import tempfile
 
 import pytest
 
-from osiris.core.state_store import SQLiteStateStore
+from osiris.core.state_store import PipelineStateStore, SQLiteStateStore
 
 
 @pytest.fixture(autouse=True)
@@ -130,3 +130,49 @@ class TestSQLiteStateStore:
         # Second instance with same session ID
         with SQLiteStateStore("persistent_session") as store2:
             assert store2.get("persistent_data") == "test_value"
+
+
+class TestPipelineStateStore:
+    """Test cases for PipelineStateStore."""
+
+    def test_load_missing_state_returns_none(self, state_store_isolation):
+        """Test that an unknown step has no state (and no database is created)."""
+        store = PipelineStateStore(state_store_isolation / "index" / "state.sqlite")
+
+        assert store.load("orders_etl", "extract") is None
+        assert not store.db_path.exists()
+
+    def test_commit_is_scoped_by_pipeline_and_step(self, state_store_isolation):
+        """Test that committed states are keyed by pipeline slug and step id."""
+        store = PipelineStateStore(state_store_isolation / "state.sqlite")
+
+        store.commit("orders_etl", {"extract": {"cursor": 1}, "users": {"cursor": 2}}, run_id="run-1")
+
+        assert store.load("orders_etl", "extract") == {"cursor": 1}
+        assert store.load("orders_etl", "users") == {"cursor": 2}
+        assert store.load("other_etl", "extract") is None
+
+    def test_checkpoint_takes_precedence_until_commit(self, state_store_isolation):
+        """Test that a failed run resumes from its checkpoint and commit clears it."""
+        store = PipelineStateStore(state_store_isolation / "state.sqlite")
+        store.commit("orders_etl", {"extract": {"cursor": 1}})
+
+        store.checkpoint("orders_etl", "extract", {"cursor": 5})
+        assert PipelineStateStore(store.db_path).load("orders_etl", "extract") == {"cursor": 5}
+
+        store.commit("orders_etl", {"extract": {"cursor": 9}})
+        store.commit("orders_etl", {"other": {"cursor": 0}})
+        assert store.load("orders_etl", "extract") == {"cursor": 9}
+
+    def test_clear_removes_state_and_checkpoints(self, state_store_isolation):
+        """Test clearing a single step and a whole pipeline."""
+        store = PipelineStateStore(state_store_isolation / "state.sqlite")
+        store.commit("orders_etl", {"extract": {"cursor": 1}, "users": {"cursor": 2}})
+        store.checkpoint("orders_etl", "users", {"cursor": 3})
+
+        store.clear("orders_etl", "extract")
+        assert store.load("orders_etl", "extract") is None
+        assert store.load("orders_etl", "users") == {"cursor": 3}
+
+        store.clear("orders_etl")
+        assert store.load("orders_etl", "users") is None
@@ -52,9 +52,8 @@ def test_fallback_to_importlib_metadata(tmp_path, monkeypatch):
 
     with patch("pathlib.Path.read_text", side_effect=mock_read_text):
         with patch("importlib.metadata.version", mock_version_func):
-            # Force reimport to trigger fallback logic
-            if "osiris" in sys.modules:
-                del sys.modules["osiris"]
+            # Force reimport to trigger fallback logic; monkeypatch restores the original module
+            monkeypatch.delitem(sys.modules, "osiris", raising=False)
 
             import osiris
 
@@ -78,9 +77,8 @@ def test_fallback_to_unknown_when_all_fail(monkeypatch):
 
     with patch("pathlib.Path.read_text", side_effect=mock_read_text):
         with patch("importlib.metadata.version", side_effect=mock_version):
-            # Force reimport to trigger fallback logic
-            if "osiris" in sys.modules:
-                del sys.modules["osiris"]
+            # Force reimport to trigger fallback logic; monkeypatch restores the original module
+            monkeypatch.delitem(sys.modules, "osiris", raising=False)
 
             import osiris
 
@@ -88,7 +86,7 @@ def test_fallback_to_unknown_when_all_fail(monkeypatch):
             assert osiris.__version__ == "unknown"
 
 
-def test_development_mode_uses_pyproject_toml():
+def test_development_mode_uses_pyproject_toml(monkeypatch):
     """Test that development mode reads from pyproject.toml.
 
     In development (editable install), pyproject.toml should be present
@@ -104,9 +102,8 @@ def test_development_mode_uses_pyproject_toml():
 
         expected_version = tomllib.loads(pyproject_file.read_text())["project"]["version"]
 
-        # Force fresh import to test primary path
-        if "osiris" in sys.modules:
-            del sys.modules["osiris"]
+        # Force fresh import to test primary path; monkeypatch restores the original module
+        monkeypatch.delitem(sys.modules, "osiris", raising=False)
 
         import osiris
 
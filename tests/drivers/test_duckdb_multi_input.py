@@ -1,8 +1,11 @@
 """Tests for DuckDB processor with multiple input tables."""
 
+from types import SimpleNamespace
+
 import pandas as pd
 import pytest
 
+from osiris.core.duckdb_session import DuckDBSession, DuckDBTable
 from osiris.drivers.duckdb_processor_driver import DuckDBProcessorDriver
 
 
@@ -22,8 +25,7 @@ def multi_input_dataframes():
 
 def test_duckdb_registers_multiple_tables(duckdb_driver, multi_input_dataframes, tmp_path):
     """DuckDB should register all df_* inputs as separate tables."""
-    config = {
-        "query": """
+    config = {"query": """
             SELECT
                 m.title,
                 AVG(r.rating) as avg_rating
@@ -31,8 +33,7 @@ def test_duckdb_registers_multiple_tables(duckdb_driver, multi_input_dataframes,
             JOIN df_extract_movies m ON r.movie_id = m.id
             GROUP BY m.title
             ORDER BY avg_rating DESC
-        """
-    }
+        """}
 
     result = duckdb_driver.run(step_id="test-calc", config=config, inputs=multi_input_dataframes, ctx=None)
 
@@ -82,3 +83,69 @@ def test_duckdb_table_not_found_error(duckdb_driver, multi_input_dataframes, tmp
 
     with pytest.raises(RuntimeError, match="DuckDB transformation failed"):
         duckdb_driver.run(step_id="test-step", config=config, inputs=multi_input_dataframes, ctx=None)
+
+
+def test_duckdb_keeps_arrow_backed_inputs_in_arrow(duckdb_driver):
+    """Arrow-backed inputs are registered as Arrow tables and the result stays Arrow-backed."""
+    pa = pytest.importorskip("pyarrow")
+    df = pa.table({"id": [1, 2, 3], "name": ["a", None, "c"]}).to_pandas(types_mapper=pd.ArrowDtype)
+
+    result = duckdb_driver.run(
+        step_id="test-arrow",
+        config={"query": "SELECT name FROM df_extract WHERE id > 1 ORDER BY id"},
+        inputs={"df_extract": df},
+        ctx=None,
+    )
+
+    out = result["df"]
+    assert isinstance(out["name"].dtype, pd.ArrowDtype)
+    assert out["name"].isna().tolist() == [True, False]
+
+
+def test_duckdb_chains_through_session_tables(duckdb_driver, multi_input_dataframes):
+    """With keep_in_duckdb the output stays a session table that the next step reads in place."""
+    session = DuckDBSession(threads=1)
+    keep_ctx = SimpleNamespace(duckdb_session=session, keep_in_duckdb=True)
+    final_ctx = SimpleNamespace(duckdb_session=session, keep_in_duckdb=False)
+
+    try:
+        first = duckdb_driver.run(
+            step_id="join",
+            config={
+                "query": "SELECT m.id, r.rating FROM df_extract_movies m JOIN df_extract_reviews r ON m.id = r.movie_id"
+            },
+            inputs=multi_input_dataframes,
+            ctx=keep_ctx,
+        )
+        table = first["df"]
+        assert isinstance(table, DuckDBTable)
+        assert len(table) == 5
+
+        second = duckdb_driver.run(
+            step_id="agg",
+            config={"query": "SELECT id, SUM(rating) AS total FROM df_join GROUP BY id ORDER BY id"},
+            inputs={"df_join": table},
+            ctx=final_ctx,
+        )
+    finally:
+        session.close()
+
+    assert isinstance(second["df"], pd.DataFrame)
+    assert second["df"]["total"].tolist() == [9, 3, 9]
+
+
+def test_duckdb_step_local_connection_settings(duckdb_driver):
+    """threads / memory_limit in the step config apply to a step-local connection."""
+    result = duckdb_driver.run(
+        step_id="settings",
+        config={
+            "query": "SELECT current_setting('threads') AS threads, current_setting('memory_limit') AS mem",
+            "threads": 1,
+            "memory_limit": "256MB",
+        },
+        inputs=None,
+        ctx=None,
+    )
+
+    assert int(result["df"]["threads"][0]) == 1
+    assert result["df"]["mem"][0].endswith("MiB")
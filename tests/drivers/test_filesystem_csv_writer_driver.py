@@ -1,10 +1,12 @@
 """Unit tests for filesystem CSV writer driver."""
 
+import gzip
 from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
 
+from osiris.core.driver import ColumnSchema, RowStream
 from osiris.drivers.filesystem_csv_writer_driver import FilesystemCsvWriterDriver
 
 
@@ -163,3 +165,130 @@ class TestFilesystemCsvWriterDriver:
         # Verify file exists but is essentially empty
         assert output_file.exists()
         assert result == {}
+
+    def test_run_quoting_all(self, tmp_path):
+        """Test that the quoting option is applied."""
+        output_file = tmp_path / "quoted.csv"
+
+        driver = FilesystemCsvWriterDriver()
+        driver.run(
+            step_id="test-write",
+            config={"path": str(output_file), "quoting": "all"},
+            inputs={"df_upstream": pd.DataFrame({"b": [1], "a": ["x"]})},
+        )
+
+        assert output_file.read_text() == '"a","b"\n"x","1"\n'
+
+    def test_run_chunk_size_matches_unchunked_output(self, tmp_path):
+        """Test that chunked writes produce the same bytes as a single write."""
+        test_df = pd.DataFrame({"z": range(25), "a": [f"v{i}" for i in range(25)]})
+        driver = FilesystemCsvWriterDriver()
+
+        for name, chunk_size in (("one.csv", 100000), ("many.csv", 3)):
+            driver.run(
+                step_id="test-write",
+                config={"path": str(tmp_path / name), "chunk_size": chunk_size},
+                inputs={"df_upstream": test_df},
+            )
+
+        assert (tmp_path / "one.csv").read_bytes() == (tmp_path / "many.csv").read_bytes()
+
+    def test_run_gzip_is_deterministic(self, tmp_path):
+        """Test gzip output round-trips and is byte-identical across runs."""
+        test_df = pd.DataFrame({"b": [1, 2], "a": ["x", "y"]})
+        driver = FilesystemCsvWriterDriver()
+
+        output_file = tmp_path / "out.csv.gz"
+        outputs = []
+        for _ in range(2):
+            driver.run(
+                step_id="test-write",
+                config={"path": str(output_file), "compression": "gzip"},
+                inputs={"df_upstream": test_df},
+            )
+            outputs.append(output_file.read_bytes())
+
+        assert outputs[0] == outputs[1]
+        with gzip.open(output_file, "rt") as f:
+            assert f.read() == "a,b\nx,1\ny,2\n"
+
+    def test_run_parquet_row_groups(self, tmp_path):
+        """Test Parquet output from a RowStream uses sorted columns and fixed row groups."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        frames = [pd.DataFrame({"id": range(i, i + 4), "name": ["n"] * 4}) for i in range(0, 12, 4)]
+        output_file = tmp_path / "out.parquet"
+        ctx = MagicMock()
+
+        driver = FilesystemCsvWriterDriver()
+        driver.run(
+            step_id="test-write",
+            config={"path": str(output_file), "format": "parquet", "compression": "zstd", "row_group_size": 5},
+            inputs={"df_upstream": RowStream(iter(frames))},
+            ctx=ctx,
+        )
+
+        parquet_file = pq.ParquetFile(output_file)
+        assert parquet_file.schema_arrow.names == ["id", "name"]
+        assert [parquet_file.metadata.row_group(i).num_rows for i in range(parquet_file.num_row_groups)] == [5, 5, 2]
+        assert parquet_file.read().column("id").to_pylist() == list(range(12))
+        ctx.log_metric.assert_called_once_with("rows_written", 12)
+
+    def test_run_arrow_ipc(self, tmp_path):
+        """Test Arrow IPC output with zstd-compressed record batches."""
+        pa = pytest.importorskip("pyarrow")
+        output_file = tmp_path / "out.arrow"
+
+        driver = FilesystemCsvWriterDriver()
+        driver.run(
+            step_id="test-write",
+            config={"path": str(output_file), "format": "arrow", "compression": "zstd", "row_group_size": 2},
+            inputs={"df_upstream": pd.DataFrame({"b": [1.0, 2.0, 3.0], "a": ["x", "y", "z"]})},
+        )
+
+        with pa.ipc.open_file(output_file) as reader:
+            assert reader.num_record_batches == 2
+            table = reader.read_all()
+        assert table.column_names == ["a", "b"]
+        assert table.column("a").to_pylist() == ["x", "y", "z"]
+
+    def test_run_empty_stream_parquet_keeps_columns(self, tmp_path):
+        """Test that an empty stream still writes a Parquet file with the known columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        output_file = tmp_path / "empty.parquet"
+        stream = RowStream(iter([]), columns=[ColumnSchema(name="b", type="int64"), ColumnSchema(name="a", type="str")])
+
+        driver = FilesystemCsvWriterDriver()
+        driver.run(step_id="test-write", config={"path": str(output_file), "format": "parquet"}, inputs={"df": stream})
+
+        table = pq.read_table(output_file)
+        assert table.column_names == ["a", "b"]
+        assert table.num_rows == 0
+
+    @pytest.mark.parametrize(
+        ("config", "message"),
+        [
+            ({"format": "xlsx"}, "Invalid format"),
+            ({"compression": "bz2"}, "Invalid compression"),
+            ({"format": "arrow", "compression": "gzip"}, "not 'gzip'"),
+            ({"quoting": "none"}, "Invalid quoting"),
+        ],
+    )
+    def test_run_rejects_invalid_options(self, tmp_path, config, message):
+        """Test validation of format, compression and quoting options."""
+        driver = FilesystemCsvWriterDriver()
+        with pytest.raises(ValueError, match=message):
+            driver.run(
+                step_id="test-write",
+                config={"path": str(tmp_path / "out"), **config},
+                inputs={"df_upstream": pd.DataFrame({"a": [1]})},
+            )
+
+    def test_run_without_create_dirs_requires_parent(self, tmp_path):
+        """Test that create_dirs=false does not create missing directories."""
+        driver = FilesystemCsvWriterDriver()
+        with pytest.raises(FileNotFoundError, match="Output directory does not exist"):
+            driver.run(
+                step_id="test-write",
+                config={"path": str(tmp_path / "missing" / "out.csv"), "create_dirs": False},
+                inputs={"df_upstream": pd.DataFrame({"a": [1]})},
+            )
@@ -1,11 +1,13 @@
 """Unit tests for MySQL extractor driver."""
 
+from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 
-from osiris.drivers.mysql_extractor_driver import MySQLExtractorDriver
+from osiris.core.driver import RowStream
+from osiris.drivers.mysql_extractor_driver import MySQLExtractorDriver, _split_range
 
 
 class TestMySQLExtractorDriver:
@@ -168,3 +170,151 @@ class TestMySQLExtractorDriver:
 
         # Verify engine disposed
         mock_engine.dispose.assert_called_once()
+
+
+class TestPartitionedExtraction:
+    """Test partition_by range extraction (SQLite stands in for MySQL)."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        import sqlalchemy as sa
+
+        engine = sa.create_engine(f"sqlite:///{tmp_path / 'facts.db'}")
+        facts = pd.DataFrame(
+            {
+                "id": pd.array(list(range(1, 101)) + [None], dtype="Int64"),
+                "day": [f"2024-01-{(i % 28) + 1:02d}" for i in range(101)],
+                "amount": [float(i) for i in range(101)],
+            }
+        )
+        facts.to_sql("facts", engine, index=False)
+        return engine
+
+    def _run(self, engine, ctx=None, **config):
+        with patch("osiris.drivers.mysql_extractor_driver.sa.create_engine", return_value=engine) as mock_create:
+            result = MySQLExtractorDriver().run(
+                step_id="test-extract",
+                config={
+                    "query": "SELECT * FROM facts;",
+                    "resolved_connection": {"host": "localhost", "database": "test_db", "user": "u"},
+                    **config,
+                },
+                ctx=ctx,
+            )
+        return result, mock_create
+
+    def test_partitions_cover_all_rows_in_key_order(self, engine):
+        ctx = MagicMock()
+        result, mock_create = self._run(engine, ctx=ctx, partition_by="id", partitions=3, batch_size=7)
+
+        df = result["df"]
+        assert len(df) == 101
+        # Partitions are concatenated in key order; NULL keys ride along with the first one
+        assert df["id"].dropna().astype(int).tolist() == list(range(1, 101))
+        assert df["id"].isna().sum() == 1
+        assert mock_create.call_args.kwargs == {"pool_size": 3, "max_overflow": 0}
+        ctx.log_metric.assert_called_once_with("rows_read", 101)
+
+    def test_partitions_stream_all_rows(self, engine):
+        ctx = MagicMock()
+        ctx.streaming = True
+
+        result, _ = self._run(engine, ctx=ctx, partition_by="id", partitions=4, batch_size=10)
+
+        stream = result["df"]
+        assert isinstance(stream, RowStream)
+        df = stream.to_dataframe()
+        assert sorted(df["id"].dropna().astype(int)) == list(range(1, 101))
+        assert df["id"].isna().sum() == 1
+        ctx.log_metric.assert_called_once_with("rows_read", 101)
+
+    def test_non_numeric_partition_column_rejected(self, engine):
+        with pytest.raises(RuntimeError, match="partition_by column must be an integer, date or datetime"):
+            self._run(engine, partition_by="amount", partitions=2)
+
+    def test_invalid_partitions(self, engine):
+        with pytest.raises(ValueError, match="'partitions' must be >= 1"):
+            self._run(engine, partition_by="id", partitions=0)
+
+
+def test_split_range_boundaries():
+    assert _split_range(1, 100, 4) == [1, 25, 50, 75, 100]
+    assert _split_range(5, 6, 4) == [5, 6]
+    assert _split_range(date(2024, 1, 1), date(2024, 1, 5), 2) == [date(2024, 1, 1), date(2024, 1, 3), date(2024, 1, 5)]
+    assert _split_range(datetime(2024, 1, 1), datetime(2024, 1, 2), 2) == [
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 1, 12),
+        datetime(2024, 1, 2),
+    ]
+
+
+class _FakeSSCursor:
+    """Minimal PyMySQL SSCursor double returning fixed rows."""
+
+    def __init__(self, description, rows):
+        self.description = description
+        self.rows = list(rows)
+        self.executed = None
+
+    def execute(self, sql, args=None):
+        self.executed = (sql, args)
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        pass
+
+
+class TestArrowBackend:
+    """Test dtype_backend=pyarrow builds Arrow columns from raw cursor rows."""
+
+    def _run(self, cursor, ctx=None):
+        engine = MagicMock()
+        conn = engine.connect.return_value.__enter__.return_value
+        conn.connection.dbapi_connection.cursor.return_value = cursor
+        with patch("osiris.drivers.mysql_extractor_driver.sa.create_engine", return_value=engine):
+            return MySQLExtractorDriver().run(
+                step_id="test-extract",
+                config={
+                    "query": "SELECT * FROM users WHERE name LIKE 'a%'",
+                    "dtype_backend": "pyarrow",
+                    "batch_size": 2,
+                    "resolved_connection": {"host": "localhost", "database": "test_db", "user": "u"},
+                },
+                ctx=ctx,
+            )
+
+    def test_arrow_columns_from_cursor_rows(self):
+        pytest.importorskip("pyarrow")
+        from pymysql.constants import FIELD_TYPE
+
+        description = [
+            ("id", FIELD_TYPE.LONGLONG, None, None, None, None, False),
+            ("name", FIELD_TYPE.VAR_STRING, None, None, None, None, True),
+            ("created", FIELD_TYPE.DATETIME, None, None, None, None, True),
+        ]
+        rows = [(1, "alice", datetime(2024, 1, 1)), (2, None, None), (3, "carol", datetime(2024, 1, 3))]
+        cursor = _FakeSSCursor(description, rows)
+        ctx = MagicMock()
+
+        df = self._run(cursor, ctx=ctx)["df"]
+
+        # No params: PyMySQL must not %-format the query
+        assert cursor.executed == ("SELECT * FROM users WHERE name LIKE 'a%'", None)
+        assert [str(dtype) for dtype in df.dtypes] == ["int64[pyarrow]", "string[pyarrow]", "timestamp[us][pyarrow]"]
+        assert df["id"].tolist() == [1, 2, 3]
+        assert df["name"].isna().tolist() == [False, True, False]
+        ctx.log_metric.assert_called_once_with("rows_read", 3)
+
+    def test_arrow_empty_result_keeps_columns(self):
+        pytest.importorskip("pyarrow")
+        from pymysql.constants import FIELD_TYPE
+
+        cursor = _FakeSSCursor([("id", FIELD_TYPE.LONG, None, None, None, None, False)], [])
+
+        df = self._run(cursor)["df"]
+
+        assert list(df.columns) == ["id"]
+        assert len(df) == 0
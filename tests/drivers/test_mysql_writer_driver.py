@@ -0,0 +1,233 @@
+"""Unit tests for MySQL writer driver."""
+
+import csv
+from datetime import datetime
+import io
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pymysql
+import pytest
+
+from osiris.core.driver import RowStream
+from osiris.drivers.mysql_writer_driver import MySQLWriterDriver, _frame_rows, _load_data_field
+
+CONNECTION = {
+    "host": "localhost",
+    "port": 3306,
+    "database": "test_db",
+    "user": "test_user",
+    "password": "test_pass",  # pragma: allowlist secret
+}
+
+
+class _FakeCursor:
+    """Records statements; reads LOAD DATA files before the driver deletes them."""
+
+    def __init__(self, fail_on=None):
+        self.statements: list[tuple[str, object]] = []
+        self.loaded_files: list[str] = []
+        self.fail_on = fail_on
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.fail_on and self.fail_on in sql:
+            raise pymysql.err.OperationalError(1148, "The used command is not allowed")
+        if sql.startswith("LOAD DATA"):
+            self.loaded_files.append(Path(params[0]).read_text(encoding="utf-8"))
+        self.statements.append((sql, params))
+
+    def executemany(self, sql, rows):
+        self.statements.append((sql, list(rows)))
+
+
+def _run(inputs, *, cursor=None, ctx=None, **config):
+    cursor = cursor or _FakeCursor()
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+    conn.bytes_sent = 4096
+    with (
+        patch.object(MySQLWriterDriver, "_connect", return_value=conn) as mock_connect,
+        patch("osiris.drivers.mysql_writer_driver.log_event"),
+        patch("osiris.drivers.mysql_writer_driver.log_metric") as mock_metric,
+    ):
+        MySQLWriterDriver().run(
+            step_id="write-mysql",
+            config={"table": "users", "resolved_connection": CONNECTION, **config},
+            inputs=inputs,
+            ctx=ctx,
+        )
+    return cursor, conn, mock_connect, mock_metric
+
+
+class TestMySQLWriterDriver:
+    """Test MySQL writer driver."""
+
+    def test_append_batches_multi_row_insert(self):
+        df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", None]})
+
+        cursor, conn, _, _ = _run({"df_extract": df}, batch_size=2)
+
+        assert len(cursor.statements) == 2
+        sql, rows = cursor.statements[0]
+        assert sql == "INSERT INTO `users` (`id`, `name`) VALUES (%s, %s)"
+        assert rows == [(1, "a"), (2, "b")]
+        assert cursor.statements[1][1] == [(3, None)]
+        conn.commit.assert_called_once()
+        conn.close.assert_called_once()
+
+    def test_upsert_uses_on_duplicate_key_update(self):
+        df = pd.DataFrame({"id": [1], "name": ["a"], "score": [1.5]})
+
+        cursor, _, _, _ = _run({"df": df}, mode="upsert", upsert_keys=["id"])
+
+        sql, _ = cursor.statements[0]
+        assert sql.endswith("AS new ON DUPLICATE KEY UPDATE `name` = new.`name`, `score` = new.`score`")
+        # PyMySQL only batches executemany into one multi-row INSERT when it recognizes the statement
+        assert pymysql.cursors.RE_INSERT_VALUES.match(sql)
+
+    def test_upsert_requires_keys(self):
+        with pytest.raises(ValueError, match="upsert_keys"):
+            _run({"df": pd.DataFrame({"id": [1]})}, mode="upsert")
+
+    def test_replace_deletes_in_same_transaction(self):
+        cursor, conn, _, _ = _run({"df": pd.DataFrame({"id": [1]})}, mode="replace")
+
+        assert cursor.statements[0] == ("DELETE FROM `users`", None)
+        assert cursor.statements[1][0].startswith("INSERT INTO `users`")
+        conn.commit.assert_called_once()
+
+    def test_consumes_row_stream_and_aligns_columns(self):
+        frames = [pd.DataFrame({"id": [1], "name": ["a"]}), pd.DataFrame({"name": ["b"], "id": [2]})]
+        stream = RowStream(iter(frames))
+
+        cursor, _, _, _ = _run({"df": stream})
+
+        assert [rows for _, rows in cursor.statements] == [[(1, "a")], [(2, "b")]]
+
+    def test_load_data_local_writes_csv_batches(self):
+        df = pd.DataFrame({"id": [1, 2], "note": ['say "hi"', None], "flag": [True, False]})
+
+        cursor, _, mock_connect, _ = _run({"df": df}, load_data_local=True)
+
+        assert mock_connect.call_args.kwargs == {"local_infile": True}
+        sql, _ = cursor.statements[0]
+        assert sql.startswith("LOAD DATA LOCAL INFILE %s INTO TABLE `users`")
+        assert sql.endswith("(`id`, `note`, `flag`)")
+        assert cursor.loaded_files == ['1,"say ""hi""",1\n2,NULL,0\n']
+
+    def test_load_data_local_rejects_upsert(self):
+        with pytest.raises(ValueError, match="load_data_local"):
+            _run({"df": pd.DataFrame({"id": [1]})}, mode="upsert", upsert_keys=["id"], load_data_local=True)
+
+    def test_mysql_error_rolls_back(self):
+        cursor = _FakeCursor(fail_on="LOAD DATA")
+
+        with pytest.raises(RuntimeError, match="MySQL write failed"):
+            _run({"df": pd.DataFrame({"id": [1]})}, cursor=cursor, load_data_local=True)
+
+    def test_mysql_error_rollback_called(self):
+        cursor = _FakeCursor(fail_on="DELETE")
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        with (
+            patch.object(MySQLWriterDriver, "_connect", return_value=conn),
+            pytest.raises(RuntimeError),
+        ):
+            MySQLWriterDriver().run(
+                step_id="write-mysql",
+                config={"table": "users", "mode": "replace", "resolved_connection": CONNECTION},
+                inputs={"df": pd.DataFrame({"id": [1]})},
+            )
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        conn.close.assert_called_once()
+
+    def test_logs_throughput_metrics(self):
+        _, _, _, mock_metric = _run({"df": pd.DataFrame({"id": range(5)})}, ctx=MagicMock())
+
+        metrics = {call.args[0]: call.args[1] for call in mock_metric.call_args_list}
+        assert metrics["rows_written"] == 5
+        assert metrics["bytes_sent"] == 4096
+        assert metrics["rows_per_sec"] > 0
+
+    def test_create_table_infers_types(self):
+        df = pd.DataFrame({"id": [1], "name": ["a"], "ts": [pd.Timestamp("2024-01-01")]})
+
+        cursor, _, _, _ = _run({"df": df}, create_table=True, mode="upsert", upsert_keys=["name"])
+
+        assert cursor.statements[0] == (
+            "CREATE TABLE IF NOT EXISTS `users` (`id` BIGINT, `name` VARCHAR(255), `ts` DATETIME(6), "
+            "PRIMARY KEY (`name`))",
+            None,
+        )
+
+
+def test_frame_rows_converts_missing_and_numpy_values():
+    df = pd.DataFrame(
+        {
+            "f": [1.5, np.nan],
+            "ts": pd.to_datetime(["2024-01-01 12:00:00", None]),
+            "tz": pd.to_datetime(["2024-01-01 12:00:00+02:00", None]),
+            "obj": [np.int64(7), pd.NA],
+        }
+    )
+
+    rows = _frame_rows(df)
+
+    assert rows[0] == (1.5, datetime(2024, 1, 1, 12), datetime(2024, 1, 1, 10), 7)
+    assert type(rows[0][3]) is int
+    assert rows[1] == (None, None, None, None)
+
+
+def test_load_data_field_keeps_null_string_distinct():
+    assert _load_data_field(None) == "NULL"
+    assert _load_data_field("NULL") == '"NULL"'
+    assert _load_data_field("") == '""'
+    assert _load_data_field(datetime(2024, 1, 1, 8, 30)) == "2024-01-01 08:30:00"
+
+
+def _parse_load_data_file(text, sql):
+    """Read a LOAD DATA file back the way MySQL does for the statement the driver sent."""
+    targets = sql[sql.index("LINES TERMINATED BY") :].split("(", 1)[1].split(")", 1)[0].split(", ")
+    unhexed = {target for target in targets if target.startswith("@")}
+    rows = []
+    for line in text.splitlines():
+        enclosed = [field.startswith('"') for field in line.split(",")]
+        fields = next(csv.reader(io.StringIO(line)))
+        row = []
+        for target, field, quoted in zip(targets, fields, enclosed, strict=True):
+            value = None if field == "NULL" and not quoted else field
+            if target in unhexed and value is not None:
+                value = bytes.fromhex(value)
+            row.append(value)
+        rows.append(tuple(row))
+    return rows
+
+
+def test_load_data_round_trips_binary_and_aware_datetimes():
+    df = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "blob": [b'\x00\xff,"\n', None],
+            "seen": [pd.Timestamp("2024-01-01 12:00:00+02:00"), pd.Timestamp("2024-06-01 08:00:00", tz="UTC")],
+            "at": [datetime.fromisoformat("2024-01-01T12:00:00+02:00"), None],
+        }
+    ).astype({"at": object})
+
+    cursor, _, _, _ = _run({"df": df}, load_data_local=True)
+
+    sql, _ = cursor.statements[0]
+    assert sql.endswith("(`id`, @osiris_hex_1, `seen`, `at`) SET `blob` = UNHEX(@osiris_hex_1)")
+    assert _parse_load_data_file(cursor.loaded_files[0], sql) == [
+        ("1", b'\x00\xff,"\n', "2024-01-01 10:00:00", "2024-01-01 10:00:00"),
+        ("2", None, "2024-06-01 08:00:00", None),
+    ]
@@ -0,0 +1,205 @@
+"""Tests for concurrent PostHog client scans (event backfills, person_distinct_ids) against a local HTTP stand-in."""
+
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+import zlib
+
+import pytest
+
+from osiris.drivers.posthog_client import PostHogClient, TokenBucket
+
+SINCE = datetime(2025, 11, 1, tzinfo=UTC)
+UNTIL = datetime(2025, 11, 2, tzinfo=UTC)
+
+# Several events share a timestamp so SEEK pagination has to use the uuid tie-breaker
+EVENTS = sorted(
+    (
+        {
+            "uuid": f"uuid-{i:05d}",
+            "event": "$pageview",
+            "timestamp": (SINCE + timedelta(seconds=(i * 37) % 86400)).strftime("%Y-%m-%d %H:%M:%S"),
+            "distinct_id": f"user-{i % 7}",
+            "person_id": None,
+            "properties": {},
+        }
+        for i in range(1500)
+    ),
+    key=lambda e: (e["timestamp"], e["uuid"]),
+)
+COLUMNS = ["uuid", "event", "timestamp", "distinct_id", "person_id", "properties"]
+
+# Every id contains a quote or backslash, which must survive the keyset cursor literal
+DISTINCT_IDS = sorted(
+    ({"distinct_id": f"user-{i:04d}" + ("'" if i % 2 else "\\"), "person_id": f"person-{i // 3}"} for i in range(952)),
+    key=lambda r: r["distinct_id"],
+)
+
+
+class _HogQLStandIn(BaseHTTPRequestHandler):
+    """Answers the events queries built by PostHogClient.iterate_events from EVENTS."""
+
+    delay = 0.02
+    active = 0
+    max_active = 0
+    requests = 0
+    lock = threading.Lock()
+
+    def do_POST(self):  # noqa: N802 - BaseHTTPRequestHandler API
+        query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["query"]["query"]
+        cls = type(self)
+        with cls.lock:
+            cls.requests += 1
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        try:
+            time.sleep(cls.delay)
+            rows = self._select(query)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+        body = json.dumps({"columns": COLUMNS, "results": [[e[c] for c in COLUMNS] for e in rows]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def _select(query):
+        if "FROM person_distinct_ids" in query:
+            return _HogQLStandIn._select_distinct_ids(query)
+        since = re.search(r"timestamp >= toDateTime\('([^']+)'\)", query).group(1)
+        until = re.search(r"timestamp < toDateTime\('([^']+)'\)", query).group(1)
+        limit = int(re.search(r"LIMIT (\d+)", query).group(1))
+        seek = re.search(r"timestamp > toDateTime\('([^']+)'\) OR .* AND uuid > '([^']+)'", query)
+        rows = [e for e in EVENTS if since <= e["timestamp"] < until]
+        if seek:
+            cursor = (seek.group(1), seek.group(2))
+            rows = [e for e in rows if (e["timestamp"], e["uuid"]) > cursor]
+        return rows[:limit]
+
+    @staticmethod
+    def _select_distinct_ids(query):
+        assert "OFFSET" not in query
+        limit = int(re.search(r"LIMIT (\d+)", query).group(1))
+        rows = DISTINCT_IDS
+        partition = re.search(r"cityHash64\(distinct_id\) % (\d+) = (\d+)", query)
+        if partition:
+            count, index = int(partition.group(1)), int(partition.group(2))
+            rows = [r for r in rows if zlib.crc32(r["distinct_id"].encode()) % count == index]
+        seek = re.search(r"distinct_id > '((?:[^'\\]|\\.)*)'", query)
+        if seek:
+            last = re.sub(r"\\(.)", r"\1", seek.group(1))
+            rows = [r for r in rows if r["distinct_id"] > last]
+        return [{**r, "uuid": None, "event": None, "timestamp": None, "properties": None} for r in rows[:limit]]
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def posthog_server():
+    _HogQLStandIn.active = _HogQLStandIn.max_active = _HogQLStandIn.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HogQLStandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_backfill_matches_serial_order(posthog_server):
+    client = PostHogClient(posthog_server, "test-key", "123")
+    serial = list(client.iterate_events(SINCE, UNTIL, page_size=100))
+
+    client = PostHogClient(posthog_server, "test-key", "123")
+    backfill = list(
+        client.iterate_events_backfill(SINCE, UNTIL, windows=7, max_workers=4, page_size=100, requests_per_second=1000)
+    )
+
+    assert [e["uuid"] for e in serial] == [e["uuid"] for e in EVENTS]
+    assert [e["uuid"] for e in backfill] == [e["uuid"] for e in EVENTS]
+    assert _HogQLStandIn.max_active > 1
+
+
+def test_backfill_resumes_after_cursor(posthog_server):
+    cursor = EVENTS[999]
+    client = PostHogClient(posthog_server, "test-key", "123")
+
+    rows = list(
+        client.iterate_events_backfill(
+            SINCE,
+            UNTIL,
+            windows=4,
+            page_size=100,
+            last_timestamp=cursor["timestamp"],
+            last_uuid=cursor["uuid"],
+            requests_per_second=1000,
+        )
+    )
+
+    assert [e["uuid"] for e in rows] == [e["uuid"] for e in EVENTS[1000:]]
+
+
+def test_backfill_closing_early_stops_workers(posthog_server):
+    client = PostHogClient(posthog_server, "test-key", "123")
+    rows = client.iterate_events_backfill(SINCE, UNTIL, windows=4, page_size=100, requests_per_second=1000)
+
+    assert next(rows)["uuid"] == EVENTS[0]["uuid"]
+    rows.close()
+    time.sleep(0.3)
+    requests_after_close = _HogQLStandIn.requests
+    time.sleep(0.3)
+
+    assert _HogQLStandIn.requests == requests_after_close
+
+
+def test_split_time_range_uses_whole_seconds():
+    since = datetime(2025, 11, 1, 0, 0, 0, 500000, tzinfo=UTC)
+    until = datetime(2025, 11, 1, 0, 0, 10, tzinfo=UTC)
+
+    slices = PostHogClient._split_time_range(since, until, 3)
+
+    assert slices[0][0] == since.replace(microsecond=0)
+    assert slices[-1][1] == until
+    assert all(start.microsecond == 0 and start < end for start, end in slices)
+    assert all(a[1] == b[0] for a, b in zip(slices, slices[1:], strict=False))
+    assert len(PostHogClient._split_time_range(since, until, 100)) == 10
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_person_distinct_ids_keyset_scan(posthog_server):
+    client = PostHogClient(posthog_server, "test-key", "123")
+
+    rows = list(client.iterate_person_distinct_ids(page_size=100))
+
+    assert [r["distinct_id"] for r in rows] == [r["distinct_id"] for r in DISTINCT_IDS]
+    assert client.pages_fetched == 10
+
+
+def test_person_distinct_ids_partitioned_scan(posthog_server):
+    client = PostHogClient(posthog_server, "test-key", "123")
+
+    rows = list(
+        client.iterate_person_distinct_ids(page_size=100, partitions=4, max_workers=4, requests_per_second=1000)
+    )
+
+    assert sorted(r["distinct_id"] for r in rows) == [r["distinct_id"] for r in DISTINCT_IDS]
+    assert len(rows) == len(DISTINCT_IDS)
+    assert _HogQLStandIn.max_active > 1
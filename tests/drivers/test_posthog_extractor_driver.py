@@ -956,6 +956,73 @@ class TestRun:
         assert call_kwargs["last_timestamp"] == "2025-11-08T17:00:00Z"
         assert call_kwargs["last_uuid"] == "existing-uuid"
 
+    @patch("osiris.drivers.posthog_extractor_driver.PostHogClient")
+    def test_run_streaming_checkpoints_every_n_pages(self, mock_client_class):
+        """Test that streamed extraction checkpoints the cursor after every N pages"""
+        mock_client = Mock()
+        events = [
+            {"uuid": f"uuid-{i}", "event": "$pageview", "timestamp": f"2025-11-08T10:{i // 60:02d}:{i % 60:02d}Z"}
+            for i in range(2500)
+        ]
+        mock_client.iterate_events.return_value = iter(events)
+        mock_client_class.return_value = mock_client
+
+        ctx = Mock()
+        ctx.streaming = True
+
+        config = {
+            "resolved_connection": {"api_key": "test-key", "project_id": "12345", "region": "us"},
+            "data_type": "events",
+            "page_size": 500,
+            "checkpoint_every_pages": 2,
+        }
+
+        result = run(step_id="test", config=config, inputs={}, ctx=ctx)
+        assert ctx.checkpoint.call_count == 0  # Nothing is extracted before the stream is consumed
+
+        rows = sum(len(chunk) for chunk in result["df"].iter_batches())
+
+        assert rows == 2500
+        # Chunks of 1000 rows, checkpoint every 1000: the trailing 500 rows are only in the final state
+        checkpoints = [call.args[0] for call in ctx.checkpoint.call_args_list]
+        assert [cp["events_state"]["last_uuid"] for cp in checkpoints] == ["uuid-999", "uuid-1999"]
+        assert result["state"]["events_state"]["last_uuid"] == "uuid-2499"
+
+    def test_run_invalid_checkpoint_every_pages(self):
+        """Test run() with negative checkpoint_every_pages"""
+        config = {
+            "resolved_connection": {"api_key": "test-key", "project_id": "12345"},
+            "checkpoint_every_pages": -1,
+        }
+
+        with pytest.raises(OsirisDriverError, match="checkpoint_every_pages"):
+            run(step_id="test", config=config, inputs={}, ctx=Mock())
+
+    @patch("osiris.drivers.posthog_extractor_driver.PostHogClient")
+    def test_run_events_backfill_windows(self, mock_client_class):
+        """Test that backfill_windows routes events through the time-sliced backfill"""
+        mock_client = Mock()
+        mock_client.iterate_events_backfill.return_value = iter(
+            [{"uuid": "uuid-1", "event": "$pageview", "timestamp": "2025-11-08T10:00:00Z"}]
+        )
+        mock_client_class.return_value = mock_client
+
+        config = {
+            "resolved_connection": {"api_key": "test-key", "project_id": "12345", "region": "us"},
+            "data_type": "events",
+            "backfill_windows": 8,
+            "backfill_workers": 2,
+        }
+
+        result = run(step_id="test", config=config, inputs={}, ctx=Mock())
+
+        assert len(result["df"]) == 1
+        mock_client.iterate_events.assert_not_called()
+        call_kwargs = mock_client.iterate_events_backfill.call_args.kwargs
+        assert call_kwargs["windows"] == 8
+        assert call_kwargs["max_workers"] == 2
+        assert call_kwargs["requests_per_second"] is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+"""Tests for concurrent batch uploads in SupabaseWriterDriver."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from osiris.drivers import supabase_writer_driver
+from osiris.drivers.supabase_writer_driver import SupabaseWriterDriver, _AdaptiveThrottle, _http_status
+
+pytestmark = pytest.mark.supabase
+
+
+class _ThrottledError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.response = MagicMock(status_code=status_code, headers={"Retry-After": "0"})
+
+
+class _RecordingTable:
+    """Stands in for ``client.table(name)``; records concurrency and sent batches."""
+
+    def __init__(self, delays=None, failures=None):
+        self.delays = delays or {}
+        self.failures = failures or {}
+        self.sent: list[list[dict]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def select(self, *_columns):
+        return MagicMock()  # Existence probe
+
+    def insert(self, batch):
+        request = MagicMock()
+        request.execute.side_effect = lambda: self._execute(batch)
+        return request
+
+    def _execute(self, batch):
+        first = batch[0]["col1"]
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # conftest stubs time.sleep for Supabase tests
+            threading.Event().wait(self.delays.get(first, 0.01))
+            with self._lock:
+                if self.failures.get(first):
+                    self.failures[first] -= 1
+                    raise _ThrottledError(429)
+                self.sent.append(batch)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _run(table, df, *, concurrency, ctx=None, **config):
+    client = MagicMock()
+    client.__enter__ = MagicMock(return_value=client)
+    client.__exit__ = MagicMock(return_value=None)
+    client.table.return_value = table
+
+    with patch.object(supabase_writer_driver, "SupabaseClient", return_value=client):
+        return SupabaseWriterDriver().run(
+            step_id="load",
+            config={
+                "resolved_connection": {"url": "http://test", "key": "test"},
+                "table": "test_table",
+                "batch_size": 2,
+                "concurrency": concurrency,
+                **config,
+            },
+            inputs={"df_upstream": df},
+            ctx=ctx,
+        )
+
+
+@pytest.fixture(autouse=True)
+def _real_client(monkeypatch):
+    monkeypatch.setenv("OSIRIS_TEST_SUPABASE_FORCE_REAL_CLIENT", "1")
+    monkeypatch.setenv("RETRY_MAX_ATTEMPTS", "3")
+    monkeypatch.setenv("RETRY_BASE_SLEEP", "0.01")
+
+
+def test_keeps_up_to_concurrency_batches_in_flight():
+    table = _RecordingTable(delays={0: 0.05, 2: 0.05, 4: 0.05})
+
+    _run(table, pd.DataFrame({"col1": range(20)}), concurrency=3)
+
+    assert table.max_in_flight == 3
+    assert sorted(row["col1"] for batch in table.sent for row in batch) == list(range(20))
+
+
+def test_progress_is_accounted_in_batch_order():
+    # The first batch finishes last, so no progress may be reported before it completes
+    table = _RecordingTable(delays={0: 0.2})
+
+    with patch.object(supabase_writer_driver, "log_event") as mock_log_event:
+        _run(table, pd.DataFrame({"col1": range(40)}), concurrency=4, ctx=MagicMock())
+
+    progress = [c.kwargs["rows_written"] for c in mock_log_event.call_args_list if c.args[0] == "write.progress"]
+    assert progress == [20, 40]
+    assert table.sent[-1][0]["col1"] == 0
+
+
+def test_throttled_batch_is_retried():
+    table = _RecordingTable(failures={4: 2})
+
+    with patch.object(supabase_writer_driver, "log_metric") as mock_log_metric:
+        _run(table, pd.DataFrame({"col1": range(10)}), concurrency=2, ctx=MagicMock())
+
+    mock_log_metric.assert_any_call("rows_written", 10, step_id="load")
+    assert sorted(batch[0]["col1"] for batch in table.sent) == [0, 2, 4, 6, 8]
+
+
+def test_batch_failure_after_retries_fails_step(monkeypatch):
+    monkeypatch.setenv("RETRY_MAX_ATTEMPTS", "2")
+    table = _RecordingTable(failures={2: 5})
+
+    with pytest.raises(RuntimeError, match="Batch 1 failed after 2 attempts"):
+        _run(table, pd.DataFrame({"col1": range(10)}), concurrency=2)
+
+
+def test_invalid_concurrency_rejected():
+    with pytest.raises(ValueError, match="'concurrency' must be a positive integer"):
+        _run(_RecordingTable(), pd.DataFrame({"col1": [1]}), concurrency=0)
+
+
+def test_throttle_halves_limit_and_recovers():
+    throttle = _AdaptiveThrottle(max_in_flight=8, base_delay=0.0)
+
+    throttle.acquire()
+    throttle.release(throttled=True, retry_after=0)
+    assert throttle.limit == 4
+
+    for _ in range(4):
+        throttle.acquire()
+        throttle.release()
+    assert throttle.limit == 5
+
+
+def test_http_status_extraction():
+    assert _http_status(_ThrottledError(503)) == 503
+    assert _http_status(type("APIError", (Exception,), {"code": "429"})()) == 429
+    assert _http_status(ValueError("boom")) is None
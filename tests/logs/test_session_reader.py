@@ -3,10 +3,13 @@
 
 import json
 from pathlib import Path
+import shutil
 import tempfile
 
 import pytest
 
+from osiris.core.session_index import SESSION_INDEX_FILENAME, SessionIndex
+from osiris.core.session_logging import SessionContext
 from osiris.core.session_reader import SessionReader
 
 
@@ -325,6 +328,76 @@ class TestSessionReader:
         assert [s.session_id for s in sessions2] == [s.session_id for s in sessions3]
 
 
+class TestSessionIndex:
+    """Test the session index behind list_sessions."""
+
+    def test_index_matches_scan(self, temp_logs_dir):
+        """Indexed listings match a full scan, with and without filters."""
+        indexed = SessionReader(str(temp_logs_dir))
+        scanned = SessionReader(str(temp_logs_dir), use_index=False)
+
+        for kwargs in [{}, {"limit": 2}, {"status": "failed"}, {"label": "test"}, {"since": "2025-01-01T11:00:00Z"}]:
+            assert indexed.list_sessions(**kwargs) == scanned.list_sessions(**kwargs), kwargs
+        assert (temp_logs_dir / SESSION_INDEX_FILENAME).exists()
+
+    def test_filters(self, temp_logs_dir):
+        """Status, pipeline, label and since filters are applied by the index."""
+        reader = SessionReader(str(temp_logs_dir))
+
+        assert [s.session_id for s in reader.list_sessions(status="failed")] == ["session_002"]
+        assert [s.session_id for s in reader.list_sessions(pipeline="test_pipeline_session_001")] == ["session_001"]
+        assert [s.session_id for s in reader.list_sessions(since="2025-01-01T11:00:00Z")] == [
+            "session_003",
+            "session_002",
+        ]
+        assert reader.list_sessions(label="missing") == []
+
+    def test_indexed_sessions_are_not_reread(self, temp_logs_dir, monkeypatch):
+        """Unchanged sessions are served from the index without reading their logs."""
+        reader = SessionReader(str(temp_logs_dir))
+        expected = reader.list_sessions()
+
+        def fail(session_id):
+            raise AssertionError(f"read_session({session_id}) called for an indexed session")
+
+        monkeypatch.setattr(reader, "read_session", fail)
+        assert reader.list_sessions() == expected
+
+    def test_changed_and_removed_sessions(self, temp_logs_dir):
+        """Sessions changed on disk are re-read and deleted ones are dropped."""
+        reader = SessionReader(str(temp_logs_dir))
+        assert reader.list_sessions()[0].status == "running"
+
+        with open(temp_logs_dir / "session_003" / "events.jsonl", "a") as f:
+            f.write(json.dumps({"ts": "2025-01-01T12:04:00Z", "event": "run_end", "status": "completed"}) + "\n")
+        shutil.rmtree(temp_logs_dir / "session_001")
+
+        sessions = reader.list_sessions()
+
+        assert [s.session_id for s in sessions] == ["session_003", "session_002"]
+        assert sessions[0].status != "running"
+        assert sessions == SessionReader(str(temp_logs_dir), use_index=False).list_sessions()
+        assert set(reader.index.signatures()) == {"session_002", "session_003"}
+
+    def test_corrupt_index_falls_back_to_scan(self, temp_logs_dir):
+        """An unreadable index file does not break listing."""
+        (temp_logs_dir / SESSION_INDEX_FILENAME).write_text("not a database")
+
+        sessions = SessionReader(str(temp_logs_dir)).list_sessions()
+
+        assert [s.session_id for s in sessions] == ["session_003", "session_002", "session_001"]
+
+    def test_closed_session_is_indexed(self, tmp_path):
+        """SessionContext.close() stores the session in the index of its logs directory."""
+        session = SessionContext(session_id="closed_session", base_logs_dir=tmp_path)
+        session.log_event("step_complete", step_id="extract")
+        session.close()
+
+        assert "closed_session" in SessionIndex(tmp_path / SESSION_INDEX_FILENAME).signatures()
+        (summary,) = SessionReader(str(tmp_path)).list_sessions()
+        assert summary.session_id == "closed_session"
+
+
 class TestRedaction:
     """Test sensitive data redaction."""
 
@@ -0,0 +1,94 @@
+"""Tests for the persistent CLI worker pool used by the MCP CLI bridge."""
+
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from osiris.mcp import cli_bridge, cli_worker
+from osiris.mcp.cli_worker import CLIWorkerPool
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+pytestmark = pytest.mark.skipif(not CLIWorkerPool.is_supported(), reason="CLI workers require POSIX pipes")
+
+
+@pytest.fixture
+def pool():
+    pool = CLIWorkerPool(size=1, max_requests=2)
+    yield pool
+    pool.shutdown()
+
+
+def _version(pool, env=None):
+    result = pool.execute(["--version", "--json"], cwd=REPO_ROOT, env=env or os.environ.copy(), timeout_s=30)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+def _worker_pids(pool):
+    return [worker.process.pid for worker in pool._idle]
+
+
+def test_worker_is_reused_then_recycled(pool):
+    pool.prestart(REPO_ROOT, os.environ.copy())
+    first_pid = _worker_pids(pool)
+
+    assert _version(pool)["version"].startswith("v")
+    assert _worker_pids(pool) == first_pid
+
+    # Second request exhausts max_requests; a replacement worker is started
+    _version(pool)
+    assert len(_worker_pids(pool)) == 1
+    assert _worker_pids(pool) != first_pid
+
+
+def test_environment_change_replaces_worker(pool):
+    _version(pool)
+    first_pid = _worker_pids(pool)
+
+    _version(pool, env={**os.environ, "OSIRIS_TEST_MARKER": "changed"})
+
+    assert _worker_pids(pool) != first_pid
+
+
+def test_exit_code_and_stderr_are_forwarded(pool):
+    result = pool.execute(["no-such-command", "--json"], cwd=REPO_ROOT, env=os.environ.copy(), timeout_s=30)
+
+    assert result.returncode == 1
+    assert json.loads(result.stdout)["error"] == "Unknown command: no-such-command"
+
+
+@pytest.mark.asyncio
+async def test_run_cli_json_uses_worker_pool():
+    try:
+        with patch("osiris.mcp.cli_bridge.ensure_base_path", return_value=REPO_ROOT):
+            cli_bridge.start_worker_pool(size=1)
+            with patch("subprocess.run", side_effect=AssertionError("subprocess fallback used")):
+                result = await cli_bridge.run_cli_json(["--version"])
+    finally:
+        cli_bridge.stop_worker_pool()
+
+    assert result["version"].startswith("v")
+    assert result["_meta"]["cli_command"] == "--version"
+
+
+def test_worker_that_never_gets_ready_is_not_reused(pool, monkeypatch):
+    popen = cli_worker.subprocess.Popen
+
+    def silent_worker(args, **kwargs):
+        # Stub worker: starts but never sends the ready handshake
+        return popen([sys.executable, "-c", "import time; time.sleep(60)"], **kwargs)
+
+    monkeypatch.setattr(cli_worker.subprocess, "Popen", silent_worker)
+    monkeypatch.setattr(cli_worker, "DEFAULT_STARTUP_TIMEOUT_S", 0.2)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        pool.execute(["--version", "--json"], cwd=REPO_ROOT, env=os.environ.copy(), timeout_s=30)
+
+    assert pool._idle == []
+    assert pool._busy == 0
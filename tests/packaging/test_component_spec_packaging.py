@@ -12,6 +12,22 @@ import sys
 import pytest
 import yaml
 
+SANDBOX_MODULES = ("proxy_worker", "rpc_protocol")
+
+
+def _restore_modules(original_modules: dict) -> None:
+    """Drop the sandbox imports and put back the modules the rest of the suite already holds."""
+    for module_name in list(sys.modules.keys()):
+        if module_name.startswith("osiris") or module_name in SANDBOX_MODULES:
+            del sys.modules[module_name]
+    sys.modules.update(
+        {
+            name: module
+            for name, module in original_modules.items()
+            if name.startswith("osiris") or name in SANDBOX_MODULES
+        }
+    )
+
 
 def test_component_spec_packaging_locally(tmp_path):
     """Test that component specs can be packaged and loaded locally."""
@@ -31,7 +47,10 @@ def test_component_spec_packaging_locally(tmp_path):
         "core/driver.py",
         "core/execution_adapter.py",
         "core/session_logging.py",
+        "core/log_sink.py",
         "core/redaction.py",
+        "core/spill.py",
+        "core/duckdb_session.py",
         "components/__init__.py",
         "components/registry.py",
         "components/error_mapper.py",
@@ -64,11 +83,13 @@ def test_component_spec_packaging_locally(tmp_path):
 
     # Add sandbox to Python path (simulating E2B PYTHONPATH)
     original_path = sys.path.copy()
+    original_modules = sys.modules.copy()
     try:
         sys.path.insert(0, str(sandbox_dir))
 
         # Try to import the modules
         import importlib
+        import importlib.util
 
         import_success = True
         import_errors = []
@@ -125,10 +146,7 @@ def test_component_spec_packaging_locally(tmp_path):
     finally:
         # Restore original Python path
         sys.path = original_path
-        # Clean up imported modules
-        for module_name in list(sys.modules.keys()):
-            if module_name.startswith("osiris"):
-                del sys.modules[module_name]
+        _restore_modules(original_modules)
 
 
 def test_component_spec_format(tmp_path):
@@ -200,7 +218,10 @@ def test_simulated_e2b_upload(tmp_path):
         "core/driver.py",
         "core/execution_adapter.py",
         "core/session_logging.py",
+        "core/log_sink.py",
         "core/redaction.py",
+        "core/spill.py",
+        "core/duckdb_session.py",
         "components/__init__.py",
         "components/registry.py",
         "components/error_mapper.py",
@@ -225,6 +246,14 @@ def test_simulated_e2b_upload(tmp_path):
     for init_path in init_paths:
         init_path.write_text("# Package init\n")
 
+    # Upload the RPC protocol and the worker, patched to import it locally
+    rpc_protocol = osiris_src / "remote" / "rpc_protocol.py"
+    shutil.copy(rpc_protocol, home_user / "rpc_protocol.py")
+    shutil.copy(rpc_protocol, osiris_dst / "remote" / "rpc_protocol.py")
+    worker_code = (osiris_src / "remote" / "proxy_worker.py").read_text()
+    patched_worker_code = worker_code.replace("from osiris.remote.rpc_protocol import", "from rpc_protocol import")
+    (home_user / "proxy_worker.py").write_text(patched_worker_code)
+
     # Copy driver files
     drivers_src = osiris_src / "drivers"
     drivers_dst = osiris_dst / "drivers"
@@ -257,18 +286,28 @@ def test_simulated_e2b_upload(tmp_path):
 
     # Add to Python path and test imports
     original_path = sys.path.copy()
+    original_modules = sys.modules.copy()
     try:
         sys.path.insert(0, str(home_user))
 
         # Clean existing imports
         for module_name in list(sys.modules.keys()):
-            if module_name.startswith("osiris"):
+            if module_name.startswith("osiris") or module_name in SANDBOX_MODULES:
                 del sys.modules[module_name]
 
         # Test imports work
         import importlib
-
-        modules_to_test = ["osiris", "osiris.components", "osiris.components.registry", "osiris.core.driver"]
+        import importlib.util
+
+        modules_to_test = [
+            "osiris",
+            "osiris.components",
+            "osiris.components.registry",
+            "osiris.core.driver",
+            "proxy_worker",
+        ]
+        if importlib.util.find_spec("duckdb") is not None:
+            modules_to_test.append("osiris.drivers.duckdb_processor_driver")
 
         for module_name in modules_to_test:
             try:
@@ -289,7 +328,4 @@ def test_simulated_e2b_upload(tmp_path):
     finally:
         # Restore Python path
         sys.path = original_path
-        # Clean up modules
-        for module_name in list(sys.modules.keys()):
-            if module_name.startswith("osiris"):
-                del sys.modules[module_name]
+        _restore_modules(original_modules)
@@ -0,0 +1,315 @@
+"""
+Parity check and benchmark for the single-pass AIOP builder.
+
+``build_aiop`` streams events and metrics: metrics are aggregated as they arrive,
+the timeline keeps only its first and last events once it outgrows the size
+budget, and sizes are accounted for instead of re-serializing the document.
+Output must be identical to building every section from the full lists and
+truncating with the previous ``apply_truncation`` (deepcopy + re-serialize after
+every step), which is kept here as the reference.
+
+Run with the timings printed: pytest tests/performance/test_aiop_streaming.py -s
+"""
+
+import copy
+from datetime import UTC, datetime, timedelta
+import time
+import tracemalloc
+
+import pytest
+
+from osiris.core.run_export_v2 import (
+    _extract_errors,
+    _json_size,
+    aggregate_metrics,
+    apply_truncation,
+    build_aiop,
+    build_timeline,
+    canonicalize_json,
+    redact_secrets,
+)
+
+STEPS = [f"step-{i:02d}" for i in range(12)] + ["export-totals"]
+
+
+def _legacy_apply_truncation(data: dict, max_bytes: int) -> tuple[dict, bool]:  # noqa: PLR0912, PLR0915
+    """apply_truncation as shipped before the size accounting."""
+
+    def size(doc):
+        return len(canonicalize_json(doc).encode("utf-8"))
+
+    current_size = size(data)
+    if current_size <= max_bytes:
+        return data, False
+
+    result = copy.deepcopy(data)
+    was_truncated = False
+    ratio = current_size / max_bytes
+    keep_count = 5 if ratio > 10 else 10 if ratio > 5 else 20 if ratio > 2 else 50 if ratio > 1.5 else 100
+
+    if "evidence" in result and "timeline" in result["evidence"]:
+        timeline = result["evidence"]["timeline"]
+        if isinstance(timeline, list) and len(timeline) > keep_count * 2:
+            kept_events = timeline[:keep_count] + timeline[-keep_count:]
+            result["evidence"]["timeline"] = {
+                "items": kept_events,
+                "truncated": True,
+                "dropped_events": len(timeline) - len(kept_events),
+            }
+            was_truncated = True
+
+    if size(result) <= max_bytes:
+        return result, was_truncated
+
+    if "evidence" in result and "metrics" in result["evidence"]:
+        metrics = result["evidence"]["metrics"]
+        if "steps" in metrics and len(metrics["steps"]) > 10:
+            original_step_count = len(metrics["steps"])
+            metrics["steps"] = dict(list(metrics["steps"].items())[:10])
+            metrics["truncated"] = True
+            metrics["aggregates_only"] = True
+            metrics["dropped_series"] = original_step_count - 10
+            was_truncated = True
+        if size(result) > max_bytes and "steps" in metrics:
+            dropped_count = len(metrics.get("steps", {}))
+            del metrics["steps"]
+            metrics["truncated"] = True
+            metrics["aggregates_only"] = True
+            metrics["dropped_series"] = dropped_count
+            was_truncated = True
+
+    if size(result) <= max_bytes:
+        return result, was_truncated
+
+    if "evidence" in result and "artifacts" in result["evidence"]:
+        artifacts = result["evidence"]["artifacts"]
+        if isinstance(artifacts, list) and len(artifacts) > 10:
+            result["evidence"]["artifacts"] = {"files": artifacts[:10], "truncated": True, "content_omitted": True}
+            was_truncated = True
+
+    current_size = size(result)
+    while current_size > max_bytes:
+        if "evidence" in result and "timeline" in result["evidence"]:
+            timeline = result["evidence"]["timeline"]
+            if isinstance(timeline, list):
+                kept_items = timeline[:5] + timeline[-5:] if len(timeline) > 10 else timeline
+                result["evidence"]["timeline"] = {
+                    "items": kept_items,
+                    "truncated": True,
+                    "dropped_events": len(timeline) - len(kept_items),
+                }
+                was_truncated = True
+                timeline = result["evidence"]["timeline"]
+            if isinstance(timeline, dict) and "items" in timeline:
+                items = timeline["items"]
+                if len(items) > 10:
+                    timeline["items"] = items[:5] + items[-5:]
+                    timeline["dropped_events"] = timeline.get("dropped_events", 0) + (len(items) - 10)
+                elif len(items) > 2:
+                    timeline["items"] = [items[0], items[-1]]
+                    timeline["dropped_events"] = timeline.get("dropped_events", 0) + (len(items) - 2)
+                else:
+                    timeline["items"] = []
+                    timeline["dropped_events"] = timeline.get("dropped_events", 0) + len(items)
+                    timeline["all_dropped"] = True
+                was_truncated = True
+        if "evidence" in result and "artifacts" in result["evidence"]:
+            artifacts = result["evidence"]["artifacts"]
+            if isinstance(artifacts, list) or isinstance(artifacts, dict) and artifacts.get("files"):
+                result["evidence"]["artifacts"] = {
+                    "files": [],
+                    "truncated": True,
+                    "content_omitted": True,
+                    "all_dropped": True,
+                }
+                was_truncated = True
+        if "evidence" in result and "errors" in result["evidence"] and result["evidence"]["errors"]:
+            result["evidence"]["errors"] = []
+            was_truncated = True
+        new_size = size(result)
+        if new_size >= current_size:
+            break
+        current_size = new_size
+
+    return result, was_truncated
+
+
+def _iso(start: datetime, ms: int) -> str:
+    return (start + timedelta(milliseconds=ms)).isoformat()
+
+
+def _run_events(batches: int):
+    """Events of a long run: per-step batches, progress noise, a few errors, slightly out of order."""
+    start = datetime(2025, 10, 1, 8, 0, tzinfo=UTC)
+    yield {"ts": _iso(start, 0), "event": "run_start", "event_type": "RUN_START", "timestamp": _iso(start, 0)}
+    for batch in range(batches):
+        step_id = STEPS[batch % len(STEPS)]
+        ms = 10 * batch + 1
+        # Every 7th batch is logged a little late, so arrival order is not chronological
+        ts = _iso(start, ms - 25 if batch % 7 == 0 and batch > 3 else ms)
+        if batch % len(STEPS) == 0:
+            yield {"ts": ts, "event": "step_start", "event_type": "STEP_START", "step_id": step_id, "timestamp": ts}
+        yield {"ts": ts, "event": "batch_metrics", "step_id": step_id, "rows": batch % 500, "cursor": f"c{batch}"}
+        yield {"ts": ts, "event": "write_progress", "step_id": step_id, "pct": batch % 100, "note": "café ✓"}
+        if batch % 997 == 0:
+            yield {"ts": ts, "event": "step_error", "step_id": step_id, "error": f"retry {batch}", "level": "ERROR"}
+        if batch % len(STEPS) == len(STEPS) - 1:
+            yield {
+                "ts": ts,
+                "event": "step_complete",
+                "event_type": "STEP_COMPLETE",
+                "step_id": step_id,
+                "timestamp": ts,
+            }
+    end = _iso(start, 10 * batches + 5)
+    yield {"ts": end, "event": "cleanup_complete", "total_rows": 12345, "password": "hunter2"}
+    yield {"ts": end, "event": "run_complete", "event_type": "RUN_COMPLETE", "timestamp": end}
+
+
+def _run_metrics(batches: int):
+    for batch in range(batches):
+        step_id = STEPS[batch % len(STEPS)]
+        yield {"step_id": step_id, "metric": "rows_read", "value": 10 + batch % 90}
+        yield {"step_id": step_id, "rows_written": batch % 50, "duration_ms": 1.5 + batch % 3}
+
+
+def _config(max_bytes: int, density: str) -> dict:
+    return {"max_core_bytes": max_bytes, "timeline_density": density, "metrics_topk": 100}
+
+
+SESSION = {"session_id": "run_streaming", "status": "completed", "started_at": "2025-10-01T08:00:00+00:00"}
+MANIFEST = {"name": "streaming", "manifest_hash": "abc123", "steps": [{"id": s, "component": "x"} for s in STEPS]}
+
+
+def _reference_aiop(aiop: dict, batches: int, config: dict) -> dict:
+    """Rebuild ``aiop`` from fully materialized sections, truncated the previous way."""
+    events = [redact_secrets(event) for event in _run_events(batches)]
+    metrics = [redact_secrets(metric) for metric in _run_metrics(batches)]
+    timeline = build_timeline(events, density=config["timeline_density"])
+    evidence = {
+        "timeline": timeline,
+        "metrics": aggregate_metrics(metrics, topk=config["metrics_topk"], events=events),
+        "errors": _extract_errors(events),
+        "artifacts": [],
+    }
+    metadata = {key: value for key, value in aiop["metadata"].items() if key != "size_bytes"}
+    metadata["truncated"] = False
+    assert metadata["size_hints"]["timeline_events"] == len(timeline)
+
+    reference, was_truncated = _legacy_apply_truncation(
+        {**aiop, "evidence": evidence, "metadata": metadata}, config["max_core_bytes"]
+    )
+    if was_truncated:
+        reference["metadata"]["truncated"] = True
+    reference["metadata"]["size_bytes"] = len(canonicalize_json(reference).encode("utf-8"))
+    return reference
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    # build_aiop looks up previous runs and chat logs relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "batches,max_bytes,density",
+    [
+        (40, 300_000, "medium"),  # fits, nothing truncated
+        (400, 60_000, "high"),  # truncated, whole timeline still held
+        (6000, 300_000, "high"),  # timeline window bounded to its first and last events
+        (6000, 90_000, "medium"),
+        (6000, 8_000, "low"),  # down to the aggressive loop
+    ],
+)
+def test_streaming_build_matches_full_build(batches, max_bytes, density):
+    config = _config(max_bytes, density)
+    aiop = build_aiop(SESSION, MANIFEST, _run_events(batches), _run_metrics(batches), [], config)
+
+    assert aiop == _reference_aiop(aiop, batches, config)
+
+
+def test_apply_truncation_matches_legacy():
+    events = [redact_secrets(event) for event in _run_events(3000)]
+    evidence = {
+        "timeline": build_timeline(events, density="high"),
+        "metrics": aggregate_metrics(list(_run_metrics(3000)), topk=100, events=events),
+        "errors": _extract_errors(events),
+        "artifacts": [{"@id": f"artifact.{i}", "path": f"out/{i}.csv", "size_bytes": i} for i in range(25)],
+    }
+    document = {"@context": "x", "evidence": evidence, "metadata": {"nested": {"empty": {}, "list": []}}}
+    snapshot = copy.deepcopy(document)
+
+    for max_bytes in (10**7, 1_000_000, 700_000, 300_000, 100_000, 20_000, 5_000, 500, 10):
+        assert apply_truncation(document, max_bytes) == _legacy_apply_truncation(document, max_bytes), max_bytes
+    assert document == snapshot
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        [],
+        {"a": [], "b": {}, "c": [{}], "d": None, "e": 1.5, "f": True},
+        {"unicode": "café ✓ \U0001f600", "ctrl": "tab\there\n", "nested": [[1, [2, [3, {}]]], (4, 5)]},
+        "scalar",
+    ],
+)
+def test_json_size_matches_canonical_json(value):
+    def canonical_size(doc):
+        return len(canonicalize_json(doc).encode("utf-8"))
+
+    for depth in range(4):
+        document, placeholder = value, 0
+        for _ in range(depth):
+            document, placeholder = {"k": document}, {"k": placeholder}
+        assert _json_size(document) == canonical_size(document)
+        # The value's share of the document, at its nesting depth
+        assert _json_size(value, depth) == canonical_size(document) - canonical_size(placeholder) + 1
+
+
+def _legacy_evidence_pass(batches: int, config: dict, rest: dict) -> dict:
+    events = [redact_secrets(event) for event in list(_run_events(batches))]
+    metrics = [redact_secrets(metric) for metric in list(_run_metrics(batches))]
+    evidence = {
+        "timeline": build_timeline(events, density=config["timeline_density"]),
+        "metrics": aggregate_metrics(metrics, topk=config["metrics_topk"], events=events),
+        "errors": _extract_errors(events),
+        "artifacts": [],
+    }
+    aiop, _ = _legacy_apply_truncation({**rest, "evidence": evidence}, config["max_core_bytes"])
+    aiop["metadata"]["size_bytes"] = len(canonicalize_json(aiop).encode("utf-8"))
+    return aiop
+
+
+def _measure(func) -> tuple[float, int]:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def test_streaming_build_benchmark():
+    batches = 15_000
+    config = _config(300_000, "high")
+    streamed = build_aiop(SESSION, MANIFEST, _run_events(batches), _run_metrics(batches), [], config)
+    rest = {key: value for key, value in streamed.items() if key != "evidence"}
+
+    # The legacy figure only covers the evidence pass and truncation, the streaming one the whole build
+    legacy_s, legacy_peak = _measure(lambda: _legacy_evidence_pass(batches, config, copy.deepcopy(rest)))
+    streaming_s, streaming_peak = _measure(
+        lambda: build_aiop(SESSION, MANIFEST, _run_events(batches), _run_metrics(batches), [], config)
+    )
+
+    print(
+        f"\n{batches} batches: legacy {legacy_s:.2f}s / {legacy_peak / 2**20:.1f} MiB peak, "
+        f"streaming {streaming_s:.2f}s / {streaming_peak / 2**20:.1f} MiB peak "
+        f"({legacy_s / streaming_s:.1f}x faster, {legacy_peak / streaming_peak:.0f}x less memory)"
+    )
+    assert streaming_s < legacy_s
+    assert streaming_peak * 10 < legacy_peak
@@ -0,0 +1,77 @@
+"""
+Latency comparison: one-shot CLI subprocess vs. persistent CLI worker.
+
+The MCP CLI bridge used to start ``python osiris.py ... --json`` for every tool
+call, paying interpreter startup and CLI imports each time. ``CLIWorkerPool``
+keeps workers that imported the CLI once and answer requests over a pipe.
+
+Both paths run the same tool command from the repository root; the worker must
+be at least twice as fast at the median (locally ~600-900ms vs. ~20ms per call), which
+only trips when requests stop being served by the warm worker.
+
+Run with the timings printed: pytest tests/performance/test_cli_worker_latency.py -s
+"""
+
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+from osiris.mcp.cli_worker import CLIWorkerPool
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+COMMAND = ["mcp", "connections", "list", "--json"]
+CALLS = 10
+
+pytestmark = pytest.mark.skipif(not CLIWorkerPool.is_supported(), reason="CLI workers require POSIX pipes")
+
+
+def _timed(call) -> float:
+    start = time.perf_counter()
+    result = call()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    assert result.returncode == 0, result.stderr
+    return elapsed_ms
+
+
+def test_worker_pool_beats_one_shot_subprocess():
+    env = os.environ.copy()
+
+    def one_shot():
+        return subprocess.run(  # noqa: S603 - fixed interpreter and script
+            [sys.executable, "osiris.py", *COMMAND],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=60,
+            cwd=REPO_ROOT,
+            env=env,
+        )
+
+    pool = CLIWorkerPool(size=1, max_requests=CALLS + 1)
+    try:
+        pool.prestart(REPO_ROOT, env)
+
+        def pooled():
+            return pool.execute(COMMAND, cwd=REPO_ROOT, env=env, timeout_s=60)
+
+        # Warm up both paths (filesystem caches, worker handshake)
+        _timed(one_shot)
+        _timed(pooled)
+
+        subprocess_ms = [_timed(one_shot) for _ in range(CALLS)]
+        worker_ms = [_timed(pooled) for _ in range(CALLS)]
+    finally:
+        pool.shutdown()
+
+    subprocess_p50, worker_p50 = statistics.median(subprocess_ms), statistics.median(worker_ms)
+    print(f"\nOne-shot subprocess: p50 {subprocess_p50:.1f}ms, max {max(subprocess_ms):.1f}ms")
+    print(f"Persistent worker:   p50 {worker_p50:.1f}ms, max {max(worker_ms):.1f}ms")
+    print(f"Speedup: {subprocess_p50 / worker_p50:.1f}x")
+
+    assert worker_p50 * 2 <= subprocess_p50
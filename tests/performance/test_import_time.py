@@ -0,0 +1,95 @@
+"""
+Import-time budget for the `osiris` package and CLI entry point.
+
+`osiris --help`, `osiris --version` and MCP-bridged CLI calls only need the
+argument parser. Connectors, pandas, SQLAlchemy, the Supabase SDK and Rich must
+be imported by the subcommands that use them, not at package import.
+
+The budget is measured with `python -X importtime` in a fresh interpreter and is
+deliberately generous (the lazy surface imports in ~30ms locally, the eager one
+took ~1s) so it only trips on real regressions.
+"""
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+IMPORT_BUDGET_MS = 300
+HEAVY_MODULES = ["duckdb", "numpy", "pandas", "pymysql", "rich", "sqlalchemy", "supabase"]
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, cwd=REPO_ROOT, timeout=60, check=True
+    )
+
+
+def _osiris_import_ms(module: str) -> float:
+    """Cumulative import time of the top-level osiris packages, per `-X importtime`."""
+    result = _python("-X", "importtime", "-c", f"import {module}")
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level entries have no indentation in the package column
+        if name.startswith(" osiris") and not name.startswith("  "):
+            total_us += int(cumulative.strip())
+    return total_us / 1000
+
+
+@pytest.mark.parametrize("module", ["osiris", "osiris.cli.main"])
+def test_import_time_within_budget(module):
+    # Warm up bytecode caches so the budget measures imports, not compilation
+    _python("-c", f"import {module}")
+
+    elapsed_ms = min(_osiris_import_ms(module) for _ in range(3))
+
+    assert elapsed_ms > 0, "importtime output did not contain osiris modules"
+    assert elapsed_ms < IMPORT_BUDGET_MS, f"import {module} took {elapsed_ms:.0f}ms (budget {IMPORT_BUDGET_MS}ms)"
+
+
+def test_cli_entry_does_not_import_heavy_dependencies():
+    script = (
+        "import json, sys; import osiris, osiris.cli.main; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    loaded = json.loads(_python("-c", script).stdout)
+
+    assert loaded == []
+
+
+def test_public_api_resolves_lazily():
+    script = (
+        "import sys, osiris; before = 'osiris.connectors' in sys.modules; "
+        "cls = osiris.SQLiteStateStore; "
+        "print(before, cls.__module__, 'MySQLExtractor' in dir(osiris))"
+    )
+    before, module, listed = _python("-c", script).stdout.split()
+
+    assert before == "False"
+    assert module == "osiris.core.state_store"
+    assert listed == "True"
+
+
+def test_unknown_attribute_raises():
+    import osiris
+
+    with pytest.raises(AttributeError, match="no attribute 'NotAThing'"):
+        _ = osiris.NotAThing
+
+
+def test_reimported_package_reaches_loaded_subpackages():
+    script = (
+        "import sys, osiris.drivers.supabase_writer_driver; del sys.modules['osiris']; import osiris; "
+        "from unittest.mock import patch; "
+        "patch('osiris.drivers.supabase_writer_driver.SupabaseClient').start(); "
+        "print(osiris.drivers.supabase_writer_driver.__name__)"
+    )
+
+    assert _python("-c", script).stdout.strip() == "osiris.drivers.supabase_writer_driver"
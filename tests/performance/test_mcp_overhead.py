@@ -22,7 +22,8 @@ TEST CRITERIA:
 
 OPTIMIZATION OPPORTUNITIES:
 - Python startup is dominant cost (~500ms)
-- Future: Consider persistent worker process for hot-path tools
+- The MCP server serves tool calls from persistent CLI workers (osiris/mcp/cli_worker.py);
+  these tests measure the one-shot subprocess path used when the pool is disabled
 - Current: Acceptable for Phase 1 (CLI-first security architecture)
 """
 
@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from osiris.drivers import supabase_writer_driver
 from osiris.drivers.supabase_writer_driver import SupabaseWriterDriver
 
 pytestmark = pytest.mark.supabase
@@ -194,6 +195,42 @@ class TestSupabaseWriterDriver:
             # Should be called 4 times (10 rows / 3 per batch = 4 batches)
             assert mock_table.insert.call_count == 4
 
+    def test_batch_processing_from_row_stream(self, monkeypatch):
+        """Test that RowStream input is written batch by batch without materializing."""
+        monkeypatch.setenv("OSIRIS_TEST_SUPABASE_FORCE_REAL_CLIENT", "1")
+
+        from osiris.core.driver import RowStream
+
+        driver = SupabaseWriterDriver()
+        frames = [pd.DataFrame({"col1": range(start, start + 4)}) for start in (0, 4, 8)]
+        stream = RowStream(iter(frames))
+
+        with patch.object(supabase_writer_driver, "SupabaseClient") as MockClient:
+            mock_client_instance = MagicMock()
+            mock_table = MagicMock()
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.__enter__ = MagicMock(return_value=mock_client_instance)
+            mock_client.__exit__ = MagicMock(return_value=None)
+            mock_client_instance.table.return_value = mock_table
+            mock_table.insert.return_value.execute.return_value = None
+
+            driver.run(
+                step_id="test",
+                config={
+                    "resolved_connection": {"url": "http://test", "key": "test"},
+                    "table": "test_table",
+                    "batch_size": 3,
+                },
+                inputs={"df_upstream": stream},
+            )
+
+        # Each 4-row frame is split into batches of 3 + 1
+        sent = [call.args[0] for call in mock_table.insert.call_args_list]
+        assert [len(batch) for batch in sent] == [3, 1, 3, 1, 3, 1]
+        assert [row["col1"] for batch in sent for row in batch] == list(range(12))
+        assert stream.rows_streamed == 12
+
     def test_primary_key_normalization(self, monkeypatch):
         """Test that primary_key is normalized to list."""
         # Force real client for this test so MagicMock behavior works
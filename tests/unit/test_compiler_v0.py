@@ -182,3 +182,48 @@ class TestCompilerV0:
         # The compiler should have created files in .osiris/index/compilations/<manifest_short>-<hash>/
         assert compiler.manifest_hash is not None
         assert compiler.manifest_short is not None
+
+    def test_compile_with_optimize_fuses_duckdb_steps(self, tmp_path, compiler_instance, monkeypatch):
+        """Test that optimize=True fuses DuckDB chains and records the rewrite in the fingerprints."""
+        monkeypatch.chdir(tmp_path)
+        compiler = compiler_instance
+        compiler.optimize = True
+
+        oml = {
+            "oml_version": "0.1.0",
+            "name": "Fusion Test",
+            "steps": [
+                {
+                    "id": "gen",
+                    "component": "duckdb.processor",
+                    "mode": "transform",
+                    "config": {"query": "SELECT 1 AS x"},
+                },
+                {
+                    "id": "double",
+                    "component": "duckdb.processor",
+                    "mode": "transform",
+                    "needs": ["gen"],
+                    "config": {"query": "SELECT x * 2 AS x FROM df_gen"},
+                },
+            ],
+        }
+        oml_path = tmp_path / "fusion.yaml"
+        oml_path.write_text(yaml.dump(oml))
+
+        success, message = compiler.compile(oml_path=str(oml_path))
+        assert success, message
+
+        paths = compiler.fs_contract.manifest_paths(
+            pipeline_slug="test-pipeline",
+            manifest_hash=compiler.manifest_hash,
+            manifest_short=compiler.manifest_short,
+            profile=None,
+        )
+        manifest = yaml.safe_load(paths["manifest"].read_text())
+
+        assert [step["id"] for step in manifest["steps"]] == ["double"]
+        assert manifest["steps"][0]["fused_steps"] == ["gen", "double"]
+        assert manifest["meta"]["optimizations"][0]["absorbed"] == "gen"
+        assert "optimizer_fp" in manifest["pipeline"]["fingerprints"]
+        assert not (paths["cfg_dir"] / "gen.json").exists()
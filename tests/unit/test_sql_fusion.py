@@ -0,0 +1,164 @@
+"""Unit tests for compile-time SQL step fusion and MySQL pushdown."""
+
+import duckdb
+import pandas as pd
+
+from osiris.core.sql_fusion import optimize_sql_steps
+
+
+def _step(step_id, driver, needs=()):
+    return {
+        "id": step_id,
+        "component": driver,
+        "driver": driver,
+        "cfg_path": f"cfg/{step_id}.json",
+        "needs": list(needs),
+    }
+
+
+def _duckdb(query):
+    return {"component": "duckdb.processor", "mode": "transform", "query": query}
+
+
+def test_fuses_linear_duckdb_chain_into_last_step():
+    steps = [
+        _step("extract", "mysql.extractor"),
+        _step("clean", "duckdb.processor", ["extract"]),
+        _step("enrich", "duckdb.processor", ["clean"]),
+        _step("write", "filesystem.csv_writer", ["enrich"]),
+    ]
+    configs = {
+        "extract": {"query": "SELECT * FROM users"},
+        "clean": _duckdb("SELECT id, lower(email) AS email FROM df_extract WHERE id > 0"),
+        "enrich": _duckdb("SELECT id, email, length(email) AS n FROM df_clean;"),
+        "write": {"path": "out.csv"},
+    }
+
+    new_steps, new_configs, rewrites = optimize_sql_steps(steps, configs)
+
+    assert [s["id"] for s in new_steps] == ["extract", "enrich", "write"]
+    fused = new_steps[1]
+    assert fused["needs"] == ["extract"]
+    assert fused["fused_steps"] == ["clean", "enrich"]
+    assert new_configs["enrich"]["query"] == (
+        "WITH df_clean AS (\nSELECT id, lower(email) AS email FROM df_extract WHERE id > 0\n)\n"
+        "SELECT id, email, length(email) AS n FROM df_clean"
+    )
+    assert "clean" not in new_configs
+    assert rewrites == [{"type": "fuse", "step": "enrich", "absorbed": "clean", "cte": "df_clean"}]
+    # Inputs are left untouched
+    assert len(steps) == 4 and configs["enrich"]["query"].endswith(";")
+
+
+def test_fused_query_matches_step_by_step_result():
+    source = pd.DataFrame({"id": [3, 1, 2, -1], "score": [30, 10, 20, 5]})
+    steps = [
+        _step("a", "duckdb.processor", ["src"]),
+        _step("b", "duckdb.processor", ["a"]),
+        _step("c", "duckdb.processor", ["b"]),
+    ]
+    configs = {
+        "a": _duckdb("SELECT * FROM df_src WHERE id > 0"),
+        "b": _duckdb("-- rank rows\nWITH ranked AS (SELECT *, score * 2 AS doubled FROM df_a) SELECT * FROM ranked"),
+        "c": _duckdb("SELECT id, doubled FROM df_b ORDER BY id -- final"),
+    }
+
+    _, new_configs, rewrites = optimize_sql_steps(steps, configs)
+
+    conn = duckdb.connect()
+    conn.register("df_src", source)
+    conn.register("df_a", conn.execute(configs["a"]["query"]).fetchdf())
+    conn.register("df_b", conn.execute(configs["b"]["query"]).fetchdf())
+    expected = conn.execute(configs["c"]["query"]).fetchdf()
+
+    fused = duckdb.connect()
+    fused.register("df_src", source)
+    pd.testing.assert_frame_equal(fused.execute(new_configs["c"]["query"]).fetchdf(), expected)
+    assert [r["absorbed"] for r in rewrites] == ["a", "b"]
+
+
+def test_does_not_fuse_shared_or_multi_input_steps():
+    steps = [
+        _step("a", "duckdb.processor"),
+        _step("b", "duckdb.processor", ["a"]),
+        _step("c", "duckdb.processor", ["a"]),
+        _step("d", "duckdb.processor", ["b", "c"]),
+    ]
+    configs = {sid: _duckdb("SELECT 1 AS x") for sid in "abcd"}
+
+    new_steps, _, rewrites = optimize_sql_steps(steps, configs)
+
+    assert [s["id"] for s in new_steps] == ["a", "b", "c", "d"]
+    assert rewrites == []
+
+
+def test_does_not_fuse_different_settings_or_non_queries():
+    steps = [
+        _step("a", "duckdb.processor"),
+        _step("b", "duckdb.processor", ["a"]),
+        _step("c", "duckdb.processor", ["b"]),
+    ]
+    configs = {
+        "a": {**_duckdb("SELECT 1 AS x"), "memory_limit": "1GB"},
+        "b": _duckdb("SELECT x FROM df_a"),
+        "c": _duckdb("DESCRIBE df_b"),
+    }
+
+    _, _, rewrites = optimize_sql_steps(steps, configs)
+
+    assert rewrites == []
+
+
+def test_pushes_projection_and_null_filters_into_mysql():
+    steps = [_step("extract-users", "mysql.extractor"), _step("pick", "duckdb.processor", ["extract-users"])]
+    configs = {
+        "extract-users": {"query": "SELECT * FROM users;", "partition_by": "id"},
+        "pick": _duckdb("SELECT email, name AS n FROM df_extract_users WHERE email IS NOT NULL AND age >= 18"),
+    }
+
+    _, new_configs, rewrites = optimize_sql_steps(steps, configs)
+
+    assert new_configs["extract-users"]["query"] == (
+        "SELECT `email`, `name`, `age`, `id` FROM (SELECT * FROM users) AS _osiris_src WHERE `email` IS NOT NULL"
+    )
+    # The DuckDB step still applies the full projection and filter
+    assert new_configs["pick"]["query"] == configs["pick"]["query"]
+    assert rewrites[0]["filters"] == ["email IS NOT NULL"]
+
+
+def test_skips_pushdown_for_complex_queries():
+    steps = [_step("extract", "mysql.extractor"), _step("agg", "duckdb.processor", ["extract"])]
+    for query in (
+        "SELECT * FROM df_extract",
+        "SELECT count(*) AS n FROM df_extract",
+        "SELECT a FROM df_extract WHERE a IS NULL OR b = 1",
+        "SELECT a FROM df_extract ORDER BY a",
+        "SELECT DISTINCT a FROM df_extract",
+        "SELECT a FROM other_table",
+    ):
+        configs = {"extract": {"query": "SELECT * FROM t"}, "agg": _duckdb(query)}
+        _, new_configs, rewrites = optimize_sql_steps(steps, configs)
+        assert rewrites == [], query
+        assert new_configs["extract"]["query"] == "SELECT * FROM t"
+
+
+def test_skips_pushdown_when_extractor_output_columns_may_repeat():
+    steps = [_step("extract", "mysql.extractor"), _step("pick", "duckdb.processor", ["extract"])]
+    for extractor_query in (
+        "SELECT * FROM orders JOIN customers USING (customer_id)",
+        "SELECT o.id, c.id FROM orders o JOIN customers c ON o.customer_id = c.id",
+        "SELECT * FROM orders, customers",
+        "SELECT id, name AS ID FROM users",
+        "SELECT * FROM (SELECT 1 AS id, 2 AS id) AS t",
+    ):
+        configs = {"extract": {"query": extractor_query}, "pick": _duckdb("SELECT id FROM df_extract")}
+        _, new_configs, rewrites = optimize_sql_steps(steps, configs)
+        assert rewrites == [], extractor_query
+        assert new_configs["extract"]["query"] == extractor_query
+
+    configs = {
+        "extract": {"query": "SELECT `id`, email AS mail FROM shop.users u WHERE u.active = 1 ORDER BY id"},
+        "pick": _duckdb("SELECT id FROM df_extract"),
+    }
+    _, _, rewrites = optimize_sql_steps(steps, configs)
+    assert [rewrite["type"] for rewrite in rewrites] == ["pushdown"]
@@ -2,6 +2,62 @@
 Shared fixtures for tests/writers/* modules.
 
 NOTE: Supabase setup is now handled by the root-level conftest.py
-supabase_test_guard fixture (autouse). This file can contain writer-specific
-fixtures if needed in the future.
+supabase_test_guard fixture (autouse). This file holds writer-specific
+fixtures.
 """
+
+import pytest
+
+import osiris.drivers.supabase_writer_driver as supabase_driver
+
+
+def _render(statement) -> str:
+    """Render a psycopg2.sql composition without a live connection."""
+    from psycopg2 import sql
+
+    if isinstance(statement, sql.Composed):
+        return "".join(_render(part) for part in statement.seq)
+    if isinstance(statement, sql.Identifier):
+        return ".".join(f'"{name}"' for name in statement.strings)
+    if isinstance(statement, sql.SQL):
+        return statement.string
+    return str(statement)
+
+
+class FakePostgres:
+    """Local Postgres stand-in recording statements and COPY payloads."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+        self.copies: list[tuple[str, str]] = []
+        self.rowcount = 0
+        self.committed = False
+        self.closed = False
+
+    def cursor(self):
+        return self
+
+    def execute(self, statement, params=None):
+        self.statements.append(_render(statement))
+
+    def copy_expert(self, statement, file):
+        self.copies.append((_render(statement), file.read()))
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.committed = exc_type is None and not self.closed
+        return False
+
+
+@pytest.fixture
+def fake_postgres(monkeypatch):
+    """Route the Supabase writer's psycopg2 connections to one FakePostgres."""
+    pytest.importorskip("psycopg2")
+    conn = FakePostgres()
+    monkeypatch.setattr(supabase_driver.SupabaseWriterDriver, "_connect_psycopg2", lambda self, config: conn)
+    return conn
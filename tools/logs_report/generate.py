@@ -550,21 +550,18 @@ def generate_html_report(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Load sessions using SessionReader
+    # Load sessions using SessionReader (status / label filters and the limit run in the session index;
+    # the since filter compares parsed timestamps, so it stays here)
     reader = SessionReader(logs_dir)
-    sessions = reader.list_sessions()
+    sessions = reader.list_sessions(
+        limit=None if since_filter else limit,
+        status=status_filter or None,
+        label=label_filter or None,
+    )
 
     # Apply filters
     filtered_sessions = []
     for session in sessions:
-        # Status filter
-        if status_filter and session.status != status_filter:
-            continue
-
-        # Label filter
-        if label_filter and label_filter not in session.labels:
-            continue
-
         # Since filter
         if since_filter and session.started_at:
             try: